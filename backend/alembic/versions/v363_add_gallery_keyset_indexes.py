@@ -0,0 +1,48 @@
+"""Add per-user (sort_field, id) indexes for keyset gallery pagination.
+
+The gallery's cursor mode seeks on ``(sort_field, id)`` instead of using
+OFFSET, which only stays constant-cost if each supported sort has a
+composite index PostgreSQL can range-scan. One index per sort field,
+scoped by ``user_id`` so the default ``ownership=mine`` listing reads a
+single contiguous index range:
+
+- upload_time, completed_at, filename, duration, file_size
+
+Indexes are declared ``DESC`` (NULLS FIRST) so DESC listings use a forward
+scan and ASC listings (NULLS LAST) a backward scan of the same index.
+
+Revision ID: v363_add_gallery_keyset_indexes
+Revises: v362_add_pipeline_timing_markers
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "v363_add_gallery_keyset_indexes"
+down_revision = "v362_add_pipeline_timing_markers"
+branch_labels = None
+depends_on = None
+
+
+_SORT_COLUMNS: tuple[str, ...] = (
+    "upload_time",
+    "completed_at",
+    "filename",
+    "duration",
+    "file_size",
+)
+
+
+def upgrade():
+    # IF NOT EXISTS keeps the migration safe to re-run against
+    # partially-upgraded databases.
+    for col in _SORT_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_media_file_user_{col}_id "
+            f"ON media_file(user_id, {col} DESC, id DESC)"
+        )
+
+
+def downgrade():
+    for col in _SORT_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_media_file_user_{col}_id")
@@ -0,0 +1,30 @@
+"""Add waveform_pyramid bytea column to media_file.
+
+Waveforms were cached as JSONB lists, one entry per requested width, each
+produced by a full ffmpeg decode. The file is now decoded once into a
+min/max/RMS peak pyramid (int16, power-of-two levels) stored as a compact
+binary blob; every display width is derived from it without decoding.
+
+``waveform_data`` stays as a small marker so existing "has waveform"
+checks keep working; legacy per-width JSONB entries are still served until
+the file is regenerated.
+
+Revision ID: v364_add_media_file_waveform_pyramid
+Revises: v363_add_gallery_keyset_indexes
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "v364_add_media_file_waveform_pyramid"
+down_revision = "v363_add_gallery_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE media_file ADD COLUMN IF NOT EXISTS waveform_pyramid BYTEA")
+
+
+def downgrade():
+    op.execute("ALTER TABLE media_file DROP COLUMN IF EXISTS waveform_pyramid")
@@ -0,0 +1,115 @@
+"""Add denormalized summary columns to speaker for the speaker directory.
+
+The full speaker listing computes segment counts, first-segment timestamps
+and consolidated suggestions for every speaker on every request, so its
+cost grows with the library. The paginated speaker directory reads them
+from these columns instead; ``SpeakerSummaryService`` keeps them current
+per file from the transcription, embedding and identification tasks.
+
+- segment_count, first_segment_times (first 4 segments, with global index)
+- top_suggestion_name / _confidence / _type
+- summary_updated_at
+
+Two keyset indexes back the directory's sort orders, declared ``DESC`` like
+the gallery indexes in ``v363_add_gallery_keyset_indexes``:
+
+- (user_id, created_at DESC, id DESC)
+- (user_id, segment_count DESC, id DESC)
+
+Existing rows are backfilled from transcript_segment and from the stored
+suggestion columns; OpenSearch profile matches are filled in the next time
+a file's summaries are refreshed.
+
+Revision ID: v365_add_speaker_summary_columns
+Revises: v364_add_media_file_waveform_pyramid
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "v365_add_speaker_summary_columns"
+down_revision = "v364_add_media_file_waveform_pyramid"
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("segment_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("first_segment_times", "JSONB"),
+    ("top_suggestion_name", "VARCHAR(255)"),
+    ("top_suggestion_confidence", "FLOAT"),
+    ("top_suggestion_type", "VARCHAR(50)"),
+    ("summary_updated_at", "TIMESTAMP WITH TIME ZONE"),
+)
+
+_SORT_COLUMNS: tuple[str, ...] = ("created_at", "segment_count")
+
+
+def upgrade():
+    for name, ddl in _COLUMNS:
+        op.execute(f"ALTER TABLE speaker ADD COLUMN IF NOT EXISTS {name} {ddl}")
+
+    for col in _SORT_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_speaker_user_{col}_id "
+            f"ON speaker(user_id, {col} DESC, id DESC)"
+        )
+
+    # Segment counts and the first 4 segments per speaker; segment_index is
+    # the 0-based position among the file's speaker-assigned segments, the
+    # same value the per-file speaker listing computes.
+    op.execute("""
+        WITH ranked AS (
+            SELECT
+                ts.speaker_id,
+                ts.uuid,
+                ts.start_time,
+                COUNT(*) OVER (PARTITION BY ts.speaker_id) AS segment_count,
+                ROW_NUMBER() OVER (
+                    PARTITION BY ts.speaker_id ORDER BY ts.start_time
+                ) AS speaker_rank,
+                ROW_NUMBER() OVER (
+                    PARTITION BY ts.media_file_id ORDER BY ts.start_time
+                ) - 1 AS segment_index
+            FROM transcript_segment ts
+            WHERE ts.speaker_id IS NOT NULL
+        ),
+        summary AS (
+            SELECT
+                speaker_id,
+                MAX(segment_count) AS segment_count,
+                jsonb_agg(
+                    jsonb_build_object(
+                        'uuid', uuid::text,
+                        'start_time', start_time,
+                        'segment_index', segment_index
+                    )
+                    ORDER BY start_time
+                ) FILTER (WHERE speaker_rank <= 4) AS first_segment_times
+            FROM ranked
+            GROUP BY speaker_id
+        )
+        UPDATE speaker s
+        SET segment_count = summary.segment_count,
+            first_segment_times = summary.first_segment_times,
+            summary_updated_at = NOW()
+        FROM summary
+        WHERE s.id = summary.speaker_id
+    """)
+
+    op.execute(r"""
+        UPDATE speaker
+        SET top_suggestion_name = suggested_name,
+            top_suggestion_confidence = confidence,
+            top_suggestion_type = COALESCE(suggestion_source, 'voice_match')
+        WHERE suggested_name IS NOT NULL
+          AND confidence IS NOT NULL
+          AND suggested_name !~ '^SPEAKER_\d+$'
+    """)
+
+
+def downgrade():
+    for col in _SORT_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_speaker_user_{col}_id")
+    for name, _ddl in reversed(_COLUMNS):
+        op.execute(f"ALTER TABLE speaker DROP COLUMN IF EXISTS {name}")
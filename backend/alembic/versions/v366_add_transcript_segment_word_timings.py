@@ -0,0 +1,33 @@
+"""Add packed word_timings bytea column to transcript_segment.
+
+Word-level timestamps were stored as JSONB, one object per word, so loading
+a long transcript parsed megabytes of JSON. New segments store them in
+``word_timings`` as packed float32 start/end/score arrays plus an
+offset-indexed UTF-8 token blob (``app.utils.word_timings``).
+
+Existing rows keep their JSONB ``words`` until the
+``migrate_word_timings_to_binary`` task, scheduled at backend startup,
+converts them in batches and clears the JSONB value. Readers go through
+``segment_words`` and accept either column in the meantime.
+
+Revision ID: v366_add_transcript_segment_word_timings
+Revises: v365_add_speaker_summary_columns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "v366_add_transcript_segment_word_timings"
+down_revision = "v365_add_speaker_summary_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE transcript_segment ADD COLUMN IF NOT EXISTS word_timings BYTEA")
+
+
+def downgrade():
+    # Rows already converted lose their word timestamps; re-transcribe or
+    # re-postprocess those files after downgrading.
+    op.execute("ALTER TABLE transcript_segment DROP COLUMN IF EXISTS word_timings")
@@ -58,6 +58,15 @@ from .crud import update_media_file
 from .crud import update_single_transcript_segment
 from .filtering import apply_all_filters
 from .filtering import get_metadata_filters
+from .pagination import SORT_FIELDS
+from .pagination import InvalidCursorError
+from .pagination import apply_keyset_order
+from .pagination import apply_keyset_seek
+from .pagination import count_cache_key
+from .pagination import decode_cursor
+from .pagination import encode_cursor
+from .pagination import filter_hash
+from .pagination import get_cached_total
 from .reprocess import process_file_reprocess
 from .segments import router as segments_router
 from .streaming import get_content_streaming_response
@@ -188,6 +197,17 @@ def list_media_files(
     # Pagination parameters
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    pagination: str = Query(
+        "offset",
+        pattern="^(offset|cursor)$",
+        description="'offset' (page numbers) or 'cursor' (keyset seek, constant cost per page)",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from next_cursor; implies pagination=cursor"
+    ),
+    include_total: bool = Query(
+        True, description="Cursor mode only: return a (cached, approximate) total count"
+    ),
     # Ownership filter
     ownership: str = Query(
         "mine",
@@ -225,6 +245,11 @@ def list_media_files(
     - 'mine': Only files owned by current user (default, preserves existing behavior)
     - 'shared': Only files accessible via shared collections
     - 'all': Both owned and shared files
+
+    Cursor mode (pagination=cursor or any cursor value) seeks on
+    (sort_field, id) instead of OFFSET, so deep pages cost the same as the
+    first one. Its total is cached per filter set and may be slightly stale;
+    pass include_total=false to skip counting entirely.
     """
     from sqlalchemy import func as sa_func
     from sqlalchemy.orm import defer
@@ -304,16 +329,22 @@ def list_media_files(
 
     # Apply sorting
     # Note: MediaFile has upload_time, completed_at, filename, duration, file_size
-    sort_field_mapping = {
-        "upload_time": MediaFile.upload_time,
-        "completed_at": MediaFile.completed_at,
-        "filename": MediaFile.filename,
-        "duration": MediaFile.duration,
-        "file_size": MediaFile.file_size,
-    }
-
     # Get the sort field (default to upload_time if invalid)
-    sort_field = sort_field_mapping.get(sort_by, MediaFile.upload_time)
+    if sort_by not in SORT_FIELDS:
+        sort_by = "upload_time"
+    sort_field = SORT_FIELDS[sort_by]
+    sort_order = "asc" if sort_order.lower() == "asc" else "desc"
+
+    if pagination == "cursor" or cursor is not None:
+        return _list_media_files_keyset(
+            filtered_query,
+            cursor=cursor,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            include_total=include_total,
+            cache_key=count_cache_key(user_id, filter_hash(ownership, filters)),
+        )
 
     # Get total count BEFORE sorting/pagination.
     # Use with_entities + func.count to avoid the subquery wrapper that
@@ -322,7 +353,7 @@ def list_media_files(
     total_count = (filtered_query.with_entities(sa_func.count(MediaFile.id)).scalar()) or 0
 
     # Apply sort order (only for the data query, not the count)
-    if sort_order.lower() == "asc":
+    if sort_order == "asc":
         filtered_query = filtered_query.order_by(sort_field.asc())  # type: ignore[attr-defined]
     else:
         filtered_query = filtered_query.order_by(sort_field.desc())  # type: ignore[attr-defined]
@@ -332,27 +363,92 @@ def list_media_files(
     paginated_query = filtered_query.offset(offset).limit(page_size)
     result = paginated_query.all()
 
-    # Format each file with URLs and formatted fields
+    formatted_files = _format_listing_rows(result)
+
+    # Calculate pagination metadata
+    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
+    has_more = page < total_pages
+
+    return PaginatedMediaFileResponse(
+        items=formatted_files,
+        total=total_count,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more,
+    )
+
+
+def _format_listing_rows(rows: list[MediaFile]) -> list[Any]:
+    """Format each file with URLs and formatted fields for the list view."""
     formatted_files = []
-    for file in result:
+    for file in rows:
         set_file_urls(file)
 
         # Use the FormattingService method which handles formatting correctly
         # Pass speakers for speaker_summary in list view
         formatted_file = FormattingService.format_media_file(file, file.speakers)
         formatted_files.append(formatted_file)
+    return formatted_files
+
+
+def _list_media_files_keyset(
+    filtered_query: Any,
+    cursor: Optional[str],
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    include_total: bool,
+    cache_key: str,
+) -> PaginatedMediaFileResponse:
+    """Serve one gallery page by seeking on (sort_field, id).
+
+    Fetches page_size + 1 rows to detect whether another page exists, so no
+    count is needed to drive infinite scroll. The optional total is read from
+    (or written to) the per-filter Redis cache entry, which is cleared by
+    ``invalidate_user_files`` and otherwise expires after ``TTL_FILES``.
+    """
+    from sqlalchemy import func as sa_func
 
-    # Calculate pagination metadata
-    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
-    has_more = page < total_pages
+    from app.services.redis_cache_service import TTL_FILES
+    from app.services.redis_cache_service import redis_cache
+
+    total_count: Optional[int] = None
+    total_is_estimate = False
+    if include_total:
+        total_count = get_cached_total(redis_cache, cache_key)
+        if total_count is None:
+            total_count = (filtered_query.with_entities(sa_func.count(MediaFile.id)).scalar()) or 0
+            redis_cache.set(cache_key, total_count, ttl=TTL_FILES)
+        else:
+            total_is_estimate = True
+
+    data_query = apply_keyset_order(filtered_query, sort_by, sort_order)
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort_by, sort_order)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        data_query = apply_keyset_seek(data_query, position)
+
+    rows = data_query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_cursor(sort_by, sort_order, rows[-1]) if has_more and rows else None
+
+    total_pages = None
+    if total_count is not None:
+        total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
 
     return PaginatedMediaFileResponse(
-        items=formatted_files,
+        items=_format_listing_rows(rows),
         total=total_count,
-        page=page,
+        page=None,
         page_size=page_size,
         total_pages=total_pages,
         has_more=has_more,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -911,6 +1007,11 @@ async def reprocess_media_file(
     num_speakers = reprocess_request.num_speakers if reprocess_request else None
     stages: list[str] = list(reprocess_request.stages) if reprocess_request else []
     whisper_model = reprocess_request.whisper_model if reprocess_request else None
+    postprocess = (
+        reprocess_request.postprocess.model_dump(exclude_none=True)
+        if reprocess_request and reprocess_request.postprocess
+        else None
+    )
 
     return await process_file_reprocess(
         file_uuid,
@@ -921,6 +1022,7 @@ async def reprocess_media_file(
         num_speakers,  # type: ignore[arg-type]
         stages=stages,
         whisper_model=whisper_model,
+        postprocess=postprocess,
     )
 
 
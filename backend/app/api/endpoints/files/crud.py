@@ -26,7 +26,9 @@ from app.schemas.media import TranscriptSegment as TranscriptSegmentSchema
 from app.schemas.media import TranscriptSegmentUpdate
 from app.services.formatting_service import FormattingService
 from app.services.minio_service import delete_file
+from app.services.minio_service import delete_raw_outputs
 from app.services.opensearch_service import update_transcript_title
+from app.services.search.suggestion_index import refresh_file_suggestions
 from app.services.speaker_status_service import SpeakerStatusService
 from app.utils.time_format import format_timestamp_simple as format_timestamp
 from app.utils.uuid_helpers import get_file_by_uuid_with_permission
@@ -532,6 +534,7 @@ def update_media_file(
             update_transcript_title(str(db_file.uuid), new_title)  # Use UUID not integer ID
         except Exception as e:
             logger.warning(f"Failed to update OpenSearch title for file {file_id}: {e}")
+        refresh_file_suggestions(db, file_id, title=True)
 
     # Invalidate caches so gallery reflects the update
     try:
@@ -679,6 +682,7 @@ def delete_media_file(db: Session, file_uuid: str, current_user: User, force: bo
     except Exception as e:
         logger.warning(f"Error deleting file from storage: {e}")
         # Don't fail the entire operation if storage deletion fails
+    delete_raw_outputs(int(db_file.user_id), file_id)
 
     # Delete associated data from OpenSearch before deleting from database
     _cleanup_opensearch_data(db, file_id, str(db_file.uuid))
@@ -686,10 +690,16 @@ def delete_media_file(db: Session, file_uuid: str, current_user: User, force: bo
     try:
         # Delete from database (cascade will handle related records)
         owner_id = int(db_file.user_id)
+        imohash = str(db_file.imohash) if db_file.imohash else None
         db.delete(db_file)
         db.commit()
         logger.info(f"Successfully deleted file {file_id} from database")
 
+        # Cached derived artifacts go with the last upload of this content
+        from app.services.artifact_cache_service import purge_if_orphaned
+
+        purge_if_orphaned(db, imohash)
+
         # Invalidate caches — file list, tags, speakers, metadata all change
         try:
             from app.services.redis_cache_service import redis_cache
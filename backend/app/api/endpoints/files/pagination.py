@@ -0,0 +1,168 @@
+"""
+Keyset (cursor) pagination for the media gallery listing.
+
+OFFSET/LIMIT pagination makes PostgreSQL walk and discard every row before
+the requested page, so deep pages in a large library get linearly slower.
+Cursor mode instead seeks on ``(sort_field, id)`` using the composite
+per-user indexes added in ``v363_add_gallery_keyset_indexes``, so page N
+costs the same as page 1.
+
+Cursors are opaque, URL-safe base64 JSON blobs carrying the sort field,
+direction and the last row's ``(value, id)``. They contain no authorization
+state — ownership filters are always re-applied on every request.
+
+NULL ordering follows PostgreSQL defaults (``NULLS LAST`` for ASC,
+``NULLS FIRST`` for DESC) so the seek predicate matches a plain backward or
+forward scan of the ``(user_id, field DESC, id DESC)`` indexes.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Query
+
+from app.models.media import MediaFile
+
+logger = logging.getLogger(__name__)
+
+# Sort fields supported by the gallery, mapped to their model columns.
+SORT_FIELDS: dict[str, Any] = {
+    "upload_time": MediaFile.upload_time,
+    "completed_at": MediaFile.completed_at,
+    "filename": MediaFile.filename,
+    "duration": MediaFile.duration,
+    "file_size": MediaFile.file_size,
+}
+
+# Sort fields whose cursor values must be round-tripped through ISO-8601.
+_DATETIME_FIELDS = frozenset({"upload_time", "completed_at"})
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the request."""
+
+
+class Cursor(NamedTuple):
+    """Decoded position of the last row on the previous page."""
+
+    sort_by: str
+    sort_order: str
+    value: Any
+    id: int
+
+
+def encode_cursor(sort_by: str, sort_order: str, row: MediaFile) -> str:
+    """Build an opaque cursor pointing just after ``row``."""
+    value = getattr(row, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"s": sort_by, "o": sort_order, "v": value, "i": int(row.id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Cursor:
+    """Decode a cursor and check it was issued for the same sort.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different sort field/order (the seek position would be meaningless).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort = payload["s"]
+        cursor_order = payload["o"]
+        value = payload["v"]
+        row_id = int(payload["i"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if cursor_sort != sort_by or cursor_order != sort_order:
+        raise InvalidCursorError("Pagination cursor does not match the requested sort order")
+
+    if value is not None and sort_by in _DATETIME_FIELDS:
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError("Malformed pagination cursor") from e
+
+    return Cursor(cursor_sort, cursor_order, value, row_id)
+
+
+def apply_keyset_order(query: Query, sort_by: str, sort_order: str) -> Query:
+    """Order by ``(sort_field, id)`` so every row has a unique, stable position."""
+    sort_field = SORT_FIELDS[sort_by]
+    if sort_order == "asc":
+        return query.order_by(sort_field.asc(), MediaFile.id.asc())
+    return query.order_by(sort_field.desc(), MediaFile.id.desc())
+
+
+def apply_keyset_seek(query: Query, cursor: Cursor) -> Query:
+    """Restrict ``query`` to rows strictly after the cursor position.
+
+    Non-NULL positions use a row-value comparison so PostgreSQL can turn the
+    predicate into an index range scan. NULL sort values are handled
+    explicitly to mirror the default NULL placement of each direction.
+    """
+    sort_field = SORT_FIELDS[cursor.sort_by]
+    row_key = sa.tuple_(sort_field, MediaFile.id)
+
+    if cursor.sort_order == "asc":
+        # ASC: non-NULL values first, NULLs last
+        if cursor.value is None:
+            return query.filter(sort_field.is_(None), MediaFile.id > cursor.id)
+        return query.filter(
+            sa.or_(row_key > sa.tuple_(cursor.value, cursor.id), sort_field.is_(None))
+        )
+
+    # DESC: NULLs first, then non-NULL values
+    if cursor.value is None:
+        return query.filter(
+            sa.or_(
+                sa.and_(sort_field.is_(None), MediaFile.id < cursor.id),
+                sort_field.isnot(None),
+            )
+        )
+    return query.filter(row_key < sa.tuple_(cursor.value, cursor.id))
+
+
+def filter_hash(ownership: str, filters: dict[str, Any]) -> str:
+    """Stable short hash of the ownership scope and filter set.
+
+    Used as the cache key suffix for listing totals, so every page of the
+    same filtered view shares one cached count.
+    """
+    canonical = json.dumps(
+        {"ownership": ownership, "filters": filters}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def count_cache_key(user_id: int, hash_value: str) -> str:
+    """Redis key for a cached listing total.
+
+    Lives under ``cache:files:{user_id}:`` so ``invalidate_user_files``
+    clears it together with the other listing caches.
+    """
+    return f"cache:files:{user_id}:count:{hash_value}"
+
+
+def get_cached_total(cache: Any, key: str) -> Optional[int]:
+    """Return a cached listing total, or None on miss / Redis unavailable."""
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    try:
+        return int(cached)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring non-integer cached total at {key}: {cached!r}")
+        return None
@@ -27,6 +27,7 @@ def clear_existing_transcription_data(db: Session, media_file: MediaFile) -> Non
         media_file.summary_status = "pending"  # type: ignore[assignment]  # Reset summary status for regeneration
         media_file.translated_text = None  # type: ignore[assignment]
         media_file.waveform_data = None  # type: ignore[assignment]  # Clear waveform data for regeneration
+        media_file.waveform_pyramid = None  # type: ignore[assignment]
 
         # Clear existing transcript segments
         from app.models.media import Analytics
@@ -61,6 +62,12 @@ def clear_existing_transcription_data(db: Session, media_file: MediaFile) -> Non
         db.commit()
         logger.info(f"Cleared existing transcription data for file {media_file.id}")
 
+        # Raw model outputs of the previous run no longer match the transcript;
+        # a local re-transcription stores fresh ones
+        from app.services.minio_service import delete_raw_outputs
+
+        delete_raw_outputs(int(media_file.user_id), int(media_file.id))
+
         # Remove deleted speakers from all OpenSearch speaker indices (non-fatal)
         if speaker_uuids_to_clean:
             try:
@@ -140,7 +147,7 @@ def clear_selective_data(db: Session, media_file: MediaFile, stages: list[str])
             clear_existing_transcription_data(db, media_file)
             return  # Already clears everything
 
-        if "rediarize" in stages:
+        if "rediarize" in stages or "repostprocess" in stages:
             # Null out speaker_id on segments first to avoid FK constraint violations,
             # then delete speakers. Transcript text/words are preserved.
             db.query(TranscriptSegment).filter(
@@ -286,6 +293,7 @@ def dispatch_selective_tasks(
     file_id: int | None = None,
     user_id: int | None = None,
     whisper_model: str | None = None,
+    postprocess: dict | None = None,
 ) -> None:
     """Dispatch Celery tasks for selected pipeline stages.
 
@@ -298,6 +306,7 @@ def dispatch_selective_tasks(
         file_id: Internal file ID (passed to tasks that need it).
         user_id: Owner user ID (passed to tasks that need it).
         whisper_model: Optional Whisper model override for transcription.
+        postprocess: Optional post-processing settings for the repostprocess stage.
     """
     import os
 
@@ -306,8 +315,8 @@ def dispatch_selective_tasks(
         return
 
     if "transcription" in stages:
-        # Transcription subsumes rediarize
-        downstream = [s for s in stages if s not in ("transcription", "rediarize")]
+        # Transcription subsumes rediarize and repostprocess
+        downstream = [s for s in stages if s not in ("transcription", "rediarize", "repostprocess")]
         start_reprocessing_task(
             file_uuid,
             min_speakers=min_speakers,
@@ -320,7 +329,7 @@ def dispatch_selective_tasks(
     elif "rediarize" in stages:
         from app.tasks.rediarize_task import rediarize_task
 
-        other_stages = [s for s in stages if s != "rediarize"]
+        other_stages = [s for s in stages if s not in ("rediarize", "repostprocess")]
         rediarize_task.delay(
             file_uuid,
             min_speakers=min_speakers,
@@ -328,6 +337,20 @@ def dispatch_selective_tasks(
             num_speakers=num_speakers,
             downstream_tasks=other_stages if other_stages else None,
         )
+    elif "repostprocess" in stages:
+        # CPU-only: rebuild the transcript from the kept raw model outputs
+        from app.tasks.repostprocess_task import repostprocess_task
+
+        other_stages = [s for s in stages if s != "repostprocess"]
+        repostprocess_task.delay(
+            file_uuid,
+            options={
+                **(postprocess or {}),
+                "num_speakers": num_speakers,
+                "max_speakers": max_speakers,
+            },
+            downstream_tasks=other_stages if other_stages else None,
+        )
     else:
         # Pure downstream tasks - dispatch each directly
         for stage in stages:
@@ -343,6 +366,7 @@ async def process_file_reprocess(
     num_speakers: int | None = None,
     stages: list[str] | None = None,
     whisper_model: str | None = None,
+    postprocess: dict | None = None,
 ) -> MediaFile:
     """
     Process file reprocessing request with enhanced error handling.
@@ -356,6 +380,7 @@ async def process_file_reprocess(
         num_speakers: Optional fixed number of speakers for diarization
         stages: Optional list of pipeline stages to re-run. Empty/None = full reprocess.
         whisper_model: Optional Whisper model override for this transcription.
+        postprocess: Optional post-processing settings for the repostprocess stage.
 
     Returns:
         Updated MediaFile object
@@ -427,6 +452,21 @@ async def process_file_reprocess(
                         detail="Failed to reset file for reprocessing",
                     )
 
+            # Re-postprocessing needs the raw model outputs of a local transcription
+            if (
+                "repostprocess" in stages
+                and "transcription" not in stages
+                and "rediarize" not in stages
+            ):
+                from app.services.minio_service import raw_outputs_exist
+
+                if not raw_outputs_exist(int(media_file.user_id), file_id):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="No saved model outputs for this file. "
+                        "Re-run transcription to enable re-postprocessing.",
+                    )
+
             # Clear data for selected stages
             clear_selective_data(db, media_file, stages)
 
@@ -443,6 +483,7 @@ async def process_file_reprocess(
                 file_id=file_id,
                 user_id=int(current_user.id),
                 whisper_model=whisper_model,
+                postprocess=postprocess,
             )
 
             logger.info(
@@ -2,24 +2,31 @@
 API endpoints for subtitle generation.
 """
 
-import io
+import itertools
 import logging
-import zipfile
+import uuid
+from typing import Any
 
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi.responses import JSONResponse
 from fastapi.responses import Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.auth import get_current_active_user
+from app.core.constants import BULK_EXPORT_ASYNC_THRESHOLD
 from app.db.base import get_db
 from app.models.user import User
 from app.schemas.media import SubtitleValidationResult
+from app.services.bulk_export_service import EXPORT_FORMATS
+from app.services.bulk_export_service import iter_export_entries
+from app.services.bulk_export_service import resolve_export_candidates
+from app.services.bulk_export_service import stream_zip
 from app.services.subtitle_service import SubtitleService
 from app.utils.uuid_helpers import get_file_by_uuid_with_permission
 
@@ -158,98 +165,124 @@ class BulkExportRequest(BaseModel):
     file_uuids: list[str]
     subtitle_format: str = "srt"
     include_speakers: bool = True
+    background: bool = False  # Build in a Celery task and deliver a download link
 
 
 @router.post("/bulk-export", response_class=StreamingResponse)
-async def bulk_export_subtitles(
+def bulk_export_subtitles(
     request: BulkExportRequest = Body(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Export subtitles for multiple files as a single ZIP download.
 
-    Generates subtitle files for each requested file and bundles them into
-    a ZIP archive. Files that are not completed or not accessible are skipped.
+    The ZIP is streamed: entries are rendered in batches on a worker thread
+    pool and written to the response as they are produced, so memory use does
+    not grow with the number of files. Files that are not completed or not
+    accessible are skipped, as are files that render to nothing; 404 is
+    returned when no file produces an entry. The X-Candidate-Count header
+    is the number of files selected for rendering, an upper bound on the
+    entries in the archive.
+
+    Selections larger than BULK_EXPORT_ASYNC_THRESHOLD (or any selection with
+    background=true) are built by a Celery task instead; the response is
+    202 with a task_id and the download link arrives via WebSocket or
+    GET /bulk-export/{task_id}.
     """
     if not request.file_uuids:
         raise HTTPException(status_code=400, detail="No file UUIDs provided")
 
-    if len(request.file_uuids) > 100:
-        raise HTTPException(status_code=400, detail="Maximum 100 files per export")
-
     format_lower = request.subtitle_format.lower()
-    if format_lower not in ("srt", "webvtt", "txt"):
+    if format_lower not in EXPORT_FORMATS:
         raise HTTPException(status_code=400, detail=f"Unsupported format: {format_lower}")
 
-    ext = "vtt" if format_lower == "webvtt" else format_lower
-    zip_buffer = io.BytesIO()
-    exported = 0
-    skipped = 0
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_uuid in request.file_uuids:
-            try:
-                media_file = get_file_by_uuid_with_permission(
-                    db, file_uuid, int(current_user.id), is_admin=current_user.is_admin
-                )
-                file_id = int(media_file.id)
-
-                if media_file.status != "completed":
-                    skipped += 1
-                    continue
-
-                if format_lower == "webvtt":
-                    content = SubtitleService.generate_webvtt_content(
-                        db, file_id, request.include_speakers
-                    )
-                elif format_lower == "txt":
-                    content = SubtitleService.generate_txt_content(
-                        db, file_id, request.include_speakers
-                    )
-                else:
-                    content = SubtitleService.generate_srt_content(
-                        db, file_id, request.include_speakers
-                    )
-
-                if not content.strip():
-                    skipped += 1
-                    continue
-
-                base_name = (
-                    media_file.filename.rsplit(".", 1)[0]
-                    if "." in media_file.filename
-                    else media_file.filename
-                )
-                zf.writestr(f"{base_name}.{ext}", content.encode("utf-8"))
-                exported += 1
-
-            except HTTPException:
-                skipped += 1
-            except Exception as e:
-                logger.warning(f"Failed to export subtitles for {file_uuid}: {e}")
-                skipped += 1
-
-    if exported == 0:
+    user_id = int(current_user.id)
+
+    if request.background or len(request.file_uuids) > BULK_EXPORT_ASYNC_THRESHOLD:
+        from app.tasks.bulk_export import bulk_export_subtitles_task
+        from app.tasks.bulk_export import record_bulk_export_owner
+
+        # Record the owner before queueing so the status endpoint never sees
+        # a task it cannot attribute
+        task_id = str(uuid.uuid4())
+        record_bulk_export_owner(task_id, user_id)
+        bulk_export_subtitles_task.apply_async(
+            args=(
+                user_id,
+                bool(current_user.is_admin),
+                request.file_uuids,
+                format_lower,
+                request.include_speakers,
+            ),
+            task_id=task_id,
+        )
+        return JSONResponse(
+            status_code=202,
+            content={
+                "status": "queued",
+                "task_id": task_id,
+                "file_count": len(request.file_uuids),
+            },
+        )
+
+    candidates = resolve_export_candidates(
+        db, request.file_uuids, user_id, is_admin=current_user.is_admin
+    )
+    if not candidates:
         raise HTTPException(
             status_code=404,
             detail="No files could be exported. Ensure files are completed and accessible.",
         )
 
-    zip_buffer.seek(0)
+    # Release the request session's connection before the long-running
+    # stream starts; render workers open their own sessions.
+    db.close()
+
     zip_filename = f"transcripts_{format_lower}.zip"
+    entries = iter_export_entries(candidates, format_lower, request.include_speakers)
+
+    # Render up to the first entry before committing to a 200 response
+    first = next(entries, None)
+    if first is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No files could be exported. The selected transcripts are empty.",
+        )
 
     return StreamingResponse(
-        zip_buffer,
+        stream_zip(itertools.chain([first], entries)),
         media_type="application/zip",
         headers={
             "Content-Disposition": f'attachment; filename="{zip_filename}"',
-            "Content-Length": str(zip_buffer.getbuffer().nbytes),
-            "X-Exported-Count": str(exported),
-            "X-Skipped-Count": str(skipped),
+            "X-Candidate-Count": str(len(candidates)),
         },
     )
 
 
+@router.get("/bulk-export/{task_id}", response_model=dict[str, Any])
+def get_bulk_export_status(
+    task_id: str,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Return the status of a background bulk export, with its download link when done."""
+    from celery.result import AsyncResult
+
+    from app.core.celery import celery_app
+    from app.tasks.bulk_export import get_bulk_export_owner
+
+    if get_bulk_export_owner(task_id) != int(current_user.id):
+        raise HTTPException(status_code=404, detail="Export not found")
+
+    task_result = AsyncResult(task_id, app=celery_app)
+    if not task_result.ready():
+        return {"status": "pending", "task_id": task_id}
+
+    result = task_result.result if isinstance(task_result.result, dict) else None
+    if result is None or result.get("user_id") != int(current_user.id):
+        raise HTTPException(status_code=404, detail="Export not found")
+    return result
+
+
 @router.get("/supported-formats")
 async def get_supported_formats():
     """
@@ -23,7 +23,11 @@ from app.models.media import MediaFile
 from app.models.user import User
 from app.services.minio_service import download_file
 from app.tasks.transcription.waveform_generator import WaveformGenerator
+from app.tasks.transcription.waveform_generator import waveform_marker
+from app.tasks.transcription.waveform_generator import waveform_payload
 from app.tasks.waveform_generation import trigger_waveform_generation
+from app.utils.waveform_pyramid import WaveformPyramid
+from app.utils.waveform_pyramid import load_pyramid
 
 from .crud import get_media_file_by_uuid
 
@@ -144,53 +148,52 @@ def _convert_waveform_to_peaks(waveform_data: list[int], height: int) -> list[in
     return peaks
 
 
-def _generate_and_cache_waveform(
-    db: Session, db_file: MediaFile, file_id: int, cache_key: str, samples: int
-) -> dict:
+def _get_or_build_pyramid(
+    db: Session, db_file: MediaFile, file_id: int, rebuild: bool = False
+) -> WaveformPyramid:
     """
-    Generate waveform data and cache it in the database.
+    Return the file's stored waveform pyramid, building it once if missing.
+
+    Files processed before pyramids existed (or with a forced refresh) are
+    decoded a single time here; every later request for any width is served
+    from the stored pyramid without touching the media.
 
     Args:
         db: Database session
         db_file: The media file record
         file_id: Internal file ID for logging
-        cache_key: Cache key for storing the waveform data
-        samples: Number of samples to extract
+        rebuild: Ignore any stored pyramid and decode again
 
     Returns:
-        Waveform data dictionary with file_id and cached flag
+        The file's WaveformPyramid
 
     Raises:
         HTTPException: If waveform generation fails
     """
+    if not rebuild:
+        pyramid = load_pyramid(db_file.waveform_pyramid)
+        if pyramid is not None:
+            return pyramid
+
     temp_file_path = None
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as temp_file:
             _download_to_temp_file(str(db_file.storage_path), temp_file)
             temp_file_path = temp_file.name
 
-        # Extract waveform data using the WaveformGenerator
-        waveform_generator = WaveformGenerator()
-        waveform_data = waveform_generator._extract_single_waveform(temp_file_path, samples)
-
-        if not waveform_data:
+        pyramid = WaveformGenerator().generate_waveform_pyramid(temp_file_path)
+        if pyramid is None:
             raise ValueError("Failed to extract waveform data")
 
-        # Cache the waveform data in database
-        if not db_file.waveform_data:
-            db_file.waveform_data = {}  # type: ignore[assignment]
-        db_file.waveform_data[cache_key] = waveform_data.copy()
+        db_file.waveform_pyramid = pyramid.to_bytes()  # type: ignore[assignment]
+        db_file.waveform_data = waveform_marker(pyramid)  # type: ignore[assignment]
         db.commit()
 
-        # Add file ID to response
-        waveform_data["file_id"] = str(db_file.uuid)
-        waveform_data["cached"] = False
-
         logger.info(
-            f"Generated and cached waveform for file {file_id}: {len(waveform_data['waveform'])} samples"
+            f"Generated and stored waveform pyramid for file {file_id}: "
+            f"{len(pyramid.levels)} levels"
         )
-
-        return waveform_data
+        return pyramid
 
     except HTTPException:
         raise
@@ -205,40 +208,8 @@ def _generate_and_cache_waveform(
             _cleanup_temp_file(temp_file_path)
 
 
-def _extract_waveform_from_file(storage_path: str, target_samples: int) -> dict:
-    """
-    Download a file and extract waveform data from it.
-
-    Args:
-        storage_path: The path in MinIO storage
-        target_samples: Number of samples to extract
-
-    Returns:
-        Waveform data dictionary
-
-    Raises:
-        ValueError: If waveform extraction fails
-    """
-    temp_file_path = None
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as temp_file:
-            _download_to_temp_file(storage_path, temp_file)
-            temp_file_path = temp_file.name
-
-        waveform_generator = WaveformGenerator()
-        waveform_data = waveform_generator._extract_single_waveform(temp_file_path, target_samples)
-
-        if not waveform_data:
-            raise ValueError("Failed to extract waveform data")
-
-        return waveform_data
-    finally:
-        if temp_file_path:
-            _cleanup_temp_file(temp_file_path)
-
-
 @router.get("/{file_uuid}/waveform")
-async def get_audio_waveform(
+def get_audio_waveform(
     file_uuid: str,
     samples: int = Query(1000, description="Number of samples to return", ge=100, le=10000),
     refresh_cache: bool = Query(False, description="Force refresh of cached waveform data"),
@@ -247,7 +218,9 @@ async def get_audio_waveform(
 ):
     """
     Generate waveform visualization data for an audio or video file.
-    Uses caching to improve performance for repeated requests.
+
+    Served from the file's stored peak pyramid, so any sample count is a
+    cheap reduction with no media decoding.
 
     Args:
         file_uuid: UUID of the media file
@@ -265,22 +238,28 @@ async def get_audio_waveform(
     # Validate the file is suitable for waveform generation
     _validate_media_file_for_waveform(db_file)
 
-    # Check for cached waveform data (prioritize cached data)
-    cache_key = f"waveform_{samples}"
-    if not refresh_cache:
-        cached_result = _get_cached_waveform(db_file, cache_key)
-        if cached_result:
-            return cached_result
+    pyramid = None if refresh_cache else load_pyramid(db_file.waveform_pyramid)
+    cached = pyramid is not None
+    if pyramid is None:
+        if not refresh_cache:
+            # Legacy per-width JSONB cache from before pyramids existed
+            cached_result = _get_cached_waveform(db_file, f"waveform_{samples}")
+            if cached_result:
+                return cached_result
+        pyramid = _get_or_build_pyramid(db, db_file, file_id, rebuild=True)
 
-    # Generate new waveform data
-    return _generate_and_cache_waveform(db, db_file, file_id, cache_key, samples)
+    waveform_data = waveform_payload(pyramid, samples)
+    waveform_data["file_id"] = str(db_file.uuid)
+    waveform_data["cached"] = cached
+    return waveform_data
 
 
 @router.get("/{file_uuid}/waveform/peaks")
-async def get_audio_waveform_peaks(
+def get_audio_waveform_peaks(
     file_uuid: str,
     width: int = Query(1000, description="Target width in pixels", ge=100, le=10000),
     height: int = Query(100, description="Target height in pixels", ge=50, le=500),
+    include_minmax: bool = Query(False, description="Also return signed min/max peaks (±height/2)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -292,6 +271,7 @@ async def get_audio_waveform_peaks(
         file_uuid: UUID of the media file
         width: Target display width in pixels
         height: Target display height in pixels
+        include_minmax: Include min_peaks/max_peaks for symmetric rendering
 
     Returns:
         JSON response with peaks data optimized for display
@@ -307,20 +287,13 @@ async def get_audio_waveform_peaks(
     # Calculate samples based on width (2 samples per pixel for better resolution)
     target_samples = min(width * 2, 4000)
 
-    # Extract waveform data
-    try:
-        waveform_data = _extract_waveform_from_file(str(db_file.storage_path), target_samples)
-    except Exception as e:
-        logger.error(f"Error generating waveform peaks for file {file_id}: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate waveform peaks: {str(e)}",
-        ) from e
+    pyramid = _get_or_build_pyramid(db, db_file, file_id)
+    waveform_data = waveform_payload(pyramid, target_samples)
 
     # Convert waveform data to height-based peaks
     peaks = _convert_waveform_to_peaks(waveform_data["waveform"], height)
 
-    return {
+    response = {
         "peaks": peaks,
         "duration": waveform_data["duration"],
         "width": width,
@@ -330,6 +303,14 @@ async def get_audio_waveform_peaks(
         "file_id": str(db_file.uuid),
     }
 
+    if include_minmax:
+        mins, maxs, _ = pyramid.resample(target_samples)
+        half = height / 2
+        response["min_peaks"] = (mins * half).astype(int).tolist()
+        response["max_peaks"] = (maxs * half).astype(int).tolist()
+
+    return response
+
 
 @router.post("/{file_uuid}/waveform/generate")
 async def generate_waveform_for_file(
@@ -16,7 +16,6 @@ from app.core.constants import NOTIFICATION_TYPE_GROUP_MEMBER_REMOVED
 from app.db.base import get_db
 from app.models.group import UserGroup
 from app.models.group import UserGroupMember
-from app.models.media import CollectionMember
 from app.models.sharing import CollectionShare
 from app.models.user import User
 from app.schemas.group import Group as GroupSchema
@@ -27,7 +26,9 @@ from app.schemas.group import GroupMemberAdd
 from app.schemas.group import GroupMemberUpdate
 from app.schemas.group import GroupUpdate
 from app.schemas.user import UserBrief
-from app.tasks.search_indexing_task import update_file_access_index
+from app.services.permission_service import PermissionService
+from app.services.redis_cache_service import redis_cache
+from app.tasks.search_indexing_task import revoke_legacy_file_access
 from app.utils.uuid_helpers import get_by_uuid
 from app.utils.websocket_notify import send_ws_event
 
@@ -66,25 +67,28 @@ def _require_group_admin(db: Session, group: UserGroup, user_id: int) -> UserGro
     return membership
 
 
-def _reindex_group_shared_files(db: Session, group_id: int) -> None:
-    """Reindex files in collections shared with this group."""
-    shared_collection_ids = [
-        cs.collection_id
-        for cs in db.query(CollectionShare.collection_id)
-        .filter(CollectionShare.target_group_id == group_id)
-        .all()
-    ]
-    if not shared_collection_ids:
-        return
-    file_ids = [
-        cm.media_file_id
-        for cm in db.query(CollectionMember.media_file_id)
-        .filter(CollectionMember.collection_id.in_(shared_collection_ids))
-        .distinct()
-        .all()
-    ]
-    if file_ids:
-        update_file_access_index.delay(file_ids)
+def _group_has_shares(db: Session, group_id: int) -> bool:
+    """Whether any collection is shared with this group."""
+    return (
+        db.query(CollectionShare.id).filter(CollectionShare.target_group_id == group_id).first()
+        is not None
+    )
+
+
+def _invalidate_member_search_access(
+    db: Session, group_id: int, user_ids: list[int], revoked: bool = False
+) -> None:
+    """Refresh search access for members whose group membership changed.
+
+    Group shares resolve to collection tokens at query time, so only the
+    affected members' cached principals need dropping. When access is
+    revoked, chunks still matched on a legacy user list are rewritten too.
+    """
+    if user_ids and _group_has_shares(db, group_id):
+        redis_cache.invalidate_search_access(user_ids)
+        file_ids = PermissionService.get_group_shared_file_ids(db, group_id) if revoked else []
+        if file_ids:
+            revoke_legacy_file_access.delay(file_ids)
 
 
 def _build_group_response(db: Session, group: UserGroup, current_user_id: int) -> GroupSchema:
@@ -328,12 +332,26 @@ def delete_group(
             detail="Only the group owner can delete this group",
         )
 
-    # Reindex files BEFORE deletion (cascade will remove shares)
-    _reindex_group_shared_files(db, int(group.id))
+    # Capture members BEFORE deletion (cascade will remove shares + memberships)
+    had_shares = _group_has_shares(db, int(group.id))
+    shared_file_ids = (
+        PermissionService.get_group_shared_file_ids(db, int(group.id)) if had_shares else []
+    )
+    member_ids = [
+        int(uid)
+        for (uid,) in db.query(UserGroupMember.user_id)
+        .filter(UserGroupMember.group_id == group.id)
+        .all()
+    ]
 
     db.delete(group)
     db.commit()
 
+    if had_shares:
+        redis_cache.invalidate_search_access(member_ids)
+        if shared_file_ids:
+            revoke_legacy_file_access.delay(shared_file_ids)
+
     return None
 
 
@@ -372,8 +390,8 @@ def add_member(
     db.commit()
     db.refresh(member)
 
-    # Reindex files in collections shared with this group
-    _reindex_group_shared_files(db, int(group.id))
+    # New member gains the group's shared collections
+    _invalidate_member_search_access(db, int(group.id), [int(target_user.id)])
 
     # Notify the new member
     send_ws_event(
@@ -438,9 +456,6 @@ def update_member_role(
     db.commit()
     db.refresh(target_membership)
 
-    # Reindex files in collections shared with this group
-    _reindex_group_shared_files(db, int(group.id))
-
     return GroupMember(
         uuid=target_membership.uuid,
         user_uuid=target_user.uuid,
@@ -494,8 +509,8 @@ def remove_member(
     db.delete(target_membership)
     db.commit()
 
-    # Reindex files in collections shared with this group
-    _reindex_group_shared_files(db, int(group.id))
+    # Removed member loses the group's shared collections
+    _invalidate_member_search_access(db, int(group.id), [removed_user_id], revoked=True)
 
     # Notify the removed member (skip if self-removal)
     if not is_self_remove:
@@ -47,6 +47,9 @@ from app.schemas.sharing import ShareUpdate
 from app.schemas.user import UserBrief
 from app.services.formatting_service import FormattingService
 from app.services.permission_service import PermissionService
+from app.services.permission_service import collection_principal
+from app.services.redis_cache_service import redis_cache
+from app.tasks.search_indexing_task import revoke_legacy_file_access
 from app.tasks.search_indexing_task import update_file_access_index
 from app.utils.uuid_helpers import get_by_uuid
 from app.utils.uuid_helpers import get_collection_by_uuid_with_permission
@@ -632,19 +635,24 @@ async def delete_collection(
             detail="Only the collection owner can delete it",
         )
 
-    # Reindex files BEFORE deletion (cascade will remove shares + members)
-    file_ids = [
-        cm.media_file_id
-        for cm in db.query(CollectionMember.media_file_id)
-        .filter(CollectionMember.collection_id == collection.id)
-        .all()
-    ]
-    if file_ids:
-        update_file_access_index.delay(file_ids)
+    # Capture share recipients BEFORE deletion (cascade will remove shares).
+    # Chunks keep the dead collection token, which no user can match anymore.
+    shared_user_ids = PermissionService.get_users_for_principals(
+        db, [collection_principal(int(collection.id))]
+    )
+    file_ids = (
+        PermissionService.get_collection_file_ids(db, [int(collection.id)])
+        if shared_user_ids
+        else []
+    )
 
     db.delete(collection)
     db.commit()
 
+    redis_cache.invalidate_search_access(shared_user_ids)
+    if file_ids:
+        revoke_legacy_file_access.delay(file_ids)
+
     return {"message": "Collection deleted successfully"}
 
 
@@ -708,13 +716,9 @@ async def add_media_to_collection(
 
     db.commit()
 
-    # If collection has shares, reindex newly added files
+    # Newly added files need this collection's token on their search chunks
     if added_file_ids:
-        share_count = (
-            db.query(CollectionShare).filter(CollectionShare.collection_id == collection_id).count()
-        )
-        if share_count > 0:
-            update_file_access_index.delay(added_file_ids)
+        update_file_access_index.delay(added_file_ids)
 
     return {
         "message": f"Added {added_count} media files to collection",
@@ -758,13 +762,9 @@ async def remove_media_from_collection(
 
     db.commit()
 
-    # If collection has shares, reindex removed files
-    if media_file_ids:
-        share_count = (
-            db.query(CollectionShare).filter(CollectionShare.collection_id == collection_id).count()
-        )
-        if share_count > 0:
-            update_file_access_index.delay(media_file_ids)
+    # Removed files must drop this collection's token from their search chunks
+    if removed_count and media_file_ids:
+        update_file_access_index.delay(media_file_ids)
 
     return {
         "message": f"Removed {removed_count} media files from collection",
@@ -1047,15 +1047,8 @@ async def create_collection_share(
         .first()
     )
 
-    # Reindex OpenSearch accessible_user_ids for files in this collection
-    file_ids = [
-        cm.media_file_id
-        for cm in db.query(CollectionMember.media_file_id)
-        .filter(CollectionMember.collection_id == collection.id)
-        .all()
-    ]
-    if file_ids:
-        update_file_access_index.delay(file_ids)
+    # Recipients now match this collection's token; no chunks are rewritten
+    redis_cache.invalidate_search_access(_get_share_target_user_ids(db, share))
 
     # Notify affected user(s) about the new share
     _notify_share_event(db, share, collection, NOTIFICATION_TYPE_COLLECTION_SHARED)
@@ -1100,15 +1093,7 @@ async def update_collection_share(
         .first()
     )
 
-    # Reindex files since permission level changed
-    file_ids = [
-        cm.media_file_id
-        for cm in db.query(CollectionMember.media_file_id)
-        .filter(CollectionMember.collection_id == collection.id)
-        .all()
-    ]
-    if file_ids:
-        update_file_access_index.delay(file_ids)
+    # Viewer/editor both grant search access, so the search index is unaffected
 
     # Notify affected user(s) about the permission change
     _notify_share_event(db, share, collection, NOTIFICATION_TYPE_COLLECTION_SHARE_UPDATED)
@@ -1152,15 +1137,12 @@ async def delete_collection_share(
     db.delete(share)
     db.commit()
 
-    # Reindex OpenSearch accessible_user_ids for files in this collection
-    file_ids = [
-        cm.media_file_id
-        for cm in db.query(CollectionMember.media_file_id)
-        .filter(CollectionMember.collection_id == collection.id)
-        .all()
-    ]
+    # Former recipients stop matching this collection's token; chunks still
+    # matched on a legacy user list are rewritten
+    redis_cache.invalidate_search_access(target_user_ids)
+    file_ids = PermissionService.get_collection_file_ids(db, [int(collection.id)])
     if file_ids:
-        update_file_access_index.delay(file_ids)
+        revoke_legacy_file_access.delay(file_ids)
 
     # Notify affected user(s) about the revocation
     for uid in target_user_ids:
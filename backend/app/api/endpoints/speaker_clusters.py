@@ -70,8 +70,9 @@ def trigger_recluster(
         from app.tasks.speaker_clustering import recluster_all_speakers
 
         threshold = data.threshold if data and data.threshold is not None else None
+        incremental = bool(data and data.incremental)
         user_id = int(current_user.id)
-        task = recluster_all_speakers.delay(user_id, threshold)
+        task = recluster_all_speakers.delay(user_id, threshold, incremental=incremental)
 
         # Send immediate "queued" notification so the UI shows status while
         # the task waits for the GPU worker to pick it up.
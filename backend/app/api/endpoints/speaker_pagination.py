@@ -0,0 +1,106 @@
+"""
+Keyset (cursor) pagination for the speaker directory.
+
+Same scheme as the media gallery (``files/pagination.py``): pages seek on
+``(sort_field, id)`` using the per-user ``(user_id, field DESC, id DESC)``
+indexes added in ``v365_add_speaker_summary_columns``, so the cost of a
+page does not depend on how many speakers the library holds.
+
+Cursors are opaque, URL-safe base64 JSON blobs and carry no authorization
+state; ownership filters are re-applied on every request.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Query
+
+from app.api.endpoints.files.pagination import Cursor
+from app.api.endpoints.files.pagination import InvalidCursorError
+from app.models.media import Speaker
+
+# Sort fields supported by the directory, mapped to their model columns.
+SORT_FIELDS: dict[str, Any] = {
+    "created_at": Speaker.created_at,
+    "segment_count": Speaker.segment_count,
+}
+
+# Sort fields whose cursor values must be round-tripped through ISO-8601.
+_DATETIME_FIELDS = frozenset({"created_at"})
+
+
+def encode_cursor(sort_by: str, sort_order: str, row: Speaker) -> str:
+    """Build an opaque cursor pointing just after ``row``."""
+    value = getattr(row, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"s": sort_by, "o": sort_order, "v": value, "i": int(row.id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Cursor:
+    """Decode a cursor and check it was issued for the same sort.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different sort field/order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort = payload["s"]
+        cursor_order = payload["o"]
+        value = payload["v"]
+        row_id = int(payload["i"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if cursor_sort != sort_by or cursor_order != sort_order:
+        raise InvalidCursorError("Pagination cursor does not match the requested sort order")
+
+    if value is not None and sort_by in _DATETIME_FIELDS:
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError("Malformed pagination cursor") from e
+
+    return Cursor(cursor_sort, cursor_order, value, row_id)
+
+
+def apply_keyset_order(query: Query, sort_by: str, sort_order: str) -> Query:
+    """Order by ``(sort_field, id)`` so every row has a unique, stable position."""
+    sort_field = SORT_FIELDS[sort_by]
+    if sort_order == "asc":
+        return query.order_by(sort_field.asc(), Speaker.id.asc())
+    return query.order_by(sort_field.desc(), Speaker.id.desc())
+
+
+def apply_keyset_seek(query: Query, cursor: Cursor) -> Query:
+    """Restrict ``query`` to rows strictly after the cursor position.
+
+    NULL placement follows the PostgreSQL defaults, as in the gallery
+    (``segment_count`` is never NULL; ``created_at`` can be on legacy rows).
+    """
+    sort_field = SORT_FIELDS[cursor.sort_by]
+    row_key = sa.tuple_(sort_field, Speaker.id)
+
+    if cursor.sort_order == "asc":
+        if cursor.value is None:
+            return query.filter(sort_field.is_(None), Speaker.id > cursor.id)
+        return query.filter(
+            sa.or_(row_key > sa.tuple_(cursor.value, cursor.id), sort_field.is_(None))
+        )
+
+    if cursor.value is None:
+        return query.filter(
+            sa.or_(
+                sa.and_(sort_field.is_(None), Speaker.id < cursor.id),
+                sort_field.isnot(None),
+            )
+        )
+    return query.filter(row_key < sa.tuple_(cursor.value, cursor.id))
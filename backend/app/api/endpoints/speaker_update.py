@@ -21,6 +21,7 @@ from app.models.media import Speaker
 from app.models.media import SpeakerMatch
 from app.models.media import SpeakerProfile
 from app.services.opensearch_service import get_speaker_embedding
+from app.services.search.suggestion_index import refresh_file_suggestions
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +180,7 @@ def _sync_speaker_to_opensearch(speaker: Speaker, db: Session) -> None:
         update_speaker_display_name(
             str(speaker.uuid), str(speaker.display_name) if speaker.display_name else None
         )
+        refresh_file_suggestions(db, int(speaker.media_file_id), speakers=True)
         profile_uuid = _get_profile_uuid(
             db, int(speaker.profile_id) if speaker.profile_id else None
         )
@@ -24,7 +24,9 @@ from app.schemas.media import Speaker as SpeakerSchema
 from app.schemas.media import SpeakerUpdate
 from app.services.opensearch_service import update_speaker_display_name
 from app.services.permission_service import PermissionService
+from app.services.search.suggestion_index import refresh_file_suggestions
 from app.services.speaker_status_service import SpeakerStatusService
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils.uuid_helpers import get_speaker_by_uuid
 
 logger = logging.getLogger(__name__)
@@ -669,6 +671,162 @@ def list_speakers(
         ) from e
 
 
+# --- Helper functions for the speaker directory ---
+
+
+def _filter_directory_query(
+    query: Any,
+    verified_only: bool,
+    labeled: bool | None,
+    has_suggestion: bool | None,
+    search: str | None,
+) -> Any:
+    """Apply directory filters; all of them are plain column predicates."""
+    from sqlalchemy import and_
+    from sqlalchemy import not_
+    from sqlalchemy import or_
+
+    if verified_only:
+        query = query.filter(Speaker.verified)
+
+    if labeled is not None:
+        is_labeled = and_(
+            Speaker.display_name.isnot(None),
+            Speaker.display_name != "",
+            ~Speaker.display_name.op("~")(r"^SPEAKER_\d+$"),
+        )
+        query = query.filter(is_labeled if labeled else not_(is_labeled))
+
+    if has_suggestion is not None:
+        query = query.filter(
+            Speaker.top_suggestion_name.isnot(None)
+            if has_suggestion
+            else Speaker.top_suggestion_name.is_(None)
+        )
+
+    if search:
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        query = query.filter(
+            or_(
+                Speaker.display_name.ilike(pattern, escape="\\"),
+                Speaker.name.ilike(pattern, escape="\\"),
+                Speaker.top_suggestion_name.ilike(pattern, escape="\\"),
+            )
+        )
+
+    return query
+
+
+def _build_directory_item(speaker: Speaker) -> dict[str, Any]:
+    """Build a directory entry from the stored summary columns only."""
+    status_info = SpeakerStatusService.compute_speaker_status(speaker)
+
+    top_suggestion = None
+    if speaker.top_suggestion_name:
+        confidence = float(speaker.top_suggestion_confidence or 0.0)
+        top_suggestion = {
+            "name": speaker.top_suggestion_name,
+            "confidence": confidence,
+            "confidence_percentage": f"{confidence:.0%}",
+            "suggestion_type": speaker.top_suggestion_type,
+        }
+
+    profile = None
+    if speaker.profile_id and speaker.profile:
+        profile = {
+            "uuid": str(speaker.profile.uuid) if speaker.profile.uuid else None,
+            "name": speaker.profile.name,
+        }
+
+    media_file = speaker.media_file
+    return {
+        "uuid": str(speaker.uuid),
+        "name": speaker.name,
+        "display_name": speaker.display_name or "",
+        "resolved_display_name": status_info["resolved_display_name"],
+        "verified": speaker.verified,
+        "computed_status": status_info["computed_status"],
+        "status_text": status_info["status_text"],
+        "status_color": status_info["status_color"],
+        "created_at": speaker.created_at.isoformat() if speaker.created_at else None,
+        "media_file_id": str(media_file.uuid) if media_file else None,
+        "media_file_title": (media_file.title or media_file.filename) if media_file else None,
+        "profile": profile,
+        "segment_count": int(speaker.segment_count or 0),
+        "segment_timestamps": speaker.first_segment_times or [],
+        "top_suggestion": top_suggestion,
+        "predicted_gender": speaker.predicted_gender,
+        "predicted_age_range": speaker.predicted_age_range,
+    }
+
+
+@router.get("/directory", response_model=dict[str, Any])
+def list_speaker_directory(
+    cursor: str | None = Query(None, description="Opaque cursor from next_cursor"),
+    limit: int = Query(50, ge=1, le=200, description="Speakers per page"),
+    sort_by: str = Query("created_at", pattern="^(created_at|segment_count)$"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    verified_only: bool = False,
+    labeled: bool | None = Query(None, description="Only labeled (true) or unlabeled (false)"),
+    has_suggestion: bool | None = Query(None, description="Filter on a stored top suggestion"),
+    search: str | None = Query(None, description="Match display name, name or suggestion"),
+    file_uuid: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict[str, Any]:
+    """
+    Cursor-paginated speaker directory across the user's whole library.
+
+    Unlike ``GET /speakers``, which computes segment counts and suggestions
+    (OpenSearch) per request, entries are read from the summary columns kept
+    by ``SpeakerSummaryService``. A page seeks on ``(sort_by, id)`` and loads
+    ``limit + 1`` rows, so its cost does not depend on library size.
+
+    Returns:
+        dict: ``items``, ``next_cursor`` (None on the last page) and ``has_more``.
+    """
+    from sqlalchemy.orm import joinedload
+
+    from app.api.endpoints.speaker_pagination import InvalidCursorError
+    from app.api.endpoints.speaker_pagination import apply_keyset_order
+    from app.api.endpoints.speaker_pagination import apply_keyset_seek
+    from app.api.endpoints.speaker_pagination import decode_cursor
+    from app.api.endpoints.speaker_pagination import encode_cursor
+
+    file_id = _resolve_file_uuid_to_id(file_uuid, current_user, db)
+
+    query = db.query(Speaker)
+    # Same scoping as list_speakers: file permission was checked above
+    if file_id is not None:
+        query = query.filter(Speaker.media_file_id == file_id)
+    elif not current_user.is_admin:
+        query = query.filter(Speaker.user_id == current_user.id)
+    query = _filter_directory_query(query, verified_only, labeled, has_suggestion, search)
+
+    query = apply_keyset_order(query, sort_by, sort_order)
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort_by, sort_order)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        query = apply_keyset_seek(query, position)
+
+    rows = (
+        query.options(joinedload(Speaker.profile), joinedload(Speaker.media_file))
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "items": [_build_directory_item(speaker) for speaker in rows],
+        "next_cursor": encode_cursor(sort_by, sort_order, rows[-1]) if has_more else None,
+        "has_more": has_more,
+    }
+
+
 @router.post("/cleanup-orphaned-embeddings", response_model=dict[str, Any])
 def cleanup_orphaned_embeddings(
     db: Session = Depends(get_db),
@@ -1153,6 +1311,10 @@ def merge_speakers(
     # Recalculate analytics for affected media files
     _refresh_analytics_after_merge(db, affected_media_files)
 
+    # Segment counts and first segments moved to the target speaker
+    for media_file_id in affected_media_files:
+        SpeakerSummaryService.refresh_file_summaries(db, media_file_id, include_suggestions=False)
+
     # Invalidate caches
     try:
         from app.services.redis_cache_service import redis_cache
@@ -1543,6 +1705,8 @@ def update_speaker(
     display_name_changed = speaker_update.display_name is not None
     new_profile_id = int(speaker.profile_id) if speaker.profile_id else None
     display_name = str(speaker.display_name) if speaker.display_name else ""
+    if display_name_changed:
+        refresh_file_suggestions(db, media_file_id, speakers=True)
 
     # Queue background processing for heavy operations
     # This handles: profile embeddings, OpenSearch updates, retroactive matching, cache clearing
@@ -21,6 +21,7 @@ from app.models.user import User
 from app.schemas.media import Tag as TagSchema
 from app.schemas.media import TagBase
 from app.schemas.media import TagWithCount
+from app.services.search.suggestion_index import refresh_file_suggestions
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +215,7 @@ async def add_tag_to_file(
         file_tag = FileTag(media_file_id=file_id, tag_id=tag.id, source=TAG_SOURCE_MANUAL)
         db.add(file_tag)
         db.commit()
+        refresh_file_suggestions(db, int(file_id), tags=True)
 
         # Invalidate caches
         try:
@@ -258,6 +260,7 @@ def remove_tag_from_file(
     if file_tag:
         db.delete(file_tag)
         db.commit()
+        refresh_file_suggestions(db, int(file_id), tags=True)
 
         # Invalidate caches
         try:
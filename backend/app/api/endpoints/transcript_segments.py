@@ -16,6 +16,7 @@ from app.models.media import TranscriptSegment
 from app.models.user import User
 from app.schemas.media import TranscriptSegment as TranscriptSegmentSchema
 from app.schemas.transcript import SegmentSpeakerUpdate
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils.time_format import format_timestamp_simple as format_timestamp
 from app.utils.uuid_helpers import get_by_uuid
 
@@ -179,6 +180,8 @@ def _handle_speaker_change(
         # Don't fail the operation if analytics refresh fails
         logger.warning(f"Failed to refresh analytics after segment speaker change: {e}")
 
+    SpeakerSummaryService.refresh_file_summaries(db, media_file_id, include_suggestions=False)
+
     # Dispatch background task to update speaker embeddings
     if segment_uuid and media_file_uuid and user_id and target_speaker_uuid:
         try:
@@ -2,6 +2,9 @@ import asyncio
 import contextlib
 import json
 import logging
+from collections.abc import Awaitable
+from collections.abc import Callable
+from functools import partial
 from typing import Optional
 
 import redis.asyncio as redis
@@ -21,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upper bound on a single send_text so one slow socket cannot stall fan-out
+WEBSOCKET_SEND_TIMEOUT = 5.0
+
 
 # Connection manager to handle WebSocket connections
 class ConnectionManager:
@@ -44,17 +50,29 @@ class ConnectionManager:
                 f"User {user_id} disconnected. Total connections: {len(self.active_connections)}"
             )
 
+    async def _send(self, connection: WebSocket, user_id: int, text: str):
+        """Send to one socket, bounded so a stalled client cannot hold up the others."""
+        try:
+            await asyncio.wait_for(connection.send_text(text), timeout=WEBSOCKET_SEND_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error sending message to user {user_id}: {str(e)}")
+
     async def send_personal_message(self, user_id: int, message: dict):
-        if user_id in self.active_connections:
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error sending message to user {user_id}: {str(e)}")
+        connections = list(self.active_connections.get(user_id, ()))
+        if not connections:
+            return
+        text = json.dumps(message)
+        await asyncio.gather(*(self._send(c, user_id, text) for c in connections))
 
     async def broadcast(self, message: dict):
-        for user_id in self.active_connections:
-            await self.send_personal_message(user_id, message)
+        text = json.dumps(message)
+        await asyncio.gather(
+            *(
+                self._send(connection, user_id, text)
+                for user_id, connections in list(self.active_connections.items())
+                for connection in list(connections)
+            )
+        )
 
 
 # Create connection manager instance
@@ -73,8 +91,38 @@ async def setup_redis():
         asyncio.create_task(redis_subscriber())
 
 
+# Latest in-flight delivery per recipient ("*" for broadcasts). Each new
+# delivery awaits its predecessor, so one user's messages arrive in publish
+# order while different users are served concurrently.
+_delivery_tails: dict[object, asyncio.Task] = {}
+
+
+def _dispatch_delivery(key: object, send: Callable[[], Awaitable[None]]) -> None:
+    """Schedule ``send`` after any earlier delivery to the same recipient."""
+    previous = _delivery_tails.get(key)
+
+    async def run() -> None:
+        if previous is not None:
+            with contextlib.suppress(Exception):
+                await previous
+        await send()
+
+    task = asyncio.create_task(run())
+    _delivery_tails[key] = task
+
+    def _release(done: asyncio.Task) -> None:
+        if _delivery_tails.get(key) is done:
+            del _delivery_tails[key]
+
+    task.add_done_callback(_release)
+
+
 async def redis_subscriber():
-    """Subscribe to Redis notifications and forward to WebSocket connections."""
+    """Subscribe to Redis notifications and forward to WebSocket connections.
+
+    Messages are handed off to per-recipient delivery tasks, so a slow socket
+    never stalls reading from Redis or delivery to other users.
+    """
     try:
         assert redis_client is not None
         pubsub = redis_client.pubsub()
@@ -90,13 +138,14 @@ async def redis_subscriber():
                     notification_type = notification_data.get("type")
                     is_broadcast = notification_data.get("broadcast", False)
                     data = notification_data.get("data", {})
+                    payload = {"type": notification_type, "data": data}
 
                     if is_broadcast and notification_type:
-                        await manager.broadcast({"type": notification_type, "data": data})
+                        _dispatch_delivery("*", partial(manager.broadcast, payload))
                         logger.debug(f"Broadcast notification: {notification_type}")
                     elif user_id and notification_type:
-                        await manager.send_personal_message(
-                            user_id, {"type": notification_type, "data": data}
+                        _dispatch_delivery(
+                            user_id, partial(manager.send_personal_message, user_id, payload)
                         )
                         logger.info(
                             f"Forwarded notification to user {user_id}: {notification_type}"
@@ -72,10 +72,13 @@ celery_app = Celery(
         "app.tasks.search_indexing_task",
         "app.tasks.thumbnail",
         "app.tasks.thumbnail_migration",
+        "app.tasks.word_timings_migration",
         "app.tasks.embedding_migration_v4",
         "app.tasks.speaker_embedding_migration",
         "app.tasks.baseline_export",
+        "app.tasks.bulk_export",
         "app.tasks.rediarize_task",
+        "app.tasks.repostprocess_task",
         "app.tasks.speaker_clustering",
         "app.tasks.auto_labeling",
         "app.tasks.speaker_attribute_migration_task",
@@ -132,6 +135,7 @@ celery_app.conf.update(
         "extract_v4_embeddings_batch": {"queue": CeleryQueues.GPU},
         "speaker.recluster_all": {"queue": CeleryQueues.GPU},
         "speaker.cluster_for_file": {"queue": CeleryQueues.CPU},
+        "repostprocess": {"queue": CeleryQueues.CPU},
         # Download Queue - Network I/O tasks (concurrency=3, no GPU)
         "download.media_url": {"queue": CeleryQueues.DOWNLOAD},
         "download.media_playlist": {"queue": CeleryQueues.DOWNLOAD},
@@ -149,6 +153,7 @@ celery_app.conf.update(
         "migration.normalize_embeddings": {"queue": CeleryQueues.CPU},
         "generate_thumbnail": {"queue": CeleryQueues.CPU},
         "migrate_thumbnails_to_webp": {"queue": CeleryQueues.CPU},
+        "migrate_word_timings_to_binary": {"queue": CeleryQueues.CPU},
         "reindex_transcripts": {"queue": CeleryQueues.CPU},
         "reindex_batch": {"queue": CeleryQueues.CPU},
         "search_index_maintenance": {"queue": CeleryQueues.CPU},
@@ -157,6 +162,7 @@ celery_app.conf.update(
         "speaker_embedding_consistency_repair_batch": {"queue": CeleryQueues.GPU},
         "process_speaker_update_background": {"queue": CeleryQueues.CPU},
         "extract_speaker_embeddings": {"queue": CeleryQueues.GPU},
+        "export.bulk_subtitles": {"queue": CeleryQueues.CPU},
         # NLP Queue - LLM API calls (concurrency=4, no GPU needed)
         "ai.generate_summary": {"queue": CeleryQueues.NLP},
         "ai.identify_speakers": {"queue": CeleryQueues.NLP},
@@ -169,6 +175,8 @@ celery_app.conf.update(
         "index_transcript_search": {"queue": CeleryQueues.EMBEDDING},
         # Access index updates are lightweight OpenSearch writes (no GPU/embedding needed)
         "update_file_access_index": {"queue": CeleryQueues.UTILITY},
+        "revoke_legacy_file_access": {"queue": CeleryQueues.UTILITY},
+        "rebuild_search_suggestions": {"queue": CeleryQueues.UTILITY},
         # Utility Queue - Lightweight maintenance tasks (concurrency=8)
         "system.startup_recovery": {"queue": CeleryQueues.UTILITY},
         "system.recover_user_files": {"queue": CeleryQueues.UTILITY},
@@ -180,6 +188,7 @@ celery_app.conf.update(
         "cleanup.emergency_recovery": {"queue": CeleryQueues.UTILITY},
         "cleanup.scratch_janitor": {"queue": CeleryQueues.CPU},
         "cleanup.orphan_upload_sweeper": {"queue": CeleryQueues.UTILITY},
+        "cleanup.expired_bulk_exports": {"queue": CeleryQueues.UTILITY},
         "check_migration_status": {"queue": CeleryQueues.UTILITY},
         "finalize_v4_migration": {"queue": CeleryQueues.UTILITY},
         "export_transcript_baseline": {"queue": CeleryQueues.UTILITY},
@@ -230,6 +239,11 @@ celery_app.conf.update(
             "schedule": crontab(minute="5,20,35,50"),
             "options": {"queue": "utility", "priority": 5},  # UtilityPriority.ROUTINE
         },
+        "expired-bulk-exports": {
+            "task": "cleanup.expired_bulk_exports",
+            "schedule": crontab(minute=45),  # Hourly at :45; links expire after 24h
+            "options": {"queue": "utility", "priority": 5},  # UtilityPriority.ROUTINE
+        },
     },
 )
 
@@ -339,6 +353,20 @@ def preload_models(**kwargs):
 
     # Validate that all registered tasks have explicit queue routes
     _validate_task_routes()
+    _warn_summary_resume_disabled()
+
+
+def _warn_summary_resume_disabled():
+    """Warn when a retried multi-section summary cannot resume.
+
+    Finished sections are answered from the LLM response cache on retry;
+    with the cache off, a retry sends every section again.
+    """
+    if settings.LLM_STREAMING_ENABLED and not settings.LLM_RESPONSE_CACHE_ENABLED:
+        logger.warning(
+            "LLM_STREAMING_ENABLED is on but LLM_RESPONSE_CACHE_ENABLED is off: "
+            "a retried multi-section summary will regenerate every section"
+        )
 
 
 def _validate_task_routes():
@@ -383,3 +411,11 @@ def close_session_after_task(**kwargs):
     from app.db.base import engine
 
     engine.dispose()
+
+
+@task_postrun.connect
+def flush_notifications_after_task(**kwargs):
+    """Publish progress notifications the finished task left coalesced in the buffer."""
+    from app.tasks.transcription.notifications import flush_pending_notifications
+
+    flush_pending_notifications()
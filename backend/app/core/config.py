@@ -264,6 +264,9 @@ class Settings(BaseSettings):
     MINIO_PORT: str = os.getenv("MINIO_PORT", "9000")
     MINIO_SECURE: bool = os.getenv("MINIO_SECURE", "false").lower() == "true"
     MEDIA_BUCKET_NAME: str = os.getenv("MEDIA_BUCKET_NAME", "opentranscribe")
+    # Reuse preprocessed audio, waveforms, thumbnails and raw model outputs
+    # across uploads of the same content (keyed by imohash under artifacts/)
+    ARTIFACT_CACHE_ENABLED: bool = os.getenv("ARTIFACT_CACHE_ENABLED", "true").lower() == "true"
 
     # Presigned URL expiration settings (AWS/GCS best practices: shortest practical time)
     # Video URLs: 5 minutes default - refreshed automatically for long playback
@@ -286,6 +289,10 @@ class Settings(BaseSettings):
         "REDIS_URL",
         f"{_REDIS_SCHEME}://{':' + REDIS_PASSWORD + '@' if REDIS_PASSWORD else ''}{REDIS_HOST}:{REDIS_PORT}/0",
     )
+    # Minimum interval between progress notifications for the same file from a
+    # Celery worker. Intermediate updates are coalesced (latest wins); status
+    # changes to completed/error are always published immediately.
+    NOTIFICATION_PROGRESS_INTERVAL_MS: int = _int_env("NOTIFICATION_PROGRESS_INTERVAL_MS", 500)
 
     # OpenSearch settings
     OPENSEARCH_HOST: str = os.getenv("OPENSEARCH_HOST", "localhost")
@@ -299,6 +306,23 @@ class Settings(BaseSettings):
     OPENSEARCH_SUMMARY_INDEX: str = "transcript_summaries"
     OPENSEARCH_TOPIC_SUGGESTIONS_INDEX: str = "topic_suggestions"
     OPENSEARCH_TOPIC_VECTORS_INDEX: str = "topic_vectors"
+    # Local memory-mapped mirror of speaker embeddings for bulk similarity work
+    SPEAKER_EMBEDDING_STORE_ENABLED: bool = (
+        os.getenv("SPEAKER_EMBEDDING_STORE_ENABLED", "true").lower() == "true"
+    )
+    SPEAKER_EMBEDDING_STORE_DIR: str = os.getenv(
+        "SPEAKER_EMBEDDING_STORE_DIR",
+        os.path.join(os.getenv("DATA_DIR", "/app/data"), "speaker_embeddings"),
+    )
+    # Gender model: clips per forward pass, and the optional INT8 ONNX export on CPU
+    SPEAKER_ATTRIBUTE_BATCH_SIZE: int = _int_env("SPEAKER_ATTRIBUTE_BATCH_SIZE", 16)
+    SPEAKER_ATTRIBUTE_ONNX_ENABLED: bool = (
+        os.getenv("SPEAKER_ATTRIBUTE_ONNX_ENABLED", "false").lower() == "true"
+    )
+    SPEAKER_ATTRIBUTE_ONNX_PATH: str = os.getenv(
+        "SPEAKER_ATTRIBUTE_ONNX_PATH",
+        os.path.join(os.getenv("MODELS_DIR", "/app/models"), "onnx", "gender_wav2vec2_int8.onnx"),
+    )
 
     # Search & RAG settings
     OPENSEARCH_CHUNKS_INDEX: str = "transcript_chunks"
@@ -334,6 +358,14 @@ class Settings(BaseSettings):
     # normal search latency is unaffected. Tuned for 6+ hour transcripts.
     SEARCH_LARGE_TRANSCRIPT_CHUNKS: int = _int_env("SEARCH_LARGE_TRANSCRIPT_CHUNKS", 500)
 
+    # Serve search-as-you-type suggestions from the Redis suggestion index
+    # (app/services/search/suggestion_index.py) instead of prefix queries
+    # against the chunk index. The index is maintained either way; with this
+    # off, or until its first rebuild finishes, OpenSearch answers.
+    SEARCH_SUGGESTION_INDEX_ENABLED: bool = (
+        os.getenv("SEARCH_SUGGESTION_INDEX_ENABLED", "true").lower() == "true"
+    )
+
     # SQLAlchemy connection pool for the FastAPI backend. Celery workers build
     # their own engines, so these sizes mainly control API concurrency.
     DB_POOL_SIZE: int = max(_int_env("DB_POOL_SIZE", 20), 1)
@@ -439,6 +471,36 @@ class Settings(BaseSettings):
     # LLM Configuration - Users configure through web UI, stored in database
     # These are system fallbacks for quick access when no user settings exist
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "")
+    # Reuse LLM responses for identical enrichment prompts (summary, topics,
+    # speaker ID) across retries and re-runs; entries live in Redis db 1
+    LLM_RESPONSE_CACHE_ENABLED: bool = (
+        os.getenv("LLM_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = _int_env("LLM_RESPONSE_CACHE_TTL_SECONDS", 604800)
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = _int_env("LLM_RESPONSE_CACHE_MAX_ENTRIES", 5000)
+    LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES: int = _int_env("LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES", 262144)
+    # Produce summary, topic suggestions and speaker ID in one request when
+    # the whole transcript fits in the model's context window
+    LLM_COMBINED_ENRICHMENT: bool = os.getenv("LLM_COMBINED_ENRICHMENT", "false").lower() == "true"
+    # Cluster-wide admission control for LLM requests (Redis db 1). Each
+    # endpoint gets an adaptive concurrency limit between MIN and MAX, an
+    # optional tokens-per-minute budget and a shared 429/503 backoff
+    LLM_SCHEDULER_ENABLED: bool = os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() == "true"
+    LLM_SCHEDULER_MAX_CONCURRENCY: int = _int_env("LLM_SCHEDULER_MAX_CONCURRENCY", 4)
+    LLM_SCHEDULER_MIN_CONCURRENCY: int = _int_env("LLM_SCHEDULER_MIN_CONCURRENCY", 1)
+    LLM_SCHEDULER_TOKENS_PER_MINUTE: int = _int_env("LLM_SCHEDULER_TOKENS_PER_MINUTE", 0)
+    LLM_SCHEDULER_MAX_WAIT_SECONDS: int = _int_env("LLM_SCHEDULER_MAX_WAIT_SECONDS", 1800)
+    LLM_SCHEDULER_MAX_BACKOFF_SECONDS: int = _int_env("LLM_SCHEDULER_MAX_BACKOFF_SECONDS", 120)
+    # Shrink the limit when latency per 1k tokens exceeds this multiple of
+    # the endpoint's baseline
+    LLM_SCHEDULER_LATENCY_FACTOR: float = float(os.getenv("LLM_SCHEDULER_LATENCY_FACTOR", "2.0"))
+    # Tokenizer used to size transcript chunks: a tokenizer.json path or
+    # Hugging Face repo id. Empty picks tiktoken / the vLLM model's tokenizer /
+    # the server's /tokenize endpoint, falling back to a heuristic
+    LLM_TOKENIZER_PATH: str = os.getenv("LLM_TOKENIZER_PATH", "")
+    # Stream summary generation so partial output reaches the user as it is
+    # produced and a long completion is not lost to a single request timeout
+    LLM_STREAMING_ENABLED: bool = os.getenv("LLM_STREAMING_ENABLED", "true").lower() == "true"
 
     # LDAP/Active Directory Configuration
     LDAP_ENABLED: bool = os.getenv("LDAP_ENABLED", "false").lower() == "true"
@@ -608,6 +670,11 @@ class Settings(BaseSettings):
     CLOUD_ASR_EXTRACT_EMBEDDINGS: bool = (
         os.getenv("CLOUD_ASR_EXTRACT_EMBEDDINGS", "true").lower() == "true"
     )
+    # Long audio is split at pauses into chunks of about this many seconds,
+    # compressed and sent to cloud ASR concurrently (0 sends the whole file)
+    CLOUD_ASR_CHUNK_SECONDS: int = _int_env("CLOUD_ASR_CHUNK_SECONDS", 600)
+    # Upper bound on in-flight chunk requests per provider per worker process
+    CLOUD_ASR_CHUNK_CONCURRENCY: int = max(_int_env("CLOUD_ASR_CHUNK_CONCURRENCY", 4), 1)
     DEPLOYMENT_MODE: str = os.getenv("DEPLOYMENT_MODE", "full")  # full or lite
 
     # ===== OpenSearch Toggle =====
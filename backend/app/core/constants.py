@@ -320,6 +320,9 @@ NOTIFICATION_TYPE_MIGRATION_PROGRESS = "migration_progress"
 NOTIFICATION_TYPE_MIGRATION_COMPLETE = "migration_complete"
 NOTIFICATION_TYPE_MIGRATION_FINALIZED = "migration_finalized"
 
+# Bulk transcript export notification types
+NOTIFICATION_TYPE_BULK_EXPORT_COMPLETE = "bulk_export_complete"
+
 # Speaker clustering notification types
 NOTIFICATION_TYPE_CLUSTERING_PROGRESS = "clustering_progress"
 NOTIFICATION_TYPE_CLUSTERING_COMPLETE = "clustering_complete"
@@ -405,6 +408,21 @@ SPEAKER_SHORT_SEGMENT_MIN_DURATION = (
     0.5  # Fallback for speakers whose total merged time never reaches 1s
 )
 
+# Batched embedding inference: segments are sorted by length and grouped so the
+# longest clip in a batch is at most SPEAKER_EMBEDDING_MAX_PAD_RATIO x the shortest.
+SPEAKER_EMBEDDING_BATCH_SIZE = 16
+SPEAKER_EMBEDDING_MAX_PAD_RATIO = 1.25
+
+# Bulk subtitle/transcript ZIP export. Files are rendered in batches of
+# BULK_EXPORT_BATCH_SIZE (one segment query per batch) by a thread pool, with
+# at most BULK_EXPORT_WORKERS + 1 batches in flight so memory stays flat.
+# Selections above BULK_EXPORT_ASYNC_THRESHOLD are built by a Celery task and
+# delivered as a presigned MinIO link instead of a streamed response.
+BULK_EXPORT_BATCH_SIZE = 25
+BULK_EXPORT_WORKERS = 4
+BULK_EXPORT_ASYNC_THRESHOLD = 500
+BULK_EXPORT_URL_EXPIRY = 86400  # 24 hours
+
 # Transcription settings defaults
 DEFAULT_TRANSCRIPTION_MIN_SPEAKERS = 1
 DEFAULT_TRANSCRIPTION_MAX_SPEAKERS = 20
@@ -277,6 +277,18 @@ async def _run_thumbnail_migration():
         logger.error(f"Error scheduling thumbnail migration: {e}")
 
 
+async def _run_word_timings_migration():
+    """Schedule conversion of legacy JSONB word timestamps after a delay."""
+    try:
+        await asyncio.sleep(50)  # Wait for other startup tasks
+        from app.tasks.word_timings_migration import migrate_word_timings_to_binary
+
+        result = migrate_word_timings_to_binary.delay()
+        logger.info(f"Word timings migration task scheduled: {result.id}")
+    except Exception as e:
+        logger.error(f"Error scheduling word timings migration: {e}")
+
+
 async def _run_one_time_embedding_normalization():
     """One-time migration: normalize legacy embeddings for users upgrading.
 
@@ -523,6 +535,7 @@ async def lifespan(app: FastAPI):
     recovery_task = asyncio.create_task(_run_startup_recovery())
     search_maintenance = asyncio.create_task(_run_search_maintenance())
     thumbnail_migration = asyncio.create_task(_run_thumbnail_migration())
+    word_timings_migration = asyncio.create_task(_run_word_timings_migration())
     neural_search_task = asyncio.create_task(_initialize_neural_search())
     embedding_migration = asyncio.create_task(_run_one_time_embedding_normalization())
 
@@ -534,6 +547,7 @@ async def lifespan(app: FastAPI):
         recovery_task,
         search_maintenance,
         thumbnail_migration,
+        word_timings_migration,
         neural_search_task,
         embedding_migration,
     ]:
@@ -7,11 +7,13 @@ from sqlalchemy import Enum as SAEnum
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
 from sqlalchemy import String
 from sqlalchemy import Text
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -65,7 +67,9 @@ class MediaFile(Base):
     metadata_important = Column(JSONB, nullable=True)  # Important metadata for display
 
     # Waveform visualization data
-    waveform_data = Column(JSONB, nullable=True)  # Cached waveform data for visualization
+    waveform_data = Column(JSONB, nullable=True)  # Waveform marker (or legacy per-width cache)
+    # Binary min/max/RMS peak pyramid (app.utils.waveform_pyramid); loaded only on access
+    waveform_pyramid = deferred(Column(LargeBinary, nullable=True))
 
     # Media technical specs
     media_format = Column(String, nullable=True)  # Container format (MP4, MOV, etc.)
@@ -173,9 +177,11 @@ class TranscriptSegment(Base):
         UUID(as_uuid=True), nullable=True, index=True
     )  # Groups overlapping segments together
     overlap_confidence = Column(Float, nullable=True)  # Confidence of overlap detection
-    words = Column(
-        JSONB, nullable=True
-    )  # Word-level timestamps: [{"word": "...", "start": 0.1, "end": 0.25, "score": 0.95}]
+    # Packed word-level timestamps (app.utils.word_timings); loaded only on access
+    word_timings = deferred(Column(LargeBinary, nullable=True))
+    # Legacy JSONB word timestamps: [{"word": "...", "start": 0.1, "end": 0.25, "score": 0.95}],
+    # converted to word_timings by migrate_word_timings_to_binary
+    words = deferred(Column(JSONB, nullable=True))
     confidence = Column(Float, nullable=True)  # ASR confidence score (0.0–1.0)
 
     # Relationships
@@ -264,6 +270,18 @@ class Speaker(Base):
     status_color = Column(String, nullable=True)  # CSS color for status display
     resolved_display_name = Column(String, nullable=True)  # Best available display name
 
+    # Denormalized summary for the speaker directory (maintained by SpeakerSummaryService)
+    segment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    first_segment_times = Column(
+        JSONB, nullable=True
+    )  # [{"uuid", "start_time", "segment_index"}] for the first 4 segments
+    top_suggestion_name = Column(String(255), nullable=True)
+    top_suggestion_confidence = Column(Float, nullable=True)
+    top_suggestion_type = Column(
+        String(50), nullable=True
+    )  # "profile", "llm_analysis", "voice_match", ...
+    summary_updated_at = Column(DateTime(timezone=True), nullable=True)
+
     # AI-predicted voice attributes
     predicted_gender = Column(String(20), nullable=True)  # "male", "female", "unknown"
     predicted_age_range = Column(
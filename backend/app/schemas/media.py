@@ -40,6 +40,33 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
+class PostprocessSettings(BaseModel):
+    """Post-processing settings for the ``repostprocess`` stage.
+
+    Unset fields keep the transcription pipeline defaults. Speaker-count
+    constraints come from ``ReprocessRequest.num_speakers``/``max_speakers``.
+    """
+
+    enable_sentence_splitting: Optional[bool] = Field(
+        None, description="Split multi-sentence segments"
+    )
+    enable_dedup: Optional[bool] = Field(None, description="Remove overlapping duplicate segments")
+    dedup_overlap_threshold: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of a segment that must overlap another to count as a duplicate",
+    )
+    resegment_by_speaker: Optional[bool] = Field(
+        None, description="Split segments at speaker changes between words"
+    )
+    merge_max_duration: Optional[float] = Field(
+        None,
+        ge=0.0,
+        description="Maximum seconds when merging consecutive same-speaker segments (0 = no merge)",
+    )
+
+
 class ReprocessRequest(BaseModel):
     """Request schema for reprocessing a file with optional speaker diarization settings.
 
@@ -48,12 +75,14 @@ class ReprocessRequest(BaseModel):
         min_speakers: Optional minimum number of speakers for diarization
         max_speakers: Optional maximum number of speakers for diarization
         num_speakers: Optional fixed number of speakers for diarization (overrides min/max)
+        postprocess: Optional settings for the ``repostprocess`` stage
     """
 
     stages: list[
         Literal[
             "transcription",
             "rediarize",
+            "repostprocess",
             "search_indexing",
             "analytics",
             "speaker_llm",
@@ -85,6 +114,11 @@ class ReprocessRequest(BaseModel):
         "Only applies to local ASR provider.",
         examples=["tiny", "medium", "large-v2", "large-v3", "large-v3-turbo"],
     )
+    postprocess: Optional[PostprocessSettings] = Field(
+        None,
+        description="Post-processing settings for the 'repostprocess' stage, which rebuilds "
+        "the transcript from saved model outputs on CPU without re-running inference",
+    )
 
     @field_validator("min_speakers", "max_speakers", "num_speakers")
     @classmethod
@@ -485,11 +519,13 @@ class PaginatedMediaFileResponse(BaseModel):
     """Paginated response for media file listings."""
 
     items: list[MediaFile]
-    total: int  # Total files matching filters
-    page: int  # Current page (1-indexed)
+    total: Optional[int]  # Total files matching filters (None if cursor mode skipped it)
+    page: Optional[int]  # Current page (1-indexed); None in cursor mode
     page_size: int  # Items per page
-    total_pages: int  # Total pages
+    total_pages: Optional[int]  # Total pages
     has_more: bool  # Convenience for infinite scroll
+    next_cursor: Optional[str] = None  # Opaque cursor for the next page (cursor mode)
+    total_is_estimate: bool = False  # True when total came from the listing count cache
 
 
 class TagBase(BaseModel):
@@ -183,6 +183,11 @@ class ReclusterRequest(BaseModel):
     threshold: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Clustering threshold (default 0.75)"
     )
+    incremental: bool = Field(
+        default=False,
+        description="Only cluster speakers added since the last re-cluster, keeping "
+        "existing clusters (falls back to a full re-cluster on first run)",
+    )
 
 
 class ReclusterResponse(BaseModel):
@@ -0,0 +1,468 @@
+"""
+Content-addressed artifact cache keyed by imohash.
+
+Derived artifacts of a media file depend only on its bytes and on the
+settings used to produce them: the preprocessed 16 kHz WAV, the waveform
+pyramid, the video thumbnail, and the raw Whisper and PyAnnote outputs.
+Each is stored once in the media bucket under::
+
+    artifacts/{imohash}/{kind}-{fingerprint}.{ext}
+
+``fingerprint`` hashes the model/config parameters of that artifact, so a
+settings change misses instead of serving a stale result. Re-uploads,
+duplicates across users and reprocess runs with unchanged settings then
+skip FFmpeg and GPU work.
+
+imohash only samples the file and is not collision-resistant. Every object
+therefore records the owner and the MinIO ETag of the source object it was
+built from. A hit is only accepted when the ETags match, even for the same
+owner, so neither a crafted upload that collides on imohash nor a user's own
+edited re-upload can be served artifacts of different bytes.
+
+Every helper is best-effort: failures are logged and treated as a miss,
+never as a pipeline error.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from app.core.config import settings
+from app.services.minio_service import minio_client
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from app.transcription.config import TranscriptionConfig
+    from app.transcription.diarize_result import DiarizeResult
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PREFIX = "artifacts"
+
+# Bump when the FFmpeg audio preprocessing (16 kHz mono PCM WAV) changes
+AUDIO_PREPROCESS_VERSION = 1
+
+_META_PREFIX = "x-amz-meta-"
+_META_OWNER = "owner"
+_META_SOURCE_ETAG = "source-etag"
+
+
+@dataclass(frozen=True)
+class ArtifactSource:
+    """Identity of the media bytes an artifact is derived from."""
+
+    imohash: str
+    owner_id: int
+    source_etag: str | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> ArtifactSource | None:
+        """Rebuild from a Celery context dict; None when caching is off for the file."""
+        if not data or not data.get("imohash"):
+            return None
+        return cls(
+            imohash=str(data["imohash"]),
+            owner_id=int(data["owner_id"]),
+            source_etag=data.get("source_etag"),
+        )
+
+
+def artifact_fingerprint(params: Mapping[str, Any]) -> str:
+    """Short stable hash of the settings an artifact was produced with."""
+    payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def artifact_key(imohash: str, kind: str, fingerprint: str, ext: str) -> str:
+    """Object key for one artifact of a file."""
+    return f"{ARTIFACT_PREFIX}/{imohash}/{kind}-{fingerprint}.{ext}"
+
+
+def is_trusted(metadata: Mapping[str, str], source: ArtifactSource) -> bool:
+    """Whether an artifact with ``metadata`` may be served for ``source``.
+
+    Only artifacts built from a byte-identical source object are accepted,
+    whoever owns them: imohash samples the file, so an owner's replaced or
+    edited upload can share the hash of its predecessor.
+    """
+    stored_etag = metadata.get(_META_SOURCE_ETAG)
+    return bool(stored_etag) and stored_etag == source.source_etag
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+
+def audio_fingerprint() -> str:
+    return artifact_fingerprint(
+        {"version": AUDIO_PREPROCESS_VERSION, "sample_rate": 16000, "channels": 1}
+    )
+
+
+def waveform_fingerprint(sample_rate: int) -> str:
+    from app.utils.waveform_pyramid import PYRAMID_VERSION
+    from app.utils.waveform_pyramid import WAVEFORM_PYRAMID_BASE_BINS
+    from app.utils.waveform_pyramid import WAVEFORM_PYRAMID_MIN_BINS
+
+    return artifact_fingerprint(
+        {
+            "version": PYRAMID_VERSION,
+            "sample_rate": sample_rate,
+            "base_bins": WAVEFORM_PYRAMID_BASE_BINS,
+            "min_bins": WAVEFORM_PYRAMID_MIN_BINS,
+        }
+    )
+
+
+def thumbnail_fingerprint(timestamp: float) -> str:
+    from app.core.constants import THUMBNAIL_MAX_DIMENSION
+    from app.core.constants import THUMBNAIL_QUALITY_WEBP
+
+    return artifact_fingerprint(
+        {
+            "timestamp": timestamp,
+            "format": "webp",
+            "max_dimension": THUMBNAIL_MAX_DIMENSION,
+            "quality": THUMBNAIL_QUALITY_WEBP,
+        }
+    )
+
+
+def transcription_fingerprint(config: TranscriptionConfig) -> str:
+    """Fingerprint of every setting that changes faster-whisper's raw output."""
+    return artifact_fingerprint(
+        {
+            "audio": AUDIO_PREPROCESS_VERSION,
+            "model": config.model_name,
+            "compute_type": config.compute_type,
+            "device": config.device,
+            "beam_size": config.beam_size,
+            "batch_size": config.batch_size,
+            "source_language": config.source_language,
+            "translate_to_english": config.translate_to_english,
+            "vad_threshold": config.vad_threshold,
+            "vad_min_silence_ms": config.vad_min_silence_ms,
+            "vad_min_speech_ms": config.vad_min_speech_ms,
+            "vad_speech_pad_ms": config.vad_speech_pad_ms,
+            "hallucination_silence_threshold": config.hallucination_silence_threshold,
+            "repetition_penalty": config.repetition_penalty,
+        }
+    )
+
+
+def diarization_fingerprint(config: TranscriptionConfig) -> str:
+    """Fingerprint of every setting that changes PyAnnote's raw output."""
+    from app.transcription.diarizer import PYANNOTE_V4_MODEL
+
+    settings_key = {
+        "audio": AUDIO_PREPROCESS_VERSION,
+        "model": PYANNOTE_V4_MODEL,
+        "min_speakers": config.min_speakers,
+        "max_speakers": config.max_speakers,
+        "num_speakers": config.num_speakers,
+        "native_embeddings": config.enable_native_embeddings,
+        "overlap_detection": config.enable_overlap_detection,
+        "overlap_min_duration": config.overlap_min_duration,
+    }
+    # Only non-default backends join the key, so PyTorch artifacts stay valid
+    if config.diarization_backend != "pytorch":
+        settings_key["backend"] = config.diarization_backend
+        settings_key["onnx_int8"] = config.diarization_onnx_int8
+    return artifact_fingerprint(settings_key)
+
+
+# ---------------------------------------------------------------------------
+# Source resolution
+# ---------------------------------------------------------------------------
+
+
+def resolve_source(
+    imohash: str | None, owner_id: int, storage_path: str | None
+) -> ArtifactSource | None:
+    """Build the cache identity of a stored media object.
+
+    Returns None when the cache is disabled or the file has no imohash
+    (uploads that predate fingerprinting).
+    """
+    if not settings.ARTIFACT_CACHE_ENABLED or not imohash:
+        return None
+    source_etag = None
+    if storage_path:
+        try:
+            stat = minio_client.stat_object(settings.MEDIA_BUCKET_NAME, storage_path)
+            source_etag = stat.etag
+        except Exception as e:
+            logger.debug(f"Could not stat {storage_path} for artifact cache: {e}")
+    return ArtifactSource(imohash=imohash, owner_id=owner_id, source_etag=source_etag)
+
+
+def source_for_file(file_id: int) -> ArtifactSource | None:
+    """Resolve the cache identity of a media file by ID."""
+    if not settings.ARTIFACT_CACHE_ENABLED:
+        return None
+    from app.db.session_utils import session_scope
+    from app.models.media import MediaFile
+
+    try:
+        with session_scope() as db:
+            media_file = db.query(MediaFile).filter(MediaFile.id == file_id).first()
+            if media_file is None:
+                return None
+            imohash = str(media_file.imohash) if media_file.imohash else None
+            owner_id = int(media_file.user_id)
+            storage_path = str(media_file.storage_path) if media_file.storage_path else None
+    except Exception as e:
+        logger.debug(f"Artifact source lookup failed for file {file_id}: {e}")
+        return None
+    return resolve_source(imohash, owner_id, storage_path)
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+
+def _user_metadata(headers: Mapping[str, str]) -> dict[str, str]:
+    """``x-amz-meta-*`` headers with the prefix stripped and keys lowercased."""
+    return {
+        key.lower()[len(_META_PREFIX) :]: value
+        for key, value in headers.items()
+        if key.lower().startswith(_META_PREFIX)
+    }
+
+
+def _metadata_for(source: ArtifactSource) -> dict[str, str]:
+    metadata = {_META_OWNER: str(source.owner_id)}
+    if source.source_etag:
+        metadata[_META_SOURCE_ETAG] = source.source_etag
+    return metadata
+
+
+def fetch_file(
+    source: ArtifactSource, kind: str, fingerprint: str, ext: str, local_path: str
+) -> bool:
+    """Download a trusted artifact to ``local_path``. Returns True on a hit."""
+    key = artifact_key(source.imohash, kind, fingerprint, ext)
+    try:
+        stat = minio_client.stat_object(settings.MEDIA_BUCKET_NAME, key)
+        if not is_trusted(_user_metadata(stat.metadata or {}), source):
+            logger.info(f"Ignoring untrusted artifact {key}")
+            return False
+        minio_client.fget_object(settings.MEDIA_BUCKET_NAME, key, local_path)
+        return True
+    except Exception as e:
+        logger.debug(f"Artifact miss for {key}: {e}")
+        return False
+
+
+def fetch_bytes(source: ArtifactSource, kind: str, fingerprint: str, ext: str) -> bytes | None:
+    """Read a trusted artifact into memory, or None on a miss."""
+    key = artifact_key(source.imohash, kind, fingerprint, ext)
+    response = None
+    try:
+        response = minio_client.get_object(settings.MEDIA_BUCKET_NAME, key)
+        if not is_trusted(_user_metadata(response.headers), source):
+            logger.info(f"Ignoring untrusted artifact {key}")
+            return None
+        return bytes(response.read())
+    except Exception as e:
+        logger.debug(f"Artifact miss for {key}: {e}")
+        return None
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
+def store_file(
+    source: ArtifactSource,
+    kind: str,
+    fingerprint: str,
+    ext: str,
+    local_path: str,
+    content_type: str,
+) -> None:
+    """Upload an artifact from disk (best-effort)."""
+    key = artifact_key(source.imohash, kind, fingerprint, ext)
+    try:
+        minio_client.fput_object(
+            settings.MEDIA_BUCKET_NAME,
+            key,
+            local_path,
+            content_type=content_type,
+            metadata=_metadata_for(source),  # type: ignore[arg-type]
+        )
+        logger.info(f"Stored artifact {key}")
+    except Exception as e:
+        logger.warning(f"Failed to store artifact {key} (non-fatal): {e}")
+
+
+def store_bytes(
+    source: ArtifactSource,
+    kind: str,
+    fingerprint: str,
+    ext: str,
+    data: bytes,
+    content_type: str,
+) -> None:
+    """Upload an in-memory artifact (best-effort)."""
+    key = artifact_key(source.imohash, kind, fingerprint, ext)
+    try:
+        minio_client.put_object(
+            settings.MEDIA_BUCKET_NAME,
+            key,
+            io.BytesIO(data),
+            len(data),
+            content_type=content_type,
+            metadata=_metadata_for(source),  # type: ignore[arg-type]
+        )
+        logger.info(f"Stored artifact {key} ({len(data)} bytes)")
+    except Exception as e:
+        logger.warning(f"Failed to store artifact {key} (non-fatal): {e}")
+
+
+def _json_default(obj: Any) -> Any:
+    # numpy scalars and arrays from the model outputs
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def fetch_json(source: ArtifactSource, kind: str, fingerprint: str) -> Any | None:
+    data = fetch_bytes(source, kind, fingerprint, "json.gz")
+    if data is None:
+        return None
+    try:
+        return json.loads(gzip.decompress(data))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable {kind} artifact for {source.imohash}: {e}")
+        return None
+
+
+def store_json(source: ArtifactSource, kind: str, fingerprint: str, payload: Any) -> None:
+    try:
+        data = gzip.compress(json.dumps(payload, default=_json_default).encode(), compresslevel=6)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Could not serialise {kind} artifact for {source.imohash}: {e}")
+        return
+    store_bytes(source, kind, fingerprint, "json.gz", data, "application/gzip")
+
+
+def purge_artifacts(imohash: str) -> int:
+    """Delete every artifact of a fingerprint. Returns the number removed."""
+    removed = 0
+    try:
+        for obj in minio_client.list_objects(
+            settings.MEDIA_BUCKET_NAME, prefix=f"{ARTIFACT_PREFIX}/{imohash}/", recursive=True
+        ):
+            minio_client.remove_object(settings.MEDIA_BUCKET_NAME, obj.object_name)
+            removed += 1
+    except Exception as e:
+        logger.warning(f"Failed to purge artifacts for {imohash} (non-fatal): {e}")
+    return removed
+
+
+def purge_if_orphaned(db: Session, imohash: str | None) -> None:
+    """Delete a fingerprint's artifacts once no media file references it.
+
+    Called after a media file is deleted so derived copies of its content
+    do not outlive every upload of it.
+    """
+    if not imohash:
+        return
+    from app.models.media import MediaFile
+
+    try:
+        still_referenced = (
+            db.query(MediaFile.id).filter(MediaFile.imohash == imohash).first() is not None
+        )
+    except Exception as e:
+        logger.debug(f"Artifact reference check failed for {imohash}: {e}")
+        return
+    if not still_referenced:
+        removed = purge_artifacts(imohash)
+        if removed:
+            logger.info(f"Purged {removed} cached artifacts for {imohash}")
+
+
+# ---------------------------------------------------------------------------
+# Raw transcription outputs
+# ---------------------------------------------------------------------------
+
+
+class TranscriptionArtifacts:
+    """Raw Whisper and PyAnnote outputs of one file under one configuration.
+
+    Passed to ``TranscriptionPipeline.process``, which loads whichever stage
+    is cached and stores the output of any stage it had to run.
+    """
+
+    def __init__(self, source: ArtifactSource, config: TranscriptionConfig) -> None:
+        self.source = source
+        self.transcript_fingerprint = transcription_fingerprint(config)
+        self.diarization_fingerprint = diarization_fingerprint(config)
+
+    def load_transcript(self) -> dict | None:
+        transcript = fetch_json(self.source, "transcript", self.transcript_fingerprint)
+        if transcript is not None:
+            logger.info(f"Reusing cached Whisper output for {self.source.imohash}")
+        return transcript
+
+    def save_transcript(self, transcript: dict) -> None:
+        store_json(self.source, "transcript", self.transcript_fingerprint, transcript)
+
+    def load_diarization(
+        self,
+    ) -> tuple[DiarizeResult, dict, dict[str, Any] | None] | None:
+        payload = fetch_json(self.source, "diarization", self.diarization_fingerprint)
+        if payload is None:
+            return None
+        import numpy as np
+
+        from app.transcription.diarize_result import DiarizeResult
+
+        try:
+            diarize_df = DiarizeResult.from_records(payload["segments"])
+            embeddings = payload.get("native_embeddings")
+            native_embeddings = (
+                {label: np.asarray(vec, dtype=np.float32) for label, vec in embeddings.items()}
+                if embeddings
+                else None
+            )
+            overlap_info = payload.get("overlap_info") or {}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Malformed diarization artifact for {self.source.imohash}: {e}")
+            return None
+        logger.info(f"Reusing cached PyAnnote output for {self.source.imohash}")
+        return diarize_df, overlap_info, native_embeddings
+
+    def save_diarization(
+        self,
+        diarize_df: DiarizeResult,
+        overlap_info: dict,
+        native_embeddings: dict[str, Any] | None,
+    ) -> None:
+        store_json(
+            self.source,
+            "diarization",
+            self.diarization_fingerprint,
+            {
+                "segments": diarize_df.to_records(),
+                "overlap_info": overlap_info,
+                "native_embeddings": native_embeddings,
+            },
+        )
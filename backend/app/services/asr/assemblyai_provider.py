@@ -24,6 +24,10 @@ _MIN_GAP = 0.5  # seconds — silence gap that triggers a new segment
 
 
 class AssemblyAIProvider(ASRProvider):
+    upload_codec = "opus"
+    # Free accounts process 5 transcripts at a time; more are only queued
+    max_concurrent_chunks = 5
+
     def __init__(self, api_key: str, model_name: str = "universal"):
         self._api_key = api_key
         self._model_name = model_name
@@ -33,6 +33,8 @@ _MIN_GAP = 0.5  # seconds — silence gap that triggers a new segment
 
 
 class AWSTranscribeProvider(ASRProvider):
+    upload_codec = "flac"
+
     def __init__(
         self,
         region: str = "us-east-1",
@@ -45,6 +45,8 @@ _TICKS_PER_SEC = 10_000_000
 
 
 class AzureASRProvider(ASRProvider):
+    upload_codec = "wav"
+
     def __init__(self, api_key: str, region: str = "eastus", model_name: str = "whisper"):
         self._api_key = api_key
         self._region = region
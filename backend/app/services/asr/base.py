@@ -13,6 +13,15 @@ from .types import ASRResult
 class ASRProvider(ABC):
     """Abstract base for all ASR provider implementations."""
 
+    # Codec long audio is re-encoded to for chunked upload ("opus", "flac" or
+    # "wav"); None sends the original file untouched. See chunked.py.
+    upload_codec: str | None = None
+    # Most chunk requests this provider may have in flight per worker process.
+    # Rate-limited providers lower it; CLOUD_ASR_CHUNK_CONCURRENCY caps it too.
+    max_concurrent_chunks: int = 4
+    # Provider returns speaker labels even when diarization is not requested
+    always_diarizes: bool = False
+
     @abstractmethod
     def transcribe(
         self,
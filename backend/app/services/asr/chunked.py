@@ -0,0 +1,361 @@
+"""Chunked, concurrent transcription of long audio with cloud ASR providers.
+
+Sending a multi-hour 16 kHz PCM WAV in one request is slow and runs into
+provider upload limits (OpenAI rejects anything over 25 MB, about 13 minutes
+of WAV). ``transcribe_chunked`` wraps any provider's ``transcribe``:
+
+1. ffmpeg ``silencedetect`` finds pauses, and the audio is cut near every
+   ``CLOUD_ASR_CHUNK_SECONDS`` at the longest pause in a window before the
+   target. Where no pause exists the cut is hard and both neighbours get
+   ``_HARD_CUT_OVERLAP`` seconds of extra audio.
+2. Each chunk is encoded to the provider's ``upload_codec`` (Opus or FLAC;
+   WAV for providers that only take PCM) and transcribed on a thread pool.
+   A per-provider semaphore caps in-flight chunks across every file the
+   worker process is handling.
+3. Segment and word times are shifted by the chunk offset. Each chunk owns
+   the span between its cuts, and words (or segments without words) whose
+   midpoint falls outside that span are dropped, so overlapped audio is
+   never transcribed twice.
+
+Provider diarization labels are only consistent within one request, so when
+the provider diarizes the file goes out as a single compressed chunk instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Callable
+from typing import NamedTuple
+
+import ffmpeg
+
+from app.core.config import settings
+
+from .base import ASRProvider
+from .types import ASRConfig
+from .types import ASRResult
+from .types import ASRSegment
+
+logger = logging.getLogger(__name__)
+
+# Pause detection
+_SILENCE_NOISE_DB = -35
+_SILENCE_MIN_SECONDS = 0.3
+# Cuts are searched for in the last quarter of each target chunk length
+_CUT_SEARCH_FRACTION = 0.25
+# A final chunk shorter than this fraction of the target is merged into the previous one
+_MIN_TAIL_FRACTION = 0.25
+_HARD_CUT_OVERLAP = 2.0  # seconds
+_CHUNK_ATTEMPTS = 2
+
+# ffmpeg output options and file extension per upload codec
+_CODECS: dict[str, tuple[str, dict]] = {
+    "opus": ("ogg", {"acodec": "libopus", "audio_bitrate": "32k"}),
+    "flac": ("flac", {"acodec": "flac"}),
+    "wav": ("wav", {"acodec": "pcm_s16le"}),
+}
+
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[\d.]+)")
+
+_slots_lock = threading.Lock()
+_provider_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+class AudioChunk(NamedTuple):
+    """One upload unit.
+
+    ``start``/``end`` is the span whose transcript the chunk owns;
+    ``audio_start``/``audio_end`` is the audio actually sent, which extends
+    past hard cuts by the overlap.
+    """
+
+    index: int
+    start: float
+    end: float
+    audio_start: float
+    audio_end: float
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_seconds: float,
+    overlap: float = _HARD_CUT_OVERLAP,
+) -> list[AudioChunk]:
+    """Split ``[0, duration]`` into chunks of about ``target_seconds``.
+
+    Each cut is placed in the middle of the longest pause whose midpoint lies
+    in the last ``_CUT_SEARCH_FRACTION`` of the target span. Without one, the
+    cut is made at the target and padded with ``overlap`` on both sides.
+    """
+    if duration <= 0 or target_seconds <= 0:
+        return [AudioChunk(0, 0.0, max(duration, 0.0), 0.0, max(duration, 0.0))]
+
+    cuts: list[tuple[float, bool]] = []  # (time, is_hard_cut)
+    pos = 0.0
+    while duration - pos > target_seconds * (1 + _MIN_TAIL_FRACTION):
+        ideal = pos + target_seconds
+        window_start = ideal - target_seconds * _CUT_SEARCH_FRACTION
+        candidates = [
+            (end - start, (start + end) / 2)
+            for start, end in silences
+            if window_start <= (start + end) / 2 <= ideal
+        ]
+        if candidates:
+            _, cut = max(candidates, key=lambda c: (c[0], c[1]))
+            cuts.append((cut, False))
+        else:
+            cut = ideal
+            cuts.append((cut, True))
+        pos = cut
+
+    chunks: list[AudioChunk] = []
+    bounds = [(0.0, False), *cuts, (duration, False)]
+    for i in range(len(bounds) - 1):
+        start, hard_before = bounds[i]
+        end, hard_after = bounds[i + 1]
+        chunks.append(
+            AudioChunk(
+                index=i,
+                start=start,
+                end=end,
+                audio_start=max(0.0, start - overlap) if hard_before else start,
+                audio_end=min(duration, end + overlap) if hard_after else end,
+            )
+        )
+    return chunks
+
+
+def stitch_results(chunks: list[AudioChunk], results: list[ASRResult]) -> list[ASRSegment]:
+    """Merge per-chunk results onto the original timeline.
+
+    Times are offset by each chunk's ``audio_start``. Words whose midpoint is
+    outside the chunk's owned span are dropped (the neighbour owns them), and
+    a segment losing words has its text rebuilt from the words that remain.
+    """
+    merged: list[ASRSegment] = []
+    for chunk, result in zip(chunks, results):
+        offset = chunk.audio_start
+        is_last = chunk.index == len(chunks) - 1
+
+        def owned(start: float, end: float, chunk=chunk, is_last=is_last) -> bool:
+            mid = (start + end) / 2
+            return chunk.start <= mid and (mid < chunk.end or is_last)
+
+        for seg in result.segments:
+            start, end = seg.start + offset, seg.end + offset
+            words = []
+            for w in seg.words:
+                w_start, w_end = w.start + offset, w.end + offset
+                if owned(w_start, w_end):
+                    w.start, w.end = w_start, w_end
+                    words.append(w)
+
+            if seg.words:
+                if not words:
+                    continue
+                if len(words) < len(seg.words):
+                    seg.text = " ".join(w.word.strip() for w in words)
+                    start, end = words[0].start, words[-1].end
+            elif not owned(start, end):
+                continue
+
+            seg.start, seg.end, seg.words = start, end, words
+            merged.append(seg)
+
+    merged.sort(key=lambda s: (s.start, s.end))
+    return merged
+
+
+def _slots_for(provider: ASRProvider) -> threading.BoundedSemaphore:
+    """Process-wide limit on in-flight chunk requests for a provider."""
+    with _slots_lock:
+        slots = _provider_slots.get(provider.provider_name)
+        if slots is None:
+            limit = max(
+                1, min(provider.max_concurrent_chunks, settings.CLOUD_ASR_CHUNK_CONCURRENCY)
+            )
+            slots = threading.BoundedSemaphore(limit)
+            _provider_slots[provider.provider_name] = slots
+        return slots
+
+
+def _probe_duration(audio_path: str) -> float:
+    probe = ffmpeg.probe(audio_path)
+    return float(probe["format"]["duration"])
+
+
+def detect_silences(audio_path: str) -> list[tuple[float, float]]:
+    """Return ``(start, end)`` pauses found by ffmpeg ``silencedetect``."""
+    _, stderr = (
+        ffmpeg.input(audio_path)
+        .filter("silencedetect", noise=f"{_SILENCE_NOISE_DB}dB", d=_SILENCE_MIN_SECONDS)
+        .output("-", format="null")
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+    silences: list[tuple[float, float]] = []
+    start: float | None = None
+    for kind, value in _SILENCE_RE.findall(stderr.decode("utf-8", errors="replace")):
+        if kind == "start":
+            start = max(0.0, float(value))
+        elif start is not None:
+            silences.append((start, float(value)))
+            start = None
+    return silences
+
+
+def _encode_chunk(audio_path: str, chunk: AudioChunk, codec: str, out_dir: str) -> str:
+    """Cut and encode one chunk, returning the path of the encoded file."""
+    ext, options = _CODECS[codec]
+    out_path = os.path.join(out_dir, f"chunk_{chunk.index:04d}.{ext}")
+    (
+        ffmpeg.input(audio_path, ss=chunk.audio_start, t=chunk.audio_end - chunk.audio_start)
+        .output(out_path, ac=1, ar=16000, **options)
+        .run(quiet=True, overwrite_output=True)
+    )
+    return out_path
+
+
+def _transcribe_chunk(
+    provider: ASRProvider,
+    audio_path: str,
+    chunk: AudioChunk,
+    config: ASRConfig,
+    out_dir: str,
+) -> ASRResult:
+    """Encode and transcribe one chunk, retrying once on failure."""
+    with _slots_for(provider):
+        chunk_path = _encode_chunk(audio_path, chunk, provider.upload_codec or "wav", out_dir)
+        try:
+            attempt = 1
+            while True:
+                try:
+                    return provider.transcribe(chunk_path, config)
+                except FileNotFoundError:
+                    raise
+                except Exception as exc:
+                    if attempt >= _CHUNK_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        "%s chunk %d failed (attempt %d/%d), retrying: %s",
+                        provider.provider_name,
+                        chunk.index,
+                        attempt,
+                        _CHUNK_ATTEMPTS,
+                        exc,
+                    )
+                    attempt += 1
+        finally:
+            if os.path.exists(chunk_path):
+                os.remove(chunk_path)
+
+
+def _merge_language(results: list[ASRResult], requested: str) -> str:
+    """Most common detected language across chunks."""
+    counts: dict[str, int] = {}
+    for r in results:
+        if r.language and r.language != "auto":
+            counts[r.language] = counts.get(r.language, 0) + 1
+    return max(counts, key=counts.__getitem__) if counts else requested
+
+
+def transcribe_chunked(  # noqa: C901
+    provider: ASRProvider,
+    audio_path: str,
+    config: ASRConfig,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> ASRResult:
+    """Transcribe ``audio_path`` with ``provider``, chunking long audio.
+
+    Providers without an ``upload_codec`` (the local pipeline) and setups
+    with ``CLOUD_ASR_CHUNK_SECONDS=0`` go straight to ``provider.transcribe``.
+    """
+    codec = provider.upload_codec
+    target = settings.CLOUD_ASR_CHUNK_SECONDS
+    if codec is None or target <= 0:
+        return provider.transcribe(audio_path, config, progress_callback)
+
+    if not os.path.exists(audio_path):
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    try:
+        duration = _probe_duration(audio_path)
+        diarized = provider.always_diarizes or (
+            config.enable_diarization and provider.supports_diarization()
+        )
+        if diarized or duration <= target * (1 + _MIN_TAIL_FRACTION):
+            chunks = plan_chunks(duration, [], 0)
+        else:
+            chunks = plan_chunks(duration, detect_silences(audio_path), target)
+    except (ffmpeg.Error, KeyError, ValueError) as exc:
+        logger.warning("Could not plan chunks for %s, sending whole file: %s", audio_path, exc)
+        return provider.transcribe(audio_path, config, progress_callback)
+
+    if len(chunks) == 1 and codec == "wav":
+        return provider.transcribe(audio_path, config, progress_callback)
+
+    logger.info(
+        "Chunked %s transcription: %.0fs audio in %d chunk(s) (%s, %d hard cuts)",
+        provider.provider_name,
+        duration,
+        len(chunks),
+        codec,
+        sum(1 for c in chunks if c.audio_end > c.end),
+    )
+    if progress_callback:
+        progress_callback(0.1, f"Transcribing with {provider.provider_name}…")
+
+    results: list[ASRResult | None] = [None] * len(chunks)
+    workers = max(1, min(len(chunks), settings.CLOUD_ASR_CHUNK_CONCURRENCY))
+    with (
+        tempfile.TemporaryDirectory(dir=os.path.dirname(audio_path) or None) as out_dir,
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asr-chunk") as pool,
+    ):
+        futures = {
+            pool.submit(_transcribe_chunk, provider, audio_path, chunk, config, out_dir): chunk
+            for chunk in chunks
+        }
+        pending = set(futures)
+        done_count = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is not None:
+                    for other in pending:
+                        other.cancel()
+                    chunk = futures[future]
+                    raise RuntimeError(
+                        f"{provider.provider_name} transcription failed on chunk "
+                        f"{chunk.index + 1}/{len(chunks)}: {exc}"
+                    ) from exc
+                results[futures[future].index] = future.result()
+                done_count += 1
+            if progress_callback:
+                progress_callback(
+                    0.1 + 0.8 * done_count / len(chunks),
+                    f"Transcribed {done_count}/{len(chunks)} audio chunks",
+                )
+
+    completed = [r for r in results if r is not None]
+    first = completed[0]
+    segments = stitch_results(chunks, completed)
+
+    if progress_callback:
+        progress_callback(1.0, f"{provider.provider_name} transcription complete")
+
+    return ASRResult(
+        segments=segments,
+        language=_merge_language(completed, config.language),
+        has_speakers=any(r.has_speakers for r in completed),
+        provider_name=first.provider_name,
+        model_name=first.model_name,
+        metadata={**first.metadata, "chunks": len(chunks), "upload_codec": codec},
+    )
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 _MAX_SEGMENT_DURATION = 30.0  # seconds — cap for no-diarization grouping
 _MIN_PAUSE_SPLIT = 0.5  # seconds — pause gap that forces a new segment
+_UPLOAD_BLOCK_BYTES = 1024 * 1024
 
 
 def _group_words_into_segments(words: list, fallback_text: str) -> list:
@@ -72,6 +73,11 @@ def _group_words_into_segments(words: list, fallback_text: str) -> list:
 
 
 class DeepgramProvider(ASRProvider):
+    upload_codec = "opus"
+    # The project-wide limit on concurrent pre-recorded requests is high;
+    # 8 per process keeps several workers well inside it
+    max_concurrent_chunks = 8
+
     def __init__(self, api_key: str, model_name: str = "nova-3"):
         self._api_key = api_key
         self._model_name = model_name
@@ -153,13 +159,13 @@ class DeepgramProvider(ASRProvider):
         if progress_callback:
             progress_callback(0.3, "Transcribing with Deepgram…")
 
-        # Read file into bytes — the v6 SDK expects bytes or an iterator for request=.
+        # The v6 SDK accepts bytes or an iterator for request=; stream the file
+        # in blocks so long recordings are not held in memory.
         try:
             with open(audio_path, "rb") as f:
-                audio_bytes = f.read()
-            response = client.listen.v1.media.transcribe_file(
-                request=audio_bytes, **transcribe_kwargs
-            )
+                response = client.listen.v1.media.transcribe_file(
+                    request=iter(lambda: f.read(_UPLOAD_BLOCK_BYTES), b""), **transcribe_kwargs
+                )
         except Exception as exc:
             sanitized = self._sanitize_error(str(exc), self._api_key)
             logger.error("Deepgram transcription failed for file=%s: %s", filename, sanitized)
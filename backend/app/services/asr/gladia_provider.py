@@ -22,6 +22,8 @@ logger = logging.getLogger(__name__)
 
 
 class GladiaProvider(ASRProvider):
+    upload_codec = "opus"
+
     _BASE = "https://api.gladia.io"
 
     def __init__(self, api_key: str, model_name: str = "standard"):
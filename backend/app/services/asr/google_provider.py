@@ -24,6 +24,11 @@ logger = logging.getLogger(__name__)
 
 
 class GoogleASRProvider(ASRProvider):
+    upload_codec = "flac"
+    # Long-running recognize operations count against a low per-project
+    # default quota; extra chunks fail with 429 rather than queueing
+    max_concurrent_chunks = 2
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -119,7 +124,11 @@ class GoogleASRProvider(ASRProvider):
 
         lang = config.language if config.language != "auto" else "en-US"
         recognition_cfg = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            encoding=(
+                speech.RecognitionConfig.AudioEncoding.FLAC
+                if audio_path.endswith(".flac")
+                else speech.RecognitionConfig.AudioEncoding.LINEAR16
+            ),
             language_code=lang,
             model=self._model_name,
             enable_automatic_punctuation=True,
@@ -1,6 +1,8 @@
 """OpenAI Whisper-1 / GPT-4o Transcribe ASR provider.
 
-Targets openai >= 1.0.0 (Python SDK v1).  Maximum file size: 25 MB.
+Targets openai >= 1.0.0 (Python SDK v1).  Maximum file size: 25 MB per request;
+long audio is split and Opus-encoded by ``chunked.transcribe_chunked`` so each
+request stays well under it.
 
 Notes on diarization
 --------------------
@@ -36,6 +38,8 @@ _MAX_MB = 25
 
 
 class OpenAIASRProvider(ASRProvider):
+    upload_codec = "opus"
+
     def __init__(self, api_key: str, model_name: str = "gpt-4o-transcribe"):
         self._api_key = api_key
         self._model_name = model_name
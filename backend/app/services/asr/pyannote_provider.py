@@ -41,6 +41,9 @@ class PyAnnoteProvider(ASRProvider):
     in a single API call.
     """
 
+    upload_codec = "flac"
+    always_diarizes = True
+
     def __init__(self, api_key: str, model_name: str = "parakeet"):
         self._api_key = api_key
         self._model_name = model_name
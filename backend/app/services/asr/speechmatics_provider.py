@@ -26,6 +26,8 @@ _POLL_INTERVAL = 10  # seconds per poll
 
 
 class SpeechmaticsProvider(ASRProvider):
+    upload_codec = "opus"
+
     def __init__(self, api_key: str, model_name: str = "standard"):
         self._api_key = api_key
         self._model_name = model_name
@@ -9,11 +9,17 @@ Pure functions — no model or DB dependencies. Used by:
 """
 
 import logging
+import os
 import subprocess
+import tempfile
 from typing import Any
 
 import numpy as np
 
+from app.utils.pcm_audio import open_pcm_wav
+from app.utils.pcm_audio import pcm_to_float32
+from app.utils.pcm_audio import read_pcm_wav
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,8 +87,9 @@ def extract_audio_segment_np(
 ) -> np.ndarray | None:
     """Extract a specific audio segment via ffmpeg seeking.
 
-    Uses -ss before -i for fast demuxer-level seek (no full file decode).
-    Works with local file paths and presigned HTTP URLs.
+    The pipeline's own PCM artifact is sliced from a memory map instead.
+    Otherwise uses -ss before -i for fast demuxer-level seek (no full file
+    decode). Works with local file paths and presigned HTTP URLs.
 
     Args:
         audio_source: Local file path or HTTP/presigned URL.
@@ -97,6 +104,14 @@ def extract_audio_segment_np(
         logger.debug("Skipping segment with non-positive duration: %.3f", duration)
         return None
 
+    pcm = open_pcm_wav(audio_source, target_sr)
+    if pcm is not None:
+        start_sample = max(0, int(start * target_sr))
+        end_sample = min(len(pcm), int((start + duration) * target_sr))
+        if end_sample <= start_sample:
+            return None
+        return np.array(pcm_to_float32(pcm[start_sample:end_sample]), dtype=np.float32)
+
     cmd = [
         "ffmpeg",
         "-ss",
@@ -144,6 +159,8 @@ def load_full_audio_np(
 ) -> np.ndarray:
     """Load entire audio file to float32 numpy array via ffmpeg.
 
+    The pipeline's own PCM artifact is read from a memory map without ffmpeg.
+
     Args:
         audio_path: Path to the audio file.
         target_sr: Target sample rate.
@@ -154,6 +171,10 @@ def load_full_audio_np(
     Raises:
         subprocess.CalledProcessError: If ffmpeg fails.
     """
+    audio = read_pcm_wav(audio_path, target_sr)
+    if audio is not None:
+        return audio
+
     cmd = [
         "ffmpeg",
         "-i",
@@ -174,6 +195,123 @@ def load_full_audio_np(
     return np.frombuffer(result.stdout, dtype=np.float32).copy()
 
 
+class AudioSession:
+    """Decode an audio file once and serve segment slices from the decoded buffer.
+
+    The file is decoded by a single ffmpeg run to mono float32 PCM in a
+    temporary file, which is then memory-mapped. Slicing is O(1) and returns a
+    view, so extracting many segments from a multi-hour recording costs one
+    decode instead of one decode per segment, and resident memory only grows
+    with the pages actually touched. The pipeline's own 16-bit PCM artifact
+    is mapped in place with no decode at all; its slices are converted to
+    float32 as they are taken.
+
+    Use as a context manager so the temporary PCM file is always removed::
+
+        with AudioSession(audio_path) as session:
+            clip = session.slice(12.5, 17.0)
+    """
+
+    def __init__(self, audio_path: str, target_sr: int = 16000) -> None:
+        self.audio_path = audio_path
+        self.sample_rate = target_sr
+        self._pcm_path: str | None = None
+        self._audio: np.ndarray | None = None
+
+    @classmethod
+    def from_array(cls, audio: np.ndarray, sample_rate: int) -> "AudioSession":
+        """Wrap an already-decoded 1-D float32 array in a session."""
+        session = cls("<memory>", sample_rate)
+        session._audio = np.ascontiguousarray(audio, dtype=np.float32)
+        return session
+
+    def open(self) -> "AudioSession":
+        """Decode the file (once) and memory-map the resulting PCM.
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails.
+            ValueError: If ffmpeg produced no audio.
+        """
+        if self._audio is not None:
+            return self
+
+        pcm = open_pcm_wav(self.audio_path, self.sample_rate)
+        if pcm is not None:
+            self._audio = pcm
+            return self
+
+        fd, pcm_path = tempfile.mkstemp(suffix=".f32")
+        os.close(fd)
+        self._pcm_path = pcm_path
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            self.audio_path,
+            "-vn",
+            "-f",
+            "f32le",
+            "-acodec",
+            "pcm_f32le",
+            "-ac",
+            "1",
+            "-ar",
+            str(self.sample_rate),
+            "-v",
+            "quiet",
+            pcm_path,
+        ]
+        try:
+            subprocess.run(cmd, capture_output=True, check=True, timeout=1800)  # noqa: S603  # nosec B603
+            if os.path.getsize(pcm_path) == 0:
+                raise ValueError(f"ffmpeg produced no audio for {self.audio_path}")
+            self._audio = np.memmap(pcm_path, dtype=np.float32, mode="r")
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def close(self) -> None:
+        """Release the memory map and delete the temporary PCM file."""
+        self._audio = None
+        if self._pcm_path:
+            try:
+                os.unlink(self._pcm_path)
+            except OSError as e:
+                logger.debug("Failed to remove session PCM %s: %s", self._pcm_path, e)
+            self._pcm_path = None
+
+    def __enter__(self) -> "AudioSession":
+        return self.open()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def num_samples(self) -> int:
+        return 0 if self._audio is None else int(self._audio.shape[0])
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sample_rate
+
+    def slice(self, start: float, end: float) -> np.ndarray:
+        """Return the samples between ``start`` and ``end`` seconds as float32.
+
+        A view for float32 sources; int16 PCM artifacts convert just the slice.
+
+        Bounds are clamped to the decoded audio; an empty array is returned
+        for ranges that fall outside it.
+        """
+        if self._audio is None:
+            raise RuntimeError("AudioSession is not open")
+        start_sample = max(0, int(start * self.sample_rate))
+        end_sample = min(self.num_samples, int(end * self.sample_rate))
+        if end_sample <= start_sample:
+            return np.empty(0, dtype=np.float32)
+        return pcm_to_float32(self._audio[start_sample:end_sample])
+
+
 def group_segments_by_speaker(
     segments: list[dict[str, Any]],
     speaker_mapping: dict[str, int],
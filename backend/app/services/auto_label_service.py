@@ -9,6 +9,8 @@ application to existing files.
 import difflib
 import logging
 import re
+from collections import Counter
+from collections import defaultdict
 from datetime import datetime
 from datetime import timezone
 from typing import Any
@@ -28,9 +30,94 @@ from app.models.media import MediaFile
 from app.models.media import Tag
 from app.models.prompt import UserSetting
 from app.models.topic import TopicSuggestion
+from app.services.search.suggestion_index import refresh_file_suggestions
 
 logger = logging.getLogger(__name__)
 
+# Suggestions loaded per query by retroactive_apply
+RETROACTIVE_BATCH_SIZE = 200
+
+
+class TrigramIndex:
+    """Trigram inverted index that narrows fuzzy name lookups.
+
+    ``find`` returns the same item as a SequenceMatcher scan over the
+    indexed names in insertion order, but only runs SequenceMatcher on
+    names that can still reach the threshold. A ratio of at least
+    ``threshold`` caps how many characters two names can differ by, and
+    each differing character breaks at most three of the query's
+    trigrams, so names sharing fewer trigrams than that are skipped.
+    """
+
+    def __init__(self, threshold: float = FUZZY_MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._items: list[Any] = []
+        self._names: list[str] = []
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _trigrams(name: str) -> Counter:
+        return Counter(name[i : i + 3] for i in range(len(name) - 2))
+
+    def add(self, item: Any, normalized_name: str) -> None:
+        """Index an item under its normalized name; empty names never match."""
+        if not normalized_name:
+            return
+        idx = len(self._items)
+        self._items.append(item)
+        self._names.append(normalized_name)
+        self._by_length[len(normalized_name)].append(idx)
+        for gram, count in self._trigrams(normalized_name).items():
+            self._postings[gram].append((idx, count))
+
+    def _min_shared(self, query_len: int, name_len: int) -> Optional[int]:
+        """Fewest trigrams a name must share with the query to reach the threshold.
+
+        Returns None when the lengths alone rule the name out.
+        """
+        # ratio = 2 * matched / total, so at most this many characters are unmatched
+        max_unmatched = int((1 - self.threshold) * (query_len + name_len) + 1e-9)
+        length_gap = query_len - name_len
+        max_unmatched -= (max_unmatched - length_gap) % 2
+        if max_unmatched < abs(length_gap):
+            return None
+        # An unmatched query character breaks up to three query trigrams; a
+        # gap on the other side breaks up to two.
+        only_query = (max_unmatched + length_gap) // 2
+        only_name = max_unmatched - only_query
+        return query_len - 2 - 3 * only_query - 2 * only_name
+
+    def find(self, normalized_name: str) -> Optional[Any]:
+        """Return the first indexed item whose name is similar, or None."""
+        if not normalized_name:
+            return None
+        shared: Counter = Counter()
+        for gram, count in self._trigrams(normalized_name).items():
+            for idx, indexed_count in self._postings.get(gram, ()):
+                shared[idx] += min(count, indexed_count)
+
+        min_shared = {
+            length: self._min_shared(len(normalized_name), length) for length in self._by_length
+        }
+        candidates: set[int] = set()
+        for length, need in min_shared.items():
+            if need is not None and need <= 0:
+                candidates.update(self._by_length[length])
+        for idx, count in shared.items():
+            need = min_shared[len(self._names[idx])]
+            if need is not None and count >= need:
+                candidates.add(idx)
+
+        for idx in sorted(candidates):
+            matcher = difflib.SequenceMatcher(None, normalized_name, self._names[idx])
+            if matcher.ratio() >= self.threshold:
+                return self._items[idx]
+        return None
+
 
 class AutoLabelService:
     """Service for auto-applying AI-generated tag and collection suggestions."""
@@ -38,7 +125,11 @@ class AutoLabelService:
     def __init__(self, db: Session):
         self.db = db
         self._tag_cache: Optional[list[Tag]] = None
+        self._tag_index: Optional[TrigramIndex] = None
         self._collection_cache: dict[int, list[Collection]] = {}
+        self._collection_index: dict[int, TrigramIndex] = {}
+        # Files whose collection membership changed since the last commit
+        self._membership_changed: set[int] = set()
 
     # =========================================================================
     # Name Normalization & Fuzzy Matching
@@ -76,9 +167,26 @@ class AutoLabelService:
             self._tag_cache = self.db.query(Tag).all()
         return self._tag_cache
 
+    def _get_tag_index(self) -> TrigramIndex:
+        """Return the trigram index over the cached tags."""
+        if self._tag_index is None:
+            self._tag_index = TrigramIndex()
+            for tag in self._get_all_tags_cached():
+                self._tag_index.add(tag, self.normalize_name(tag.name))
+        return self._tag_index
+
+    def _remember_tag(self, tag: Tag) -> None:
+        """Add a newly created tag to the cache instead of reloading every tag."""
+        if self._tag_cache is None:
+            return
+        self._tag_cache.append(tag)
+        if self._tag_index is not None:
+            self._tag_index.add(tag, self.normalize_name(tag.name))
+
     def _invalidate_tag_cache(self) -> None:
-        """Invalidate the tag cache after creating a new tag."""
+        """Invalidate the tag cache when it may have missed a tag."""
         self._tag_cache = None
+        self._tag_index = None
 
     def _get_user_collections_cached(self, user_id: int) -> list[Collection]:
         """Return user collections, using instance-level cache."""
@@ -88,15 +196,33 @@ class AutoLabelService:
             )
         return self._collection_cache[user_id]
 
+    def _get_collection_index(self, user_id: int) -> TrigramIndex:
+        """Return the trigram index over a user's cached collections."""
+        if user_id not in self._collection_index:
+            index = TrigramIndex()
+            for coll in self._get_user_collections_cached(user_id):
+                index.add(coll, self.normalize_name(coll.name))
+            self._collection_index[user_id] = index
+        return self._collection_index[user_id]
+
+    def _remember_collection(self, user_id: int, collection: Collection) -> None:
+        """Add a newly created collection to the user's cache."""
+        if user_id not in self._collection_cache:
+            return
+        self._collection_cache[user_id].append(collection)
+        if user_id in self._collection_index:
+            self._collection_index[user_id].add(collection, self.normalize_name(collection.name))
+
     def _invalidate_collection_cache(self, user_id: int) -> None:
-        """Invalidate the collection cache for a user after creating a new collection."""
+        """Invalidate the collection cache for a user when it may have missed one."""
         self._collection_cache.pop(user_id, None)
+        self._collection_index.pop(user_id, None)
 
     def find_existing_similar_tag(self, suggested_name: str) -> Optional[Tag]:
         """Find an existing tag that matches the suggested name.
 
         1. Exact normalized_name match (uses index)
-        2. Fallback: SequenceMatcher scan of cached tags
+        2. Fallback: SequenceMatcher over cached tags, prefiltered by trigrams
         """
         normalized = self.normalize_name(suggested_name)
 
@@ -105,22 +231,17 @@ class AutoLabelService:
         if tag:
             return tag
 
-        # Slow path: fuzzy scan using cached tag list
-        all_tags = self._get_all_tags_cached()
-        for existing in all_tags:
-            if self.are_names_similar(suggested_name, existing.name):
-                return existing
-        return None
+        # Slow path: fuzzy match against the cached tag list
+        existing: Optional[Tag] = self._get_tag_index().find(normalized)
+        return existing
 
     def find_existing_similar_collection(
         self, user_id: int, suggested_name: str
     ) -> Optional[Collection]:
         """Find an existing collection matching the suggested name, scoped to user."""
-        user_collections = self._get_user_collections_cached(user_id)
-        for coll in user_collections:
-            if self.are_names_similar(suggested_name, coll.name):
-                return coll
-        return None
+        index = self._get_collection_index(user_id)
+        coll: Optional[Collection] = index.find(self.normalize_name(suggested_name))
+        return coll
 
     # =========================================================================
     # Auto-Apply Logic
@@ -201,7 +322,14 @@ class AutoLabelService:
             self.db.commit()
         except Exception:
             self.db.rollback()
+            self._membership_changed.clear()
+            # Tags and collections remembered since the last commit are gone
+            self._invalidate_tag_cache()
+            self._invalidate_collection_cache(user_id)
             raise
+        self._refresh_search_access()
+        if result["auto_applied_tags"]:
+            refresh_file_suggestions(self.db, int(media_file.id), tags=True)
 
         logger.info(
             f"Auto-applied {len(result['auto_applied_tags'])} tags and "
@@ -222,7 +350,7 @@ class AutoLabelService:
             tag = Tag(name=name, source=source, normalized_name=normalized)
             self.db.add(tag)
             self.db.flush()
-            self._invalidate_tag_cache()
+            self._remember_tag(tag)
             return tag
         except IntegrityError:
             nested.rollback()
@@ -245,7 +373,7 @@ class AutoLabelService:
             collection = Collection(name=name, user_id=user_id, source=source)
             self.db.add(collection)
             self.db.flush()
-            self._invalidate_collection_cache(user_id)
+            self._remember_collection(user_id, collection)
             return collection
         except IntegrityError:
             nested.rollback()
@@ -308,6 +436,7 @@ class AutoLabelService:
             )
             self.db.add(member)
             self.db.flush()
+            self._membership_changed.add(int(media_file.id))
         except IntegrityError:
             nested.rollback()
             logger.debug(
@@ -315,6 +444,19 @@ class AutoLabelService:
                 f"collection={collection.id}, skipping"
             )
 
+    def _refresh_search_access(self) -> None:
+        """Push committed collection membership changes to the search index."""
+        if not self._membership_changed:
+            return
+        file_ids = sorted(self._membership_changed)
+        self._membership_changed.clear()
+        try:
+            from app.tasks.search_indexing_task import update_file_access_index
+
+            update_file_access_index.delay(file_ids)
+        except Exception as e:
+            logger.warning(f"Failed to queue search access update for files {file_ids}: {e}")
+
     # =========================================================================
     # Batch Grouping
     # =========================================================================
@@ -372,9 +514,8 @@ class AutoLabelService:
             collection_name = tag_name.title()
 
             # _get_or_create_collection_with_dedup already does fuzzy lookup
-            # internally; detect new collections via cache invalidation.
-            # Ensure cache is populated so we can detect invalidation.
-            self._get_user_collections_cached(user_id)
+            # internally; a new collection grows the user's cached list.
+            known = len(self._get_user_collections_cached(user_id))
             collection = self._get_or_create_collection_with_dedup(
                 collection_name, user_id, source=TAG_SOURCE_BULK_GROUP
             )
@@ -383,8 +524,7 @@ class AutoLabelService:
                 self._add_file_to_collection(mf, collection, confidence=0.0)
                 files_grouped.add(mf.id)
 
-            # Cache is invalidated only when a new collection is created
-            if user_id not in self._collection_cache:
+            if len(self._get_user_collections_cached(user_id)) > known:
                 collections_created += 1
 
         batch.grouping_status = "completed"
@@ -392,7 +532,12 @@ class AutoLabelService:
             self.db.commit()
         except Exception:
             self.db.rollback()
+            self._membership_changed.clear()
+            # Tags and collections remembered since the last commit are gone
+            self._invalidate_tag_cache()
+            self._invalidate_collection_cache(user_id)
             raise
+        self._refresh_search_access()
 
         return {
             "collections_created": collections_created,
@@ -426,10 +571,9 @@ class AutoLabelService:
         if file_ids:
             query = query.filter(TopicSuggestion.media_file_id.in_(file_ids))
 
-        # Collect IDs upfront so we can re-query each suggestion fresh
-        # inside the loop.  After a rollback() ORM objects loaded from the
-        # original query may be stale/detached.
-        suggestion_ids = [s.id for s in query.all()]
+        # Collect IDs upfront and load suggestions with their files a chunk
+        # at a time, rather than two queries per suggestion.
+        suggestion_ids = [s.id for s in query.order_by(TopicSuggestion.id).all()]
 
         result: dict[str, Any] = {
             "files_processed": 0,
@@ -444,55 +588,81 @@ class AutoLabelService:
         apply_tags = settings.get("tags_enabled", True)
         apply_collections = settings.get("collections_enabled", True)
 
-        for i, suggestion_id in enumerate(suggestion_ids):
-            try:
-                # Re-query suggestion each iteration to avoid stale objects
-                suggestion = (
-                    self.db.query(TopicSuggestion)
-                    .filter(TopicSuggestion.id == suggestion_id)
-                    .first()
-                )
-                if not suggestion:
-                    result["files_skipped"] += 1
-                    continue
-
-                media_file = (
-                    self.db.query(MediaFile)
-                    .filter(MediaFile.id == suggestion.media_file_id)
-                    .first()
-                )
-                if not media_file:
-                    result["files_skipped"] += 1
-                    continue
-
-                apply_result = self.auto_apply_suggestions(
-                    media_file=media_file,
-                    suggestion=suggestion,
-                    user_id=user_id,
-                    confidence_threshold=confidence_threshold,
-                    apply_tags=apply_tags,
-                    apply_collections=apply_collections,
-                )
-
-                result["files_processed"] += 1
-                result["tags_applied"] += len(apply_result["auto_applied_tags"])
-                result["collections_applied"] += len(apply_result["auto_applied_collections"])
-
-                if progress_callback:
-                    progress_callback(
-                        i + 1,
-                        total,
-                        media_file.filename,
-                        file_uuid=str(media_file.uuid),
-                    )
-
-            except Exception as e:
-                logger.error(f"Error processing suggestion {suggestion_id}: {e}")
-                result["errors"].append(str(e))
-                result["files_skipped"] += 1
+        # auto_apply_suggestions commits once per file; keep the rest of the
+        # chunk loaded across those commits. A rollback still expires them,
+        # so they reload on next access.
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            for start in range(0, total, RETROACTIVE_BATCH_SIZE):
+                chunk_ids = suggestion_ids[start : start + RETROACTIVE_BATCH_SIZE]
+                suggestions, media_files = self._load_suggestion_chunk(chunk_ids)
+
+                for i, suggestion_id in enumerate(chunk_ids, start=start):
+                    try:
+                        suggestion = suggestions.get(suggestion_id)
+                        if not suggestion:
+                            result["files_skipped"] += 1
+                            continue
+
+                        media_file = media_files.get(suggestion.media_file_id)
+                        if not media_file:
+                            result["files_skipped"] += 1
+                            continue
+
+                        apply_result = self.auto_apply_suggestions(
+                            media_file=media_file,
+                            suggestion=suggestion,
+                            user_id=user_id,
+                            confidence_threshold=confidence_threshold,
+                            apply_tags=apply_tags,
+                            apply_collections=apply_collections,
+                        )
+
+                        result["files_processed"] += 1
+                        result["tags_applied"] += len(apply_result["auto_applied_tags"])
+                        result["collections_applied"] += len(
+                            apply_result["auto_applied_collections"]
+                        )
+
+                        if progress_callback:
+                            progress_callback(
+                                i + 1,
+                                total,
+                                media_file.filename,
+                                file_uuid=str(media_file.uuid),
+                            )
+
+                    except Exception as e:
+                        logger.error(f"Error processing suggestion {suggestion_id}: {e}")
+                        result["errors"].append(str(e))
+                        result["files_skipped"] += 1
+        finally:
+            self.db.expire_on_commit = expire_on_commit
 
         return result
 
+    def _load_suggestion_chunk(
+        self, suggestion_ids: list[int]
+    ) -> tuple[dict[int, TopicSuggestion], dict[int, MediaFile]]:
+        """Load suggestions and their media files with one query each."""
+        suggestions = {
+            s.id: s
+            for s in self.db.query(TopicSuggestion)
+            .filter(TopicSuggestion.id.in_(suggestion_ids))
+            .all()
+        }
+        media_file_ids = {s.media_file_id for s in suggestions.values()}
+        media_files = (
+            {
+                mf.id: mf
+                for mf in self.db.query(MediaFile).filter(MediaFile.id.in_(media_file_ids)).all()
+            }
+            if media_file_ids
+            else {}
+        )
+        return suggestions, media_files
+
     # =========================================================================
     # User Settings
     # =========================================================================
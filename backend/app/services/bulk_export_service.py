@@ -0,0 +1,205 @@
+"""
+Streaming bulk export of subtitles/transcripts as a ZIP archive.
+
+The archive is produced incrementally so memory stays flat regardless of how
+many files are selected:
+
+- Accessible, completed files are resolved up front in chunked queries.
+- Files are rendered in batches (one segment query + one speaker query per
+  batch) on a small thread pool, each worker with its own DB session. At most
+  ``BULK_EXPORT_WORKERS + 1`` batches are in flight at any time.
+- ZIP entries are written to a non-seekable sink, so ``zipfile`` emits data
+  descriptors and each entry's compressed bytes can be yielded as soon as
+  it is written.
+
+The same entry iterator feeds both the HTTP streaming response and the
+Celery task that writes large archives to MinIO.
+"""
+
+import logging
+import zipfile
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+
+from app.core.constants import BULK_EXPORT_BATCH_SIZE
+from app.core.constants import BULK_EXPORT_WORKERS
+from app.db.session_utils import session_scope
+from app.models.media import FileStatus
+from app.models.media import MediaFile
+from app.models.media import TranscriptSegment
+from app.services.subtitle_service import SubtitleService
+
+logger = logging.getLogger(__name__)
+
+# Subtitle format -> archive entry extension
+EXPORT_FORMATS = {"srt": "srt", "webvtt": "vtt", "txt": "txt"}
+
+# Upper bound on UUIDs per IN (...) clause when resolving the selection
+_RESOLVE_CHUNK_SIZE = 500
+
+
+class ExportCandidate(NamedTuple):
+    """A file that will be written to the archive."""
+
+    file_id: int
+    base_name: str
+
+
+def resolve_export_candidates(
+    db: Session, file_uuids: list[str], user_id: int, is_admin: bool = False
+) -> list[ExportCandidate]:
+    """Resolve requested UUIDs to exportable files, preserving request order.
+
+    A file is exportable when the user can access it (admin, owner, or via a
+    shared collection), its status is completed and it has at least one
+    transcript segment. Invalid, inaccessible or unfinished UUIDs are dropped.
+    """
+    from app.services.permission_service import PermissionService
+
+    parsed: list[UUID] = []
+    for raw in dict.fromkeys(file_uuids):
+        try:
+            parsed.append(UUID(str(raw)))
+        except ValueError:
+            continue
+
+    accessible_ids = None
+    if not is_admin:
+        accessible_ids = PermissionService.get_accessible_file_ids_subquery(db, user_id)
+
+    has_segments = exists().where(TranscriptSegment.media_file_id == MediaFile.id)
+    found: dict[UUID, ExportCandidate] = {}
+    for start in range(0, len(parsed), _RESOLVE_CHUNK_SIZE):
+        chunk = parsed[start : start + _RESOLVE_CHUNK_SIZE]
+        query = db.query(MediaFile.id, MediaFile.uuid, MediaFile.filename).filter(
+            MediaFile.uuid.in_(chunk),
+            MediaFile.status == FileStatus.COMPLETED,
+            has_segments,
+        )
+        if accessible_ids is not None:
+            query = query.filter(MediaFile.id.in_(db.query(accessible_ids.c.id)))
+        for row in query.all():
+            filename = str(row.filename)
+            base_name = filename.rsplit(".", 1)[0] if "." in filename else filename
+            found[row.uuid] = ExportCandidate(int(row.id), base_name)
+
+    return [found[u] for u in parsed if u in found]
+
+
+def _render_batch(
+    batch: list[ExportCandidate], subtitle_format: str, include_speakers: bool
+) -> list[tuple[str, bytes]]:
+    """Render one batch of files to ``(entry_name, content)`` pairs."""
+    ext = EXPORT_FORMATS[subtitle_format]
+    entries: list[tuple[str, bytes]] = []
+    with session_scope() as db:
+        transcripts = SubtitleService.load_transcripts_batch(
+            db, [c.file_id for c in batch], include_speakers
+        )
+        for candidate in batch:
+            loaded = transcripts.get(candidate.file_id)
+            if loaded is None:
+                continue
+            segments, speaker_map = loaded
+            try:
+                content = SubtitleService.render_content(
+                    subtitle_format, segments, speaker_map, include_speakers
+                )
+            except Exception as e:
+                logger.warning(f"Failed to export subtitles for file {candidate.file_id}: {e}")
+                continue
+            if content.strip():
+                entries.append((f"{candidate.base_name}.{ext}", content.encode("utf-8")))
+    return entries
+
+
+def iter_export_entries(
+    candidates: list[ExportCandidate],
+    subtitle_format: str,
+    include_speakers: bool = True,
+    batch_size: int = BULK_EXPORT_BATCH_SIZE,
+    workers: int = BULK_EXPORT_WORKERS,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield rendered archive entries in request order.
+
+    Batches are rendered concurrently but consumed in order, and only
+    ``workers + 1`` batches are ever submitted ahead of the consumer.
+    """
+    batches = [candidates[i : i + batch_size] for i in range(0, len(candidates), batch_size)]
+    if not batches:
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-export") as pool:
+        pending: deque[Future] = deque()
+        next_batch = 0
+        try:
+            while pending or next_batch < len(batches):
+                while next_batch < len(batches) and len(pending) <= workers:
+                    pending.append(
+                        pool.submit(
+                            _render_batch, batches[next_batch], subtitle_format, include_speakers
+                        )
+                    )
+                    next_batch += 1
+                yield from pending.popleft().result()
+        finally:
+            # Client disconnected or a batch failed — drop work not yet started
+            for future in pending:
+                future.cancel()
+
+
+class _ZipStreamSink:
+    """Write-only buffer handed to ``zipfile``.
+
+    It deliberately has no ``tell``/``seek``, which makes ``ZipFile`` treat
+    it as a non-seekable stream and write data descriptors instead of
+    patching local headers after the fact.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[tuple[str, bytes]]) -> Iterator[bytes]:
+    """Yield a ZIP archive chunk by chunk as entries are produced."""
+    sink = _ZipStreamSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:  # type: ignore[arg-type]
+        for name, content in entries:
+            zf.writestr(name, content)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
+def write_zip(entries: Iterable[tuple[str, bytes]], fileobj: BinaryIO) -> int:
+    """Write a ZIP archive of ``entries`` to a seekable file. Returns entry count."""
+    count = 0
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in entries:
+            zf.writestr(name, content)
+            count += 1
+    return count
@@ -433,16 +433,26 @@ def auto_delete_media_file(db: Session, file: MediaFile) -> dict:
                         f"(non-fatal): {minio_err}"
                     )
 
+        from app.services.minio_service import delete_raw_outputs
+
+        delete_raw_outputs(int(file.user_id), int(file.id))
+
         # Step 2: Delete all OpenSearch data for this file.
         _cleanup_opensearch_for_file(file, file_uuid)
 
         # Step 4: Delete from database — cascade removes all child rows.
         owner_id = int(file.user_id)
+        imohash = str(file.imohash) if file.imohash else None
         db.delete(file)
         db.commit()
         logger.info(f"auto_delete_media_file: deleted file {file_uuid} from database")
 
-        # Step 5: Invalidate Redis caches for the file owner.
+        # Step 5: Drop cached artifacts once no other upload shares the content.
+        from app.services.artifact_cache_service import purge_if_orphaned
+
+        purge_if_orphaned(db, imohash)
+
+        # Step 6: Invalidate Redis caches for the file owner.
         try:
             from app.services.redis_cache_service import redis_cache
 
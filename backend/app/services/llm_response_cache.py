@@ -0,0 +1,193 @@
+"""
+Persistent cache for LLM responses to transcript enrichment prompts.
+
+Summaries, topic suggestions and speaker identification all send a full
+transcript to the LLM. Retries, ``summary_retry`` sweeps and user re-runs
+used to repeat those requests verbatim. Responses are now stored in Redis
+(db 1, shared by every worker) keyed by::
+
+    sha256(provider, endpoint, model, prompt template hash,
+           transcript content hash, request parameters)
+
+Callers store a response with ``LLMService.cache_response`` only after it
+parsed, so a malformed or truncated reply is never replayed.
+
+The prompt template hash covers the rendered messages with the transcript
+text replaced by a placeholder, so a changed prompt, language, speaker list
+or organization context misses as reliably as a changed transcript.
+
+Entries expire after ``LLM_RESPONSE_CACHE_TTL_SECONDS``. A sorted-set index
+scored by last use bounds the cache to ``LLM_RESPONSE_CACHE_MAX_ENTRIES``;
+the least recently used entries are evicted when a write exceeds it.
+
+The same store carries the topic part of a combined enrichment response
+(see ``LLMService.generate_combined_enrichment``) so topic extraction can
+pick it up instead of issuing its own request.
+
+Cache key conventions (deliberately outside ``cache:*`` so per-user
+invalidation never drops them):
+    llm_cache:resp:{hash}           - Cached chat completion
+    llm_cache:part:{hash}           - Part of a combined enrichment response
+    llm_cache:lru                   - Sorted set of keys scored by last use
+
+Like ``RedisCacheService``, every operation degrades to a miss when Redis
+is unavailable.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+from typing import Optional
+
+from app.core.config import settings
+from app.services.redis_cache_service import redis_cache
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_KEY_PREFIX = "llm_cache:resp:"
+PART_KEY_PREFIX = "llm_cache:part:"
+LRU_INDEX_KEY = "llm_cache:lru"
+
+TRANSCRIPT_PLACEHOLDER = "{transcript}"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_transcript(transcript: str) -> str:
+    """Content hash of a transcript, used in response and part keys."""
+    return _sha256(transcript)
+
+
+def prompt_template_hash(messages: list[dict[str, str]], transcript: str) -> str:
+    """Hash the rendered messages with the transcript text masked out."""
+    masked = [
+        {
+            **message,
+            "content": message.get("content", "").replace(transcript, TRANSCRIPT_PLACEHOLDER),
+        }
+        for message in messages
+    ]
+    return _sha256(json.dumps(masked, sort_keys=True, ensure_ascii=False))
+
+
+def build_response_key(
+    provider: str,
+    endpoint: str,
+    model: str,
+    messages: list[dict[str, str]],
+    transcript: str,
+    params: dict[str, Any],
+) -> str:
+    """Cache key for a chat completion over ``transcript``.
+
+    Args:
+        provider: LLM provider name
+        endpoint: Resolved endpoint URL (two servers may serve the same model name)
+        model: Model name
+        messages: Rendered request messages, transcript included
+        transcript: Transcript text embedded in ``messages``
+        params: Every other request field (token limits, temperature, ...)
+    """
+    parts = [
+        provider,
+        endpoint,
+        model,
+        prompt_template_hash(messages, transcript),
+        hash_transcript(transcript),
+        json.dumps(params, sort_keys=True, default=str),
+    ]
+    return RESPONSE_KEY_PREFIX + _sha256("\x1f".join(parts))
+
+
+def build_part_key(
+    provider: str,
+    model: str,
+    part: str,
+    transcript_hash: str,
+    output_language: str,
+    known_speakers: list[dict[str, Any]],
+    metadata_context: str,
+) -> str:
+    """Cache key for one part of a combined enrichment response.
+
+    Known speaker profiles and file metadata are part of the combined prompt,
+    so a new profile or edited file details miss instead of reusing old parts.
+    """
+    raw = "\x1f".join(
+        [
+            provider,
+            model,
+            part,
+            transcript_hash,
+            output_language,
+            json.dumps(known_speakers, sort_keys=True, default=str),
+            metadata_context,
+        ]
+    )
+    return PART_KEY_PREFIX + _sha256(raw)
+
+
+class LLMResponseCache:
+    """Size-bounded, TTL-limited LLM response store on the shared Redis cache."""
+
+    @property
+    def enabled(self) -> bool:
+        return settings.LLM_RESPONSE_CACHE_ENABLED
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return a cached entry and mark it recently used. None on miss or error."""
+        if not self.enabled:
+            return None
+        client = redis_cache.redis
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+            if raw is None:
+                return None
+            client.zadd(LRU_INDEX_KEY, {key: time.time()})
+            value: dict[str, Any] = json.loads(raw)
+            return value
+        except Exception as e:
+            logger.debug(f"LLM cache GET error for {key}: {e}")
+        return None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store an entry, then evict expired and least recently used keys."""
+        if not self.enabled:
+            return
+        client = redis_cache.redis
+        if client is None:
+            return
+        try:
+            raw = json.dumps(value, default=str)
+            if len(raw) > settings.LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES:
+                logger.debug(f"LLM cache entry too large to store ({len(raw)} bytes)")
+                return
+
+            now = time.time()
+            ttl = settings.LLM_RESPONSE_CACHE_TTL_SECONDS
+            pipe = client.pipeline(transaction=False)
+            pipe.setex(key, ttl, raw)
+            pipe.zadd(LRU_INDEX_KEY, {key: now})
+            # Index members whose entry has already expired
+            pipe.zremrangebyscore(LRU_INDEX_KEY, "-inf", now - ttl)
+            pipe.zcard(LRU_INDEX_KEY)
+            size = int(pipe.execute()[-1])
+
+            excess = size - settings.LLM_RESPONSE_CACHE_MAX_ENTRIES
+            if excess > 0:
+                evicted = [member for member, _ in client.zpopmin(LRU_INDEX_KEY, excess)]
+                if evicted:
+                    client.delete(*evicted)
+                    logger.debug(f"LLM cache evicted {len(evicted)} least recently used entries")
+        except Exception as e:
+            logger.debug(f"LLM cache SET error for {key}: {e}")
+
+
+# Module-level singleton
+llm_response_cache = LLMResponseCache()
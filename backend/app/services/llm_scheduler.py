@@ -0,0 +1,434 @@
+"""
+Cluster-wide scheduler for LLM requests.
+
+Every Celery NLP worker thread and API process talks to the same LLM
+endpoints. Without coordination a batch upload starts hundreds of
+summaries, topic extractions and speaker identifications at once, which
+times out self-hosted vLLM/Ollama servers and trips hosted rate limits.
+
+Requests now take a lease from a Redis-backed scheduler shared by every
+``LLMService`` before they are sent. Per endpoint (URL + API key):
+
+- A distributed semaphore caps in-flight requests. Leases expire so a
+  crashed worker cannot hold a slot forever; a streaming response renews
+  its lease as text arrives, so a long generation keeps its slot.
+- Waiters queue by priority, so user-triggered work is admitted ahead of
+  pipeline and batch work (Celery task priority, lower is sooner).
+- An optional tokens-per-minute budget (sliding 60 s window) is charged
+  with the estimated tokens up front and settled with the reported usage.
+- The concurrency limit adapts (AIMD): it grows by one after ``limit``
+  on-time responses, shrinks by one when latency per 1k tokens exceeds
+  ``LLM_SCHEDULER_LATENCY_FACTOR`` x its moving average, and halves on
+  429/503 or timeouts.
+- Overload responses set one shared backoff deadline (``Retry-After`` or
+  exponential) that every waiter honours, instead of each thread retrying
+  on its own.
+
+Key conventions (Redis db 1, outside ``cache:*``):
+    llm_sched:{endpoint}:slots      - Sorted set of leases scored by expiry
+    llm_sched:{endpoint}:queue      - Sorted set of waiters scored by priority, arrival
+    llm_sched:{endpoint}:alive      - Sorted set of waiters scored by heartbeat expiry
+    llm_sched:{endpoint}:tokens     - Sorted set of "{lease}:{tokens}" scored by time
+    llm_sched:{endpoint}:state      - Hash: limit, successes, latency_avg, backoff_level
+    llm_sched:{endpoint}:backoff    - Shared backoff deadline (epoch seconds)
+
+The scheduler degrades to unscheduled requests when Redis is unavailable.
+"""
+
+import contextlib
+import hashlib
+import logging
+import math
+import random
+import time
+import uuid
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+
+from app.core.config import settings
+from app.core.constants import NLPPriority
+from app.services.redis_cache_service import redis_cache
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "llm_sched:"
+_STATE_TTL_SECONDS = 86400
+_POLL_SECONDS = 0.25
+_WAITER_TTL_SECONDS = 10
+# Longest single sleep while queued; well inside the waiter TTL so a long
+# backoff or token-budget wait never lets the heartbeat lapse
+_MAX_SLEEP_SECONDS = _WAITER_TTL_SECONDS / 2
+# Minimum gap between lease renewals while a response streams
+_RENEW_INTERVAL_SECONDS = 30.0
+
+# Admit the waiter if it is within the free slots at the head of the queue
+# and the token budget allows it. Returns {1, 0} on success or {0, wait_ms}.
+_ACQUIRE_LUA = """
+local slots, queue, alive, tokens, state, backoff = KEYS[1], KEYS[2], KEYS[3], KEYS[4], KEYS[5], KEYS[6]
+local now = tonumber(ARGV[1])
+local lease = ARGV[2]
+local lease_ttl = tonumber(ARGV[3])
+local default_limit = tonumber(ARGV[4])
+local budget = tonumber(ARGV[5])
+local cost = tonumber(ARGV[6])
+
+redis.call("ZREMRANGEBYSCORE", slots, "-inf", now)
+local gone = redis.call("ZRANGEBYSCORE", alive, "-inf", now)
+for _, waiter in ipairs(gone) do
+    redis.call("ZREM", queue, waiter)
+    redis.call("ZREM", alive, waiter)
+end
+
+local until_ts = tonumber(redis.call("GET", backoff) or "0")
+if until_ts > now then
+    return {0, math.ceil((until_ts - now) * 1000)}
+end
+
+local limit = tonumber(redis.call("HGET", state, "limit") or default_limit)
+local free = limit - redis.call("ZCARD", slots)
+local rank = redis.call("ZRANK", queue, lease)
+if free <= 0 or not rank or rank >= free then
+    return {0, 0}
+end
+
+if budget > 0 then
+    redis.call("ZREMRANGEBYSCORE", tokens, "-inf", now - 60)
+    local used = 0
+    for _, entry in ipairs(redis.call("ZRANGE", tokens, 0, -1)) do
+        used = used + tonumber(string.match(entry, ":(%d+)$"))
+    end
+    if used > 0 and used + cost > budget then
+        local oldest = redis.call("ZRANGE", tokens, 0, 0, "WITHSCORES")
+        return {0, math.ceil((tonumber(oldest[2]) + 60 - now) * 1000)}
+    end
+    redis.call("ZADD", tokens, now, lease .. ":" .. cost)
+    redis.call("EXPIRE", tokens, 120)
+end
+
+redis.call("ZREM", queue, lease)
+redis.call("ZREM", alive, lease)
+redis.call("ZADD", slots, now + lease_ttl, lease)
+redis.call("EXPIRE", slots, math.ceil(lease_ttl) + 60)
+return {1, 0}
+"""
+
+# Release a lease and adapt the limit from its latency. Returns the new limit.
+_SUCCESS_LUA = """
+local slots, tokens, state = KEYS[1], KEYS[2], KEYS[3]
+local lease = ARGV[1]
+local latency = tonumber(ARGV[2])
+local charged = ARGV[3]
+local used = ARGV[4]
+local min_limit, max_limit = tonumber(ARGV[5]), tonumber(ARGV[6])
+local factor = tonumber(ARGV[7])
+local now = tonumber(ARGV[8])
+local ttl = tonumber(ARGV[9])
+
+redis.call("ZREM", slots, lease)
+if charged ~= used and redis.call("ZREM", tokens, lease .. ":" .. charged) == 1 then
+    redis.call("ZADD", tokens, now, lease .. ":" .. used)
+end
+
+local limit = tonumber(redis.call("HGET", state, "limit") or max_limit)
+local avg = tonumber(redis.call("HGET", state, "latency_avg") or "0")
+if avg > 0 and latency > factor * avg then
+    limit = math.max(min_limit, limit - 1)
+    redis.call("HSET", state, "successes", 0)
+else
+    local successes = redis.call("HINCRBY", state, "successes", 1)
+    if successes >= limit then
+        limit = math.min(max_limit, limit + 1)
+        redis.call("HSET", state, "successes", 0)
+    end
+end
+if avg > 0 then avg = 0.8 * avg + 0.2 * latency else avg = latency end
+
+redis.call("HSET", state, "limit", limit, "latency_avg", tostring(avg), "backoff_level", 0)
+redis.call("EXPIRE", state, ttl)
+return limit
+"""
+
+# Release a lease after an overload response, halve the limit and extend the
+# shared backoff deadline. Returns the backoff in milliseconds.
+_OVERLOAD_LUA = """
+local slots, tokens, state, backoff = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local lease = ARGV[1]
+local retry_after = tonumber(ARGV[2])
+local min_limit, max_limit = tonumber(ARGV[3]), tonumber(ARGV[4])
+local max_backoff = tonumber(ARGV[5])
+local now = tonumber(ARGV[6])
+local ttl = tonumber(ARGV[7])
+local charged = ARGV[8]
+
+-- The rejected request consumed no tokens
+redis.call("ZREM", slots, lease)
+redis.call("ZREM", tokens, lease .. ":" .. charged)
+local limit = tonumber(redis.call("HGET", state, "limit") or max_limit)
+limit = math.max(min_limit, math.floor(limit / 2))
+local level = redis.call("HINCRBY", state, "backoff_level", 1)
+redis.call("HSET", state, "limit", limit, "successes", 0)
+redis.call("EXPIRE", state, ttl)
+
+local delay = retry_after
+if delay <= 0 then delay = math.min(max_backoff, 2 ^ (level - 1)) end
+local until_ts = now + delay
+local current = tonumber(redis.call("GET", backoff) or "0")
+if until_ts > current then
+    redis.call("SET", backoff, tostring(until_ts), "EX", math.ceil(delay) + 1)
+end
+return math.ceil(delay * 1000)
+"""
+
+
+class LLMCapacityTimeoutError(Exception):
+    """No scheduler slot became available within ``LLM_SCHEDULER_MAX_WAIT_SECONDS``."""
+
+
+def endpoint_key(url: str, api_key: Optional[str]) -> str:
+    """Scheduler identity of an endpoint: hosted rate limits apply per API key."""
+    raw = f"{url}\x1f{api_key or ''}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def current_priority() -> int:
+    """Priority of the calling Celery task (lower is sooner).
+
+    Requests made outside a task come from API handlers with a user waiting
+    and are treated as user-triggered.
+    """
+    try:
+        from celery import current_task
+
+        if current_task and current_task.request.id:
+            delivery_info = current_task.request.delivery_info or {}
+            priority = delivery_info.get("priority")
+            if priority is None:
+                priority = getattr(current_task, "priority", None)
+            if priority is not None:
+                return int(priority)
+            return NLPPriority.AUTO_PIPELINE
+    except Exception as e:
+        logger.debug(f"Could not read Celery task priority: {e}")
+    return NLPPriority.USER_TRIGGERED
+
+
+class Lease:
+    """One admitted request. Report exactly one outcome before the slot is released."""
+
+    def __init__(
+        self, scheduler: "LLMScheduler", endpoint: str, lease_id: str, tokens: int, ttl: float
+    ):
+        self._scheduler = scheduler
+        self.endpoint = endpoint
+        self.lease_id = lease_id
+        self.tokens = tokens
+        self.ttl = ttl
+        self.admitted = False
+        self.reported = False
+        self._renewed_at = time.monotonic()
+
+    def renew(self) -> None:
+        """Extend the lease by its TTL while the response is still arriving.
+
+        Throttled to one Redis write per ``_RENEW_INTERVAL_SECONDS``, so it
+        can be called on every streamed chunk.
+        """
+        now = time.monotonic()
+        if not self.admitted or self.reported or now - self._renewed_at < _RENEW_INTERVAL_SECONDS:
+            return
+        self._renewed_at = now
+        self._scheduler._renew(self)
+
+    def completed(self, latency: float, usage_tokens: Optional[int] = None) -> None:
+        """Report an on-time response; feeds the adaptive limit."""
+        self.reported = True
+        self._scheduler._record_success(self, latency, usage_tokens)
+
+    def overloaded(self, retry_after: Optional[float] = None) -> float:
+        """Report a 429/503 or timeout. Returns the shared backoff in seconds."""
+        self.reported = True
+        return self._scheduler._record_overload(self, retry_after)
+
+
+class LLMScheduler:
+    """Distributed per-endpoint semaphore with priorities, token budget and AIMD limit."""
+
+    @property
+    def enabled(self) -> bool:
+        return settings.LLM_SCHEDULER_ENABLED
+
+    @staticmethod
+    def _keys(endpoint: str) -> dict[str, str]:
+        base = f"{_KEY_PREFIX}{endpoint}:"
+        return {
+            name: base + name for name in ("slots", "queue", "alive", "tokens", "state", "backoff")
+        }
+
+    @contextlib.contextmanager
+    def slot(
+        self, endpoint: str, priority: int, tokens: int, request_timeout: float
+    ) -> Iterator[Lease]:
+        """Wait for capacity on ``endpoint`` and hold it for one request.
+
+        Args:
+            endpoint: ``endpoint_key`` of the target
+            priority: Celery-style priority, lower is admitted first
+            tokens: Estimated prompt + completion tokens, charged to the budget
+            request_timeout: HTTP timeout; the lease outlives it by a minute and
+                is renewed with ``Lease.renew`` while a response streams
+
+        Raises:
+            LLMCapacityTimeoutError: If no slot frees up in time
+        """
+        lease = Lease(self, endpoint, uuid.uuid4().hex, max(1, int(tokens)), request_timeout + 60)
+        client = redis_cache.redis if self.enabled else None
+        if client is None:
+            yield lease
+            return
+
+        try:
+            lease.admitted = self._acquire(client, lease, priority, lease.ttl)
+        except LLMCapacityTimeoutError:
+            raise
+        except Exception as e:
+            logger.warning(f"LLM scheduler unavailable, sending unscheduled: {e}")
+            yield lease
+            return
+
+        try:
+            yield lease
+        finally:
+            if lease.admitted and not lease.reported:
+                self._release(client, lease)
+
+    def _acquire(self, client: Any, lease: Lease, priority: int, lease_ttl: float) -> bool:
+        keys = self._keys(lease.endpoint)
+        arrival = time.time()
+        # Priority dominates; arrival time breaks ties within a class
+        score = priority * 1e10 + arrival
+        deadline = arrival + settings.LLM_SCHEDULER_MAX_WAIT_SECONDS
+        try:
+            while True:
+                now = time.time()
+                # Re-queue at the original position if a stalled poll let the
+                # waiter be purged as dead
+                client.zadd(keys["queue"], {lease.lease_id: score}, nx=True)
+                client.zadd(keys["alive"], {lease.lease_id: now + _WAITER_TTL_SECONDS})
+                admitted, wait_ms = client.eval(
+                    _ACQUIRE_LUA,
+                    6,
+                    keys["slots"],
+                    keys["queue"],
+                    keys["alive"],
+                    keys["tokens"],
+                    keys["state"],
+                    keys["backoff"],
+                    now,
+                    lease.lease_id,
+                    lease_ttl,
+                    settings.LLM_SCHEDULER_MAX_CONCURRENCY,
+                    settings.LLM_SCHEDULER_TOKENS_PER_MINUTE,
+                    lease.tokens,
+                )
+                if int(admitted):
+                    if now - arrival > 1:
+                        logger.info(f"LLM request admitted after {now - arrival:.1f}s queued")
+                    return True
+                if now >= deadline:
+                    raise LLMCapacityTimeoutError(
+                        f"No LLM capacity after {settings.LLM_SCHEDULER_MAX_WAIT_SECONDS}s"
+                    )
+                # Jitter keeps released waiters from polling in lockstep
+                pause = min(max(_POLL_SECONDS, int(wait_ms) / 1000), _MAX_SLEEP_SECONDS)
+                time.sleep(min(pause, deadline - now) * random.uniform(1.0, 1.2))  # noqa: S311  # nosec B311
+        except BaseException:
+            with contextlib.suppress(Exception):
+                client.zrem(keys["queue"], lease.lease_id)
+                client.zrem(keys["alive"], lease.lease_id)
+            raise
+
+    def _renew(self, lease: Lease) -> None:
+        client = redis_cache.redis if self.enabled else None
+        if client is None:
+            return
+        slots = self._keys(lease.endpoint)["slots"]
+        try:
+            # Re-adds the lease if it already expired: the request is still in flight
+            client.zadd(slots, {lease.lease_id: time.time() + lease.ttl})
+            client.expire(slots, math.ceil(lease.ttl) + 60)
+        except Exception as e:
+            logger.debug(f"LLM scheduler renew error: {e}")
+
+    def _release(self, client: Any, lease: Lease) -> None:
+        try:
+            client.zrem(self._keys(lease.endpoint)["slots"], lease.lease_id)
+        except Exception as e:
+            logger.debug(f"LLM scheduler release error: {e}")
+
+    def _record_success(self, lease: Lease, latency: float, usage_tokens: Optional[int]) -> None:
+        client = redis_cache.redis if self.enabled else None
+        if client is None:
+            return
+        keys = self._keys(lease.endpoint)
+        used = usage_tokens if usage_tokens else lease.tokens
+        # Compare latency per 1k tokens so long prompts are not read as overload
+        normalized = latency / max(used / 1000, 0.1)
+        try:
+            client.eval(
+                _SUCCESS_LUA,
+                3,
+                keys["slots"],
+                keys["tokens"],
+                keys["state"],
+                lease.lease_id,
+                normalized,
+                lease.tokens,
+                used,
+                settings.LLM_SCHEDULER_MIN_CONCURRENCY,
+                settings.LLM_SCHEDULER_MAX_CONCURRENCY,
+                settings.LLM_SCHEDULER_LATENCY_FACTOR,
+                time.time(),
+                _STATE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.debug(f"LLM scheduler success report error: {e}")
+            self._release(client, lease)
+
+    def _record_overload(self, lease: Lease, retry_after: Optional[float]) -> float:
+        fallback = min(float(settings.LLM_SCHEDULER_MAX_BACKOFF_SECONDS), retry_after or 5.0)
+        client = redis_cache.redis if self.enabled else None
+        if client is None:
+            # No shared state: back off locally before the caller retries
+            time.sleep(fallback)
+            return fallback
+        keys = self._keys(lease.endpoint)
+        try:
+            delay_ms = client.eval(
+                _OVERLOAD_LUA,
+                4,
+                keys["slots"],
+                keys["tokens"],
+                keys["state"],
+                keys["backoff"],
+                lease.lease_id,
+                retry_after or 0,
+                settings.LLM_SCHEDULER_MIN_CONCURRENCY,
+                settings.LLM_SCHEDULER_MAX_CONCURRENCY,
+                settings.LLM_SCHEDULER_MAX_BACKOFF_SECONDS,
+                time.time(),
+                _STATE_TTL_SECONDS,
+                lease.tokens,
+            )
+            delay = int(delay_ms) / 1000
+            logger.warning(f"LLM endpoint overloaded, all workers backing off {delay:.1f}s")
+            return delay
+        except Exception as e:
+            logger.debug(f"LLM scheduler overload report error: {e}")
+            self._release(client, lease)
+            time.sleep(fallback)
+            return fallback
+
+
+# Module-level singleton
+llm_scheduler = LLMScheduler()
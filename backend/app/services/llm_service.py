@@ -7,8 +7,12 @@ Designed specifically for Celery tasks - no asyncio conflicts.
 
 import json
 import logging
+import math
 import re
+import threading
 import time
+from collections.abc import Callable
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -20,6 +24,19 @@ from urllib3.util.retry import Retry
 
 from app.core.config import settings
 from app.core.constants import LLM_OUTPUT_LANGUAGES
+from app.services.llm_response_cache import build_part_key
+from app.services.llm_response_cache import build_response_key
+from app.services.llm_response_cache import hash_transcript
+from app.services.llm_response_cache import llm_response_cache
+from app.services.llm_scheduler import Lease
+from app.services.llm_scheduler import current_priority
+from app.services.llm_scheduler import endpoint_key
+from app.services.llm_scheduler import llm_scheduler
+from app.services.llm_tokenizer import TokenCounter
+from app.services.llm_tokenizer import get_token_counter
+from app.services.llm_tokenizer import heuristic_token_count
+from app.services.llm_tokenizer import pack_segments
+from app.services.summary_progress import SummaryProgress
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +50,49 @@ OPENAI_REASONING_MODEL_PREFIXES = (
     "gpt-5",  # gpt-5 series
 )
 
+# Minimum seconds between partial-text callbacks while a response streams
+STREAM_CALLBACK_INTERVAL_SECONDS = 0.5
+# Seconds allowed to open the connection of a streamed request
+STREAM_CONNECT_TIMEOUT_SECONDS = 30
+
+# Attempts per request when the endpoint answers 429/503 (backoff is shared
+# through the LLM scheduler)
+OVERLOAD_ATTEMPTS = 4
+
+
+class LLMOverloadedError(Exception):
+    """The provider rejected a request for capacity (HTTP 429/503)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _renewing(lease: Lease, callback: Callable[[str], None]) -> Callable[[str], None]:
+    """Wrap a stream callback so each update also keeps the scheduler lease alive."""
+
+    def on_text(text: str) -> None:
+        lease.renew()
+        callback(text)
+
+    return on_text
+
 
 class LLMProvider(str, Enum):
     OPENAI = "openai"
@@ -54,6 +114,9 @@ class LLMResponse:
     finish_reason: Optional[str] = None
     model: Optional[str] = None
     provider: Optional[str] = None
+    cached: bool = False
+    # Response cache key, set when the request was cacheable (see cache_response)
+    cache_key: Optional[str] = None
 
 
 @dataclass
@@ -82,12 +145,19 @@ class LLMService:
         # For 121K context → 16384, for 8K → 4000 (floor)
         self.response_tokens = max(4000, min(16384, self.user_context_window // 4))
 
-        # Create session with retry strategy for reliability
+        # Priority of the task creating the service; chunk worker threads
+        # have no Celery context of their own
+        self.priority = current_priority()
+
+        # Create session with retry strategy for reliability. With the
+        # scheduler on, 429/503 are retried through its shared backoff
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 504]
+            if settings.LLM_SCHEDULER_ENABLED
+            else [429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "POST"],
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -134,6 +204,7 @@ class LLMService:
 
         # Log the resolved endpoint for debugging (helps diagnose connection issues like Issue #100)
         resolved_endpoint = self.endpoints.get(config.provider)
+        self.scheduler_endpoint = endpoint_key(str(resolved_endpoint), config.api_key)
         logger.info(
             f"Initialized LLMService: {config.provider}/{config.model}, "
             f"endpoint={resolved_endpoint}, "
@@ -370,6 +441,152 @@ class LLMService:
         else:
             return self._extract_openai_response(data)
 
+    def _raise_for_llm_status(self, response: requests.Response) -> None:
+        """Raise for a non-200 LLM response; 429/503 raise ``LLMOverloadedError``."""
+        if response.status_code in (429, 503):
+            logger.warning(f"LLM endpoint overloaded ({response.status_code})")
+            raise LLMOverloadedError(
+                f"LLM API error: {response.status_code} - {response.text[:500]}",
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        if response.status_code != 200:
+            error_detail = f"LLM API error ({response.status_code}): {response.text[:500]}{'...' if len(response.text) > 500 else ''}"
+            logger.error(error_detail)
+            raise Exception(f"LLM API error: {response.status_code} - {response.text}")
+
+    def _enable_streaming(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Ask for a streamed response: SSE, or NDJSON for Ollama."""
+        streamed = {**payload, "stream": True}
+        if self.config.provider in [LLMProvider.OPENAI, LLMProvider.VLLM, LLMProvider.OPENROUTER]:
+            # Usage is only reported in a final chunk when requested
+            streamed["stream_options"] = {"include_usage": True}
+        return streamed
+
+    @staticmethod
+    def _iter_stream_events(response: requests.Response) -> Iterator[dict[str, Any]]:
+        """Decode the JSON events of an SSE or NDJSON response body."""
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            if line.startswith("data:"):
+                line = line[5:].strip()
+                if line == "[DONE]":
+                    return
+            elif line.startswith(("event:", "id:", "retry:", ":")):
+                continue
+            yield json.loads(line)
+
+    def _apply_stream_event(self, event: dict[str, Any], state: dict[str, Any]) -> str:
+        """Record metadata from one stream event in ``state`` and return its text."""
+        if "error" in event:
+            raise Exception(f"LLM API error in stream: {event['error']}")
+
+        if self.config.provider in [LLMProvider.CLAUDE, LLMProvider.ANTHROPIC]:
+            event_type = event.get("type")
+            if event_type == "message_start":
+                state["input_tokens"] = event["message"].get("usage", {}).get("input_tokens", 0)
+            elif event_type == "content_block_delta":
+                delta = event.get("delta", {})
+                if delta.get("type") == "text_delta":
+                    return str(delta.get("text", ""))
+            elif event_type == "message_delta":
+                state["stop_reason"] = event.get("delta", {}).get("stop_reason")
+                state["output_tokens"] = event.get("usage", {}).get("output_tokens", 0)
+            return ""
+
+        if self.config.provider == LLMProvider.OLLAMA:
+            if event.get("done"):
+                state.update(
+                    {
+                        key: event[key]
+                        for key in ("done_reason", "prompt_eval_count", "eval_count")
+                        if key in event
+                    }
+                )
+            return str(event.get("message", {}).get("content", ""))
+
+        if event.get("usage"):
+            state["usage"] = event["usage"]
+        if not event.get("choices"):
+            return ""
+        choice = event["choices"][0]
+        if choice.get("finish_reason"):
+            state["finish_reason"] = choice["finish_reason"]
+        return str((choice.get("delta") or {}).get("content") or "")
+
+    def _assemble_stream_response(self, content: str, state: dict[str, Any]) -> dict[str, Any]:
+        """Shape a streamed response like the provider's non-streaming response."""
+        if self.config.provider in [LLMProvider.CLAUDE, LLMProvider.ANTHROPIC]:
+            data: dict[str, Any] = {
+                "content": [{"type": "text", "text": content}],
+                "stop_reason": state.get("stop_reason"),
+            }
+            if "output_tokens" in state:
+                data["usage"] = {
+                    "input_tokens": state.get("input_tokens", 0),
+                    "output_tokens": state["output_tokens"],
+                }
+            return data
+
+        if self.config.provider == LLMProvider.OLLAMA:
+            return {"message": {"role": "assistant", "content": content}, **state}
+
+        data = {
+            "choices": [
+                {"message": {"content": content}, "finish_reason": state.get("finish_reason")}
+            ]
+        }
+        if "usage" in state:
+            data["usage"] = state["usage"]
+        return data
+
+    def _stream_llm_request(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict,
+        timeout: int,
+        stream_callback: Callable[[str], None],
+    ) -> dict[str, Any]:
+        """Send a streaming request, reporting text as it arrives.
+
+        ``timeout`` bounds the wait for each chunk instead of the whole
+        completion, so a long generation only fails if the server stalls.
+
+        Returns:
+            The assembled response, shaped like a non-streaming response
+        """
+        start_time = time.time()
+        with self.session.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=(STREAM_CONNECT_TIMEOUT_SECONDS, timeout),
+            stream=True,
+        ) as response:
+            self._raise_for_llm_status(response)
+            response.encoding = response.encoding or "utf-8"
+
+            parts: list[str] = []
+            state: dict[str, Any] = {}
+            last_callback = 0.0
+            try:
+                for event in self._iter_stream_events(response):
+                    text = self._apply_stream_event(event, state)
+                    if not text:
+                        continue
+                    parts.append(text)
+                    now = time.monotonic()
+                    if now - last_callback >= STREAM_CALLBACK_INTERVAL_SECONDS:
+                        last_callback = now
+                        stream_callback("".join(parts))
+            except json.JSONDecodeError as e:
+                raise Exception(f"Invalid JSON in LLM stream: {e}") from e
+
+        logger.info(f"LLM stream completed in {time.time() - start_time:.2f}s")
+        return self._assemble_stream_response("".join(parts), state)
+
     def _send_llm_request(
         self, url: str, payload: dict, headers: dict, timeout: int
     ) -> dict[str, Any]:
@@ -382,10 +599,7 @@ class LLMService:
             f"LLM request completed in {request_time:.2f}s with status {response.status_code}"
         )
 
-        if response.status_code != 200:
-            error_detail = f"LLM API error ({response.status_code}): {response.text[:500]}{'...' if len(response.text) > 500 else ''}"
-            logger.error(error_detail)
-            raise Exception(f"LLM API error: {response.status_code} - {response.text}")
+        self._raise_for_llm_status(response)
 
         try:
             result: dict[str, Any] = response.json()
@@ -394,9 +608,75 @@ class LLMService:
             logger.error(f"Failed to parse LLM response: {response.text}")
             raise Exception(f"Invalid JSON response: {e}") from e
 
-    def chat_completion(self, messages: list[dict[str, str]], **kwargs) -> LLMResponse:
+    def _send_scheduled_request(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict,
+        timeout: int,
+        estimated_tokens: int,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> tuple[str, Optional[int], Optional[str]]:
+        """Send a request through the cluster-wide LLM scheduler.
+
+        Waits for a slot on this endpoint, reports latency and token usage
+        back to the scheduler, and retries 429/503 responses after the
+        shared backoff rather than on a per-thread timer. A streamed
+        response renews the lease as text arrives, since the generation can
+        outlast the lease TTL.
+
+        Returns:
+            Content, usage tokens and finish reason of the response
+        """
+        for attempt in range(1, OVERLOAD_ATTEMPTS + 1):
+            with llm_scheduler.slot(
+                self.scheduler_endpoint, self.priority, estimated_tokens, timeout
+            ) as lease:
+                start_time = time.time()
+                try:
+                    if stream_callback:
+                        data = self._stream_llm_request(
+                            url, payload, headers, timeout, _renewing(lease, stream_callback)
+                        )
+                    else:
+                        data = self._send_llm_request(url, payload, headers, timeout)
+                except LLMOverloadedError as e:
+                    delay = lease.overloaded(e.retry_after)
+                    if attempt == OVERLOAD_ATTEMPTS:
+                        raise
+                    logger.info(
+                        f"Retrying LLM request after shared backoff of {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{OVERLOAD_ATTEMPTS})"
+                    )
+                    continue
+                except requests.exceptions.Timeout:
+                    lease.overloaded()
+                    raise
+
+                result = self._extract_response_content(data)
+                lease.completed(time.time() - start_time, result[1])
+                return result
+
+        raise LLMOverloadedError("LLM endpoint stayed overloaded")  # pragma: no cover
+
+    def chat_completion(
+        self,
+        messages: list[dict[str, str]],
+        cache_transcript: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> LLMResponse:
         """
         Send chat completion request to LLM provider
+
+        Args:
+            messages: Chat messages to send
+            cache_transcript: Transcript text embedded in ``messages``. When given,
+                the response is served from the LLM response cache, and the caller
+                stores it with ``cache_response`` once its content checks out
+            stream_callback: Called with the text generated so far while the
+                response streams (requires ``LLM_STREAMING_ENABLED``)
+            **kwargs: Request parameters passed to the payload builders
         """
         url = self.endpoints[self.config.provider]
         if url is None:
@@ -404,6 +684,19 @@ class LLMService:
         headers = self._get_headers()
         payload = self._prepare_payload(messages, **kwargs)
 
+        cache_key = None
+        if cache_transcript:
+            cache_key = self._response_cache_key(url, messages, cache_transcript, payload, kwargs)
+            cached = llm_response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM response served from cache ({self.config.provider})")
+                return LLMResponse(**cached, cached=True)
+
+        if stream_callback and settings.LLM_STREAMING_ENABLED:
+            payload = self._enable_streaming(payload)
+        else:
+            stream_callback = None
+
         total_content_length = sum(len(msg.get("content", "")) for msg in messages)
         logger.info(f"Sending request to {self.config.provider} ({url})")
         logger.info(f"Total request content length: {total_content_length} characters")
@@ -412,9 +705,14 @@ class LLMService:
         timeout = min(1200, max(300, total_content_length // 1000))
         logger.info(f"Using timeout: {timeout} seconds for content length: {total_content_length}")
 
+        estimated_tokens = sum(
+            self._estimate_tokens(msg.get("content", "")) for msg in messages
+        ) + kwargs.get("max_tokens", self.config.response_tokens)
+
         try:
-            data = self._send_llm_request(url, payload, headers, timeout)
-            content, usage_tokens, finish_reason = self._extract_response_content(data)
+            content, usage_tokens, finish_reason = self._send_scheduled_request(
+                url, payload, headers, timeout, estimated_tokens, stream_callback
+            )
 
             if not content:
                 raise Exception("Empty content in LLM response")
@@ -427,6 +725,7 @@ class LLMService:
                 finish_reason=finish_reason,
                 model=self.config.model,
                 provider=self.config.provider.value,
+                cache_key=cache_key,
             )
 
         except requests.exceptions.Timeout as e:
@@ -446,6 +745,53 @@ class LLMService:
             )
             raise
 
+    def cache_response(self, response: LLMResponse) -> None:
+        """Store a ``chat_completion`` response that parsed and validated.
+
+        Only the caller knows whether a reply is usable, so responses are
+        not cached on receipt; a malformed or truncated one is never replayed.
+        """
+        if response.cached or not response.cache_key:
+            return
+        llm_response_cache.set(
+            response.cache_key,
+            {
+                "content": response.content,
+                "usage_tokens": response.usage_tokens,
+                "finish_reason": response.finish_reason,
+                "model": response.model,
+                "provider": response.provider,
+            },
+        )
+
+    def _cache_summary_response(self, response: LLMResponse, summary: dict[str, Any]) -> None:
+        """Cache a summary response unless parsing failed or had to repair it."""
+        if "error" in summary or summary.get("metadata", {}).get("json_repaired"):
+            return
+        self.cache_response(response)
+
+    def _response_cache_key(
+        self,
+        url: str,
+        messages: list[dict[str, str]],
+        transcript: str,
+        payload: dict[str, Any],
+        options: dict[str, Any],
+    ) -> str:
+        """Build the response cache key for a request over ``transcript``.
+
+        Messages are hashed separately from the payload so the provider-specific
+        placement of the system prompt does not leak transcript text into the
+        parameter part of the key.
+        """
+        params = {
+            "request": {k: v for k, v in payload.items() if k not in ("messages", "system")},
+            "options": options,
+        }
+        return build_response_key(
+            self.config.provider.value, url, self.config.model, messages, transcript, params
+        )
+
     def _estimate_tokens(self, text: str) -> int:
         """
         Estimate token count using more accurate heuristics.
@@ -464,74 +810,75 @@ class LLMService:
             - Uses word-based and character-based heuristics
             - Accounts for common punctuation and formatting
             - Returns slightly higher estimates to be safe
+            - Transcript chunking uses ``_token_counter`` instead, which is
+              exact when a tokenizer for the model is available
         """
-        if not text:
-            return 0
-
-        # Basic word count
-        words = text.split()
-        word_count = len(words)
-
-        # Character-based estimation for better accuracy
-        char_count = len(text)
-
-        # Combine both methods:
-        # - English averages ~4.7 characters per token
-        # - But also consider word boundaries and punctuation
-        from app.core.constants import CHARS_PER_TOKEN_ESTIMATE
-        from app.core.constants import SUBWORD_TOKENIZATION_FACTOR
-        from app.core.constants import TOKEN_ESTIMATION_BUFFER
-
-        char_based_estimate = char_count / CHARS_PER_TOKEN_ESTIMATE
-        word_based_estimate = word_count * SUBWORD_TOKENIZATION_FACTOR
-
-        # Use the higher estimate to be conservative
-        estimated_tokens = max(char_based_estimate, word_based_estimate)
-
-        # Add buffer for safety
-        return int(estimated_tokens * TOKEN_ESTIMATION_BUFFER)
+        return heuristic_token_count(text)
+
+    @property
+    def _token_counter(self) -> TokenCounter:
+        """Token counter for this provider/model (resolved once per process)."""
+        return get_token_counter(
+            self.config.provider.value,
+            self.config.model,
+            str(self.endpoints[self.config.provider]),
+            self.config.api_key,
+        )
 
     def _split_oversized_chunk_by_sentences(self, chunk: str, available_tokens: int) -> list[str]:
         """Split an oversized chunk into smaller chunks by sentence boundaries."""
-        sentences = re.split(r"(?<=[.!?])\s+", chunk)
-        sub_chunks = []
-        sub_chunk = ""
-
-        for sentence in sentences:
-            test_chunk = sub_chunk + sentence + " "
-            if self._estimate_tokens(test_chunk) <= available_tokens:
-                sub_chunk = test_chunk
-            else:
-                if sub_chunk.strip():
-                    sub_chunks.append(sub_chunk.strip())
-                sub_chunk = sentence + " "
-
-        if sub_chunk.strip():
-            sub_chunks.append(sub_chunk.strip())
-
-        return sub_chunks
+        # Zero-width split keeps the whitespace, so pieces rejoin losslessly
+        sentences = [s for s in re.split(r"(?<=[.!?])(?=\s)", chunk) if s]
+        counts = self._token_counter.count_many(sentences)
+
+        pieces: list[str] = []
+        piece_counts: list[int] = []
+        for sentence, count in zip(sentences, counts):
+            if count <= available_tokens:
+                pieces.append(sentence)
+                piece_counts.append(count)
+                continue
+            # A single sentence over budget: cut it into equal character windows
+            parts = math.ceil(count / available_tokens)
+            width = math.ceil(len(sentence) / parts)
+            for offset in range(0, len(sentence), width):
+                pieces.append(sentence[offset : offset + width])
+                piece_counts.append(math.ceil(count / parts))
+
+        return [
+            "".join(pieces[i] for i in group).strip()
+            for group in pack_segments(pieces, piece_counts, available_tokens)
+        ]
 
     def _split_by_speaker_segments(self, transcript: str, available_tokens: int) -> list[str]:
-        """Split transcript by speaker changes into appropriately sized chunks."""
-        speaker_segments = re.split(r"(\n[A-Z_][A-Z0-9_]*:\s*\[\d+:\d+\])", transcript)
-        chunks = []
-        current_chunk = ""
-        current_size = 0
-
-        for segment in speaker_segments:
-            segment_size = self._estimate_tokens(segment)
+        """Split transcript by speaker changes into appropriately sized chunks.
 
-            if current_size + segment_size > available_tokens and current_chunk:
-                chunks.append(current_chunk.strip())
-                logger.debug(f"Created chunk {len(chunks)}: {len(current_chunk)} chars")
-                current_chunk = segment
-                current_size = segment_size
-            else:
-                current_chunk += segment
-                current_size += segment_size
+        Each speaker turn is counted once; ``pack_segments`` then fills every
+        chunk up to ``available_tokens`` in a single pass over prefix sums.
+        Turns too large for any chunk are split by sentences.
+        """
+        # Split before each speaker header so a turn keeps its header
+        segments = [s for s in re.split(r"(?=\n[A-Z_][A-Z0-9_]*:\s*\[\d+:\d+\])", transcript) if s]
+        counts = self._token_counter.count_many(segments)
+
+        expanded: list[str] = []
+        expanded_counts: list[int] = []
+        for segment, count in zip(segments, counts):
+            if count <= available_tokens:
+                expanded.append(segment)
+                expanded_counts.append(count)
+                continue
+            logger.warning("Speaker segment too large, splitting by sentences")
+            sub_chunks = self._split_oversized_chunk_by_sentences(segment, available_tokens)
+            expanded.extend(sub_chunks)
+            expanded_counts.extend([available_tokens] * len(sub_chunks))
 
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        chunks = []
+        for group in pack_segments(expanded, expanded_counts, available_tokens):
+            chunk = "".join(expanded[i] for i in group).strip()
+            if chunk:
+                chunks.append(chunk)
+                logger.debug(f"Created chunk {len(chunks)}: {len(chunk)} chars")
 
         return chunks
 
@@ -542,38 +889,26 @@ class LLMService:
         Split transcript into intelligent chunks using ONLY user's max_tokens setting
         """
         available_tokens = self.user_context_window - 2000  # Reserve for prompt + response
-        estimated_tokens = self._estimate_tokens(transcript)
+        counter = self._token_counter
+        transcript_tokens = counter.count(transcript)
 
         logger.info(
-            f"Chunking transcript: {len(transcript)} chars, estimated {estimated_tokens} tokens"
+            f"Chunking transcript: {len(transcript)} chars, {transcript_tokens} tokens "
+            f"({counter.source})"
         )
         logger.info(
             f"Using user context window: {self.user_context_window}, available for content: {available_tokens}"
         )
 
-        if estimated_tokens <= available_tokens:
+        if transcript_tokens <= available_tokens:
             logger.info("Transcript fits in single chunk")
             return [transcript]
 
-        target_chars_per_chunk = int(available_tokens * 2.5)
-        logger.info(f"Target chars per chunk: {target_chars_per_chunk}")
-
-        chunks = self._split_by_speaker_segments(transcript, available_tokens)
-
-        # Handle oversized chunks by splitting on sentences
-        final_chunks = []
-        for chunk in chunks:
-            if self._estimate_tokens(chunk) <= available_tokens:
-                final_chunks.append(chunk)
-            else:
-                logger.warning("Chunk too large, splitting by sentences")
-                final_chunks.extend(
-                    self._split_oversized_chunk_by_sentences(chunk, available_tokens)
-                )
+        final_chunks = self._split_by_speaker_segments(transcript, available_tokens)
 
         if not final_chunks and transcript:
             logger.warning("No chunks created, truncating original transcript")
-            final_chunks = [transcript[:target_chars_per_chunk]]
+            final_chunks = [transcript[: int(available_tokens * 2.5)]]
 
         logger.info(
             f"Split transcript into {len(final_chunks)} chunks using user context window: {self.user_context_window}"
@@ -592,6 +927,7 @@ class LLMService:
         output_language: str = "en",
         organization_context: str = "",
         prompt_uuid: Optional[str] = None,
+        progress: Optional[SummaryProgress] = None,
     ) -> dict[str, Any]:
         """
         Generate structured summary from transcript.
@@ -602,6 +938,8 @@ class LLMService:
             user_id: Optional user ID for loading custom prompts
             output_language: ISO 639-1 code for output language (default: "en")
             organization_context: Organization/project context to inject into prompts
+            progress: Receives streamed text and finished sections. A retried
+                multi-section run skips sections found in the LLM response cache
 
         Returns:
             Structured summary dict with metadata
@@ -629,6 +967,7 @@ class LLMService:
                 prompt_template,
                 output_language_name,
                 organization_context,
+                progress,
             )
         else:
             # Multi-chunk processing
@@ -639,8 +978,171 @@ class LLMService:
                 prompt_template,
                 output_language_name,
                 organization_context,
+                progress,
+            )
+
+    def generate_combined_enrichment(
+        self,
+        transcript: str,
+        speaker_data: Optional[dict[str, Any]] = None,
+        speaker_names: Optional[dict[str, str]] = None,
+        known_speakers: Optional[list] = None,
+        metadata_context: str = "",
+        user_id: Optional[int] = None,
+        output_language: str = "en",
+        organization_context: str = "",
+        prompt_uuid: Optional[str] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Generate summary and topic suggestions in one request.
+
+        The transcript is sent once, with the summary prompt followed by the
+        topic instructions. The topic part is published to the LLM response
+        cache (see ``get_enrichment_part``); automatic topic extraction is
+        started by the summary task once this returns, so it finds the part.
+        Speaker identification stays a separate request: it waits for gender
+        detection and would rarely run after the summary.
+
+        Args:
+            transcript: Transcript with diarization labels (``build_full_transcript``)
+            speaker_data: Optional speaker statistics (talk time, word count, etc.)
+            speaker_names: Diarization label to display name, for the summary
+            known_speakers: Known speaker profiles with names and descriptions
+            metadata_context: File metadata (title, author, description, tags)
+            user_id: Optional user ID for loading custom prompts
+            output_language: ISO 639-1 code for output language (default: "en")
+            organization_context: Organization/project context to inject into prompts
+            prompt_uuid: Optional summary prompt to use instead of the active one
+
+        Returns:
+            Structured summary dict with metadata, or None when the transcript
+            does not fit in a single request or the response has no summary.
+            Callers fall back to ``generate_summary``.
+        """
+        from app.utils.prompt_manager import get_user_active_prompt
+
+        prompt_template = get_user_active_prompt(user_id, prompt_uuid=prompt_uuid)
+        output_language_name = LLM_OUTPUT_LANGUAGES.get(output_language, "English")
+
+        formatted_prompt = prompt_template.format(
+            transcript=transcript,
+            speaker_data=json.dumps(speaker_data or {}, indent=2),
+        )
+        names = "\n".join(f"- {label}: {name}" for label, name in (speaker_names or {}).items())
+        metadata_section = f"FILE METADATA:\n{metadata_context}\n" if metadata_context else ""
+        user_prompt = f"""{formatted_prompt}
+
+SPEAKER NAMES (diarization label: name to use in the summary):
+{names or "- none known"}
+{self._build_known_speakers_context(known_speakers or [])}
+{metadata_section}
+ADDITIONAL TASK ON THE SAME TRANSCRIPT:
+Suggest 3-10 searchable tags (lowercase, 1-3 words, no generic tags like "meeting")
+and 1-3 collections that would group this file with related content.
+
+RESPONSE FORMAT (a single JSON object):
+{{
+    "summary": {{ the summary object in the format requested above }},
+    "topics": {{
+        "suggested_collections": [{{"name": "Collection Name", "confidence": 0.85, "rationale": "..."}}],
+        "suggested_tags": [{{"name": "tag-name", "confidence": 0.9, "rationale": "..."}}]
+    }}
+}}"""
+
+        language_instruction = (
+            f" Generate all output text in {output_language_name}; speaker names stay unchanged."
+            if output_language_name != "English"
+            else ""
+        )
+        messages = [
+            {
+                "role": "system",
+                "content": "You are an expert meeting analyst. Analyze the transcript once and "
+                "return the summary and tag and collection suggestions "
+                f"in the exact JSON format specified.{language_instruction}"
+                f"{self._build_org_context_block(organization_context)}",
+            },
+            {"role": "user", "content": user_prompt},
+        ]
+
+        max_tokens = min(self.response_tokens * 2, self.user_context_window // 2)
+        prompt_tokens = sum(self._estimate_tokens(m["content"]) for m in messages)
+        if prompt_tokens + max_tokens > self.user_context_window:
+            logger.info(
+                f"Combined enrichment needs ~{prompt_tokens + max_tokens} tokens, "
+                f"context window is {self.user_context_window}; using separate requests"
+            )
+            return None
+
+        response = self.chat_completion(
+            messages,
+            cache_transcript=transcript,
+            max_tokens=max_tokens,
+            temperature=0.1,
+            prefill_json=True,
+        )
+        combined = self._parse_summary_response(response, len(transcript))
+        summary = combined.get("summary")
+        if not isinstance(summary, dict):
+            logger.warning("Combined enrichment response has no summary; using separate requests")
+            return None
+        self._cache_summary_response(response, combined)
+
+        topics = combined.get("topics")
+        if isinstance(topics, dict):
+            llm_response_cache.set(
+                self._enrichment_part_key(
+                    "topics", transcript, output_language, known_speakers, metadata_context
+                ),
+                topics,
             )
 
+        summary["metadata"] = {**combined["metadata"], "processing_method": "combined-enrichment"}
+        return summary
+
+    def get_enrichment_part(
+        self,
+        part: str,
+        transcript: str,
+        output_language: str = "en",
+        known_speakers: Optional[list] = None,
+        metadata_context: str = "",
+    ) -> Optional[dict[str, Any]]:
+        """Return a part published by ``generate_combined_enrichment``, if any.
+
+        Args:
+            part: ``"topics"``
+            transcript: Transcript with diarization labels (``build_full_transcript``)
+            output_language: ISO 639-1 code the part was generated in
+            known_speakers: Known speaker profiles the request was given
+            metadata_context: File metadata the request was given
+        """
+        if not settings.LLM_COMBINED_ENRICHMENT:
+            return None
+        return llm_response_cache.get(
+            self._enrichment_part_key(
+                part, transcript, output_language, known_speakers, metadata_context
+            )
+        )
+
+    def _enrichment_part_key(
+        self,
+        part: str,
+        transcript: str,
+        output_language: str,
+        known_speakers: Optional[list],
+        metadata_context: str,
+    ) -> str:
+        return build_part_key(
+            self.config.provider.value,
+            self.config.model,
+            part,
+            hash_transcript(transcript),
+            output_language,
+            known_speakers or [],
+            metadata_context,
+        )
+
     def _build_org_context_block(self, organization_context: str) -> str:
         """Build the organization context block for system prompts."""
         if not organization_context or not organization_context.strip():
@@ -658,8 +1160,10 @@ class LLMService:
         prompt_template: str,
         output_language_name: str = "English",
         organization_context: str = "",
+        progress: Optional[SummaryProgress] = None,
     ) -> dict[str, Any]:
         """Process single transcript chunk"""
+        stream_callback = progress.stream_text if progress else None
         formatted_prompt = prompt_template.format(
             transcript=transcript,
             speaker_data=json.dumps(speaker_data or {}, indent=2),
@@ -683,7 +1187,12 @@ class LLMService:
 
         # Use response prefilling to force JSON output (bypasses preamble)
         response = self.chat_completion(
-            messages, max_tokens=self.response_tokens, temperature=0.1, prefill_json=True
+            messages,
+            cache_transcript=transcript,
+            stream_callback=stream_callback,
+            max_tokens=self.response_tokens,
+            temperature=0.1,
+            prefill_json=True,
         )
 
         # Retry with doubled tokens if response was truncated
@@ -694,10 +1203,17 @@ class LLMService:
                 f"retrying with max_tokens={retry_tokens}"
             )
             response = self.chat_completion(
-                messages, max_tokens=retry_tokens, temperature=0.1, prefill_json=True
+                messages,
+                cache_transcript=transcript,
+                stream_callback=stream_callback,
+                max_tokens=retry_tokens,
+                temperature=0.1,
+                prefill_json=True,
             )
 
-        return self._parse_summary_response(response, len(transcript))
+        summary = self._parse_summary_response(response, len(transcript))
+        self._cache_summary_response(response, summary)
+        return summary
 
     def _process_multiple_chunks(
         self,
@@ -706,11 +1222,15 @@ class LLMService:
         prompt_template: str,
         output_language_name: str = "English",
         organization_context: str = "",
+        progress: Optional[SummaryProgress] = None,
     ) -> dict[str, Any]:
         """Process multiple transcript chunks in parallel using ThreadPoolExecutor.
 
         Each chunk is summarized independently, then combined into a final summary.
         Parallelism is capped at min(num_chunks, 4) to avoid overwhelming the LLM API.
+        With ``progress``, each finished section is reported as it completes.
+        A rerun gets the sections that already parsed from the LLM response
+        cache, so only the missing ones are sent again.
         """
         from concurrent.futures import ThreadPoolExecutor
         from concurrent.futures import as_completed
@@ -730,6 +1250,18 @@ class LLMService:
             for i in range(num_chunks)
         ]
 
+        completed_count = 0
+        completed_lock = threading.Lock()
+
+        def _report(index: int, section: dict[str, Any]) -> None:
+            nonlocal completed_count
+            if progress is None:
+                return
+            with completed_lock:
+                completed_count += 1
+                done = completed_count
+            progress.section_done(index, done, num_chunks, section)
+
         logger.info(f"Processing {num_chunks} sections in parallel (max_workers={max_workers})")
 
         def _process_one(index: int, chunk: str) -> tuple[int, dict[str, Any]]:
@@ -745,6 +1277,7 @@ class LLMService:
                     prompt_template,
                     output_language_name,
                     organization_context,
+                    on_success=lambda section: _report(index, section),
                 ),
             )
 
@@ -776,6 +1309,7 @@ class LLMService:
             num_chunks,
             output_language_name,
             organization_context,
+            stream_callback=progress.stream_text if progress else None,
         )
 
     def _summarize_section(
@@ -787,8 +1321,9 @@ class LLMService:
         prompt_template: str,
         output_language_name: str = "English",
         organization_context: str = "",
+        on_success: Optional[Callable[[dict[str, Any]], None]] = None,
     ) -> dict[str, Any]:
-        """Summarize a single section"""
+        """Summarize a single section; ``on_success`` receives a parsed result"""
         formatted_prompt = prompt_template.format(
             transcript=chunk,
             speaker_data=json.dumps(speaker_data or {}, indent=2),
@@ -812,7 +1347,11 @@ class LLMService:
 
         # Use response prefilling for consistent JSON output
         response = self.chat_completion(
-            messages, max_tokens=min(4000, self.response_tokens), temperature=0.1, prefill_json=True
+            messages,
+            cache_transcript=chunk,
+            max_tokens=min(4000, self.response_tokens),
+            temperature=0.1,
+            prefill_json=True,
         )
 
         try:
@@ -823,7 +1362,6 @@ class LLMService:
                 content = content[3:-3].strip()
 
             parsed_result: dict[str, Any] = json.loads(content)
-            return parsed_result
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse section {section_num} JSON: {e}")
             return {
@@ -834,6 +1372,11 @@ class LLMService:
                 "topics_discussed": [],
             }
 
+        self.cache_response(response)
+        if on_success:
+            on_success(parsed_result)
+        return parsed_result
+
     def _combine_sections(
         self,
         sections: list[dict[str, Any]],
@@ -842,6 +1385,7 @@ class LLMService:
         total_sections: int,
         output_language_name: str = "English",
         organization_context: str = "",
+        stream_callback: Optional[Callable[[str], None]] = None,
     ) -> dict[str, Any]:
         """Combine multiple section summaries into final summary"""
         combined_content = f"SECTION SUMMARIES TO COMBINE:\n{json.dumps(sections, indent=2)}"
@@ -870,7 +1414,12 @@ class LLMService:
         try:
             # Use response prefilling for final combined summary
             response = self.chat_completion(
-                messages, max_tokens=self.response_tokens, temperature=0.1, prefill_json=True
+                messages,
+                cache_transcript=combined_content,
+                stream_callback=stream_callback,
+                max_tokens=self.response_tokens,
+                temperature=0.1,
+                prefill_json=True,
             )
 
             # Retry with doubled tokens if response was truncated
@@ -881,14 +1430,21 @@ class LLMService:
                     f"retrying with max_tokens={retry_tokens}"
                 )
                 response = self.chat_completion(
-                    messages, max_tokens=retry_tokens, temperature=0.1, prefill_json=True
+                    messages,
+                    cache_transcript=combined_content,
+                    stream_callback=stream_callback,
+                    max_tokens=retry_tokens,
+                    temperature=0.1,
+                    prefill_json=True,
                 )
 
-            return self._parse_summary_response(
+            summary = self._parse_summary_response(
                 response,
                 0,
                 {"sections_processed": total_sections, "processing_method": "multi-section"},
             )
+            self._cache_summary_response(response, summary)
+            return summary
         except Exception as e:
             logger.error(f"Failed to combine sections: {e}")
             return {
@@ -1407,6 +1963,7 @@ IMPORTANT: Only include predictions with confidence >= 0.5. If you cannot confid
             response_tokens = min(self.config.response_tokens, self.user_context_window // 4)
             response = self.chat_completion(
                 messages=messages,
+                cache_transcript=transcript_content,
                 max_tokens=response_tokens,
                 temperature=0.2,
             )
@@ -1415,7 +1972,10 @@ IMPORTANT: Only include predictions with confidence >= 0.5. If you cannot confid
                 logger.warning("LLM returned empty response for speaker identification")
                 return {"speaker_predictions": [], "error": "No response from LLM"}
 
-            return self._parse_speaker_identification_response(response)
+            result = self._parse_speaker_identification_response(response)
+            if "error" not in result:
+                self.cache_response(response)
+            return result
 
         except Exception as e:
             logger.error(f"Speaker identification failed with error: {e}", exc_info=True)
@@ -0,0 +1,250 @@
+"""
+Token counting for LLM transcript chunking.
+
+``LLMService._estimate_tokens`` pads a character/word heuristic by 10%, so
+chunks were sized for more tokens than they held and long transcripts were
+split into more map calls than the context window required. Chunking now
+asks a ``TokenCounter`` for per-segment counts, using the most accurate
+source available for the configured model:
+
+1. ``LLM_TOKENIZER_PATH`` - a ``tokenizer.json`` file or Hugging Face repo id,
+   loaded with the ``tokenizers`` library
+2. tiktoken for OpenAI models, when the package is installed
+3. The model's Hugging Face ``tokenizer.json`` for vLLM (model names are
+   repo ids there)
+4. The server's ``/tokenize`` endpoint for vLLM and other OpenAI-compatible
+   servers that expose it; one request per batch calibrates the heuristic
+5. The heuristic, as before
+
+Counters are resolved once per provider/model/endpoint and kept for the
+life of the process, including negative results, so a missing tokenizer
+costs one lookup rather than one per chunking call.
+"""
+
+import logging
+import math
+import os
+import threading
+from collections.abc import Callable
+from typing import Optional
+
+import requests
+
+from app.core.config import settings
+from app.core.constants import CHARS_PER_TOKEN_ESTIMATE
+from app.core.constants import SUBWORD_TOKENIZATION_FACTOR
+from app.core.constants import TOKEN_ESTIMATION_BUFFER
+
+logger = logging.getLogger(__name__)
+
+_TOKENIZE_TIMEOUT_SECONDS = 30
+
+_counters: dict[tuple[str, str, str], "TokenCounter"] = {}
+_counters_lock = threading.Lock()
+
+
+def heuristic_token_count(text: str, buffer: float = TOKEN_ESTIMATION_BUFFER) -> int:
+    """Conservative token estimate from character and word counts."""
+    if not text:
+        return 0
+    char_based_estimate = len(text) / CHARS_PER_TOKEN_ESTIMATE
+    word_based_estimate = len(text.split()) * SUBWORD_TOKENIZATION_FACTOR
+    return int(max(char_based_estimate, word_based_estimate) * buffer)
+
+
+class TokenCounter:
+    """Counts tokens for a batch of texts.
+
+    Args:
+        source: Where counts come from, for logging (``tiktoken``, ``hf``, ...)
+        count_batch: Returns one count per text, or None to fall back to the
+            heuristic for this batch
+    """
+
+    def __init__(
+        self, source: str, count_batch: Optional[Callable[[list[str]], Optional[list[int]]]] = None
+    ):
+        self.source = source
+        self._count_batch = count_batch
+
+    @property
+    def exact(self) -> bool:
+        return self._count_batch is not None
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        """Token count of each text, in order."""
+        if self._count_batch is not None and texts:
+            try:
+                counts = self._count_batch(texts)
+                if counts is not None:
+                    return counts
+            except Exception as e:
+                logger.debug(f"Token counting via {self.source} failed, using heuristic: {e}")
+        return [heuristic_token_count(text) for text in texts]
+
+    def count(self, text: str) -> int:
+        return self.count_many([text])[0]
+
+
+def _tokenizers_batch(tokenizer) -> Callable[[list[str]], list[int]]:
+    def count_batch(texts: list[str]) -> list[int]:
+        encodings = tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+    return count_batch
+
+
+def _load_hf_tokenizer(name_or_path: str) -> Optional[Callable[[list[str]], list[int]]]:
+    """Load a ``tokenizers`` tokenizer from a tokenizer.json file or repo id."""
+    try:
+        from tokenizers import Tokenizer
+
+        if os.path.isfile(name_or_path):
+            tokenizer = Tokenizer.from_file(name_or_path)
+        else:
+            tokenizer = Tokenizer.from_pretrained(
+                name_or_path, token=settings.HUGGINGFACE_TOKEN or None
+            )
+        return _tokenizers_batch(tokenizer)
+    except ImportError:
+        logger.debug("tokenizers package not installed")
+    except Exception as e:
+        logger.debug(f"No Hugging Face tokenizer for {name_or_path}: {e}")
+    return None
+
+
+def _load_tiktoken(model: str) -> Optional[Callable[[list[str]], list[int]]]:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Newer model names map to o200k_base before tiktoken learns about them
+        encoding = tiktoken.get_encoding("o200k_base")
+
+    def count_batch(texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+    return count_batch
+
+
+def _tokenize_url(chat_endpoint: str) -> str:
+    """``/tokenize`` lives at the server root, next to ``/v1``."""
+    base = chat_endpoint.split("/v1/", 1)[0].rstrip("/")
+    return f"{base}/tokenize"
+
+
+def _server_calibrated(
+    chat_endpoint: str, model: str, api_key: Optional[str]
+) -> Optional[Callable[[list[str]], Optional[list[int]]]]:
+    """Count via the server's ``/tokenize`` endpoint, if it has one.
+
+    A request per segment would cost hundreds of round trips, so the batch
+    is tokenized once as a whole and the exact total is spread over the
+    texts in proportion to their unpadded heuristic estimates.
+    """
+    url = _tokenize_url(chat_endpoint)
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+    def server_count(text: str) -> Optional[int]:
+        response = requests.post(
+            url,
+            json={"model": model, "prompt": text, "add_special_tokens": False},
+            headers=headers,
+            timeout=_TOKENIZE_TIMEOUT_SECONDS,
+        )
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        count = data.get("count")
+        return int(count) if count is not None else len(data.get("tokens", []))
+
+    try:
+        if server_count("hello") is None:
+            return None
+    except (requests.RequestException, ValueError) as e:
+        logger.debug(f"No tokenize endpoint at {url}: {e}")
+        return None
+
+    def count_batch(texts: list[str]) -> Optional[list[int]]:
+        total = server_count("".join(texts))
+        if total is None:
+            return None
+        raw = [heuristic_token_count(text, buffer=1.0) for text in texts]
+        scale = total / max(sum(raw), 1)
+        return [math.ceil(estimate * scale) for estimate in raw]
+
+    return count_batch
+
+
+def _resolve_counter(
+    provider: str, model: str, chat_endpoint: str, api_key: Optional[str]
+) -> TokenCounter:
+    if settings.LLM_TOKENIZER_PATH:
+        count_batch = _load_hf_tokenizer(settings.LLM_TOKENIZER_PATH)
+        if count_batch:
+            return TokenCounter("hf", count_batch)
+
+    if provider == "openai" and not chat_endpoint.startswith("https://api.openai.com"):
+        # OpenAI-compatible server behind a custom base URL: not an OpenAI model
+        provider = "custom"
+
+    if provider == "openai":
+        count_batch = _load_tiktoken(model)
+        if count_batch:
+            return TokenCounter("tiktoken", count_batch)
+
+    if provider == "vllm":
+        count_batch = _load_hf_tokenizer(model)
+        if count_batch:
+            return TokenCounter("hf", count_batch)
+
+    if provider in ("vllm", "custom"):
+        calibrated = _server_calibrated(chat_endpoint, model, api_key)
+        if calibrated:
+            return TokenCounter("server", calibrated)
+
+    return TokenCounter("heuristic")
+
+
+def get_token_counter(
+    provider: str, model: str, chat_endpoint: str, api_key: Optional[str] = None
+) -> TokenCounter:
+    """Cached ``TokenCounter`` for a provider/model/endpoint."""
+    key = (provider, model, chat_endpoint)
+    with _counters_lock:
+        counter = _counters.get(key)
+    if counter is None:
+        counter = _resolve_counter(provider, model, chat_endpoint, api_key)
+        logger.info(f"Token counting for {provider}/{model} uses {counter.source}")
+        with _counters_lock:
+            counter = _counters.setdefault(key, counter)
+    return counter
+
+
+def pack_segments(segments: list[str], counts: list[int], budget: int) -> list[list[int]]:
+    """Group consecutive segments into the fewest chunks within ``budget`` tokens.
+
+    One pass over prefix sums of ``counts``: each chunk extends until the
+    next segment would exceed the budget. For contiguous chunks that keep
+    transcript order this greedy fill is optimal. A segment larger than the
+    budget on its own becomes a chunk by itself.
+
+    Returns:
+        Segment indices of each chunk
+    """
+    prefix = [0]
+    for count in counts:
+        prefix.append(prefix[-1] + count)
+
+    chunks: list[list[int]] = []
+    start = 0
+    while start < len(segments):
+        end = start + 1
+        while end < len(segments) and prefix[end + 1] - prefix[start] <= budget:
+            end += 1
+        chunks.append(list(range(start, end)))
+        start = end
+    return chunks
@@ -376,6 +376,28 @@ def delete_file(object_name: str):
         raise Exception(f"Error deleting file: {e}") from e
 
 
+def delete_expired_objects(prefix: str, max_age_seconds: int) -> int:
+    """
+    Delete objects under a prefix that were last modified too long ago
+
+    Args:
+        prefix: Object name prefix to sweep
+        max_age_seconds: Objects older than this are deleted
+
+    Returns:
+        Number of objects deleted
+    """
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        seconds=max_age_seconds
+    )
+    removed = 0
+    for obj in minio_client.list_objects(settings.MEDIA_BUCKET_NAME, prefix=prefix, recursive=True):
+        if obj.last_modified is not None and obj.last_modified < cutoff:
+            minio_client.remove_object(settings.MEDIA_BUCKET_NAME, obj.object_name)
+            removed += 1
+    return removed
+
+
 TEMP_PREPROCESS_PREFIX = "temp/preprocess"
 
 
@@ -439,6 +461,24 @@ def download_temp_audio(file_uuid: str, local_path: str) -> None:
     minio_client.fget_object(settings.MEDIA_BUCKET_NAME, object_name, local_path)
 
 
+def resolve_temp_audio(file_uuid: str, local_path: str) -> str:
+    """Return a readable path to the preprocessed audio.wav.
+
+    When the scratch copy exists it is used in place: no download, copy or
+    link, and readers memory-map it directly. Otherwise the WAV is fetched
+    to ``local_path`` via ``download_temp_audio``.
+    """
+    from app.utils import scratch_volume
+
+    if scratch_volume.is_scratch_available():
+        scratch_path = scratch_volume.scratch_audio_path(file_uuid)
+        if scratch_path.is_file():
+            return str(scratch_path)
+
+    download_temp_audio(file_uuid, local_path)
+    return local_path
+
+
 def temp_audio_exists(file_uuid: str) -> bool:
     """Return True when the preprocessed WAV is reachable from either source."""
     from app.utils import scratch_volume
@@ -469,6 +509,56 @@ def cleanup_temp_audio(file_uuid: str) -> None:
         _logger.debug(f"Temp audio cleanup failed (non-fatal): {e}")
 
 
+def raw_outputs_object_name(user_id: int, file_id: int) -> str:
+    """MinIO object key for a file's raw transcriber/diarizer outputs."""
+    return f"user_{user_id}/file_{file_id}/raw_outputs.npz"
+
+
+def upload_raw_outputs(user_id: int, file_id: int, data: bytes) -> str:
+    """Store the serialized ``RawOutputs`` of a file, replacing any previous run."""
+    object_name = raw_outputs_object_name(user_id, file_id)
+    minio_client.put_object(
+        settings.MEDIA_BUCKET_NAME,
+        object_name,
+        io.BytesIO(data),
+        len(data),
+        content_type="application/octet-stream",
+    )
+    return object_name
+
+
+def download_raw_outputs(user_id: int, file_id: int) -> bytes | None:
+    """Return the serialized raw outputs of a file, or None if none were kept."""
+    response = None
+    try:
+        response = minio_client.get_object(
+            settings.MEDIA_BUCKET_NAME, raw_outputs_object_name(user_id, file_id)
+        )
+        return bytes(response.read())
+    except S3Error as e:
+        if e.code == "NoSuchKey":
+            return None
+        raise
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
+def raw_outputs_exist(user_id: int, file_id: int) -> bool:
+    """Return True when raw outputs were kept for the file."""
+    return object_exists_and_size(raw_outputs_object_name(user_id, file_id)) is not None
+
+
+def delete_raw_outputs(user_id: int, file_id: int) -> None:
+    """Remove a file's raw outputs (best-effort, no-op when absent)."""
+    object_name = raw_outputs_object_name(user_id, file_id)
+    try:
+        minio_client.remove_object(settings.MEDIA_BUCKET_NAME, object_name)
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"Raw outputs cleanup failed (non-fatal): {e}")
+
+
 def get_internal_presigned_url(object_name: str, expires: int = 3600) -> str:
     """Get a presigned URL for server-to-server access (no hostname rewriting)."""
     delta = datetime.timedelta(seconds=expires)
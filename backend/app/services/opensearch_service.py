@@ -15,6 +15,7 @@ from app.core.constants import SENTENCE_TRANSFORMER_DIMENSION
 from app.core.constants import get_speaker_index
 from app.core.constants import get_speaker_index_v3
 from app.core.constants import get_speaker_index_v4
+from app.services.speaker_embedding_store import speaker_embedding_store
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -374,6 +375,7 @@ def swap_speaker_alias(new_target: str) -> dict[str, Any]:
 
     opensearch_client.indices.update_aliases(body={"actions": actions})
     invalidate_active_speaker_index_cache()
+    speaker_embedding_store.invalidate_all()
 
     logger.info(f"Swapped speaker alias: {alias_name} → {new_target} (was: {old_target})")
     return {"status": "success", "old_target": old_target, "new_target": new_target}
@@ -779,6 +781,7 @@ def rebuild_speaker_index(db: "Any") -> dict[str, Any]:
             opensearch_client.indices.delete(index=rebuild_index)
             logger.info(f"Rebuild: deleted temporary index {rebuild_index}")
 
+        speaker_embedding_store.invalidate_all()
         logger.info(f"Speaker index rebuild complete: {indexed_count} speakers re-indexed")
         return {
             "status": "rebuilt",
@@ -1221,6 +1224,8 @@ def add_speaker_embedding_v4(
             id=str(speaker_uuid),  # Use speaker_uuid as document ID
         )
 
+        speaker_embedding_store.upsert(user_id, [(str(speaker_uuid), speaker_id, embedding)])
+
         logger.info(
             f"Indexed speaker embedding for speaker {speaker_uuid} (ID: {speaker_id}) to v4 index: {response}"
         )
@@ -1232,6 +1237,25 @@ def add_speaker_embedding_v4(
         )
 
 
+def _mirror_bulk_speaker_embeddings(
+    embeddings_data: list[dict[str, Any]], response: dict[str, Any]
+) -> None:
+    """Apply the documents a bulk request actually indexed to the local embedding store.
+
+    ``embeddings_data`` must be in the same order as the bulk actions.
+    """
+    items = response.get("items") or []
+    by_user: dict[int, list[tuple[str, Any, list[float]]]] = {}
+    for data, item in zip(embeddings_data, items):
+        if item.get("index", {}).get("status", 500) >= 300:
+            continue
+        by_user.setdefault(data["user_id"], []).append(
+            (str(data["speaker_uuid"]), data["speaker_id"], data["embedding"])
+        )
+    for user_id, rows in by_user.items():
+        speaker_embedding_store.upsert(user_id, rows)
+
+
 def bulk_add_speaker_embeddings_v4(embeddings_data: list[dict[str, Any]]) -> dict[str, Any] | None:
     """Bulk-index v4 (256-dim) speaker embeddings in one OpenSearch round-trip.
 
@@ -1263,7 +1287,7 @@ def bulk_add_speaker_embeddings_v4(embeddings_data: list[dict[str, Any]]) -> dic
     v4_index = get_speaker_index_v4()
     bulk_body: list[dict[str, Any]] = []
     now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    accepted = 0
+    accepted: list[dict[str, Any]] = []
 
     for data in embeddings_data:
         speaker_uuid = data.get("speaker_uuid")
@@ -1307,9 +1331,9 @@ def bulk_add_speaker_embeddings_v4(embeddings_data: list[dict[str, Any]]) -> dic
                 "embedding": embedding,
             }
         )
-        accepted += 1
+        accepted.append(data)
 
-    if accepted == 0:
+    if not accepted:
         return None
 
     try:
@@ -1318,8 +1342,9 @@ def bulk_add_speaker_embeddings_v4(embeddings_data: list[dict[str, Any]]) -> dic
             logger.error(f"Bulk v4 speaker embedding indexing had errors: {response}")
         else:
             logger.info(
-                f"Bulk-indexed {accepted} v4 speaker embeddings into {v4_index} in one request"
+                f"Bulk-indexed {len(accepted)} v4 speaker embeddings into {v4_index} in one request"
             )
+        _mirror_bulk_speaker_embeddings(accepted, response)
         return response  # type: ignore[no-any-return]
     except Exception as e:
         logger.error(f"Error bulk-indexing v4 speaker embeddings: {e}")
@@ -1578,6 +1603,8 @@ def add_speaker_embedding(
             id=str(speaker_uuid),  # Use speaker_uuid as document ID
         )
 
+        speaker_embedding_store.upsert(user_id, [(str(speaker_uuid), speaker_id, embedding)])
+
         logger.info(
             f"Indexed speaker embedding for speaker {speaker_uuid} (ID: {speaker_id}) "
             f"to {index_name}: {response}"
@@ -1598,6 +1625,9 @@ def add_speaker_embedding(
                     body=doc,
                     id=str(speaker_uuid),
                 )
+                speaker_embedding_store.upsert(
+                    user_id, [(str(speaker_uuid), speaker_id, embedding)]
+                )
                 logger.info(
                     f"Retry succeeded: indexed speaker {speaker_uuid} after transient error"
                 )
@@ -1632,6 +1662,9 @@ def add_speaker_embedding(
                         body=doc,
                         id=str(speaker_uuid),
                     )
+                    speaker_embedding_store.upsert(
+                        user_id, [(str(speaker_uuid), speaker_id, embedding)]
+                    )
                     logger.info(f"Retry succeeded: indexed speaker {speaker_uuid} after repair")
                     return response
                 except Exception as retry_err:
@@ -1695,6 +1728,7 @@ def bulk_add_speaker_embeddings(embeddings_data: list[dict[str, Any]]):
             logger.error(f"Bulk indexing had errors: {response}")
         else:
             logger.info(f"Successfully bulk indexed {len(embeddings_data)} speaker embeddings")
+        _mirror_bulk_speaker_embeddings(embeddings_data, response)
 
         return response
 
@@ -2345,8 +2379,12 @@ def merge_speaker_embeddings(
         return
 
     try:
+        owner_id = _speaker_owner(source_speaker_uuid)
+
         # Delete the source speaker document from main index
         opensearch_client.delete(index=get_speaker_index(), id=str(source_speaker_uuid))
+        if owner_id is not None:
+            speaker_embedding_store.remove(owner_id, [source_speaker_uuid])
 
         # Also remove source from v4 staging index if it exists (mid-migration cleanup)
         import contextlib as _ctx
@@ -2509,18 +2547,37 @@ def get_speaker_embedding(speaker_uuid: str) -> list[float] | None:
         return None
 
 
-def get_speaker_embeddings_batch(speaker_uuids: list[str]) -> dict[str, list[float]]:
+def get_speaker_embeddings_batch(
+    speaker_uuids: list[str], user_id: int | None = None
+) -> dict[str, list[float]]:
     """Get embeddings for multiple speakers in a single mget request.
 
     Args:
         speaker_uuids: List of speaker UUIDs
+        user_id: Owner of the speakers. When given, the embeddings are read
+            from the local embedding store if it is current for that user;
+            speakers missing from it are fetched with mget.
 
     Returns:
         Dict mapping speaker_uuid -> embedding vector (only for found speakers)
     """
-    if not opensearch_client or not speaker_uuids:
+    if not speaker_uuids:
         return {}
 
+    results: dict[str, list[float]] = {}
+    if user_id is not None:
+        matrix = speaker_embedding_store.load(user_id)
+        if matrix is not None:
+            found, vectors = matrix.rows(str(uid) for uid in speaker_uuids)
+            results = dict(zip(found, vectors.tolist()))
+            # A rebuild scrolls the index, which misses writes not yet refreshed
+            speaker_uuids = [uid for uid in speaker_uuids if str(uid) not in results]
+            if not speaker_uuids:
+                return results
+
+    if not opensearch_client:
+        return results
+
     try:
         ensure_indices_exist()
         active_index = get_active_speaker_index()
@@ -2528,7 +2585,6 @@ def get_speaker_embeddings_batch(speaker_uuids: list[str]) -> dict[str, list[flo
         body = {"docs": [{"_index": active_index, "_id": str(uid)} for uid in speaker_uuids]}
         response = opensearch_client.mget(body=body)
 
-        results: dict[str, list[float]] = {}
         for doc in response.get("docs", []):
             if doc.get("found") and "_source" in doc:
                 embedding = doc["_source"].get("embedding")
@@ -2538,7 +2594,7 @@ def get_speaker_embeddings_batch(speaker_uuids: list[str]) -> dict[str, list[flo
 
     except Exception as e:
         logger.error(f"Error batch-fetching speaker embeddings: {e}")
-        return {}
+        return results
 
 
 def msearch_profile_knn_batch(
@@ -3005,6 +3061,7 @@ def iter_speaker_embeddings(
     user_id: int,
     speaker_uuids: list[str] | None = None,
     batch_size: int = 200,
+    strict: bool = False,
 ) -> Generator[list[dict[str, Any]], None, None]:
     """Yield batches of speaker embeddings from the active index.
 
@@ -3013,11 +3070,17 @@ def iter_speaker_embeddings(
     scrolled.  Embeddings are never accumulated — each batch is yielded
     and can be discarded by the caller.
 
+    With *strict*, OpenSearch errors are raised instead of ending the
+    iteration early, for callers that must not mistake a failure for a
+    complete result.
+
     Yields:
         Lists of dicts with keys: speaker_uuid, embedding, speaker_id,
         profile_id, display_name.
     """
     if not opensearch_client:
+        if strict:
+            raise RuntimeError("OpenSearch client not initialized")
         return
 
     active_index = get_active_speaker_index()
@@ -3048,6 +3111,8 @@ def iter_speaker_embeddings(
                 if batch:
                     yield batch
             except Exception as e:
+                if strict:
+                    raise
                 logger.warning("mget batch failed: %s", e)
                 continue
     else:
@@ -3077,6 +3142,8 @@ def iter_speaker_embeddings(
             try:
                 response = opensearch_client.search(index=active_index, body=query)
             except Exception as e:
+                if strict:
+                    raise
                 logger.error("Scroll failed: %s", e)
                 break
 
@@ -3193,6 +3260,46 @@ def get_all_speaker_embeddings(
         return []
 
 
+def count_speaker_embeddings_by_user() -> dict[int, int] | None:
+    """Number of speaker embeddings per user in the active index.
+
+    Returns:
+        Dict mapping user_id -> speaker document count, or None if the
+        query failed.
+    """
+    if not opensearch_client:
+        return None
+
+    try:
+        response = opensearch_client.search(
+            index=get_active_speaker_index(),
+            body={
+                "size": 0,
+                "query": {"bool": {"must_not": [{"exists": {"field": "document_type"}}]}},
+                "aggs": {"users": {"terms": {"field": "user_id", "size": 100000}}},
+            },
+        )
+        buckets = response.get("aggregations", {}).get("users", {}).get("buckets", [])
+        return {int(b["key"]): int(b["doc_count"]) for b in buckets}
+    except Exception as e:
+        logger.warning(f"Error counting speaker embeddings per user: {e}")
+        return None
+
+
+def _speaker_owner(speaker_uuid: str) -> int | None:
+    """User ID of an indexed speaker, needed to keep the embedding store in sync on deletes."""
+    if not opensearch_client or not settings.SPEAKER_EMBEDDING_STORE_ENABLED:
+        return None
+    try:
+        doc = opensearch_client.get(
+            index=get_active_speaker_index(), id=str(speaker_uuid), _source_includes=["user_id"]
+        )
+        user_id = doc.get("_source", {}).get("user_id")
+        return int(user_id) if user_id is not None else None
+    except Exception:
+        return None  # Not indexed: nothing to mirror
+
+
 def remove_speaker_embedding(speaker_uuid: str) -> bool:
     """Remove a speaker embedding from all speaker indices (main + v4 staging).
 
@@ -3211,6 +3318,7 @@ def remove_speaker_embedding(speaker_uuid: str) -> bool:
         return False
 
     success = False
+    owner_id = _speaker_owner(speaker_uuid)
 
     # Delete from all speaker indices (v3, v4, and alias target)
     indices_to_clean = {get_speaker_index(), get_speaker_index_v3(), get_speaker_index_v4()}
@@ -3224,6 +3332,8 @@ def remove_speaker_embedding(speaker_uuid: str) -> bool:
             pass  # Non-fatal: speaker may not exist in this index
 
     if success:
+        if owner_id is not None:
+            speaker_embedding_store.remove(owner_id, [speaker_uuid])
         logger.info(f"Removed speaker {speaker_uuid} from speaker indices")
 
     return success
@@ -3589,14 +3699,16 @@ def cleanup_orphaned_speaker_embeddings(user_id: int) -> int:
                 )
 
         # Delete orphaned documents using UUIDs
-        deleted_count = 0
+        deleted: list[str] = []
         for speaker_uuid in orphaned_speaker_uuids:
             try:
                 opensearch_client.delete(index=get_speaker_index(), id=str(speaker_uuid))
                 logger.info(f"Deleted orphaned speaker document for speaker {speaker_uuid}")
-                deleted_count += 1
+                deleted.append(speaker_uuid)
             except Exception as e:
                 logger.error(f"Error deleting orphaned speaker {speaker_uuid}: {e}")
+        speaker_embedding_store.remove(user_id, deleted)
+        deleted_count = len(deleted)
 
         logger.info(
             f"Cleanup completed: removed {deleted_count} orphaned speaker documents for user {user_id}"
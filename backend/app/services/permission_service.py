@@ -3,9 +3,19 @@
 All access control decisions for collections and files route through this
 service. It supports a three-level permission hierarchy (viewer < editor < owner)
 and resolves access via direct ownership, direct user shares, and group shares.
+
+Search access principals:
+    Transcript chunks in OpenSearch carry ``access_principals`` tokens rather
+    than a materialized list of user IDs: the owner's ``user:{id}`` plus one
+    ``collection:{id}`` per collection containing the file. At query time a
+    caller's tokens are their own ``user:{id}`` plus every collection shared
+    with them directly or through a group. Sharing, unsharing and group
+    membership changes therefore only change the caller side and never
+    require rewriting chunks.
 """
 
 import logging
+from collections.abc import Iterable
 from typing import Optional
 
 from sqlalchemy import case
@@ -30,6 +40,26 @@ logger = logging.getLogger(__name__)
 PERMISSION_LEVELS = {"viewer": 1, "editor": 2, "owner": 3}
 PERMISSION_NAMES = {1: "viewer", 2: "editor", 3: "owner"}
 
+USER_PRINCIPAL_PREFIX = "user:"
+COLLECTION_PRINCIPAL_PREFIX = "collection:"
+
+
+def user_principal(user_id: int) -> str:
+    """Search access token for a user."""
+    return f"{USER_PRINCIPAL_PREFIX}{user_id}"
+
+
+def collection_principal(collection_id: int) -> str:
+    """Search access token for a collection."""
+    return f"{COLLECTION_PRINCIPAL_PREFIX}{collection_id}"
+
+
+def file_access_principals(owner_id: int, collection_ids: Optional[Iterable[int]]) -> list[str]:
+    """Access tokens stored on a file's search chunks."""
+    principals = [user_principal(owner_id)]
+    principals.extend(collection_principal(cid) for cid in sorted(set(collection_ids or ())))
+    return principals
+
 
 class PermissionService:
     """Centralized permission checking for collections and files."""
@@ -390,3 +420,134 @@ class PermissionService:
         result = [(pid, True) for pid in owned_ids]
         result.extend((pid, False) for pid in shared_ids - owned_ids)
         return result
+
+    @staticmethod
+    def get_search_principals(db: Session, user_id: int) -> list[str]:
+        """Return the access tokens a user matches in the search index.
+
+        Mirrors ``get_accessible_file_ids_subquery``: the user's own token
+        (files they own) plus a token per collection shared with them
+        directly or via one of their groups.
+        """
+        user_group_ids = (
+            select(UserGroupMember.group_id)
+            .where(UserGroupMember.user_id == user_id)
+            .scalar_subquery()
+        )
+        shared_collection_ids = (
+            db.query(CollectionShare.collection_id)
+            .filter(
+                or_(
+                    CollectionShare.target_user_id == user_id,
+                    CollectionShare.target_group_id.in_(user_group_ids),
+                )
+            )
+            .distinct()
+            .all()
+        )
+        return [user_principal(user_id)] + sorted(
+            collection_principal(cid) for (cid,) in shared_collection_ids
+        )
+
+    @staticmethod
+    def get_cached_search_principals(user_id: int) -> list[str]:
+        """``get_search_principals`` behind the Redis cache.
+
+        Entries are dropped by ``redis_cache.invalidate_search_access`` when
+        a share or group membership change affects the user, and otherwise
+        expire after ``TTL_PRINCIPALS``.
+        """
+        from app.db.session_utils import session_scope
+        from app.services.redis_cache_service import TTL_PRINCIPALS
+        from app.services.redis_cache_service import principals_cache_key
+        from app.services.redis_cache_service import redis_cache
+
+        key = principals_cache_key(user_id)
+        cached = redis_cache.get(key)
+        if isinstance(cached, list) and cached:
+            return [str(p) for p in cached]
+
+        with session_scope() as db:
+            principals = PermissionService.get_search_principals(db, user_id)
+        redis_cache.set(key, principals, ttl=TTL_PRINCIPALS)
+        return principals
+
+    @staticmethod
+    def get_users_for_principals(db: Session, principals: Iterable[str]) -> set[int]:
+        """Expand search access tokens back to the user IDs they grant.
+
+        Used to find whose cached search results go stale when chunks
+        carrying these tokens change.
+        """
+        user_ids: set[int] = set()
+        collection_ids: set[int] = set()
+        for token in principals:
+            prefix, _, raw_id = str(token).partition(":")
+            if not raw_id.isdigit():
+                continue
+            if f"{prefix}:" == USER_PRINCIPAL_PREFIX:
+                user_ids.add(int(raw_id))
+            elif f"{prefix}:" == COLLECTION_PRINCIPAL_PREFIX:
+                collection_ids.add(int(raw_id))
+
+        if collection_ids:
+            direct = (
+                db.query(CollectionShare.target_user_id)
+                .filter(
+                    CollectionShare.collection_id.in_(collection_ids),
+                    CollectionShare.target_user_id.isnot(None),
+                )
+                .all()
+            )
+            via_group = (
+                db.query(UserGroupMember.user_id)
+                .join(
+                    CollectionShare,
+                    CollectionShare.target_group_id == UserGroupMember.group_id,
+                )
+                .filter(CollectionShare.collection_id.in_(collection_ids))
+                .all()
+            )
+            user_ids.update(int(uid) for (uid,) in direct)
+            user_ids.update(int(uid) for (uid,) in via_group)
+
+        return user_ids
+
+    @staticmethod
+    def get_collection_file_ids(db: Session, collection_ids: Iterable[int]) -> list[int]:
+        """Return the IDs of the files in any of the given collections."""
+        ids = list(collection_ids)
+        if not ids:
+            return []
+        rows = (
+            db.query(CollectionMember.media_file_id)
+            .filter(CollectionMember.collection_id.in_(ids))
+            .distinct()
+            .all()
+        )
+        return sorted(int(fid) for (fid,) in rows)
+
+    @staticmethod
+    def get_group_shared_file_ids(db: Session, group_id: int) -> list[int]:
+        """Return the IDs of the files in collections shared with a group."""
+        shared = (
+            db.query(CollectionShare.collection_id)
+            .filter(CollectionShare.target_group_id == group_id)
+            .all()
+        )
+        return PermissionService.get_collection_file_ids(db, [cid for (cid,) in shared])
+
+    @staticmethod
+    def get_file_collection_ids(db: Session, file_ids: list[int]) -> dict[int, list[int]]:
+        """Map each file ID to the IDs of the collections containing it."""
+        result: dict[int, list[int]] = {fid: [] for fid in file_ids}
+        if not file_ids:
+            return result
+        rows = (
+            db.query(CollectionMember.media_file_id, CollectionMember.collection_id)
+            .filter(CollectionMember.media_file_id.in_(file_ids))
+            .all()
+        )
+        for file_id, collection_id in rows:
+            result[file_id].append(int(collection_id))
+        return result
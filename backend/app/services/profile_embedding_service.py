@@ -63,13 +63,23 @@ def _store_profile_embedding_to_opensearch(
 def _collect_speaker_embeddings(speakers: list[Speaker]) -> dict[int, list[float]]:
     """Collect embeddings for all speakers, keyed by speaker ID.
 
-    Uses batch fetch to avoid N+1 OpenSearch calls per speaker.
+    Uses one batch fetch per owner to avoid N+1 OpenSearch calls per speaker;
+    owners with a current local embedding store skip OpenSearch entirely.
     """
     from app.services.opensearch_service import get_speaker_embeddings_batch
 
     uuid_to_id = {str(s.uuid): int(s.id) for s in speakers}
-    batch_result = get_speaker_embeddings_batch(list(uuid_to_id.keys()))
-    return {uuid_to_id[uuid]: emb for uuid, emb in batch_result.items() if uuid in uuid_to_id}
+    uuids_by_user: dict[int, list[str]] = {}
+    for s in speakers:
+        uuids_by_user.setdefault(int(s.user_id), []).append(str(s.uuid))
+
+    embeddings: dict[int, list[float]] = {}
+    for user_id, uuids in uuids_by_user.items():
+        batch_result = get_speaker_embeddings_batch(uuids, user_id=user_id)
+        embeddings.update(
+            {uuid_to_id[uuid]: emb for uuid, emb in batch_result.items() if uuid in uuid_to_id}
+        )
+    return embeddings
 
 
 def _calculate_average_embedding(embeddings: list[list[float]]) -> list[float]:
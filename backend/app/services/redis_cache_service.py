@@ -13,10 +13,18 @@ Cache key conventions:
     cache:files:{user_id}:{hash}    - Paginated file listings
     cache:status:{user_id}          - User file status summary
     cache:collections:{user_id}     - Collection list for a user
+    cache:search:{user_id}:{hash}   - Serialized search responses
+    cache:principals:{user_id}      - Search access principals for a user
+
+Search generation counters (no TTL, deliberately outside ``cache:*`` so the
+pattern-based invalidators never reset them):
+    search_gen:global               - Bumped on full reindex / model switch
+    search_gen:user:{user_id}       - Bumped when a user's visible index changes
 """
 
 import json
 import logging
+from collections.abc import Iterable
 from typing import Any
 from typing import Optional
 
@@ -31,6 +39,16 @@ TTL_METADATA = 300
 TTL_FILES = 120  # 2 minutes
 TTL_STATUS = 60  # 1 minute
 TTL_COLLECTIONS = 300
+TTL_SEARCH = 300
+TTL_PRINCIPALS = 600
+
+SEARCH_GEN_GLOBAL_KEY = "search_gen:global"
+SEARCH_GEN_USER_KEY = "search_gen:user:{user_id}"
+
+
+def principals_cache_key(user_id: int) -> str:
+    """Redis key for a user's cached search access principals."""
+    return f"cache:principals:{user_id}"
 
 
 class RedisCacheService:
@@ -141,6 +159,73 @@ class RedisCacheService:
         self.delete_pattern(f"cache:*:{user_id}*")
         self._push_invalidation(user_id, "all")
 
+    # ------------------------------------------------------------------
+    # Search index generations
+    # ------------------------------------------------------------------
+
+    def get_search_generations(self, user_id: int) -> Optional[tuple[int, int]]:
+        """Return ``(global_gen, user_gen)`` for a user's search index view.
+
+        Search cache keys embed both counters, so bumping either one makes
+        every previously cached response unreachable on every worker without
+        scanning or deleting keys. Returns None when Redis is unavailable.
+        """
+        client = self.redis
+        if client is None:
+            return None
+        try:
+            global_gen, user_gen = client.mget(
+                SEARCH_GEN_GLOBAL_KEY, SEARCH_GEN_USER_KEY.format(user_id=user_id)
+            )
+            return int(global_gen or 0), int(user_gen or 0)
+        except Exception as e:
+            logger.debug(f"Search generation GET error for user {user_id}: {e}")
+        return None
+
+    def bump_search_generation(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """Invalidate cached search responses in O(1) per user.
+
+        Args:
+            user_ids: Users whose searchable documents changed (indexing,
+                deletion, sharing). None bumps the global generation, which
+                invalidates every user's cached searches.
+        """
+        client = self.redis
+        if client is None:
+            return
+        try:
+            if user_ids is None:
+                client.incr(SEARCH_GEN_GLOBAL_KEY)
+                return
+            unique_ids = set(user_ids)
+            if not unique_ids:
+                return
+            pipe = client.pipeline(transaction=False)
+            for user_id in unique_ids:
+                pipe.incr(SEARCH_GEN_USER_KEY.format(user_id=user_id))
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Search generation bump error: {e}")
+
+    def invalidate_search_access(self, user_ids: Iterable[int]) -> None:
+        """Drop cached search principals and cached searches for users whose
+        access changed (share created/revoked, group membership changed).
+
+        This is the only index-side work sharing needs: chunks carry
+        collection tokens, so nothing in OpenSearch is rewritten.
+        """
+        unique_ids = set(user_ids)
+        if not unique_ids:
+            return
+        client = self.redis
+        if client is None:
+            return
+        try:
+            client.delete(*(principals_cache_key(uid) for uid in unique_ids))
+        except Exception as e:
+            logger.debug(f"Principal cache DELETE error: {e}")
+        self.bump_search_generation(unique_ids)
+
     # ------------------------------------------------------------------
     # Push invalidation to frontend via WebSocket
     # ------------------------------------------------------------------
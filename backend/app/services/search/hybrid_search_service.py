@@ -9,6 +9,7 @@ import re
 import threading
 import time
 from collections import OrderedDict
+from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
@@ -23,8 +24,10 @@ from app.core.constants import SEARCH_MAX_PAGE_SIZE
 from app.core.constants import SEARCH_MAX_SNIPPETS_PER_FILE
 from app.services.opensearch_service import get_opensearch_client
 from app.services.opensearch_service import opensearch_client
+from app.services.search.indexing_service import build_access_filter
 from app.services.search.indexing_service import ensure_chunks_index_exists
 from app.services.search.indexing_service import ensure_search_pipeline_exists
+from app.services.search.suggestion_index import suggest_for_user
 
 logger = logging.getLogger(__name__)
 
@@ -361,9 +364,13 @@ class SearchResponse:
     _fell_back_to_bm25: bool = False  # Internal flag — skip caching if True
 
 
-# Module-level search cache (OrderedDict for O(1) LRU eviction)
+# Two-tier search cache: a per-process LRU (OrderedDict for O(1) eviction) in
+# front of a Redis tier shared by every API worker. Keys embed the global and
+# per-user index generations from RedisCacheService, so bumping a generation
+# invalidates stale entries in both tiers on all workers at once.
 _search_cache: OrderedDict[str, tuple[float, SearchResponse]] = OrderedDict()
 _search_cache_lock = threading.Lock()
+_SHARED_CACHE_PREFIX = "cache:search"
 
 
 def _make_cache_key(**kwargs) -> str:
@@ -373,8 +380,25 @@ def _make_cache_key(**kwargs) -> str:
     return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
 
 
-def _get_cached_response(cache_key: str) -> SearchResponse | None:
-    """Get a cached response if it exists and hasn't expired."""
+def _shared_cache_key(user_id: int, cache_key: str) -> str:
+    return f"{_SHARED_CACHE_PREFIX}:{user_id}:{cache_key}"
+
+
+def _response_from_dict(data: dict[str, Any]) -> SearchResponse:
+    """Rebuild a SearchResponse (and nested dataclasses) from its asdict() form."""
+    hits = [
+        SearchHit(
+            **{
+                **hit,
+                "occurrences": [SearchOccurrence(**occ) for occ in hit.get("occurrences", [])],
+            }
+        )
+        for hit in data.get("results", [])
+    ]
+    return SearchResponse(**{**data, "results": hits})
+
+
+def _get_local_response(cache_key: str) -> SearchResponse | None:
     with _search_cache_lock:
         entry = _search_cache.get(cache_key)
         if entry is None:
@@ -388,8 +412,7 @@ def _get_cached_response(cache_key: str) -> SearchResponse | None:
     return None
 
 
-def _set_cached_response(cache_key: str, response: SearchResponse) -> None:
-    """Cache a search response with TTL and O(1) LRU eviction."""
+def _set_local_response(cache_key: str, response: SearchResponse) -> None:
     with _search_cache_lock:
         if cache_key in _search_cache:
             _search_cache.move_to_end(cache_key)
@@ -399,10 +422,62 @@ def _set_cached_response(cache_key: str, response: SearchResponse) -> None:
             _search_cache.popitem(last=False)  # Remove oldest (first item)
 
 
+def _get_cached_response(
+    cache_key: str, user_id: int | None = None, shared: bool = False
+) -> SearchResponse | None:
+    """Get a cached response from the local LRU, then the shared Redis tier.
+
+    Shared hits are promoted into the local LRU so repeat queries on the same
+    worker skip the Redis round trip.
+    """
+    cached = _get_local_response(cache_key)
+    if cached is not None or not shared or user_id is None:
+        return cached
+
+    from app.services.redis_cache_service import redis_cache
+
+    data = redis_cache.get(_shared_cache_key(user_id, cache_key))
+    if data is None:
+        return None
+    try:
+        cached = _response_from_dict(data)
+    except (TypeError, KeyError) as e:
+        logger.debug(f"Discarding malformed shared search cache entry: {e}")
+        return None
+    _set_local_response(cache_key, cached)
+    return cached
+
+
+def _set_cached_response(
+    cache_key: str,
+    response: SearchResponse,
+    user_id: int | None = None,
+    shared: bool = False,
+) -> None:
+    """Cache a search response locally and, when enabled, in the shared tier."""
+    _set_local_response(cache_key, response)
+    if shared and user_id is not None:
+        from app.services.redis_cache_service import redis_cache
+
+        redis_cache.set(
+            _shared_cache_key(user_id, cache_key),
+            asdict(response),
+            ttl=SEARCH_CACHE_TTL_SECONDS,
+        )
+
+
 def clear_search_cache() -> None:
-    """Clear the entire search cache. Called after reindex or model switch."""
+    """Invalidate all cached searches on every worker.
+
+    Called after reindex or model switch. Bumps the global search generation
+    so other workers' local and shared entries become unreachable, and clears
+    this process's LRU immediately.
+    """
+    from app.services.redis_cache_service import redis_cache
+
     with _search_cache_lock:
         _search_cache.clear()
+    redis_cache.bump_search_generation()
     logger.info("Search cache cleared")
 
 
@@ -540,8 +615,14 @@ class HybridSearchService:
         start_time = time.time()
         page_size = min(page_size, SEARCH_MAX_PAGE_SIZE)
 
-        # Check cache
+        # Check cache. Index generations are part of the key; when Redis is
+        # down they are None and only the local LRU (TTL-bounded) is used.
+        from app.services.redis_cache_service import redis_cache
+
+        generations = redis_cache.get_search_generations(user_id)
+        shared_cache = generations is not None
         cache_key = _make_cache_key(
+            generations=generations,
             query=query,
             user_id=user_id,
             page=page,
@@ -562,7 +643,7 @@ class HybridSearchService:
             language=language,
             title_filter=title_filter,
         )
-        cached = _get_cached_response(cache_key)
+        cached = _get_cached_response(cache_key, user_id, shared=shared_cache)
         if cached:
             return cached
 
@@ -630,7 +711,7 @@ class HybridSearchService:
         # Cache the response — but NOT if it fell back to BM25-only due to
         # a transient error, so the next request retries hybrid properly.
         if not result._fell_back_to_bm25:
-            _set_cached_response(cache_key, result)
+            _set_cached_response(cache_key, result, user_id, shared=shared_cache)
         else:
             logger.info("Skipping cache for BM25-fallback response (query='%s')", query)
 
@@ -819,6 +900,9 @@ class HybridSearchService:
     ) -> list[dict[str, Any]]:
         """Get auto-complete suggestions.
 
+        Served from the Redis suggestion index when it is built; otherwise
+        title and speaker prefix queries run against the chunk index.
+
         Args:
             prefix: Search prefix text.
             user_id: Current user ID.
@@ -827,6 +911,10 @@ class HybridSearchService:
         Returns:
             List of suggestion dicts with type, text, and optional metadata.
         """
+        indexed = suggest_for_user(user_id, prefix, limit)
+        if indexed is not None:
+            return indexed
+
         if not opensearch_client:
             return []
 
@@ -844,6 +932,7 @@ class HybridSearchService:
         suggestions = []
 
         try:
+            access_filter = build_access_filter(user_id)
             # Multi-search for title and speaker suggestions
             msearch_body = [
                 # Title matches
@@ -853,7 +942,7 @@ class HybridSearchService:
                     "query": {
                         "bool": {
                             "must": [{"match_phrase_prefix": {"title": prefix}}],
-                            "filter": [{"terms": {"accessible_user_ids": [user_id]}}],
+                            "filter": [access_filter],
                         }
                     },
                     "_source": ["title", "file_uuid"],
@@ -866,7 +955,7 @@ class HybridSearchService:
                     "query": {
                         "bool": {
                             "must": [{"prefix": {"speaker": {"value": prefix.lower()}}}],
-                            "filter": [{"terms": {"accessible_user_ids": [user_id]}}],
+                            "filter": [access_filter],
                         }
                     },
                     "aggs": {"speakers": {"terms": {"field": "speaker", "size": 4}}},
@@ -932,11 +1021,12 @@ class HybridSearchService:
                 return {"speakers": [], "tags": [], "date_range": {}}
 
         try:
+            access_filter = build_access_filter(user_id)
             response = opensearch_client.search(
                 index=index_name,
                 body={
                     "size": 0,
-                    "query": {"terms": {"accessible_user_ids": [user_id]}},
+                    "query": access_filter,
                     "aggs": {
                         "speakers": {"terms": {"field": "speaker", "size": 100}},
                         "tags": {"terms": {"field": "tags", "size": 100}},
@@ -985,7 +1075,7 @@ class HybridSearchService:
         title_filter: str | None = None,
     ) -> list[dict[str, Any]]:
         """Build OpenSearch filter clauses."""
-        filters: list[dict[str, Any]] = [{"terms": {"accessible_user_ids": [user_id]}}]
+        filters: list[dict[str, Any]] = [build_access_filter(user_id)]
 
         if speakers:
             filters.append({"terms": {"speaker": speakers}})
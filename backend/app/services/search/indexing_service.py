@@ -2,22 +2,30 @@
 
 import contextlib
 import datetime
+import hashlib
+import json
 import logging
 import time
 from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 
 from app.core.config import settings
 from app.services.opensearch_service import get_opensearch_client
 from app.services.opensearch_service import opensearch_client
+from app.services.permission_service import file_access_principals
 
 from .chunking_service import chunk_transcript_by_speaker_turns
+from .suggestion_index import frequent_terms
+from .suggestion_index import suggestion_index
 
 logger = logging.getLogger(__name__)
 
 # Track whether neural pipeline is available
 _neural_pipeline_verified = False
 _neural_pipeline_available = False
+_additive_mappings_applied = False
 
 # Index version -- bump when mappings or analysis settings change.
 # Stored in index _meta so ensure_chunks_index_exists() can detect stale indices.
@@ -104,6 +112,10 @@ TRANSCRIPT_CHUNKS_INDEX_BODY = {
             "duration": {"type": "float"},
             "file_size": {"type": "long"},
             "collection_ids": {"type": "integer"},
+            # Access control tokens ("user:{id}", "collection:{id}"); see
+            # PermissionService. accessible_user_ids is the legacy
+            # per-user list, still honoured for chunks indexed before tokens.
+            "access_principals": {"type": "keyword"},
             "accessible_user_ids": {"type": "integer"},
             "upload_time": {"type": "date"},
             "language": {"type": "keyword"},
@@ -127,6 +139,9 @@ TRANSCRIPT_CHUNKS_INDEX_BODY = {
             # Tracking
             "embedding_model": {"type": "keyword"},
             "indexed_at": {"type": "date"},
+            # Change detection for incremental reindexing (see compute_chunk_hashes)
+            "content_hash": {"type": "keyword"},
+            "text_hash": {"type": "keyword"},
         },
     },
 }
@@ -169,6 +184,7 @@ def ensure_chunks_index_exists() -> bool:
         if opensearch_client.indices.exists(index=index_name):
             # Check index version from _meta
             _check_index_version(index_name)
+            _apply_additive_mappings(index_name)
             return True
 
         # Get dimension from settings service (reads from DB with default fallback)
@@ -335,37 +351,48 @@ def _get_model_id_from_service() -> str | None:
         return None
 
 
-def _check_existing_pipeline_model(pipeline_id: str, expected_model_id: str) -> bool | None:
-    """Check if existing pipeline has the expected model.
+def _get_pipeline_model_id(pipeline_id: str) -> str | None:
+    """Get the model ID an ingest pipeline's text_embedding processor uses.
 
     Args:
         pipeline_id: Pipeline ID to check.
-        expected_model_id: Expected model ID.
 
     Returns:
-        True if pipeline exists with correct model, False if model mismatch, None if not found.
+        Model ID string, or None if the pipeline or its processor is missing.
     """
     if not opensearch_client:
         return None
 
     try:
         response = opensearch_client.ingest.get_pipeline(id=pipeline_id)
-        current_pipeline = response.get(pipeline_id, {})
-        processors = current_pipeline.get("processors", [])
-
-        for processor in processors:
-            if "text_embedding" in processor:
-                current_model = processor["text_embedding"].get("model_id")
-                if current_model == expected_model_id:
-                    return True
-                logger.info(
-                    f"Neural pipeline model mismatch: {current_model} vs {expected_model_id}, updating"
-                )
-                return False
-        return None
     except Exception:
-        logger.debug(f"Neural ingest pipeline {pipeline_id} not found, will create it")
+        logger.debug(f"Neural ingest pipeline {pipeline_id} not found")
+        return None
+
+    processors = response.get(pipeline_id, {}).get("processors", [])
+    for processor in processors:
+        if "text_embedding" in processor:
+            return processor["text_embedding"].get("model_id")  # type: ignore[no-any-return]
+    return None
+
+
+def _check_existing_pipeline_model(pipeline_id: str, expected_model_id: str) -> bool | None:
+    """Check if existing pipeline has the expected model.
+
+    Args:
+        pipeline_id: Pipeline ID to check.
+        expected_model_id: Expected model ID.
+
+    Returns:
+        True if pipeline exists with correct model, False if model mismatch, None if not found.
+    """
+    current_model = _get_pipeline_model_id(pipeline_id)
+    if current_model is None:
         return None
+    if current_model == expected_model_id:
+        return True
+    logger.info(f"Neural pipeline model mismatch: {current_model} vs {expected_model_id}, updating")
+    return False
 
 
 def ensure_neural_ingest_pipeline(model_id: str | None = None) -> bool:
@@ -518,6 +545,30 @@ def _check_index_version(index_name: str) -> None:
         logger.debug(f"Could not check index version for {index_name}: {e}")
 
 
+# Fields added to the mapping after the index version they shipped in. They
+# are put onto existing indexes in place, since dynamic mapping would
+# otherwise analyze them as text on first write.
+_ADDITIVE_FIELDS = {
+    "access_principals": {"type": "keyword"},
+    "content_hash": {"type": "keyword"},
+    "text_hash": {"type": "keyword"},
+}
+
+
+def _apply_additive_mappings(index_name: str) -> None:
+    """Add ``_ADDITIVE_FIELDS`` to an existing index (once per process)."""
+    global _additive_mappings_applied
+    if _additive_mappings_applied or not opensearch_client:
+        return
+    try:
+        opensearch_client.indices.put_mapping(
+            index=index_name, body={"properties": _ADDITIVE_FIELDS}
+        )
+        _additive_mappings_applied = True
+    except Exception as e:
+        logger.warning(f"Could not add {list(_ADDITIVE_FIELDS)} mapping to {index_name}: {e}")
+
+
 @contextlib.contextmanager
 def _suspended_refresh_for_large_index(
     index_name: str,
@@ -579,6 +630,251 @@ def _suspended_refresh_for_large_index(
             )
 
 
+def get_indexed_accessible_user_ids(query: dict[str, Any]) -> set[int]:
+    """Return the users who can currently see chunks matching a query.
+
+    Collects the ``access_principals`` on matching chunks (plus the legacy
+    ``accessible_user_ids`` of chunks indexed before tokens) and expands
+    collection tokens to the users they are shared with. Used to find whose
+    cached search results go stale before chunks are deleted or their
+    access tokens rewritten.
+
+    Args:
+        query: OpenSearch query selecting the affected chunks.
+
+    Returns:
+        Set of user IDs (empty on error or when nothing matches).
+    """
+    client = get_opensearch_client()
+    if not client:
+        return set()
+    try:
+        response = client.search(
+            index=settings.OPENSEARCH_CHUNKS_INDEX,
+            body={
+                "size": 0,
+                "query": query,
+                "aggs": {
+                    "principals": {"terms": {"field": "access_principals", "size": 10000}},
+                    "users": {"terms": {"field": "accessible_user_ids", "size": 10000}},
+                },
+            },
+        )
+    except Exception as e:
+        logger.debug(f"Could not collect access principals for {query}: {e}")
+        return set()
+
+    aggs = response.get("aggregations", {})
+    user_ids = {int(b["key"]) for b in aggs.get("users", {}).get("buckets", [])}
+    principals = [b["key"] for b in aggs.get("principals", {}).get("buckets", [])]
+    if principals:
+        from app.db.session_utils import session_scope
+        from app.services.permission_service import PermissionService
+
+        try:
+            with session_scope() as db:
+                user_ids |= PermissionService.get_users_for_principals(db, principals)
+        except Exception as e:
+            logger.debug(f"Could not expand access principals {principals}: {e}")
+    return user_ids
+
+
+def get_files_missing_principals(file_ids: list[int] | None = None) -> list[int]:
+    """File IDs whose chunks predate ``access_principals`` and need a backfill.
+
+    Args:
+        file_ids: Only consider these files; all indexed files when None.
+    """
+    client = get_opensearch_client()
+    if not client or file_ids == []:
+        return []
+
+    index_name = settings.OPENSEARCH_CHUNKS_INDEX
+    query: dict[str, Any] = {"bool": {"must_not": [{"exists": {"field": "access_principals"}}]}}
+    if file_ids is not None:
+        query["bool"]["filter"] = [{"terms": {"file_id": file_ids}}]
+    missing: list[int] = []
+    after_key = None
+    try:
+        if not client.indices.exists(index=index_name):
+            return []
+        while True:
+            composite: dict[str, Any] = {
+                "size": 1000,
+                "sources": [{"file_id": {"terms": {"field": "file_id"}}}],
+            }
+            if after_key:
+                composite["after"] = after_key
+            response = client.search(
+                index=index_name,
+                body={"size": 0, "query": query, "aggs": {"files": {"composite": composite}}},
+            )
+            agg = response.get("aggregations", {}).get("files", {})
+            missing.extend(int(b["key"]["file_id"]) for b in agg.get("buckets", []))
+            after_key = agg.get("after_key")
+            if not after_key:
+                break
+    except Exception as e:
+        logger.warning(f"Could not check chunks for missing access principals: {e}")
+    return missing
+
+
+def build_access_filter(user_id: int) -> dict[str, Any]:
+    """OpenSearch filter restricting chunks to those ``user_id`` may see.
+
+    Matches the caller's cached access principals against the chunks'
+    ``access_principals``. Chunks indexed before principals existed have no
+    such field and are matched on their legacy ``accessible_user_ids`` until
+    search maintenance backfills them; revoking a share or group membership
+    rewrites the affected ones straight away (``revoke_legacy_file_access``).
+    """
+    from app.services.permission_service import PermissionService
+    from app.services.permission_service import user_principal
+
+    try:
+        principals = PermissionService.get_cached_search_principals(user_id)
+    except Exception as e:
+        # Fail closed to the user's own files rather than failing the search
+        logger.warning(f"Could not resolve search principals for user {user_id}: {e}")
+        principals = [user_principal(user_id)]
+
+    return {
+        "bool": {
+            "should": [
+                {"terms": {"access_principals": principals}},
+                {
+                    "bool": {
+                        "must_not": [{"exists": {"field": "access_principals"}}],
+                        "filter": [{"term": {"accessible_user_ids": user_id}}],
+                    }
+                },
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+
+
+# Chunk fields left out of content_hash: indexing bookkeeping, and the access
+# fields that update_file_access_index rewrites in place.
+_UNHASHED_FIELDS = frozenset(
+    {
+        "indexed_at",
+        "embedding_model",
+        "content_hash",
+        "text_hash",
+        "access_principals",
+        "accessible_user_ids",
+        "collection_ids",
+    }
+)
+
+# Fields read back from existing chunks when diffing a reindex
+_SYNC_SOURCE_FIELDS = ["content_hash", "text_hash", "access_principals", "collection_ids"]
+_SYNC_PAGE_SIZE = 1000
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def embedding_key(use_neural: bool) -> str:
+    """Identify how chunk embeddings are produced, for ``text_hash``.
+
+    The model is read from the ingest pipeline at index time rather than
+    cached per worker, so once any process switches the model, stored
+    vectors from the previous model are never reused.
+    """
+    if not use_neural:
+        return "none"
+    return f"neural:{_get_pipeline_model_id(settings.OPENSEARCH_NEURAL_PIPELINE) or ''}"
+
+
+def compute_chunk_hashes(chunk: dict[str, Any], embedding: str) -> tuple[str, str]:
+    """Return ``(content_hash, text_hash)`` for a chunk document.
+
+    ``content_hash`` covers every field except bookkeeping and access
+    control, so an equal hash at the same document ID means the stored chunk
+    is current. ``text_hash`` covers only what the embedding is computed from,
+    so a chunk whose metadata or position changed can reuse a stored vector.
+    """
+    hashed = {k: v for k, v in chunk.items() if k not in _UNHASHED_FIELDS}
+    hashed["_embedding"] = embedding
+    text_hash = _digest({"content": chunk.get("content", ""), "_embedding": embedding})
+    return _digest(hashed), text_hash
+
+
+def chunk_doc_id(chunk: dict[str, Any]) -> str:
+    """OpenSearch document ID of a chunk."""
+    return f"{chunk['file_uuid']}_{chunk['chunk_index']}"
+
+
+@dataclass
+class ChunkSyncPlan:
+    """Writes needed to bring a file's stored chunks in line with a new chunking."""
+
+    # Chunks that need a fresh embedding (or have none, in text-only mode)
+    embed: list[dict[str, Any]] = field(default_factory=list)
+    # (chunk, existing doc ID) pairs whose stored embedding can be copied
+    reuse: list[tuple[dict[str, Any], str]] = field(default_factory=list)
+    # Unchanged chunks whose access fields are out of date
+    access_updates: list[dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+    delete_ids: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.embed or self.reuse or self.access_updates or self.delete_ids)
+
+
+def plan_chunk_sync(
+    chunks: list[dict[str, Any]],
+    existing: dict[str, dict[str, Any]],
+    reuse_embeddings: bool = True,
+) -> ChunkSyncPlan:
+    """Diff new chunks against stored ones by hash.
+
+    Args:
+        chunks: New chunk documents, already carrying ``content_hash`` and
+            ``text_hash``.
+        existing: Stored chunks for the same file, doc ID -> ``_source``
+            restricted to ``_SYNC_SOURCE_FIELDS``.
+        reuse_embeddings: Whether stored vectors may be copied (neural mode).
+
+    Returns:
+        The plan; stored chunks absent from ``chunks`` are scheduled for delete.
+    """
+    plan = ChunkSyncPlan()
+    vectors_by_text: dict[str, str] = {}
+    if reuse_embeddings:
+        for doc_id, source in existing.items():
+            if source.get("text_hash"):
+                vectors_by_text.setdefault(source["text_hash"], doc_id)
+
+    new_ids: set[str] = set()
+    for chunk in chunks:
+        doc_id = chunk_doc_id(chunk)
+        new_ids.add(doc_id)
+        current = existing.get(doc_id)
+        if current is not None and current.get("content_hash") == chunk["content_hash"]:
+            if current.get("access_principals") != chunk.get("access_principals") or sorted(
+                current.get("collection_ids") or []
+            ) != sorted(chunk.get("collection_ids") or []):
+                plan.access_updates.append(chunk)
+            else:
+                plan.unchanged += 1
+            continue
+
+        source_id = vectors_by_text.get(chunk["text_hash"])
+        if source_id is not None:
+            plan.reuse.append((chunk, source_id))
+        else:
+            plan.embed.append(chunk)
+
+    plan.delete_ids = [doc_id for doc_id in existing if doc_id not in new_ids]
+    return plan
+
+
 class TranscriptIndexingService:
     """Handles chunking, embedding, and indexing transcripts into OpenSearch.
 
@@ -607,7 +903,12 @@ class TranscriptIndexingService:
         collection_ids: list[int] | None = None,
         accessible_user_ids: list[int] | None = None,
     ) -> dict[str, Any] | int:
-        """Chunk and index a transcript.
+        """Chunk a transcript and sync its chunks into the index.
+
+        Each chunk carries a content hash, and the new chunk set is diffed
+        against the file's stored chunks: unchanged chunks are skipped, chunks
+        whose text is unchanged reuse their stored embedding, and chunks no
+        longer produced are deleted. Only new text goes through embedding.
 
         Embedding modes (in priority order):
         1. Neural pipeline available — OpenSearch generates embeddings server-side
@@ -626,9 +927,10 @@ class TranscriptIndexingService:
             content_type: MIME content type of the file.
             duration: Duration in seconds.
             file_size: File size in bytes.
-            collection_ids: List of collection IDs the file belongs to.
-            accessible_user_ids: List of user IDs with access to this file.
-                Includes owner + users/groups with collection shares.
+            collection_ids: List of collection IDs the file belongs to. Also
+                determines the chunks' ``access_principals``.
+            accessible_user_ids: Users with access to this file, whose cached
+                searches are invalidated once the chunks are written.
                 If None, defaults to [user_id] (owner only).
 
         Returns:
@@ -641,6 +943,7 @@ class TranscriptIndexingService:
 
         if not segments:
             logger.warning(f"No segments to index for file {file_uuid}")
+            self.delete_transcript_chunks(file_uuid)
             return 0
 
         ensure_chunks_index_exists()
@@ -669,48 +972,92 @@ class TranscriptIndexingService:
         chunk_ms = round((time.time() - t_chunk_start) * 1000)
 
         if not chunks:
+            # Drop the chunks from the previous transcript, or they stay searchable
             logger.warning(f"No chunks generated for file {file_uuid}")
+            self.delete_transcript_chunks(file_uuid)
             return 0
 
-        # 2. Add indexed_at timestamp and accessible_user_ids
+        # 2. Add indexed_at timestamp, access principals and content hashes
         now = datetime.datetime.now(datetime.timezone.utc).isoformat()
         effective_user_ids = accessible_user_ids if accessible_user_ids else [user_id]
+        principals = file_access_principals(user_id, collection_ids)
+        use_neural = is_neural_pipeline_available()
+        embedding = embedding_key(use_neural)
         for chunk in chunks:
             chunk["indexed_at"] = now
-            chunk["accessible_user_ids"] = effective_user_ids
+            chunk["access_principals"] = principals
+            chunk["embedding_model"] = "neural" if use_neural else None
+            chunk["content_hash"], chunk["text_hash"] = compute_chunk_hashes(chunk, embedding)
 
-        # 3. Choose embedding mode and index
+        # 3. Diff against the stored chunks and write only the delta
         t_index_start = time.time()
         try:
-            use_neural = is_neural_pipeline_available()
-            if use_neural:
-                for chunk in chunks:
-                    chunk["embedding_model"] = "neural"
-                logger.debug(f"Using neural ingest pipeline for file {file_uuid}")
-            else:
-                for chunk in chunks:
-                    chunk["embedding_model"] = None
+            existing = self._fetch_existing_chunks(file_uuid)
+            if existing is None:
+                # Stored chunks are unknown: drop any past the new chunk count
+                # and rewrite the rest, which overwrites them by doc ID
+                self._delete_chunks_from(file_uuid, len(chunks))
+                existing = {}
+            plan = plan_chunk_sync(chunks, existing, reuse_embeddings=use_neural)
+            if plan.reuse:
+                vectors = self._fetch_embeddings([source_id for _, source_id in plan.reuse])
+                for chunk, source_id in plan.reuse:
+                    vector = vectors.get(source_id)
+                    if vector is None:
+                        plan.embed.append(chunk)
+                    else:
+                        chunk["embedding"] = vector
+                plan.reuse = [(c, s) for c, s in plan.reuse if s in vectors]
+            if not use_neural:
                 logger.warning(f"Neural pipeline not available for {file_uuid}, text-only")
 
             # For very large transcripts (6h+ recordings produce 500+ chunks)
             # suspend index refresh during the bulk load so we don't pay the
             # per-batch refresh cost. The context manager restores the prior
             # refresh_interval on exit.
+            written = 0
             with _suspended_refresh_for_large_index(
                 settings.OPENSEARCH_CHUNKS_INDEX,
-                chunk_count=len(chunks),
+                chunk_count=len(plan.embed) + len(plan.reuse),
                 threshold=settings.SEARCH_LARGE_TRANSCRIPT_CHUNKS,
             ):
-                indexed = self._bulk_index_chunks(chunks, use_neural_pipeline=use_neural)
+                if plan.embed:
+                    written += self._bulk_index_chunks(plan.embed, use_neural_pipeline=use_neural)
+                if plan.reuse:
+                    written += self._bulk_index_chunks(
+                        [chunk for chunk, _ in plan.reuse], use_neural_pipeline=False
+                    )
+            access_updated = self._bulk_update_access(plan.access_updates)
+            deleted = self._bulk_delete(plan.delete_ids)
+
             index_ms = round((time.time() - t_index_start) * 1000)
             total_ms = chunk_ms + index_ms
             mode_str = "neural" if use_neural else "text-only"
             logger.info(
-                f"Indexed {indexed} chunks for file {file_uuid} "
+                f"Indexed file {file_uuid}: {len(plan.embed)} embedded, "
+                f"{len(plan.reuse)} reused, {plan.unchanged} unchanged, "
+                f"{access_updated} access updates, {deleted} deleted "
                 f"(mode: {mode_str}, chunk={chunk_ms}ms, index={index_ms}ms)"
             )
+
+            if plan.has_changes:
+                from app.services.redis_cache_service import redis_cache
+
+                redis_cache.bump_search_generation(effective_user_ids)
+            suggestion_index.sync_file(
+                file_uuid,
+                principals,
+                title=title,
+                speakers=speakers,
+                tags=tags,
+                terms=frequent_terms(str(seg.get("text") or "") for seg in segments),
+            )
             return {
-                "chunk_count": indexed,
+                "chunk_count": written + access_updated + plan.unchanged,
+                "embedded": len(plan.embed),
+                "reused": len(plan.reuse),
+                "unchanged": plan.unchanged,
+                "deleted": deleted,
                 "chunk_ms": chunk_ms,
                 "index_ms": index_ms,
                 "total_ms": total_ms,
@@ -730,6 +1077,7 @@ class TranscriptIndexingService:
         Returns:
             Number of chunks deleted.
         """
+        suggestion_index.remove_file(file_uuid)
         if not opensearch_client:
             return 0
 
@@ -738,12 +1086,18 @@ class TranscriptIndexingService:
             if not opensearch_client.indices.exists(index=index_name):
                 return 0
 
+            query = {"term": {"file_uuid": file_uuid}}
+            affected_user_ids = get_indexed_accessible_user_ids(query)
             response = opensearch_client.delete_by_query(
                 index=index_name,
-                body={"query": {"term": {"file_uuid": file_uuid}}},
+                body={"query": query},
                 refresh=True,
             )
             deleted: int = response.get("deleted", 0)
+            if deleted:
+                from app.services.redis_cache_service import redis_cache
+
+                redis_cache.bump_search_generation(affected_user_ids)
             logger.info(f"Deleted {deleted} chunks for file {file_uuid}")
             return deleted
         except Exception as e:
@@ -767,18 +1121,17 @@ class TranscriptIndexingService:
         collection_ids: list[int] | None = None,
         accessible_user_ids: list[int] | None = None,
     ) -> int:
-        """Re-chunk and re-index a single transcript.
+        """Re-chunk a single transcript and sync its stored chunks.
+
+        Chunks are diffed by content hash, so only new or changed chunks are
+        written and only new text is embedded; see index_transcript_chunks.
 
         Args:
             Same as index_transcript_chunks.
 
         Returns:
-            Number of chunks indexed.
+            Number of chunks now current in the index.
         """
-        # Delete existing chunks first
-        self.delete_transcript_chunks(file_uuid)
-
-        # Re-index
         result = self.index_transcript_chunks(
             file_id=file_id,
             file_uuid=file_uuid,
@@ -801,6 +1154,140 @@ class TranscriptIndexingService:
             return chunk_count
         return result
 
+    def _fetch_existing_chunks(self, file_uuid: str) -> dict[str, dict[str, Any]] | None:
+        """Return doc ID -> hash and access fields for a file's stored chunks.
+
+        Returns None when the lookup fails part way. A partial map would
+        leave unread chunks out of the delete list, so the caller must not
+        diff against it.
+        """
+        if not opensearch_client:
+            return {}
+
+        existing: dict[str, dict[str, Any]] = {}
+        search_after: list[Any] | None = None
+        try:
+            while True:
+                body: dict[str, Any] = {
+                    "query": {"term": {"file_uuid": file_uuid}},
+                    "_source": _SYNC_SOURCE_FIELDS,
+                    "sort": [{"chunk_index": "asc"}],
+                    "size": _SYNC_PAGE_SIZE,
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+                hits = opensearch_client.search(index=settings.OPENSEARCH_CHUNKS_INDEX, body=body)[
+                    "hits"
+                ]["hits"]
+                for hit in hits:
+                    existing[hit["_id"]] = hit.get("_source", {})
+                if len(hits) < _SYNC_PAGE_SIZE:
+                    break
+                search_after = hits[-1]["sort"]
+        except Exception as e:
+            logger.warning(f"Could not read existing chunks for {file_uuid}: {e}")
+            return None
+        return existing
+
+    def _delete_chunks_from(self, file_uuid: str, chunk_index: int) -> None:
+        """Delete a file's chunks with ``chunk_index`` at or above the given one.
+
+        Raises on failure, so the reindex stops before writing a chunk set
+        that stale chunks would outlive.
+        """
+        if not opensearch_client:
+            return
+        response = opensearch_client.delete_by_query(
+            index=settings.OPENSEARCH_CHUNKS_INDEX,
+            body={
+                "query": {
+                    "bool": {
+                        "filter": [
+                            {"term": {"file_uuid": file_uuid}},
+                            {"range": {"chunk_index": {"gte": chunk_index}}},
+                        ]
+                    }
+                }
+            },
+            refresh=False,
+        )
+        logger.info(
+            f"Deleted {response.get('deleted', 0)} chunks from index {chunk_index} "
+            f"for {file_uuid} after a failed chunk lookup"
+        )
+
+    def _fetch_embeddings(self, doc_ids: list[str]) -> dict[str, list[float]]:
+        """Load stored embedding vectors for the given chunk IDs."""
+        if not opensearch_client or not doc_ids:
+            return {}
+
+        vectors: dict[str, list[float]] = {}
+        unique_ids = list(dict.fromkeys(doc_ids))
+        batch_size = settings.SEARCH_BULK_BATCH_SIZE
+        try:
+            for start in range(0, len(unique_ids), batch_size):
+                response = opensearch_client.mget(
+                    index=settings.OPENSEARCH_CHUNKS_INDEX,
+                    body={
+                        "docs": [
+                            {"_id": doc_id, "_source": ["embedding"]}
+                            for doc_id in unique_ids[start : start + batch_size]
+                        ]
+                    },
+                )
+                for doc in response.get("docs", []):
+                    vector = doc.get("_source", {}).get("embedding") if doc.get("found") else None
+                    if vector:
+                        vectors[doc["_id"]] = vector
+        except Exception as e:
+            logger.warning(f"Could not load stored embeddings, re-embedding instead: {e}")
+        return vectors
+
+    def _bulk_update_access(self, chunks: list[dict[str, Any]]) -> int:
+        """Rewrite access fields of unchanged chunks in place (no re-embedding)."""
+        actions: list[Any] = []
+        for chunk in chunks:
+            actions.append({"update": {"_id": chunk_doc_id(chunk)}})
+            actions.append(
+                {
+                    "doc": {
+                        "access_principals": chunk["access_principals"],
+                        "collection_ids": chunk["collection_ids"],
+                    }
+                }
+            )
+        return self._bulk_apply(actions, "update")
+
+    def _bulk_delete(self, doc_ids: list[str]) -> int:
+        """Delete chunks that no longer exist in the transcript."""
+        return self._bulk_apply([{"delete": {"_id": doc_id}} for doc_id in doc_ids], "delete")
+
+    def _bulk_apply(self, actions: list[Any], op: str) -> int:
+        """Send non-indexing bulk actions, returning the number that succeeded.
+
+        Failures are logged rather than retried: the stored hashes still
+        differ, so the next reindex of the file picks them up again.
+        """
+        if not opensearch_client or not actions:
+            return 0
+
+        index_name = settings.OPENSEARCH_CHUNKS_INDEX
+        succeeded = 0
+        batch_size = settings.SEARCH_BULK_BATCH_SIZE * (2 if op == "update" else 1)
+        for start in range(0, len(actions), batch_size):
+            response = opensearch_client.bulk(
+                index=index_name, body=actions[start : start + batch_size], refresh=False
+            )
+            for item in response.get("items", []):
+                result = item.get(op, {})
+                if result.get("error"):
+                    logger.warning(
+                        f"Bulk {op} of chunk {result.get('_id')} failed: {result['error']}"
+                    )
+                else:
+                    succeeded += 1
+        return succeeded
+
     def _bulk_index_chunks(
         self, chunks: list[dict[str, Any]], use_neural_pipeline: bool = False
     ) -> int:
@@ -829,7 +1316,7 @@ class TranscriptIndexingService:
             bulk_body: list[Any] = []
 
             for chunk in batch:
-                doc_id = f"{chunk['file_uuid']}_{chunk['chunk_index']}"
+                doc_id = chunk_doc_id(chunk)
                 index_action: dict[str, Any] = {
                     "index": {
                         "_index": index_name,
@@ -953,7 +1440,7 @@ class TranscriptIndexingService:
 
             bulk_body: list[Any] = []
             for chunk in remaining:
-                doc_id = f"{chunk['file_uuid']}_{chunk['chunk_index']}"
+                doc_id = chunk_doc_id(chunk)
                 index_action: dict[str, Any] = {
                     "index": {
                         "_index": index_name,
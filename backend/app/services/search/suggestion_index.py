@@ -0,0 +1,440 @@
+"""
+Autocomplete index for search suggestions, kept in Redis.
+
+``HybridSearchService.get_suggestions`` used to run prefix queries against
+the chunk index on every keystroke. This index keeps the suggestion
+vocabulary (file titles, speaker names, tags and each file's most frequent
+transcript terms) in Redis sorted sets instead, one per search access
+principal (see ``permission_service``) and kind of entry, so a keystroke
+costs two pipelined round trips and never touches OpenSearch. Each kind
+is scanned separately, so a prefix shared by many terms cannot crowd the
+titles, speakers and tags out of the scan.
+
+Every entry is stored under each principal of the file it came from, with
+a count of the files contributing it. Each file's entries and principals
+are kept in a record, so a write only applies the difference:
+
+- ``index_transcript_chunks`` syncs the whole file,
+- title, speaker and tag edits replace one kind of entry,
+- ``update_file_access_index`` moves the entries to the new principals,
+- ``delete_transcript_chunks`` removes them.
+
+Entries are searchable from the start of every word, so "smi" finds
+"John Smith". Readers get None until ``rebuild_search_suggestions`` has
+filled the index once, and fall back to OpenSearch.
+
+Unlike the relevance-ranked OpenSearch path, ranking by file count only
+sees the alphabetically first ``SCAN_LIMIT`` matches per principal and
+kind. For a short, common prefix, frequent entries later in the alphabet
+are not suggested until the user types more of them.
+
+Key conventions (outside ``cache:*``):
+    suggest:ready:v{LAYOUT}         - Set once the initial rebuild finished
+    suggest:file:{file_uuid}        - JSON record of the file's principals and entries
+    suggest:lock:{file_uuid}        - Short writer lock for the record
+    suggest:lex:{principal}:{kind}  - ZSET, all scores 0, "{key}\\0{kind}\\0{ref}\\0{text}"
+    suggest:n:{principal}:{kind}    - HASH member -> number of files contributing it
+
+Records written under an older ``LAYOUT`` are treated as missing, so the
+rebuild that runs while the new ready flag is unset fills the new keys.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Any
+from typing import Optional
+
+from app.core.config import settings
+from app.services.redis_cache_service import redis_cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "suggest:"
+# Bumped when the key layout changes
+LAYOUT = 2
+READY_KEY = f"{KEY_PREFIX}ready:v{LAYOUT}"
+
+# Entry kinds, in the order suggestions are listed
+KINDS = ("title", "speaker", "tag", "term")
+# Suggestions per kind, as the OpenSearch path returned
+KIND_LIMIT = 4
+# Members read per principal, kind and keystroke
+SCAN_LIMIT = 64
+# Word positions indexed per entry ("weekly team meeting" -> 3 keys)
+MAX_WORD_STARTS = 8
+TERMS_PER_FILE = 15
+MIN_TERM_LENGTH = 4
+LOCK_TTL_SECONDS = 10
+LOCK_WAIT_SECONDS = 2.0
+
+_SEP = "\x00"
+_WORD_RE = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)?")
+
+# KEYS: lex zset, count hash. ARGV: member, delta pairs.
+_APPLY_SCRIPT = """
+for i = 1, #ARGV, 2 do
+  local n = redis.call('HINCRBY', KEYS[2], ARGV[i], ARGV[i + 1])
+  if n > 0 then
+    redis.call('ZADD', KEYS[1], 0, ARGV[i])
+  else
+    redis.call('HDEL', KEYS[2], ARGV[i])
+    redis.call('ZREM', KEYS[1], ARGV[i])
+  end
+end
+return 0
+"""
+
+
+def normalize(text: str) -> str:
+    """Lookup form of an entry or prefix: case-folded, single-spaced."""
+    return " ".join(text.replace(_SEP, " ").casefold().split())
+
+
+def frequent_terms(texts: Iterable[str], limit: int = TERMS_PER_FILE) -> list[str]:
+    """Most frequent non-stopword words of a transcript (seen at least twice)."""
+    stopwords = _stopwords()
+    counts: Counter[str] = Counter(
+        word
+        for text in texts
+        for word in _WORD_RE.findall((text or "").casefold())
+        if len(word) >= MIN_TERM_LENGTH and word not in stopwords
+    )
+    return [word for word, n in counts.most_common(limit) if n > 1]
+
+
+def _stopwords() -> frozenset[str]:
+    try:
+        from app.utils.text_preprocessing import _get_stopwords
+
+        return _get_stopwords()
+    except Exception:
+        from app.utils.text_preprocessing import _TRANSCRIPT_FILLER
+
+        return _TRANSCRIPT_FILLER
+
+
+def _members(kind: str, text: str, ref: str = "") -> list[str]:
+    """Sorted-set members for one entry, one per indexed word position."""
+    words = normalize(text).split(" ")
+    if not words[0]:
+        return []
+    display = text.replace(_SEP, " ").strip()
+    return [
+        _SEP.join((" ".join(words[i:]), kind, ref, display))
+        for i in range(min(len(words), MAX_WORD_STARTS))
+    ]
+
+
+def _member_kind(member: str) -> str:
+    return member.split(_SEP, 2)[1]
+
+
+def _lex_key(principal: str, kind: str) -> str:
+    return f"{KEY_PREFIX}lex:{principal}:{kind}"
+
+
+def _count_key(principal: str, kind: str) -> str:
+    return f"{KEY_PREFIX}n:{principal}:{kind}"
+
+
+def _record_members(file_uuid: str, entries: dict[str, list[str]]) -> set[str]:
+    members: set[str] = set()
+    for kind, texts in entries.items():
+        ref = file_uuid if kind == "title" else ""
+        for text in texts:
+            members.update(_members(kind, text, ref))
+    return members
+
+
+def _clean(texts: Iterable[Optional[str]]) -> list[str]:
+    return sorted({text.strip() for text in texts if text and text.strip()})
+
+
+class SuggestionIndex:
+    """Per-principal prefix index over titles, speakers, tags and terms.
+
+    All methods degrade to no-ops (writers) or None (readers) when Redis is
+    unavailable; OpenSearch remains the fallback for suggestions.
+    """
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def sync_file(
+        self,
+        file_uuid: str,
+        principals: list[str],
+        title: str,
+        speakers: Iterable[str],
+        tags: Iterable[str],
+        terms: Iterable[str] = (),
+    ) -> None:
+        """Replace everything a file contributes."""
+        record = {
+            "layout": LAYOUT,
+            "principals": sorted(set(principals)),
+            "entries": {
+                "title": _clean([title]),
+                "speaker": _clean(speakers),
+                "tag": _clean(tags),
+                "term": _clean(terms),
+            },
+        }
+        self._write(file_uuid, lambda _old: record)
+
+    def update_file(
+        self,
+        file_uuid: str,
+        title: Optional[str] = None,
+        speakers: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Replace the given kinds of entry of an already indexed file."""
+        changes = {"title": None if title is None else [title], "speaker": speakers, "tag": tags}
+
+        def apply(old: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+            if old is None:
+                return None
+            entries = dict(old["entries"])
+            for kind, texts in changes.items():
+                if texts is not None:
+                    entries[kind] = _clean(texts)
+            return {"layout": LAYOUT, "principals": old["principals"], "entries": entries}
+
+        self._write(file_uuid, apply)
+
+    def set_principals(self, file_uuid: str, principals: list[str]) -> None:
+        """Move an already indexed file's entries to new access principals."""
+
+        def apply(old: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+            if old is None:
+                return None
+            return {
+                "layout": LAYOUT,
+                "principals": sorted(set(principals)),
+                "entries": old["entries"],
+            }
+
+        self._write(file_uuid, apply)
+
+    def remove_file(self, file_uuid: str) -> None:
+        """Drop everything a file contributes."""
+        self._write(file_uuid, lambda _old: {"layout": LAYOUT, "principals": [], "entries": {}})
+
+    def mark_ready(self) -> None:
+        client = redis_cache.redis
+        if client is not None:
+            client.set(READY_KEY, "1")
+
+    def is_ready(self) -> bool:
+        client = redis_cache.redis
+        if client is None:
+            return False
+        try:
+            return bool(client.exists(READY_KEY))
+        except Exception:
+            return False
+
+    def _write(
+        self,
+        file_uuid: str,
+        update: Callable[[Optional[dict[str, Any]]], Optional[dict[str, Any]]],
+    ) -> None:
+        """Read the file's record, apply ``update`` and write the difference.
+
+        ``update`` returns the new record, or None to leave the file alone.
+        The per-file lock keeps concurrent edits of one file from applying
+        the same difference twice; counts shared between files are only
+        changed inside the Lua script.
+        """
+        client = redis_cache.redis
+        if client is None:
+            return
+        record_key = f"{KEY_PREFIX}file:{file_uuid}"
+        lock_key = f"{KEY_PREFIX}lock:{file_uuid}"
+        try:
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while not client.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS):
+                if time.monotonic() > deadline:
+                    logger.warning(f"Suggestion index busy for file {file_uuid}, skipping")
+                    return
+                time.sleep(0.01)
+            try:
+                raw = client.get(record_key)
+                old = json.loads(raw) if raw else None
+                if old is not None and old.get("layout") != LAYOUT:
+                    old = None
+                new = update(old)
+                if new is None:
+                    return
+                self._apply_diff(client, file_uuid, old, new)
+                if new["entries"] and new["principals"]:
+                    client.set(record_key, json.dumps(new))
+                else:
+                    client.delete(record_key)
+            finally:
+                client.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Suggestion index update failed for file {file_uuid}: {e}")
+
+    @staticmethod
+    def _apply_diff(
+        client: Any,
+        file_uuid: str,
+        old: Optional[dict[str, Any]],
+        new: dict[str, Any],
+    ) -> None:
+        old_members = _record_members(file_uuid, old["entries"]) if old else set()
+        new_members = _record_members(file_uuid, new["entries"])
+        old_principals = set(old["principals"]) if old else set()
+        new_principals = set(new["principals"])
+
+        pipe = client.pipeline(transaction=False)
+        for principal in sorted(old_principals | new_principals):
+            before = old_members if principal in old_principals else set()
+            after = new_members if principal in new_principals else set()
+            deltas: dict[str, list[Any]] = {}
+            for members, delta in ((before - after, -1), (after - before, 1)):
+                for member in sorted(members):
+                    deltas.setdefault(_member_kind(member), []).extend((member, delta))
+            for kind, args in sorted(deltas.items()):
+                pipe.eval(
+                    _APPLY_SCRIPT, 2, _lex_key(principal, kind), _count_key(principal, kind), *args
+                )
+        pipe.execute()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def suggest(
+        self, principals: list[str], prefix: str, limit: int
+    ) -> Optional[list[dict[str, Any]]]:
+        """Suggestions visible through ``principals`` that start with ``prefix``.
+
+        Only the alphabetically first ``SCAN_LIMIT`` matches per principal
+        and kind are ranked by file count. Returns None when the index cannot answer (Redis unavailable, not
+        built yet) so the caller can fall back to OpenSearch.
+        """
+        client = redis_cache.redis
+        if client is None:
+            return None
+        key = normalize(prefix)
+        scans = [(principal, kind) for principal in principals for kind in KINDS]
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.exists(READY_KEY)
+            low = b"[" + key.encode()
+            high = low + b"\xff"
+            for principal, kind in scans:
+                pipe.zrangebylex(_lex_key(principal, kind), low, high, start=0, num=SCAN_LIMIT)
+            ready, *ranges = pipe.execute()
+            if not ready:
+                return None
+
+            pipe = client.pipeline(transaction=False)
+            for (principal, kind), members in zip(scans, ranges):
+                if members:
+                    pipe.hmget(_count_key(principal, kind), members)
+            counts = iter(pipe.execute())
+        except Exception as e:
+            logger.warning(f"Suggestion index lookup failed: {e}")
+            return None
+
+        totals: Counter[tuple[str, str, str]] = Counter()
+        for members in ranges:
+            if not members:
+                continue
+            for member, count in zip(members, next(counts)):
+                _, kind, ref, text = member.split(_SEP, 3)
+                totals[(kind, ref, text)] += int(count or 0)
+        return self._rank(totals, limit)
+
+    @staticmethod
+    def _rank(totals: Counter[tuple[str, str, str]], limit: int) -> list[dict[str, Any]]:
+        ranked = sorted(
+            ((kind, ref, text, n) for (kind, ref, text), n in totals.items() if n > 0),
+            key=lambda item: (KINDS.index(item[0]), -item[3], item[2].casefold()),
+        )
+        suggestions: list[dict[str, Any]] = []
+        per_kind: Counter[str] = Counter()
+        for kind, ref, text, n in ranked:
+            if per_kind[kind] >= KIND_LIMIT:
+                continue
+            per_kind[kind] += 1
+            if kind == "title":
+                suggestions.append({"type": kind, "text": text, "file_uuid": ref})
+            else:
+                suggestions.append({"type": kind, "text": text, "count": n})
+        return suggestions[:limit]
+
+
+suggestion_index = SuggestionIndex()
+
+
+def suggest_for_user(user_id: int, prefix: str, limit: int) -> Optional[list[dict[str, Any]]]:
+    """``SuggestionIndex.suggest`` for everything ``user_id`` may search."""
+    if not settings.SEARCH_SUGGESTION_INDEX_ENABLED:
+        return None
+    from app.services.permission_service import PermissionService
+    from app.services.permission_service import user_principal
+
+    try:
+        principals = PermissionService.get_cached_search_principals(user_id)
+    except Exception as e:
+        logger.warning(f"Could not resolve search principals for user {user_id}: {e}")
+        principals = [user_principal(user_id)]
+    return suggestion_index.suggest(principals, prefix, limit)
+
+
+def refresh_file_suggestions(
+    db: Any,
+    media_file_id: int,
+    title: bool = False,
+    speakers: bool = False,
+    tags: bool = False,
+) -> None:
+    """Reload the given kinds of entry of one file from the database.
+
+    Called after title, speaker name and tag edits. Files that were never
+    indexed are left for indexing or the rebuild to pick up.
+    """
+    from app.models.media import FileTag
+    from app.models.media import MediaFile
+    from app.models.media import Speaker
+    from app.models.media import Tag
+    from app.models.media import TranscriptSegment
+
+    try:
+        media_file = db.query(MediaFile).filter(MediaFile.id == media_file_id).first()
+        if media_file is None:
+            return
+        changes: dict[str, Any] = {}
+        if title:
+            changes["title"] = media_file.title or media_file.filename or f"File {media_file_id}"
+        if speakers:
+            rows = (
+                db.query(Speaker.display_name, Speaker.name)
+                .join(TranscriptSegment, TranscriptSegment.speaker_id == Speaker.id)
+                .filter(TranscriptSegment.media_file_id == media_file_id)
+                .distinct()
+                .all()
+            )
+            changes["speakers"] = [display_name or name for display_name, name in rows]
+        if tags:
+            rows = (
+                db.query(Tag.name)
+                .join(FileTag, FileTag.tag_id == Tag.id)
+                .filter(FileTag.media_file_id == media_file_id)
+                .all()
+            )
+            changes["tags"] = [name for (name,) in rows]
+        suggestion_index.update_file(str(media_file.uuid), **changes)
+    except Exception as e:
+        logger.warning(f"Failed to refresh suggestions for file {media_file_id}: {e}")
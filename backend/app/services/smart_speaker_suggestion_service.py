@@ -482,7 +482,7 @@ class SmartSpeakerSuggestionService:
                 )
 
         # Phase 2: Batch-fetch all speaker embeddings (1 mget)
-        embeddings_map = get_speaker_embeddings_batch(list(uuid_to_id.keys()))
+        embeddings_map = get_speaker_embeddings_batch(list(uuid_to_id.keys()), user_id=user_id)
 
         # Phase 3: Check if profiles exist at all (1 search, same for all speakers)
         profiles_exist = False
@@ -3,7 +3,9 @@ Protocol, adapters, and multi-model runner for speaker analysis pipelines.
 
 Provides a unified interface for running one or more speaker analysis models
 (embedding extraction, gender detection) on the same audio segments. Audio
-is loaded once by I/O threads and fed to each model back-to-back.
+is loaded once by I/O threads and fed to each model back-to-back. Models
+that implement ``process_batch`` receive every segment of a file group in
+one call.
 
 Three operational modes:
   Mode 1 — Embedding only: MultiModelRunner([EmbeddingModelAdapter(...)])
@@ -115,6 +117,23 @@ class GenderModelAdapter:
             logger.debug("Gender inference failed: %s", e)
             return None
 
+    def process_batch(
+        self, clips: list[np.ndarray], sample_rate: int
+    ) -> list[tuple[str, float] | None]:
+        """Classify many segments in length-bucketed forward passes."""
+        eligible = [i for i, clip in enumerate(clips) if len(clip) >= sample_rate]
+        results: list[tuple[str, float] | None] = [None] * len(clips)
+        if not eligible:
+            return results
+        try:
+            predictions = self._service.predict_batch([clips[i] for i in eligible])
+        except Exception as e:
+            logger.debug("Batched gender inference failed: %s", e)
+            return results
+        for i, prediction in zip(eligible, predictions):
+            results[i] = prediction
+        return results
+
     def cleanup(self) -> None:
         self._service.cleanup()
 
@@ -169,6 +188,39 @@ class MultiModelRunner:
                 )
         return results
 
+    def process_segments(
+        self,
+        segments: list[tuple[int, np.ndarray]],
+        sample_rate: int,
+    ) -> list[SegmentResult]:
+        """Run all models on many segments at once.
+
+        Models with a ``process_batch`` method get every segment in one
+        call; the rest fall back to ``process_audio`` per segment.
+
+        Args:
+            segments: (speaker_id, 1-D float32 audio) pairs, possibly from
+                several files.
+            sample_rate: Sample rate of every segment.
+
+        Returns:
+            SegmentResult per model and segment that succeeded.
+        """
+        clips = [audio_np for _, audio_np in segments]
+        results = []
+        for model in self._models:
+            process_batch = getattr(model, "process_batch", None)
+            if process_batch is not None:
+                values = process_batch(clips, sample_rate)
+            else:
+                values = [model.process_audio(clip, sample_rate) for clip in clips]
+            for (speaker_id, _), value in zip(segments, values):
+                if value is not None:
+                    results.append(
+                        SegmentResult(model_name=model.name, speaker_id=speaker_id, value=value)
+                    )
+        return results
+
     def cleanup(self) -> None:
         """Release all model resources."""
         for model in self._models:
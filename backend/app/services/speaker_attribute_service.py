@@ -6,14 +6,24 @@ This model (~380MB, Apache 2.0) is fine-tuned from wav2vec2-base-960h and achiev
 98.46% accuracy on gender classification (female/male).
 
 Model card: https://huggingface.co/prithivMLmods/Common-Voice-Gender-Detection
+
+Clips are classified in batches: ``predict_batch`` sorts them by length,
+buckets similar lengths together and runs one forward pass per bucket,
+optionally through an INT8 ONNX export on CPU
+(scripts/export-gender-onnx.py).
 """
 
 import logging
+import os
+from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import Any
 from typing import Optional
 
 import numpy as np
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "prithivMLmods/Common-Voice-Gender-Detection"
@@ -21,12 +31,82 @@ MODEL_NAME = "prithivMLmods/Common-Voice-Gender-Detection"
 # Label mapping: model index → gender string
 GENDER_ID2LABEL = {0: "female", 1: "male"}
 
+SAMPLE_RATE = 16000
+
+# wav2vec2-base normalizes its conv features over time with GroupNorm, so
+# zero padding shifts the logits slightly. Clips share a bucket only while
+# the longest is within 15 % of the shortest, which keeps batched results
+# within rounding of single-clip inference.
+BUCKET_MAX_PAD_RATIO = 1.15
+
+# Padded samples per forward pass (4 minutes of audio). Long merged
+# sections end up in buckets of their own instead of one huge tensor.
+MAX_BATCH_SAMPLES = 240 * SAMPLE_RATE
+
+
+def bucket_by_length(
+    lengths: Sequence[int],
+    max_batch_size: int,
+    max_batch_samples: int = MAX_BATCH_SAMPLES,
+    max_pad_ratio: float = BUCKET_MAX_PAD_RATIO,
+) -> list[list[int]]:
+    """Group clip indices into batches of similar length.
+
+    Indices are visited shortest first. A bucket closes when it is full,
+    when the next clip would pad the shortest one by more than
+    ``max_pad_ratio``, or when the padded batch would exceed
+    ``max_batch_samples``. A single clip always gets a bucket.
+    """
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    shortest = 0
+    for idx in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        length = lengths[idx]
+        if current and (
+            len(current) >= max_batch_size
+            or length > shortest * max_pad_ratio
+            or length * (len(current) + 1) > max_batch_samples
+        ):
+            buckets.append(current)
+            current = []
+        if not current:
+            shortest = length
+        current.append(idx)
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def aggregate_by_speaker(
+    predictions: Iterable[tuple[int, tuple[str, float]]],
+) -> dict[int, tuple[str, float]]:
+    """Combine per-clip (gender, confidence) votes into one result per speaker.
+
+    Confidences are summed per gender; the winning gender's sum is divided
+    by the speaker's clip count.
+    """
+    speaker_probs: dict[int, dict[str, float]] = {}
+    speaker_clip_counts: dict[int, int] = {}
+    for speaker_id, (gender, confidence) in predictions:
+        if speaker_id not in speaker_probs:
+            speaker_probs[speaker_id] = {"male": 0.0, "female": 0.0}
+            speaker_clip_counts[speaker_id] = 0
+        speaker_probs[speaker_id][gender] += confidence
+        speaker_clip_counts[speaker_id] += 1
+
+    results = {}
+    for speaker_id, probs in speaker_probs.items():
+        final_gender = max(probs, key=lambda k: probs[k])
+        results[speaker_id] = (final_gender, probs[final_gender] / speaker_clip_counts[speaker_id])
+    return results
+
 
 class SpeakerAttributeService:
     """Predicts speaker gender from audio using wav2vec2 sequence classification."""
 
     def __init__(self, force_cpu: bool = False) -> None:
         self._model: Optional[Any] = None
+        self._onnx_session: Optional[Any] = None
         self._feature_extractor: Optional[Any] = None
         self._model_loaded = False
         self._device: str = "cpu"
@@ -37,6 +117,7 @@ class SpeakerAttributeService:
 
         Uses GPU if available (and not force_cpu) for faster inference.
         The model is small (~380MB) and fits alongside WhisperX on GPU.
+        On CPU the INT8 ONNX export is used instead when enabled and present.
         """
         if self._model_loaded:
             return
@@ -47,22 +128,22 @@ class SpeakerAttributeService:
             from transformers import Wav2Vec2ForSequenceClassification
 
             self._feature_extractor = Wav2Vec2FeatureExtractor.from_pretrained(MODEL_NAME)
-            self._model = Wav2Vec2ForSequenceClassification.from_pretrained(MODEL_NAME)
-            self._model.eval()
 
             # Use GPU only on GPU workers (PRELOAD_GPU_MODELS=true).
             # On CPU workers, this model would leak a CUDA context (~5GB)
             # in the prefork child process that never gets released.
-            import os
-
             is_gpu_worker = os.environ.get("PRELOAD_GPU_MODELS", "").lower() == "true"
             if not self._force_cpu and is_gpu_worker and torch.cuda.is_available():
                 self._device = "cuda"
-                self._model = self._model.to(self._device)
-                logger.info(f"Gender model loaded on GPU: {MODEL_NAME}")
             else:
                 self._device = "cpu"
-                logger.info(f"Gender model loaded on CPU: {MODEL_NAME}")
+                self._onnx_session = self._load_onnx_session()
+
+            if self._onnx_session is None:
+                self._model = Wav2Vec2ForSequenceClassification.from_pretrained(MODEL_NAME)
+                self._model.eval()
+                self._model = self._model.to(self._device)
+                logger.info(f"Gender model loaded on {self._device.upper()}: {MODEL_NAME}")
 
             self._model_loaded = True
 
@@ -74,12 +155,85 @@ class SpeakerAttributeService:
     def _load_audio_ffmpeg(audio_path: str, target_sr: int = 16000) -> np.ndarray:
         """Load audio to float32 numpy array at target_sr via ffmpeg.
 
-        Delegates to audio_segment_utils.load_full_audio_np().
+        Delegates to audio_segment_utils.load_full_audio_np(), which reads
+        the pipeline's own PCM artifact without ffmpeg.
         """
         from app.services.audio_segment_utils import load_full_audio_np
 
         return load_full_audio_np(audio_path, target_sr)
 
+    @staticmethod
+    def _load_onnx_session() -> Optional[Any]:
+        """Open the INT8 ONNX export on ORT's CPU provider, or None to use PyTorch."""
+        if not settings.SPEAKER_ATTRIBUTE_ONNX_ENABLED:
+            return None
+        onnx_path = settings.SPEAKER_ATTRIBUTE_ONNX_PATH
+        if not os.path.exists(onnx_path):
+            logger.warning(
+                f"Gender ONNX model not found at {onnx_path}; using PyTorch "
+                "(export it with scripts/export-gender-onnx.py)"
+            )
+            return None
+        try:
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        except Exception as e:
+            logger.warning(f"Failed to load gender ONNX model, using PyTorch: {e}")
+            return None
+        logger.info(f"Gender model loaded on CPU (ONNX Runtime): {onnx_path}")
+        return session
+
+    def _forward(self, clips: Sequence[np.ndarray]) -> np.ndarray:
+        """Class probabilities, shape (len(clips), 2), from one forward pass.
+
+        Clips are zero-padded to the longest; the attention mask keeps the
+        padding out of per-clip normalization and the pooled hidden state.
+        """
+        inputs = self._feature_extractor(  # type: ignore[misc]
+            list(clips),
+            sampling_rate=SAMPLE_RATE,
+            return_tensors="np",
+            padding=True,
+            return_attention_mask=True,
+        )
+        input_values = np.asarray(inputs["input_values"], dtype=np.float32)
+        mask = inputs.get("attention_mask")
+        attention_mask = (
+            np.ones(input_values.shape, dtype=np.int64)
+            if mask is None
+            else np.asarray(mask, dtype=np.int64)
+        )
+
+        if self._onnx_session is not None:
+            logits = self._onnx_session.run(
+                ["logits"], {"input_values": input_values, "attention_mask": attention_mask}
+            )[0]
+        else:
+            import torch
+
+            with torch.inference_mode():
+                logits = (
+                    self._model(  # type: ignore[misc]
+                        input_values=torch.from_numpy(input_values).to(self._device),
+                        attention_mask=torch.from_numpy(attention_mask).to(self._device),
+                    )
+                    .logits.float()
+                    .cpu()
+                    .numpy()
+                )
+
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        return probs / probs.sum(axis=1, keepdims=True)  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _label(probs: np.ndarray) -> tuple[str, float]:
+        predicted_id = int(np.argmax(probs))
+        return GENDER_ID2LABEL.get(predicted_id, "male"), float(probs[predicted_id])
+
     def _run_inference(self, audio_np: np.ndarray) -> tuple[str, float]:
         """Run model inference on a 1-D float32 audio array at 16kHz.
 
@@ -88,32 +242,47 @@ class SpeakerAttributeService:
         """
         if not self._model_loaded:
             self.load_models()
+        return self._label(self._forward([audio_np])[0])
 
-        import torch
+    def predict_batch(self, clips: Sequence[np.ndarray]) -> list[Optional[tuple[str, float]]]:
+        """Classify many 16 kHz clips with one forward pass per length bucket.
 
-        inputs = self._feature_extractor(  # type: ignore[misc]
-            audio_np,
-            sampling_rate=16000,
-            return_tensors="pt",
-            padding=True,
-        )
+        Args:
+            clips: 1-D float32 arrays, from any number of speakers or files.
 
-        # Move inputs to same device as model
-        if self._device != "cpu":
-            inputs = {k: v.to(self._device) for k, v in inputs.items()}
-
-        with torch.inference_mode():
-            logits = self._model(**inputs).logits  # type: ignore[misc]
+        Returns:
+            (gender, confidence) per clip, in input order. A bucket whose
+            batched pass fails is retried clip by clip; clips that still
+            fail are None.
+        """
+        if not self._model_loaded:
+            self.load_models()
 
-        probs = torch.nn.functional.softmax(logits, dim=1).squeeze().cpu().numpy()
-        predicted_id = int(np.argmax(probs))
-        gender = GENDER_ID2LABEL.get(predicted_id, "male")
-        confidence = float(probs[predicted_id])
-        return gender, confidence
+        results: list[Optional[tuple[str, float]]] = [None] * len(clips)
+        buckets = bucket_by_length(
+            [len(clip) for clip in clips], max(1, settings.SPEAKER_ATTRIBUTE_BATCH_SIZE)
+        )
+        for bucket in buckets:
+            try:
+                probs = self._forward([clips[i] for i in bucket])
+            except Exception as e:
+                logger.warning(f"Batched gender inference failed ({len(bucket)} clips): {e}")
+                for i in bucket:
+                    try:
+                        results[i] = self._run_inference(clips[i])
+                    except Exception as clip_error:
+                        logger.debug(f"Gender inference failed: {clip_error}")
+                continue
+            for i, row in zip(bucket, probs):
+                results[i] = self._label(row)
+
+        logger.debug(f"Gender inference: {len(clips)} clips in {len(buckets)} forward passes")
+        return results
 
     def cleanup(self) -> None:
         """Release model resources and free GPU memory."""
         self._model = None
+        self._onnx_session = None
         self._feature_extractor = None
         self._model_loaded = False
 
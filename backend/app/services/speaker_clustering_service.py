@@ -4,6 +4,9 @@ Speaker Clustering Service for pre-clustering unnamed speakers across files.
 Uses a hybrid approach:
 - Real-time: kNN against cluster centroids in OpenSearch + threshold assignment
 - Batch: GPU-accelerated cosine similarity (PyTorch) with AHC (complete linkage)
+- Incremental: speakers added since the last re-cluster join existing clusters
+  via centroid kNN; the rest are grouped by AHC over the connected components
+  of a sparse OpenSearch kNN graph, so work scales with new speakers only
 
 Cluster centroids are stored in OpenSearch with document_type="cluster".
 """
@@ -11,6 +14,8 @@ Cluster centroids are stored in OpenSearch with document_type="cluster".
 import logging
 import math
 from collections import defaultdict
+from datetime import datetime
+from datetime import timezone
 from typing import Any
 from uuid import uuid4
 
@@ -49,6 +54,48 @@ GENDER_OUTLIER_EVICT_THRESHOLD = 0.70
 # 500 rows x N cols x 4 bytes keeps each chunk under ~30 MB
 # even at 15 000 unlabeled speakers.
 SIM_CHUNK = 500
+# Neighbours fetched per new speaker when building the sparse kNN graph
+# for incremental re-clustering.
+INCREMENTAL_KNN_K = 10
+# Redis key holding the start time of the last re-cluster run per user.
+# Speakers created after it are the "new" speakers for incremental mode.
+RECLUSTER_WATERMARK_KEY = "speaker_recluster_watermark:{user_id}"
+
+
+def _get_recluster_watermark(user_id: int) -> datetime | None:
+    """Return the start time of the user's last re-cluster, if known."""
+    try:
+        from app.core.redis import get_redis
+
+        raw = get_redis().get(RECLUSTER_WATERMARK_KEY.format(user_id=user_id))
+        if raw:
+            return datetime.fromisoformat(raw.decode() if isinstance(raw, bytes) else raw)
+    except Exception as e:
+        logger.debug("Could not read recluster watermark for user %s: %s", user_id, e)
+    return None
+
+
+def _set_recluster_watermark(user_id: int, started_at: datetime) -> None:
+    """Record the start time of a completed re-cluster run."""
+    try:
+        from app.core.redis import get_redis
+
+        get_redis().set(RECLUSTER_WATERMARK_KEY.format(user_id=user_id), started_at.isoformat())
+    except Exception as e:
+        logger.debug("Could not store recluster watermark for user %s: %s", user_id, e)
+
+
+def _complete_linkage_groups(embeddings: np.ndarray, threshold: float) -> list[int]:
+    """AHC (complete linkage) labels for a small dense embedding matrix."""
+    if len(embeddings) < 2:
+        return [1] * len(embeddings)
+    normed = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True).clip(1e-8)
+    sim = np.clip(normed @ normed.T, -1.0, 1.0)
+    dist = 1.0 - np.maximum(sim, sim.T)
+    np.clip(dist, 0.0, 2.0, out=dist)
+    np.fill_diagonal(dist, 0.0)
+    Z = linkage(squareform(dist, checks=False), method="complete")
+    return [int(label) for label in fcluster(Z, t=1.0 - threshold, criterion="distance")]
 
 
 class SpeakerClusteringService:
@@ -104,6 +151,9 @@ class SpeakerClusteringService:
             matches = find_matching_clusters(embedding, user_id, k=5, threshold=threshold)
 
             if matches:
+                clusters = self._load_clusters_by_uuid(
+                    user_id, [m["cluster_uuid"] for m in matches]
+                )
                 # Iterate through matches to find first non-blocked cluster
                 for i, candidate in enumerate(matches):
                     margin = (
@@ -112,14 +162,7 @@ class SpeakerClusteringService:
                         else 1.0
                     )
                     cluster_uuid = candidate["cluster_uuid"]
-                    cluster = (
-                        self.db.query(SpeakerCluster)
-                        .filter(
-                            SpeakerCluster.uuid == cluster_uuid,
-                            SpeakerCluster.user_id == user_id,
-                        )
-                        .first()
-                    )
+                    cluster = clusters.get(cluster_uuid)
                     if not cluster:
                         continue
 
@@ -233,7 +276,8 @@ class SpeakerClusteringService:
         verified profile_id into clusters — no embedding math required.
 
         Phase 2 (similarity): For remaining unlabeled speakers, build a full
-        cosine similarity matrix from OpenSearch embeddings and discover
+        cosine similarity matrix from the local speaker embedding store
+        (OpenSearch when the store is unavailable) and discover
         clusters via AHC (Agglomerative Hierarchical Clustering) with
         complete linkage.
 
@@ -251,6 +295,9 @@ class SpeakerClusteringService:
                 raise ValueError(f"Threshold must be in [0.5, 0.95], got {threshold}")
 
             from app.services.opensearch_service import iter_speaker_embeddings
+            from app.services.speaker_embedding_store import speaker_embedding_store
+
+            started_at = datetime.now(timezone.utc)
 
             def _report(step: int, total: int, msg: str, pct: float) -> None:
                 if progress_callback:
@@ -385,16 +432,23 @@ class SpeakerClusteringService:
 
             # Collect embeddings into aligned index arrays
             ordered_ids: list[int] = []
-            emb_rows: list[list[float]] = []
-
-            for batch in iter_speaker_embeddings(
-                user_id, speaker_uuids=unlabeled_uuids, batch_size=500
-            ):
-                for item in batch:
-                    sid = unlabeled_uuid_to_id.get(item["speaker_uuid"])
-                    if sid is not None:
-                        ordered_ids.append(sid)
-                        emb_rows.append(item["embedding"])
+            emb_rows: list[Any] = []
+
+            store_matrix = speaker_embedding_store.load(user_id)
+            if store_matrix is not None:
+                # Local mirror: one memmap gather instead of mget-ing JSON lists
+                found_uuids, found_rows = store_matrix.rows(unlabeled_uuids)
+                ordered_ids = [unlabeled_uuid_to_id[u] for u in found_uuids]
+                emb_rows = list(found_rows)
+            else:
+                for batch in iter_speaker_embeddings(
+                    user_id, speaker_uuids=unlabeled_uuids, batch_size=500
+                ):
+                    for item in batch:
+                        sid = unlabeled_uuid_to_id.get(item["speaker_uuid"])
+                        if sid is not None:
+                            ordered_ids.append(sid)
+                            emb_rows.append(item["embedding"])
 
             # Cache embeddings so centroid computation skips OpenSearch
             for i, sid in enumerate(ordered_ids):
@@ -531,63 +585,7 @@ class SpeakerClusteringService:
 
             # Post-AHC constraint enforcement: remove speakers that violate
             # cannot-link constraints from their assigned groups.
-            from app.models.media import SpeakerCannotLink
-
-            all_cannot_links = (
-                self.db.query(SpeakerCannotLink)
-                .filter(
-                    SpeakerCannotLink.speaker_id.in_(ordered_ids)
-                    | SpeakerCannotLink.cannot_link_speaker_id.in_(ordered_ids)
-                )
-                .all()
-            )
-            cannot_link_set: set[tuple[int, int]] = set()
-            for cl in all_cannot_links:
-                cannot_link_set.add((int(cl.speaker_id), int(cl.cannot_link_speaker_id)))
-
-            if cannot_link_set:
-                for label_key in list(groups.keys()):
-                    member_ids_g = groups[label_key]
-                    if len(member_ids_g) < 2:
-                        continue
-                    # Find violating speakers in this group
-                    evicted: set[int] = set()
-                    for i, sid_a in enumerate(member_ids_g):
-                        for sid_b in member_ids_g[i + 1 :]:
-                            if (sid_a, sid_b) in cannot_link_set or (
-                                sid_b,
-                                sid_a,
-                            ) in cannot_link_set:
-                                # Evict the speaker with lower similarity to group centroid
-                                g_embs = [
-                                    emb_cache[s]
-                                    for s in member_ids_g
-                                    if s in emb_cache and s not in evicted
-                                ]
-                                if g_embs:
-                                    g_cent = np.mean(g_embs, axis=0)
-                                    g_norm = np.linalg.norm(g_cent)
-                                    if g_norm > 1e-8:
-                                        g_cent = g_cent / g_norm
-                                    sim_a = (
-                                        float(np.dot(emb_cache[sid_a], g_cent))
-                                        if sid_a in emb_cache
-                                        else 0.0
-                                    )
-                                    sim_b = (
-                                        float(np.dot(emb_cache[sid_b], g_cent))
-                                        if sid_b in emb_cache
-                                        else 0.0
-                                    )
-                                    evicted.add(sid_b if sim_a >= sim_b else sid_a)
-                                else:
-                                    evicted.add(sid_b)
-                    if evicted:
-                        groups[label_key] = [s for s in member_ids_g if s not in evicted]
-                        logger.debug(
-                            "Constraint enforcement: evicted %d speaker(s) from AHC group",
-                            len(evicted),
-                        )
+            self._enforce_cannot_links(groups, ordered_ids, emb_cache)
 
             # Batch-fetch all speakers that belong to multi-member groups
             multi_member_ids: list[int] = []
@@ -602,154 +600,19 @@ class SpeakerClusteringService:
                 )
                 speakers_by_id = {int(s.id): s for s in batch_speakers}
 
-            # Gender-aware eviction: for each group, if there's a clear
-            # dominant gender, evict minority-gender members whose embedding
-            # similarity to the group centroid is below the eviction threshold.
-            # Dual signal required: gender mismatch + weak embedding.
-            gender_evicted_total = 0
-            for label_key in list(groups.keys()):
-                member_ids_g = groups[label_key]
-                if len(member_ids_g) < 3:
-                    continue
-                # Count genders in this group
-                g_counts: dict[str, list[int]] = {}
-                for sid in member_ids_g:
-                    s = speakers_by_id.get(sid)
-                    g = s.predicted_gender if s else None
-                    if g:
-                        g_counts.setdefault(g, []).append(sid)
-                if len(g_counts) < 2:
-                    continue
-                # Find dominant gender (must be clear majority: >= 2/3)
-                sorted_g = sorted(g_counts.items(), key=lambda x: len(x[1]), reverse=True)
-                dominant_g, dominant_ids = sorted_g[0]
-                total_gendered = sum(len(v) for v in g_counts.values())
-                if len(dominant_ids) < total_gendered * 2 / 3:
-                    continue  # No clear majority — skip
-                # Compute group centroid from majority members
-                maj_embs = [emb_cache[sid] for sid in dominant_ids if sid in emb_cache]
-                if not maj_embs:
-                    continue
-                g_cent = np.mean(maj_embs, axis=0)
-                g_norm = np.linalg.norm(g_cent)
-                if g_norm > 1e-8:
-                    g_cent = g_cent / g_norm
-                # Check minority members: evict only if sim < threshold
-                evict_ids: list[int] = []
-                for minority_g, minority_ids in sorted_g[1:]:
-                    for sid in minority_ids:
-                        if sid not in emb_cache:
-                            continue
-                        sim = float(np.dot(emb_cache[sid], g_cent))
-                        if sim < GENDER_OUTLIER_EVICT_THRESHOLD:
-                            evict_ids.append(sid)
-                            logger.debug(
-                                "Gender eviction: speaker %d (%s) from group, "
-                                "sim %.3f < %.3f to %s-dominant centroid",
-                                sid,
-                                minority_g,
-                                sim,
-                                GENDER_OUTLIER_EVICT_THRESHOLD,
-                                dominant_g,
-                            )
-                if evict_ids:
-                    groups[label_key] = [s for s in member_ids_g if s not in evict_ids]
-                    gender_evicted_total += len(evict_ids)
-            if gender_evicted_total:
-                logger.info(
-                    "Gender-aware eviction: removed %d speaker(s) from AHC groups",
-                    gender_evicted_total,
-                )
-
-            from app.services.opensearch_service import store_cluster_embedding
+            # Gender-aware eviction (gender mismatch + weak embedding)
+            self._evict_gender_outliers(groups, speakers_by_id, emb_cache)
 
             for _label, member_ids in groups.items():
                 if len(member_ids) < 2:
                     continue
 
-                cluster = SpeakerCluster(
-                    uuid=uuid4(),
-                    user_id=user_id,
-                    member_count=0,
-                )
-                self.db.add(cluster)
-                self.db.flush()
-
-                # Compute centroid and per-member confidence from cached
-                # embeddings before adding members to cluster
-                member_embs = [emb_cache[sid] for sid in member_ids if sid in emb_cache]
-                per_member_conf: dict[int, float] = {}
-                if member_embs:
-                    arr = np.array(member_embs, dtype=np.float32)
-                    centroid = np.mean(arr, axis=0)
-                    c_norm = np.linalg.norm(centroid)
-                    if c_norm > 1e-8:
-                        centroid = centroid / c_norm
-                    # Cosine similarity of each member to the L2-normalized centroid
-                    arr_norms = np.linalg.norm(arr, axis=1, keepdims=True).clip(1e-8)
-                    arr_normed = arr / arr_norms
-                    sims = arr_normed @ centroid  # centroid already L2-normalized
-                    emb_idx = 0
-                    for sid in member_ids:
-                        if sid in emb_cache:
-                            per_member_conf[sid] = float(max(0.0, min(1.0, sims[emb_idx])))
-                            emb_idx += 1
-
-                # Bulk-add all members with per-member confidence
-                cluster_speakers = [
-                    speakers_by_id[sid] for sid in member_ids if sid in speakers_by_id
-                ]
-                added = self._bulk_add_speakers_to_cluster(
-                    cluster_speakers,
-                    cluster,
-                    per_member_conf or 0.0,
+                _cluster, added, centroid_ok = self._create_cluster_from_group(
+                    member_ids, user_id, emb_cache, speakers_by_id
                 )
                 sim_assigned += added
-
-                if member_embs:
-                    # Quality score: average centroid similarity (same metric
-                    # shown per-member, so the cluster score is consistent
-                    # with individual member scores users see in the UI).
-                    # min_similarity: tightest pairwise cosine similarity
-                    # (worst-case pair within the cluster).
-                    if len(member_embs) >= 2:
-                        normed = arr / np.linalg.norm(
-                            arr,
-                            axis=1,
-                            keepdims=True,
-                        ).clip(1e-8)
-                        # Average centroid similarity for quality score
-                        cluster.quality_score = float(  # type: ignore[assignment]
-                            np.mean(normed @ centroid)
-                        )
-                        # Min pairwise for worst-case indicator
-                        sim_mat = normed @ normed.T
-                        iu = np.triu_indices(len(member_embs), k=1)
-                        cluster.min_similarity = float(  # type: ignore[assignment]
-                            np.min(sim_mat[iu])
-                        )
-                    else:
-                        cluster.quality_score = 1.0  # type: ignore[assignment]
-                        cluster.min_similarity = 1.0  # type: ignore[assignment]
-
-                    cluster.representative_speaker_id = member_ids[0]  # type: ignore[assignment]
-
-                    try:
-                        store_cluster_embedding(
-                            cluster_uuid=str(cluster.uuid),
-                            user_id=user_id,
-                            embedding=centroid.tolist(),
-                            label=cluster.label,
-                            refresh=False,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Could not store centroid for cluster %s: %s",
-                            cluster.uuid,
-                            e,
-                        )
-                        centroid_failures += 1
-
+                if not centroid_ok:
+                    centroid_failures += 1
                 sim_clusters += 1
 
             clusters_created += sim_clusters
@@ -908,6 +771,7 @@ class SpeakerClusteringService:
                     )
 
             self.db.commit()
+            _set_recluster_watermark(user_id, started_at)
             logger.info(
                 "Re-clustering complete for user %d: "
                 "%d profile clusters (%d speakers), "
@@ -947,6 +811,597 @@ class SpeakerClusteringService:
             self.db.rollback()
             raise
 
+    def incremental_recluster(
+        self,
+        user_id: int,
+        threshold: float = CLUSTER_ASSIGNMENT_THRESHOLD,
+        progress_callback: Any | None = None,
+    ) -> dict[str, Any]:
+        """Re-cluster only the speakers added since the last re-cluster run.
+
+        Existing clusters are kept. Each new unlabeled speaker (created after
+        the stored watermark and not yet in a multi-member cluster):
+
+        1. Joins the best existing multi-member cluster whose centroid is
+           within ``threshold`` (same constraint and gender checks as the
+           real-time path).
+        2. Otherwise becomes a node in a sparse similarity graph built from
+           OpenSearch kNN neighbours (k=INCREMENTAL_KNN_K, edges >= threshold)
+           over new speakers and existing unclustered ones. Each connected
+           component is re-clustered with complete-linkage AHC, so the dense
+           step only ever sees one neighbourhood.
+
+        Falls back to :meth:`batch_recluster` when no previous run is
+        recorded for the user.
+
+        Args:
+            user_id: Owner user ID.
+            threshold: Cosine similarity threshold.
+            progress_callback: Optional callable(step, total, message, progress).
+
+        Returns:
+            Summary dict with cluster counts and stats.
+        """
+        watermark = _get_recluster_watermark(user_id)
+        if watermark is None:
+            logger.info("No previous re-cluster for user %d — running full re-cluster", user_id)
+            return self.batch_recluster(user_id, threshold, progress_callback)
+
+        try:
+            if threshold < 0.5 or threshold > 0.95:
+                raise ValueError(f"Threshold must be in [0.5, 0.95], got {threshold}")
+
+            from app.services.opensearch_service import find_matching_clusters
+            from app.services.opensearch_service import get_speaker_embeddings_batch
+            from app.services.opensearch_service import msearch_speaker_similarities
+
+            def _report(step: int, total: int, msg: str, pct: float) -> None:
+                if progress_callback:
+                    try:
+                        progress_callback(step, total, msg, pct)
+                    except Exception as e:
+                        logger.debug("Progress callback failed: %s", e)
+
+            started_at = datetime.now(timezone.utc)
+
+            # ----------------------------------------------------------
+            # Step 1: New unlabeled speakers not yet in a real cluster
+            # ----------------------------------------------------------
+            _report(1, 4, "Finding new speakers...", 0.05)
+            new_speakers = (
+                self.db.query(Speaker)
+                .outerjoin(SpeakerCluster, Speaker.cluster_id == SpeakerCluster.id)
+                .filter(
+                    Speaker.user_id == user_id,
+                    Speaker.profile_id.is_(None),
+                    Speaker.created_at >= watermark,
+                    (Speaker.cluster_id.is_(None)) | (SpeakerCluster.member_count <= 1),
+                )
+                .all()
+            )
+            if not new_speakers:
+                _set_recluster_watermark(user_id, started_at)
+                return {
+                    "status": "completed",
+                    "mode": "incremental",
+                    "new_speakers": 0,
+                    "clusters_created": 0,
+                    "speakers_assigned": 0,
+                    "singletons": 0,
+                }
+
+            speakers_by_id: dict[int, Speaker] = {int(s.id): s for s in new_speakers}
+            uuid_to_id: dict[str, int] = {str(s.uuid): int(s.id) for s in new_speakers}
+            emb_cache: dict[int, list[float]] = {}
+            for uuid_str, emb in get_speaker_embeddings_batch(
+                list(uuid_to_id), user_id=user_id
+            ).items():
+                emb_cache[uuid_to_id[uuid_str]] = emb
+
+            logger.info(
+                "Incremental re-cluster: %d new speakers (%d with embeddings) for user %d",
+                len(new_speakers),
+                len(emb_cache),
+                user_id,
+            )
+
+            # Singleton clusters left behind when their only member moves
+            vacated_cluster_ids: set[int] = {
+                int(s.cluster_id) for s in new_speakers if s.cluster_id is not None
+            }
+
+            # ----------------------------------------------------------
+            # Step 2: Join existing multi-member clusters via centroid kNN
+            # ----------------------------------------------------------
+            _report(2, 4, "Matching new speakers to existing clusters...", 0.2)
+            touched_clusters: dict[int, SpeakerCluster] = {}
+            joined_ids: set[int] = set()
+            matches_by_sid = {
+                sid: find_matching_clusters(emb, user_id, k=5, threshold=threshold)
+                for sid, emb in emb_cache.items()
+            }
+            candidate_clusters = self._load_clusters_by_uuid(
+                user_id,
+                [m["cluster_uuid"] for matches in matches_by_sid.values() for m in matches],
+            )
+            for sid, matches in matches_by_sid.items():
+                speaker = speakers_by_id[sid]
+                for i, candidate in enumerate(matches):
+                    cluster = candidate_clusters.get(candidate["cluster_uuid"])
+                    if (
+                        not cluster
+                        or cluster.id in vacated_cluster_ids
+                        or (cluster.member_count or 0) < 2
+                        or self._is_speaker_blocked_from_cluster(sid, cluster)
+                    ):
+                        continue
+                    if speaker.predicted_gender:
+                        dominant = self._get_cluster_dominant_gender(cluster)
+                        if (
+                            dominant
+                            and dominant != speaker.predicted_gender
+                            and candidate["similarity"] < GENDER_CROSS_THRESHOLD
+                        ):
+                            continue
+                    margin = (
+                        candidate["similarity"] - matches[i + 1]["similarity"]
+                        if i + 1 < len(matches)
+                        else 1.0
+                    )
+                    self._add_speaker_to_cluster(
+                        speaker, cluster, candidate["similarity"], margin=margin
+                    )
+                    if cluster.promoted_to_profile_id:
+                        speaker.profile_id = cluster.promoted_to_profile_id
+                        profile = (
+                            self.db.query(SpeakerProfile)
+                            .filter(SpeakerProfile.id == cluster.promoted_to_profile_id)
+                            .first()
+                        )
+                        if profile:
+                            speaker.display_name = profile.name
+                            speaker.verified = True  # type: ignore[assignment]
+                    touched_clusters[int(cluster.id)] = cluster
+                    joined_ids.add(sid)
+                    break
+
+            # ----------------------------------------------------------
+            # Step 3: Sparse kNN graph over the remaining new speakers
+            # ----------------------------------------------------------
+            _report(3, 4, "Building neighbourhood graph...", 0.45)
+            pending = [sid for sid in emb_cache if sid not in joined_ids]
+            id_to_uuid = {v: k for k, v in uuid_to_id.items()}
+            neighbour_lists = msearch_speaker_similarities(
+                [{"speaker_uuid": id_to_uuid[sid], "embedding": emb_cache[sid]} for sid in pending],
+                user_id,
+                k=INCREMENTAL_KNN_K,
+            )
+
+            edges: list[tuple[str, str]] = []
+            neighbour_uuids: set[str] = set()
+            for sid, hits in zip(pending, neighbour_lists):
+                own_uuid = id_to_uuid[sid]
+                for hit in hits:
+                    other = hit.get("speaker_uuid")
+                    if not other or other == own_uuid or hit["similarity"] < threshold:
+                        continue
+                    # Speakers that joined a cluster in Step 2 stay out of regrouping
+                    if uuid_to_id.get(other) in joined_ids:
+                        continue
+                    edges.append((own_uuid, other))
+                    if other not in uuid_to_id:
+                        neighbour_uuids.add(other)
+
+            # Existing neighbours are eligible only if unlabeled and not in a
+            # multi-member cluster (those were handled by the centroid step).
+            if neighbour_uuids:
+                for spk in (
+                    self.db.query(Speaker)
+                    .outerjoin(SpeakerCluster, Speaker.cluster_id == SpeakerCluster.id)
+                    .filter(
+                        Speaker.user_id == user_id,
+                        Speaker.uuid.in_(list(neighbour_uuids)),
+                        Speaker.profile_id.is_(None),
+                        (Speaker.cluster_id.is_(None)) | (SpeakerCluster.member_count <= 1),
+                    )
+                    .all()
+                ):
+                    speakers_by_id[int(spk.id)] = spk
+                    uuid_to_id[str(spk.uuid)] = int(spk.id)
+                    if spk.cluster_id is not None:
+                        vacated_cluster_ids.add(int(spk.cluster_id))
+                missing = [u for u in neighbour_uuids if u in uuid_to_id]
+                for uuid_str, emb in get_speaker_embeddings_batch(missing, user_id=user_id).items():
+                    emb_cache[uuid_to_id[uuid_str]] = emb
+
+            # Union-find over eligible edges -> affected neighbourhoods
+            parent: dict[int, int] = {}
+
+            def _find(x: int) -> int:
+                parent.setdefault(x, x)
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+
+            for a_uuid, b_uuid in edges:
+                a, b = uuid_to_id.get(a_uuid), uuid_to_id.get(b_uuid)
+                if a is None or b is None or a not in emb_cache or b not in emb_cache:
+                    continue
+                parent[_find(a)] = _find(b)
+
+            components: dict[int, list[int]] = defaultdict(list)
+            for node in list(parent):
+                components[_find(node)].append(node)
+
+            # ----------------------------------------------------------
+            # Step 4: AHC per neighbourhood + cluster records
+            # ----------------------------------------------------------
+            _report(4, 4, "Clustering affected neighbourhoods...", 0.7)
+            groups: dict[int, list[int]] = {}
+            for component in components.values():
+                if len(component) < 2:
+                    continue
+                matrix = np.array([emb_cache[sid] for sid in component], dtype=np.float32)
+                local: dict[int, list[int]] = defaultdict(list)
+                for label, sid in zip(_complete_linkage_groups(matrix, threshold), component):
+                    local[label].append(sid)
+                for members in local.values():
+                    groups[len(groups)] = members
+
+            self._enforce_cannot_links(
+                groups, [sid for g in groups.values() for sid in g], emb_cache
+            )
+            self._evict_gender_outliers(groups, speakers_by_id, emb_cache)
+
+            new_ids = {int(s.id) for s in new_speakers}
+            clusters_created = 0
+            grouped = 0
+            grouped_new = 0
+            centroid_failures = 0
+            for member_ids in groups.values():
+                if len(member_ids) < 2:
+                    continue
+                # Members may still hold a singleton membership from the
+                # real-time path; a speaker can only be in one cluster.
+                self.db.query(SpeakerClusterMember).filter(
+                    SpeakerClusterMember.speaker_id.in_(member_ids)
+                ).delete(synchronize_session=False)
+                cluster, added, centroid_ok = self._create_cluster_from_group(
+                    member_ids, user_id, emb_cache, speakers_by_id
+                )
+                touched_clusters[int(cluster.id)] = cluster
+                grouped += added
+                grouped_new += sum(1 for sid in member_ids if sid in new_ids)
+                clusters_created += 1
+                if not centroid_ok:
+                    centroid_failures += 1
+
+            # Drop singleton clusters whose only member moved elsewhere
+            self.db.flush()
+            for old_cluster in (
+                self.db.query(SpeakerCluster)
+                .filter(SpeakerCluster.id.in_(list(vacated_cluster_ids)))
+                .all()
+                if vacated_cluster_ids
+                else []
+            ):
+                remaining = (
+                    self.db.query(SpeakerClusterMember)
+                    .filter(SpeakerClusterMember.cluster_id == old_cluster.id)
+                    .count()
+                )
+                if remaining == 0 and not old_cluster.promoted_to_profile_id:
+                    try:
+                        from app.services.opensearch_service import delete_cluster_embedding
+
+                        delete_cluster_embedding(str(old_cluster.uuid))
+                    except Exception:
+                        logger.debug("Failed to remove centroid for cluster %s", old_cluster.uuid)
+                    self.db.delete(old_cluster)
+
+            # Refresh centroids only for clusters that gained members
+            for cluster in touched_clusters.values():
+                self._update_cluster_centroid(cluster, user_id, refresh=False)
+
+            try:
+                from app.services.opensearch_service import get_active_speaker_index
+                from app.services.opensearch_service import opensearch_client
+
+                if opensearch_client:
+                    opensearch_client.indices.refresh(index=get_active_speaker_index())
+            except Exception as e:
+                logger.warning("Failed to refresh speaker index: %s", e)
+
+            self.db.commit()
+            _set_recluster_watermark(user_id, started_at)
+
+            joined = len(joined_ids)
+            speakers_assigned = joined + grouped
+            singletons = len(new_speakers) - joined - grouped_new
+            logger.info(
+                "Incremental re-cluster for user %d: %d new speakers, %d joined existing "
+                "clusters, %d new clusters (%d speakers), %d neighbourhoods",
+                user_id,
+                len(new_speakers),
+                joined,
+                clusters_created,
+                grouped,
+                len(components),
+            )
+
+            status = "completed"
+            if (
+                centroid_failures > 0
+                and clusters_created > 0
+                and centroid_failures / clusters_created > 0.1
+            ):
+                status = "partial_failure"
+
+            return {
+                "status": status,
+                "mode": "incremental",
+                "new_speakers": len(new_speakers),
+                "joined_existing": joined,
+                "similarity_clusters": clusters_created,
+                "similarity_speakers_assigned": grouped,
+                "clusters_created": clusters_created,
+                "speakers_assigned": speakers_assigned,
+                "singletons": singletons,
+                "centroid_failures": centroid_failures,
+            }
+
+        except Exception as e:
+            logger.error("Error in incremental re-clustering: %s", e)
+            self.db.rollback()
+            raise
+
+    # ------------------------------------------------------------------
+    # Group post-processing shared by full and incremental re-clustering
+    # ------------------------------------------------------------------
+
+    def _enforce_cannot_links(
+        self,
+        groups: dict[int, list[int]],
+        speaker_ids: list[int],
+        emb_cache: dict[int, list[float]],
+    ) -> None:
+        """Evict speakers that violate cannot-link constraints from their group.
+
+        For each violating pair, the member less similar to the group
+        centroid is removed. ``groups`` is modified in place.
+        """
+        from app.models.media import SpeakerCannotLink
+
+        all_cannot_links = (
+            self.db.query(SpeakerCannotLink)
+            .filter(
+                SpeakerCannotLink.speaker_id.in_(speaker_ids)
+                | SpeakerCannotLink.cannot_link_speaker_id.in_(speaker_ids)
+            )
+            .all()
+        )
+        cannot_link_set: set[tuple[int, int]] = set()
+        for cl in all_cannot_links:
+            cannot_link_set.add((int(cl.speaker_id), int(cl.cannot_link_speaker_id)))
+
+        if cannot_link_set:
+            for label_key in list(groups.keys()):
+                member_ids_g = groups[label_key]
+                if len(member_ids_g) < 2:
+                    continue
+                # Find violating speakers in this group
+                evicted: set[int] = set()
+                for i, sid_a in enumerate(member_ids_g):
+                    for sid_b in member_ids_g[i + 1 :]:
+                        if (sid_a, sid_b) in cannot_link_set or (
+                            sid_b,
+                            sid_a,
+                        ) in cannot_link_set:
+                            # Evict the speaker with lower similarity to group centroid
+                            g_embs = [
+                                emb_cache[s]
+                                for s in member_ids_g
+                                if s in emb_cache and s not in evicted
+                            ]
+                            if g_embs:
+                                g_cent = np.mean(g_embs, axis=0)
+                                g_norm = np.linalg.norm(g_cent)
+                                if g_norm > 1e-8:
+                                    g_cent = g_cent / g_norm
+                                sim_a = (
+                                    float(np.dot(emb_cache[sid_a], g_cent))
+                                    if sid_a in emb_cache
+                                    else 0.0
+                                )
+                                sim_b = (
+                                    float(np.dot(emb_cache[sid_b], g_cent))
+                                    if sid_b in emb_cache
+                                    else 0.0
+                                )
+                                evicted.add(sid_b if sim_a >= sim_b else sid_a)
+                            else:
+                                evicted.add(sid_b)
+                if evicted:
+                    groups[label_key] = [s for s in member_ids_g if s not in evicted]
+                    logger.debug(
+                        "Constraint enforcement: evicted %d speaker(s) from AHC group",
+                        len(evicted),
+                    )
+
+    def _evict_gender_outliers(
+        self,
+        groups: dict[int, list[int]],
+        speakers_by_id: dict[int, Speaker],
+        emb_cache: dict[int, list[float]],
+    ) -> int:
+        """Evict minority-gender members with weak similarity to the group.
+
+        For each group with a clear (>= 2/3) dominant gender, minority-gender
+        members whose similarity to the majority centroid is below
+        GENDER_OUTLIER_EVICT_THRESHOLD are removed. Dual signal required:
+        gender mismatch + weak embedding. ``groups`` is modified in place.
+
+        Returns:
+            Number of evicted speakers.
+        """
+        gender_evicted_total = 0
+        for label_key in list(groups.keys()):
+            member_ids_g = groups[label_key]
+            if len(member_ids_g) < 3:
+                continue
+            # Count genders in this group
+            g_counts: dict[str, list[int]] = {}
+            for sid in member_ids_g:
+                s = speakers_by_id.get(sid)
+                g = s.predicted_gender if s else None
+                if g:
+                    g_counts.setdefault(g, []).append(sid)
+            if len(g_counts) < 2:
+                continue
+            # Find dominant gender (must be clear majority: >= 2/3)
+            sorted_g = sorted(g_counts.items(), key=lambda x: len(x[1]), reverse=True)
+            dominant_g, dominant_ids = sorted_g[0]
+            total_gendered = sum(len(v) for v in g_counts.values())
+            if len(dominant_ids) < total_gendered * 2 / 3:
+                continue  # No clear majority — skip
+            # Compute group centroid from majority members
+            maj_embs = [emb_cache[sid] for sid in dominant_ids if sid in emb_cache]
+            if not maj_embs:
+                continue
+            g_cent = np.mean(maj_embs, axis=0)
+            g_norm = np.linalg.norm(g_cent)
+            if g_norm > 1e-8:
+                g_cent = g_cent / g_norm
+            # Check minority members: evict only if sim < threshold
+            evict_ids: list[int] = []
+            for minority_g, minority_ids in sorted_g[1:]:
+                for sid in minority_ids:
+                    if sid not in emb_cache:
+                        continue
+                    sim = float(np.dot(emb_cache[sid], g_cent))
+                    if sim < GENDER_OUTLIER_EVICT_THRESHOLD:
+                        evict_ids.append(sid)
+                        logger.debug(
+                            "Gender eviction: speaker %d (%s) from group, "
+                            "sim %.3f < %.3f to %s-dominant centroid",
+                            sid,
+                            minority_g,
+                            sim,
+                            GENDER_OUTLIER_EVICT_THRESHOLD,
+                            dominant_g,
+                        )
+            if evict_ids:
+                groups[label_key] = [s for s in member_ids_g if s not in evict_ids]
+                gender_evicted_total += len(evict_ids)
+        if gender_evicted_total:
+            logger.info(
+                "Gender-aware eviction: removed %d speaker(s) from AHC groups",
+                gender_evicted_total,
+            )
+        return gender_evicted_total
+
+    def _create_cluster_from_group(
+        self,
+        member_ids: list[int],
+        user_id: int,
+        emb_cache: dict[int, list[float]],
+        speakers_by_id: dict[int, Speaker],
+    ) -> tuple[SpeakerCluster, int, bool]:
+        """Create a similarity cluster for a group of speakers.
+
+        Computes the centroid and per-member confidence from cached
+        embeddings, adds the members, and stores the centroid in OpenSearch
+        (without a refresh; callers refresh once after a batch of writes).
+
+        Returns:
+            Tuple of (cluster, members added, centroid stored successfully).
+        """
+        from app.services.opensearch_service import store_cluster_embedding
+
+        centroid_ok = True
+        cluster = SpeakerCluster(
+            uuid=uuid4(),
+            user_id=user_id,
+            member_count=0,
+        )
+        self.db.add(cluster)
+        self.db.flush()
+
+        # Compute centroid and per-member confidence from cached
+        # embeddings before adding members to cluster
+        member_embs = [emb_cache[sid] for sid in member_ids if sid in emb_cache]
+        per_member_conf: dict[int, float] = {}
+        if member_embs:
+            arr = np.array(member_embs, dtype=np.float32)
+            centroid = np.mean(arr, axis=0)
+            c_norm = np.linalg.norm(centroid)
+            if c_norm > 1e-8:
+                centroid = centroid / c_norm
+            # Cosine similarity of each member to the L2-normalized centroid
+            arr_norms = np.linalg.norm(arr, axis=1, keepdims=True).clip(1e-8)
+            arr_normed = arr / arr_norms
+            sims = arr_normed @ centroid  # centroid already L2-normalized
+            emb_idx = 0
+            for sid in member_ids:
+                if sid in emb_cache:
+                    per_member_conf[sid] = float(max(0.0, min(1.0, sims[emb_idx])))
+                    emb_idx += 1
+
+        # Bulk-add all members with per-member confidence
+        cluster_speakers = [speakers_by_id[sid] for sid in member_ids if sid in speakers_by_id]
+        added = self._bulk_add_speakers_to_cluster(
+            cluster_speakers,
+            cluster,
+            per_member_conf or 0.0,
+        )
+
+        if member_embs:
+            # Quality score: average centroid similarity (same metric
+            # shown per-member, so the cluster score is consistent
+            # with individual member scores users see in the UI).
+            # min_similarity: tightest pairwise cosine similarity
+            # (worst-case pair within the cluster).
+            if len(member_embs) >= 2:
+                normed = arr / np.linalg.norm(
+                    arr,
+                    axis=1,
+                    keepdims=True,
+                ).clip(1e-8)
+                # Average centroid similarity for quality score
+                cluster.quality_score = float(  # type: ignore[assignment]
+                    np.mean(normed @ centroid)
+                )
+                # Min pairwise for worst-case indicator
+                sim_mat = normed @ normed.T
+                iu = np.triu_indices(len(member_embs), k=1)
+                cluster.min_similarity = float(  # type: ignore[assignment]
+                    np.min(sim_mat[iu])
+                )
+            else:
+                cluster.quality_score = 1.0  # type: ignore[assignment]
+                cluster.min_similarity = 1.0  # type: ignore[assignment]
+
+            cluster.representative_speaker_id = member_ids[0]  # type: ignore[assignment]
+
+            try:
+                store_cluster_embedding(
+                    cluster_uuid=str(cluster.uuid),
+                    user_id=user_id,
+                    embedding=centroid.tolist(),
+                    label=cluster.label,
+                    refresh=False,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Could not store centroid for cluster %s: %s",
+                    cluster.uuid,
+                    e,
+                )
+                centroid_ok = False
+
+        return cluster, added, centroid_ok
+
     # ------------------------------------------------------------------
     # Cluster operations (merge, split, promote)
     # ------------------------------------------------------------------
@@ -1308,7 +1763,7 @@ class SpeakerClusteringService:
 
         # Batch-fetch all embeddings in one mget call
         speaker_uuids = [str(s.uuid) for s in speakers]
-        raw_embeddings = get_speaker_embeddings_batch(speaker_uuids)
+        raw_embeddings = get_speaker_embeddings_batch(speaker_uuids, user_id=user_id)
 
         embeddings: dict[int, np.ndarray] = {}
         for suuid, emb in raw_embeddings.items():
@@ -2012,6 +2467,23 @@ class SpeakerClusteringService:
         dominant: str | None = max(rows, key=lambda r: r[1])[0]
         return dominant
 
+    def _load_clusters_by_uuid(
+        self, user_id: int, cluster_uuids: list[str]
+    ) -> dict[str, SpeakerCluster]:
+        """Load the user's clusters for kNN matches in one query, keyed by UUID."""
+        unique_uuids = list(dict.fromkeys(cluster_uuids))
+        if not unique_uuids:
+            return {}
+        clusters = (
+            self.db.query(SpeakerCluster)
+            .filter(
+                SpeakerCluster.uuid.in_(unique_uuids),
+                SpeakerCluster.user_id == user_id,
+            )
+            .all()
+        )
+        return {str(c.uuid): c for c in clusters}
+
     def _is_speaker_blocked_from_cluster(self, speaker_id: int, cluster: SpeakerCluster) -> bool:
         """Check if a speaker is blocked from joining a cluster by constraints."""
         from app.models.media import SpeakerCannotLink
@@ -9,6 +9,8 @@ import torch
 from pyannote.audio import Inference
 
 from app.core.config import settings
+from app.core.constants import SPEAKER_EMBEDDING_BATCH_SIZE
+from app.core.constants import SPEAKER_EMBEDDING_MAX_PAD_RATIO
 from app.core.constants import SPEAKER_SHORT_SEGMENT_MIN_DURATION
 from app.services.embedding_mode_service import EmbeddingMode
 from app.services.embedding_mode_service import EmbeddingModeService
@@ -104,13 +106,20 @@ class SpeakerEmbeddingService:
     def _load_audio(audio_path: str, target_sr: int = 16000) -> tuple[torch.Tensor, int]:
         """Load audio file as a torch tensor with multi-backend fallback.
 
-        Tries in order: FFmpeg (handles all formats), torchaudio, scipy.
+        The pipeline's own PCM artifact is read from a memory map. Other files
+        try in order: FFmpeg (handles all formats), torchaudio, scipy.
         FFmpeg is preferred because torchaudio 2.8+ may have zero backends
         and scipy only handles WAV files.
 
         Returns:
             Tuple of (waveform tensor [1, samples], sample_rate).
         """
+        from app.utils.pcm_audio import read_pcm_wav
+
+        audio = read_pcm_wav(audio_path, target_sr)
+        if audio is not None:
+            return torch.from_numpy(audio).unsqueeze(0), target_sr
+
         # 1. FFmpeg: handles any audio format reliably
         try:
             import subprocess
@@ -317,6 +326,101 @@ class SpeakerEmbeddingService:
             logger.error(f"Error extracting embedding from waveform segment: {e}")
             return None
 
+    @staticmethod
+    def _plan_batches(lengths: list[int], batch_size: int) -> list[list[int]]:
+        """Group clip indices into length-bucketed batches.
+
+        Clips are sorted by length and a batch is closed once it is full or
+        the next clip would exceed SPEAKER_EMBEDDING_MAX_PAD_RATIO times the
+        shortest clip, which keeps zero-padding (and its effect on feature
+        normalization) small.
+        """
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+        batches: list[list[int]] = []
+        current: list[int] = []
+        for idx in order:
+            if current and (
+                len(current) >= batch_size
+                or lengths[idx] > lengths[current[0]] * SPEAKER_EMBEDDING_MAX_PAD_RATIO
+            ):
+                batches.append(current)
+                current = []
+            current.append(idx)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _infer_padded_batch(self, clips: list[np.ndarray]) -> np.ndarray:
+        """Run the embedding model once on a zero-padded batch of clips.
+
+        A per-frame weight mask is passed so statistics pooling ignores the
+        padded tail of shorter clips.
+
+        Returns:
+            Array of shape (batch, dim) with raw (unnormalized) embeddings.
+        """
+        max_len = max(len(c) for c in clips)
+        hop = 160  # 10 ms at 16 kHz; pooling interpolates weights to its frame rate
+        num_frames = max(1, -(-max_len // hop))
+        waveforms = torch.zeros((len(clips), 1, max_len), dtype=torch.float32)
+        weights = torch.zeros((len(clips), num_frames), dtype=torch.float32)
+        for i, clip in enumerate(clips):
+            waveforms[i, 0, : len(clip)] = torch.tensor(np.asarray(clip), dtype=torch.float32)
+            weights[i, : max(1, -(-len(clip) // hop))] = 1.0
+
+        model = self.inference.model
+        with torch.inference_mode():
+            output = model(waveforms.to(self.device), weights=weights.to(self.device))
+        return output.detach().cpu().numpy()  # type: ignore[no-any-return]
+
+    def extract_embeddings_batch(
+        self,
+        clips: list[np.ndarray],
+        sample_rate: int = 16000,
+        batch_size: int = SPEAKER_EMBEDDING_BATCH_SIZE,
+    ) -> list[Optional[np.ndarray]]:
+        """Extract embeddings for many mono clips using padded batch inference.
+
+        Clips are bucketed by length so each model call processes up to
+        ``batch_size`` segments. If a batched call fails (e.g. a model that
+        does not accept pooling weights), that batch falls back to one
+        inference call per clip.
+
+        Args:
+            clips: 1-D float32 arrays at ``sample_rate`` Hz.
+            sample_rate: Sample rate of every clip.
+            batch_size: Maximum clips per forward pass.
+
+        Returns:
+            L2-normalized embeddings aligned with ``clips`` (None on failure).
+        """
+        results: list[Optional[np.ndarray]] = [None] * len(clips)
+        valid = [i for i, c in enumerate(clips) if len(c) > 0]
+        lengths = [len(clips[i]) for i in valid]
+
+        for batch in self._plan_batches(lengths, batch_size):
+            indices = [valid[b] for b in batch]
+            embeddings: Optional[np.ndarray] = None
+            if len(indices) > 1:
+                try:
+                    embeddings = self._infer_padded_batch([clips[i] for i in indices])
+                except Exception as e:
+                    logger.debug(f"Batched embedding inference failed, falling back: {e}")
+
+            if embeddings is None:
+                for i in indices:
+                    waveform = torch.tensor(np.asarray(clips[i]), dtype=torch.float32)
+                    results[i] = self.extract_embedding_from_waveform(
+                        waveform.unsqueeze(0), sample_rate
+                    )
+                continue
+
+            for i, embedding in zip(indices, embeddings):
+                norm = np.linalg.norm(embedding)
+                results[i] = embedding / norm if norm > 0 else embedding
+
+        return results
+
     def extract_embeddings_for_segments(
         self,
         audio_path: str,
@@ -329,6 +433,10 @@ class SpeakerEmbeddingService:
         continuous speaking sections before selecting the top 5 longest.
         This gives the embedding model longer, more representative audio.
 
+        The file is decoded once into an AudioSession and every selected
+        segment is sliced from that buffer, then all segments (across all
+        speakers) go through the model in padded batches.
+
         Args:
             audio_path: Path to the audio file
             segments: List of transcript segments with speaker information
@@ -337,31 +445,49 @@ class SpeakerEmbeddingService:
         Returns:
             Dictionary mapping speaker IDs to lists of embeddings
         """
+        from app.services.audio_segment_utils import AudioSession
         from app.services.audio_segment_utils import group_segments_by_speaker
         from app.services.audio_segment_utils import merge_adjacent_segments
         from app.services.audio_segment_utils import select_top_segments
 
-        speaker_embeddings: dict[int, list[np.ndarray]] = {}
         grouped = group_segments_by_speaker(segments, speaker_mapping)
-
+        selected_by_speaker: list[tuple[int, dict[str, Any]]] = []
         for speaker_id, speaker_segs in grouped.items():
             merged = merge_adjacent_segments(speaker_segs)
             selected = select_top_segments(
                 merged, min_duration=SPEAKER_SHORT_SEGMENT_MIN_DURATION, max_segments=5
             )
+            selected_by_speaker.extend((speaker_id, seg) for seg in selected)
 
-            embeddings = []
-            for segment in selected:
-                embedding = self.extract_embedding_from_file(
-                    audio_path, {"start": segment["start"], "end": segment["end"]}
-                )
+        if not selected_by_speaker:
+            return {}
+
+        try:
+            session = AudioSession(audio_path).open()
+        except Exception as e:
+            logger.debug(f"AudioSession decode failed ({e}), using fallback loaders")
+            try:
+                waveform, sample_rate = self._load_audio(audio_path)
+                if waveform.shape[0] > 1:
+                    waveform = waveform.mean(dim=0, keepdim=True)
+                session = AudioSession.from_array(waveform[0].numpy(), sample_rate)
+            except Exception as load_err:
+                logger.error(f"Error loading audio {audio_path}: {load_err}")
+                return {}
 
-                if embedding is not None:
-                    embeddings.append(embedding)
+        try:
+            clips = [session.slice(seg["start"], seg["end"]) for _, seg in selected_by_speaker]
+            embeddings = self.extract_embeddings_batch(clips, session.sample_rate)
+        finally:
+            session.close()
+
+        speaker_embeddings: dict[int, list[np.ndarray]] = {}
+        for (speaker_id, _), embedding in zip(selected_by_speaker, embeddings):
+            if embedding is not None:
+                speaker_embeddings.setdefault(speaker_id, []).append(embedding)
 
-            if embeddings:
-                speaker_embeddings[speaker_id] = embeddings
-                logger.info(f"Extracted {len(embeddings)} embeddings for speaker {speaker_id}")
+        for speaker_id, speaker_embs in speaker_embeddings.items():
+            logger.info(f"Extracted {len(speaker_embs)} embeddings for speaker {speaker_id}")
 
         return speaker_embeddings
 
@@ -0,0 +1,478 @@
+"""
+Local memory-mapped mirror of each user's speaker embeddings.
+
+Re-clustering, outlier analysis, profile centroids and suggestion lookups
+read many speaker embeddings at once. Fetching them from OpenSearch means
+scrolling or mget-ing JSON float lists and parsing them into Python lists
+before NumPy sees them, which takes minutes for tens of thousands of
+speakers. This store keeps a float16 copy of every user's speaker vectors
+on local disk, so a bulk read is one small JSON load plus an ``np.memmap``.
+
+OpenSearch stays the source of truth and the local copy is only used when
+it is known to be current:
+
+- Every speaker write in ``opensearch_service`` bumps a per-user revision
+  in Redis after OpenSearch accepted it, then applies the same change
+  locally if the local copy was at the previous revision.
+- Readers use the local copy only when its revision matches Redis. A
+  mismatch (a write on another host, a missed write, an alias swap) makes
+  the next reader rebuild it with one OpenSearch scroll. Without Redis,
+  readers get None and keep using OpenSearch.
+- The consistency task compares per-user counts with OpenSearch and bumps
+  the revision of every user whose copy drifted.
+
+Rows are append-only: an update appends a new row and tombstones the old
+one, so a reader that already mapped the file never sees a row change.
+Once tombstones outnumber live rows the file is compacted into a new
+generation and the old one is unlinked (open maps stay valid).
+
+Layout under ``SPEAKER_EMBEDDING_STORE_DIR``:
+    user_{id}/index.json        - Epoch, revision, dim, generation, row -> uuid
+    user_{id}/{generation}.f16  - Rows x dim float16, row-major
+    user_{id}/.lock             - Writer lock (readers never lock)
+
+Key conventions (outside ``cache:*``):
+    speaker_emb_rev:epoch       - Bumped when the speaker index is swapped
+    speaker_emb_rev:{user_id}   - Bumped on every change to the user's speakers
+"""
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.redis_cache_service import redis_cache
+
+logger = logging.getLogger(__name__)
+
+REVISION_KEY_PREFIX = "speaker_emb_rev:"
+EPOCH_KEY = f"{REVISION_KEY_PREFIX}epoch"
+INDEX_FILE = "index.json"
+LOCK_FILE = ".lock"
+REBUILD_BATCH_SIZE = 1000
+# Compact once tombstones outnumber live rows, but not for tiny stores
+COMPACT_MIN_ROWS = 1024
+
+# (speaker_uuid, speaker_id, embedding)
+EmbeddingRow = tuple[str, int | None, Sequence[float]]
+
+
+class SpeakerEmbeddingMatrix:
+    """Live speaker embeddings of one user.
+
+    ``vectors`` is the read-only float16 map of the store file and may hold
+    tombstoned rows; look rows up by speaker UUID with ``rows``.
+    """
+
+    def __init__(self, uuids: list[str | None], speaker_ids: list[Any], vectors: np.ndarray):
+        self._uuids = uuids
+        self._speaker_ids = speaker_ids
+        self.vectors = vectors
+
+    @cached_property
+    def row_of(self) -> dict[str, int]:
+        return {uuid: row for row, uuid in enumerate(self._uuids) if uuid is not None}
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def __contains__(self, speaker_uuid: object) -> bool:
+        return speaker_uuid in self.row_of
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def speaker_id(self, speaker_uuid: str) -> int | None:
+        row = self.row_of.get(speaker_uuid)
+        return None if row is None else self._speaker_ids[row]
+
+    def rows(self, speaker_uuids: Iterable[str] | None = None) -> tuple[list[str], np.ndarray]:
+        """Float32 embeddings for the given speakers (all when None).
+
+        Returns:
+            Tuple of (found UUIDs in input order, matrix with one row each).
+            Speakers not in the store are left out.
+        """
+        row_of = self.row_of
+        if speaker_uuids is None:
+            found = list(row_of)
+        else:
+            found = [uuid for uuid in dict.fromkeys(speaker_uuids) if uuid in row_of]
+        rows = np.fromiter((row_of[uuid] for uuid in found), dtype=np.intp, count=len(found))
+        return found, self.vectors[rows].astype(np.float32)
+
+
+class SpeakerEmbeddingStore:
+    """Per-user float16 embedding files kept in step with OpenSearch.
+
+    Every public method swallows its own errors: a broken store only costs
+    the caller a round-trip to OpenSearch.
+
+    Args:
+        root: Directory holding one subdirectory per user
+    """
+
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    # ------------------------------------------------------------------
+    # Revisions (Redis)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _client() -> Any:
+        if not settings.SPEAKER_EMBEDDING_STORE_ENABLED:
+            return None
+        return redis_cache.redis
+
+    @staticmethod
+    def _revisions(client: Any, user_id: int, bump: bool) -> tuple[int, int]:
+        """Current (epoch, revision) of a user, optionally bumping the revision.
+
+        Missing keys are seeded with the clock rather than 0 so a local copy
+        can never match a counter that Redis lost.
+        """
+        key = f"{REVISION_KEY_PREFIX}{user_id}"
+        seed = time.time_ns()
+        pipe = client.pipeline(transaction=True)
+        pipe.set(EPOCH_KEY, seed, nx=True)
+        pipe.set(key, seed, nx=True)
+        pipe.get(EPOCH_KEY)
+        if bump:
+            pipe.incr(key)
+        else:
+            pipe.get(key)
+        _, _, epoch, revision = pipe.execute()
+        return int(epoch), int(revision)
+
+    def invalidate(self, user_id: int) -> None:
+        """Mark every host's copy of a user as stale."""
+        client = self._client()
+        if client is None:
+            return
+        try:
+            self._revisions(client, user_id, bump=True)
+        except Exception as e:
+            logger.debug(f"Speaker embedding store invalidate error for user {user_id}: {e}")
+
+    def invalidate_all(self) -> None:
+        """Mark every copy stale, e.g. after the speaker index alias moved."""
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.incr(EPOCH_KEY)
+        except Exception as e:
+            logger.debug(f"Speaker embedding store epoch bump error: {e}")
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _user_dir(self, user_id: int) -> Path:
+        return self.root / f"user_{int(user_id)}"
+
+    @staticmethod
+    def _data_path(user_dir: Path, index: dict[str, Any]) -> Path:
+        return user_dir / f"{index['generation']}.f16"
+
+    @staticmethod
+    def _read_index(user_dir: Path) -> dict[str, Any] | None:
+        try:
+            with open(user_dir / INDEX_FILE, encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_index(user_dir: Path, index: dict[str, Any]) -> None:
+        tmp_path = user_dir / f"{INDEX_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, user_dir / INDEX_FILE)
+
+    @contextlib.contextmanager
+    def _locked(self, user_dir: Path) -> Iterator[None]:
+        user_dir.mkdir(parents=True, exist_ok=True)
+        with open(user_dir / LOCK_FILE, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write_rows(
+        self, user_dir: Path, index: dict[str, Any], vectors: np.ndarray, start_row: int
+    ) -> None:
+        """Write rows at ``start_row`` and drop anything a crashed writer left after them."""
+        path = self._data_path(user_dir, index)
+        with open(path, "r+b" if path.exists() else "wb") as f:
+            f.seek(start_row * index["dim"] * 2)
+            f.write(vectors.astype("<f2").tobytes())
+            f.truncate()
+
+    def _map(self, user_dir: Path, index: dict[str, Any]) -> SpeakerEmbeddingMatrix:
+        num_rows = len(index["uuids"])
+        dim = index["dim"] or 0
+        if num_rows == 0:
+            vectors = np.empty((0, dim), dtype=np.float16)
+        else:
+            vectors = np.memmap(
+                self._data_path(user_dir, index), dtype="<f2", mode="r", shape=(num_rows, dim)
+            )
+        return SpeakerEmbeddingMatrix(index["uuids"], index["speaker_ids"], vectors)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def load(self, user_id: int) -> SpeakerEmbeddingMatrix | None:
+        """Current speaker embeddings of a user, rebuilding the copy if stale.
+
+        Returns:
+            The mapped matrix, or None when the store is disabled, Redis is
+            unavailable or the rebuild failed. Callers then use OpenSearch.
+        """
+        client = self._client()
+        if client is None:
+            return None
+        user_dir = self._user_dir(user_id)
+        try:
+            epoch, revision = self._revisions(client, user_id, bump=False)
+
+            def current(index: dict[str, Any] | None) -> bool:
+                return (
+                    index is not None and index["epoch"] == epoch and index["revision"] == revision
+                )
+
+            index = self._read_index(user_dir)
+            if not current(index):
+                with self._locked(user_dir):
+                    index = self._read_index(user_dir)
+                    if not current(index):
+                        index = self._rebuild(user_dir, user_id, epoch, revision)
+            if index is None:
+                return None
+            try:
+                return self._map(user_dir, index)
+            except (FileNotFoundError, ValueError):
+                # A writer compacted between reading the index and mapping it
+                index = self._read_index(user_dir)
+                return self._map(user_dir, index) if current(index) else None
+        except Exception as e:
+            logger.warning(f"Speaker embedding store unavailable for user {user_id}: {e}")
+            return None
+
+    def _rebuild(
+        self, user_dir: Path, user_id: int, epoch: int, revision: int
+    ) -> dict[str, Any] | None:
+        """Replace the local copy with one scroll over the active speaker index."""
+        from app.services.opensearch_service import iter_speaker_embeddings
+
+        started = time.monotonic()
+        previous = self._read_index(user_dir)
+        index: dict[str, Any] = {
+            "epoch": epoch,
+            "revision": revision,
+            "generation": (previous["generation"] + 1) if previous else 1,
+            "dim": None,
+            "uuids": [],
+            "speaker_ids": [],
+        }
+        path = self._data_path(user_dir, index)
+        skipped = 0
+        try:
+            with open(path, "wb") as f:
+                for batch in iter_speaker_embeddings(
+                    user_id, batch_size=REBUILD_BATCH_SIZE, strict=True
+                ):
+                    if index["dim"] is None:
+                        index["dim"] = len(batch[0]["embedding"])
+                    items = [item for item in batch if len(item["embedding"]) == index["dim"]]
+                    skipped += len(batch) - len(items)
+                    if not items:
+                        continue
+                    vectors = np.asarray([item["embedding"] for item in items], dtype="<f2")
+                    f.write(vectors.tobytes())
+                    index["uuids"].extend(str(item["speaker_uuid"]) for item in items)
+                    index["speaker_ids"].extend(item.get("speaker_id") for item in items)
+        except Exception as e:
+            with contextlib.suppress(OSError):
+                path.unlink()
+            logger.warning(f"Speaker embedding store rebuild failed for user {user_id}: {e}")
+            return None
+
+        self._write_index(user_dir, index)
+        if previous and previous["generation"] != index["generation"]:
+            with contextlib.suppress(OSError):
+                self._data_path(user_dir, previous).unlink()
+        if skipped:
+            logger.warning(
+                f"Speaker embedding store skipped {skipped} embeddings of user {user_id} "
+                f"with a dimension other than {index['dim']}"
+            )
+        logger.info(
+            f"Rebuilt speaker embedding store for user {user_id}: {len(index['uuids'])} "
+            f"embeddings in {time.monotonic() - started:.2f}s"
+        )
+        return index
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _commit(self, user_id: int, apply: Callable[[Path, dict[str, Any]], bool]) -> None:
+        """Bump the user's revision and apply the change to the local copy.
+
+        ``apply(user_dir, index)`` edits the index and files in place and
+        returns False when it cannot (the copy is then left stale and the
+        next reader rebuilds it). It must be idempotent: a reader may rebuild
+        the copy at the new revision before this runs, and that rebuild's
+        scroll may or may not have seen the write.
+        """
+        client = self._client()
+        if client is None:
+            return
+        try:
+            epoch, revision = self._revisions(client, user_id, bump=True)
+            user_dir = self._user_dir(user_id)
+            if not (user_dir / INDEX_FILE).exists():
+                return  # Nothing mirrored on this host yet
+            with self._locked(user_dir):
+                index = self._read_index(user_dir)
+                if index is None or index["epoch"] != epoch:
+                    return
+                if index["revision"] not in (revision - 1, revision):
+                    return  # Missed another change: leave stale for a rebuild
+                if not apply(user_dir, index):
+                    return
+                index["revision"] = revision
+                self._write_index(user_dir, index)
+                self._maybe_compact(user_dir, index)
+        except Exception as e:
+            logger.warning(f"Speaker embedding store update failed for user {user_id}: {e}")
+
+    def upsert(self, user_id: int, rows: Sequence[EmbeddingRow]) -> None:
+        """Mirror speaker embeddings that were just written to OpenSearch."""
+        latest = {str(uuid): (speaker_id, embedding) for uuid, speaker_id, embedding in rows}
+        if not latest:
+            return
+
+        def apply(user_dir: Path, index: dict[str, Any]) -> bool:
+            vectors = np.asarray([emb for _, emb in latest.values()], dtype=np.float32)
+            if vectors.ndim != 2:
+                return False
+            if index["dim"] is None:
+                index["dim"] = vectors.shape[1]
+            elif vectors.shape[1] != index["dim"]:
+                return False  # Written to an index of another dimension
+
+            self._tombstone(index, latest)
+            start_row = len(index["uuids"])
+            self._write_rows(user_dir, index, vectors, start_row)
+            index["uuids"].extend(latest)
+            index["speaker_ids"].extend(speaker_id for speaker_id, _ in latest.values())
+            return True
+
+        self._commit(user_id, apply)
+
+    def remove(self, user_id: int, speaker_uuids: Iterable[str]) -> None:
+        """Mirror speaker embeddings that were just deleted from OpenSearch."""
+        removed = {str(uuid) for uuid in speaker_uuids}
+        if not removed:
+            return
+
+        def apply(user_dir: Path, index: dict[str, Any]) -> bool:
+            self._tombstone(index, removed)
+            return True
+
+        self._commit(user_id, apply)
+
+    @staticmethod
+    def _tombstone(index: dict[str, Any], speaker_uuids: Iterable[str]) -> None:
+        targets = set(speaker_uuids)
+        for row, uuid in enumerate(index["uuids"]):
+            if uuid in targets:
+                index["uuids"][row] = None
+                index["speaker_ids"][row] = None
+
+    def _maybe_compact(self, user_dir: Path, index: dict[str, Any]) -> None:
+        total = len(index["uuids"])
+        live = [row for row, uuid in enumerate(index["uuids"]) if uuid is not None]
+        if total < COMPACT_MIN_ROWS or len(live) * 2 >= total:
+            return
+
+        previous_path = self._data_path(user_dir, index)
+        vectors = np.asarray(self._map(user_dir, index).vectors[live])
+        index["generation"] += 1
+        index["uuids"] = [index["uuids"][row] for row in live]
+        index["speaker_ids"] = [index["speaker_ids"][row] for row in live]
+        self._write_rows(user_dir, index, vectors, 0)
+        self._write_index(user_dir, index)
+        with contextlib.suppress(OSError):
+            previous_path.unlink()
+        logger.debug(f"Compacted speaker embedding store {user_dir.name}: {total} -> {len(live)}")
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(self, opensearch_counts: dict[int, int]) -> list[int]:
+        """Invalidate local copies whose size no longer matches OpenSearch.
+
+        Args:
+            opensearch_counts: Speaker embedding count per user in the active index
+
+        Returns:
+            IDs of users whose copies were invalidated or dropped
+        """
+        client = self._client()
+        if client is None or not self.root.is_dir():
+            return []
+
+        drifted: list[int] = []
+        for user_dir in self.root.glob("user_*"):
+            try:
+                user_id = int(user_dir.name[len("user_") :])
+            except ValueError:
+                continue
+            try:
+                if user_id not in opensearch_counts:
+                    # No speakers left in OpenSearch: drop the copy entirely
+                    with self._locked(user_dir):
+                        shutil.rmtree(user_dir, ignore_errors=True)
+                    self._revisions(client, user_id, bump=True)
+                    drifted.append(user_id)
+                    continue
+
+                index = self._read_index(user_dir)
+                if index is None:
+                    continue
+                live = sum(uuid is not None for uuid in index["uuids"])
+                if live != opensearch_counts[user_id]:
+                    logger.info(
+                        f"Speaker embedding store for user {user_id} has {live} embeddings, "
+                        f"OpenSearch has {opensearch_counts[user_id]}: invalidating"
+                    )
+                    self._revisions(client, user_id, bump=True)
+                    drifted.append(user_id)
+            except Exception as e:
+                logger.warning(f"Speaker embedding store reconcile failed for user {user_id}: {e}")
+        return drifted
+
+
+speaker_embedding_store = SpeakerEmbeddingStore(settings.SPEAKER_EMBEDDING_STORE_DIR)
@@ -0,0 +1,215 @@
+"""Denormalized per-speaker summaries for the speaker directory.
+
+The per-file speaker listing computes segment counts, first-segment
+timestamps and consolidated suggestions (OpenSearch kNN) for every speaker
+it returns. That is fine for one file but makes a library-wide listing cost
+proportional to the number of speakers. The speaker directory instead reads
+these values from summary columns on ``speaker``, which this service
+refreshes one file at a time whenever they change:
+
+- transcription postprocess and re-diarization (segments and embeddings)
+- speaker embedding extraction on the cloud ASR path
+- LLM speaker identification (new suggestions)
+- speaker merges and segment reassignment (segment counts only)
+
+Example:
+    SpeakerSummaryService.refresh_file_summaries(db, media_file_id)
+
+Classes:
+    SpeakerSummaryService: Computes and stores speaker summary columns.
+"""
+
+import logging
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.session_utils import session_scope
+from app.models.media import Speaker
+
+logger = logging.getLogger(__name__)
+
+# Number of leading segments kept per speaker for jump-to-timestamp
+FIRST_SEGMENT_LIMIT = 4
+
+# Same thresholds the per-file speaker listing uses for suggestions
+SUMMARY_SUGGESTION_MIN_CONFIDENCE = 0.5
+SUMMARY_SUGGESTION_MAX_COUNT = 5
+
+
+class SpeakerSummaryService:
+    """Service for maintaining the denormalized speaker summary columns."""
+
+    @staticmethod
+    def compute_segment_summaries(db: Session, media_file_id: int) -> dict[int, dict[str, Any]]:
+        """Compute segment count and first segments for every speaker in a file.
+
+        Single pass over the file's speaker-assigned segments with window
+        functions; ``segment_index`` is the 0-based position among those
+        segments, matching the per-file listing.
+
+        Returns:
+            Dict mapping speaker_id to ``{"segment_count", "first_segment_times"}``.
+        """
+        sql = text("""
+            WITH ranked AS (
+                SELECT
+                    ts.speaker_id,
+                    ts.uuid,
+                    ts.start_time,
+                    COUNT(*) OVER (PARTITION BY ts.speaker_id) AS segment_count,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY ts.speaker_id ORDER BY ts.start_time
+                    ) AS speaker_rank,
+                    ROW_NUMBER() OVER (
+                        ORDER BY ts.start_time
+                    ) - 1 AS segment_index
+                FROM transcript_segment ts
+                WHERE ts.media_file_id = :file_id
+                  AND ts.speaker_id IS NOT NULL
+            )
+            SELECT speaker_id, uuid, start_time, segment_index, segment_count
+            FROM ranked
+            WHERE speaker_rank <= :limit
+            ORDER BY speaker_id, start_time
+        """)
+        rows = db.execute(sql, {"file_id": media_file_id, "limit": FIRST_SEGMENT_LIMIT})
+
+        summaries: dict[int, dict[str, Any]] = {}
+        for speaker_id, segment_uuid, start_time, segment_index, segment_count in rows:
+            summary = summaries.setdefault(
+                int(speaker_id),
+                {"segment_count": int(segment_count), "first_segment_times": []},
+            )
+            summary["first_segment_times"].append(
+                {
+                    "uuid": str(segment_uuid),
+                    "start_time": float(start_time),
+                    "segment_index": int(segment_index),
+                }
+            )
+        return summaries
+
+    @staticmethod
+    def select_top_suggestion(
+        speaker: Speaker, suggestions: list[Any]
+    ) -> Optional[tuple[str, float, str]]:
+        """Pick the suggestion shown for a speaker in the directory.
+
+        ``suggestions`` are ``ConsolidatedSuggestion`` objects already ranked
+        by ``SmartSpeakerSuggestionService`` (profiles first, then by
+        confidence), so the first one wins. Otherwise fall back to the
+        suggestion stored on the speaker (voice match, metadata hint, ...).
+
+        Returns:
+            ``(name, confidence, suggestion_type)`` or None.
+        """
+        if suggestions:
+            top = suggestions[0]
+            return str(top.name), float(top.confidence), str(top.suggestion_type)
+
+        name = speaker.suggested_name
+        if name and speaker.confidence and not str(name).startswith("SPEAKER_"):
+            return (
+                str(name),
+                float(speaker.confidence),
+                str(speaker.suggestion_source or "voice_match"),
+            )
+        return None
+
+    @staticmethod
+    def refresh_file_summaries(
+        db: Session, media_file_id: int, include_suggestions: bool = True
+    ) -> bool:
+        """Recompute and store the summary columns of all speakers in a file.
+
+        Args:
+            db: Database session
+            media_file_id: ID of the media file
+            include_suggestions: Also refresh the top suggestion. This needs
+                OpenSearch (one mget + one msearch for the whole file); pass
+                False when only segment assignments changed.
+
+        Returns:
+            True if the summaries were stored, False otherwise
+        """
+        try:
+            speakers = db.query(Speaker).filter(Speaker.media_file_id == media_file_id).all()
+            if not speakers:
+                return True
+
+            summaries = SpeakerSummaryService.compute_segment_summaries(db, media_file_id)
+            suggestions = (
+                SpeakerSummaryService._fetch_suggestions(db, speakers)
+                if include_suggestions
+                else None
+            )
+
+            now = datetime.now(timezone.utc)
+            for speaker in speakers:
+                summary = summaries.get(int(speaker.id), {})
+                speaker.segment_count = summary.get("segment_count", 0)  # type: ignore[assignment]
+                speaker.first_segment_times = summary.get("first_segment_times", [])  # type: ignore[assignment]
+                speaker.summary_updated_at = now  # type: ignore[assignment]
+                if suggestions is None:
+                    continue
+                top = SpeakerSummaryService.select_top_suggestion(
+                    speaker, suggestions.get(int(speaker.id), [])
+                )
+                name, confidence, suggestion_type = top or (None, None, None)
+                speaker.top_suggestion_name = name  # type: ignore[assignment]
+                speaker.top_suggestion_confidence = confidence  # type: ignore[assignment]
+                speaker.top_suggestion_type = suggestion_type  # type: ignore[assignment]
+
+            db.commit()
+            logger.debug(
+                f"Refreshed summaries for {len(speakers)} speakers in media file {media_file_id}"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error refreshing speaker summaries for media file {media_file_id}: {e}")
+            db.rollback()
+            return False
+
+    @staticmethod
+    def refresh_file_summaries_background(
+        media_file_id: int, include_suggestions: bool = True
+    ) -> bool:
+        """Refresh summaries in a fresh session, for use from Celery tasks.
+
+        Never raises: a stale summary must not fail the task that calls this.
+        """
+        try:
+            with session_scope() as db:
+                return SpeakerSummaryService.refresh_file_summaries(
+                    db, media_file_id, include_suggestions
+                )
+        except Exception as e:
+            logger.warning(f"Speaker summary refresh failed for media file {media_file_id}: {e}")
+            return False
+
+    @staticmethod
+    def _fetch_suggestions(db: Session, speakers: list[Speaker]) -> Optional[dict[int, list[Any]]]:
+        """Batch-fetch consolidated suggestions, or None if OpenSearch failed.
+
+        On failure the stored top suggestions are left untouched rather than
+        cleared.
+        """
+        from app.services.smart_speaker_suggestion_service import SmartSpeakerSuggestionService
+
+        try:
+            return SmartSpeakerSuggestionService.consolidate_suggestions_batch(
+                speakers=speakers,
+                user_id=int(speakers[0].user_id),
+                db=db,
+                confidence_threshold=SUMMARY_SUGGESTION_MIN_CONFIDENCE,
+                max_suggestions=SUMMARY_SUGGESTION_MAX_COUNT,
+            )
+        except Exception as e:
+            logger.warning(f"Could not fetch speaker suggestions for summaries: {e}")
+            return None
@@ -9,6 +9,7 @@ import textwrap
 from collections import defaultdict
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import load_only
 
 from app.models.media import MediaFile
 from app.models.media import Speaker
@@ -282,14 +283,10 @@ class SubtitleService:
         return subtitle_parts
 
     @staticmethod
-    def generate_webvtt_content(
-        db: Session, media_file_id: int, include_speakers: bool = True
-    ) -> str:
-        """Generate WebVTT subtitle content from transcript segments.
-
-        Handles overlapping speech by merging segments with the same overlap_group_id
-        into a single subtitle cue with speaker labels on separate lines.
-        """
+    def _load_transcript(
+        db: Session, media_file_id: int, include_speakers: bool
+    ) -> tuple[list[TranscriptSegment], dict[int, str]]:
+        """Load one file's segments (ordered by start time) and its speaker map."""
         # Get media file and transcript segments
         media_file = db.query(MediaFile).filter(MediaFile.id == media_file_id).first()
         if not media_file:
@@ -318,6 +315,90 @@ class SubtitleService:
             for row in speaker_rows:
                 speaker_map[row.id] = str(row.display_name) if row.display_name else str(row.name)
 
+        return segments, speaker_map
+
+    @staticmethod
+    def load_transcripts_batch(
+        db: Session, media_file_ids: list[int], include_speakers: bool = True
+    ) -> dict[int, tuple[list[TranscriptSegment], dict[int, str]]]:
+        """Load segments and speaker maps for many files in two queries.
+
+        Only the columns the renderers need are loaded (word-level timing is
+        skipped). Files without segments are absent from the result.
+        """
+        if not media_file_ids:
+            return {}
+
+        rows = (
+            db.query(TranscriptSegment)
+            .options(
+                load_only(
+                    TranscriptSegment.id,  # type: ignore[arg-type]
+                    TranscriptSegment.media_file_id,  # type: ignore[arg-type]
+                    TranscriptSegment.speaker_id,  # type: ignore[arg-type]
+                    TranscriptSegment.start_time,  # type: ignore[arg-type]
+                    TranscriptSegment.end_time,  # type: ignore[arg-type]
+                    TranscriptSegment.text,  # type: ignore[arg-type]
+                    TranscriptSegment.overlap_group_id,  # type: ignore[arg-type]
+                )
+            )
+            .filter(TranscriptSegment.media_file_id.in_(media_file_ids))
+            .order_by(TranscriptSegment.media_file_id, TranscriptSegment.start_time)
+            .all()
+        )
+
+        segments_by_file: dict[int, list[TranscriptSegment]] = defaultdict(list)
+        for segment in rows:
+            segments_by_file[int(segment.media_file_id)].append(segment)
+
+        speaker_map: dict[int, str] = {}
+        if include_speakers:
+            speaker_ids = {s.speaker_id for s in rows if s.speaker_id}
+            if speaker_ids:
+                speaker_rows = (
+                    db.query(Speaker.id, Speaker.name, Speaker.display_name)
+                    .filter(Speaker.id.in_(speaker_ids))
+                    .all()
+                )
+                for row in speaker_rows:
+                    speaker_map[row.id] = (
+                        str(row.display_name) if row.display_name else str(row.name)
+                    )
+
+        # Speaker IDs are globally unique, so one map serves every file
+        return {file_id: (segs, speaker_map) for file_id, segs in segments_by_file.items()}
+
+    @staticmethod
+    def render_content(
+        subtitle_format: str,
+        segments: list[TranscriptSegment],
+        speaker_map: dict[int, str],
+        include_speakers: bool = True,
+    ) -> str:
+        """Render already-loaded segments as srt, webvtt or txt."""
+        if subtitle_format == "webvtt":
+            return SubtitleService.render_webvtt(segments, speaker_map)
+        if subtitle_format == "txt":
+            return SubtitleService.render_txt(segments, speaker_map, include_speakers)
+        return SubtitleService.render_srt(segments, speaker_map)
+
+    @staticmethod
+    def generate_webvtt_content(
+        db: Session, media_file_id: int, include_speakers: bool = True
+    ) -> str:
+        """Generate WebVTT subtitle content from transcript segments.
+
+        Handles overlapping speech by merging segments with the same overlap_group_id
+        into a single subtitle cue with speaker labels on separate lines.
+        """
+        segments, speaker_map = SubtitleService._load_transcript(
+            db, media_file_id, include_speakers
+        )
+        return SubtitleService.render_webvtt(segments, speaker_map)
+
+    @staticmethod
+    def render_webvtt(segments: list[TranscriptSegment], speaker_map: dict[int, str]) -> str:
+        """Render WebVTT content from loaded segments and a speaker map."""
         # Group overlapping segments
         segment_groups = SubtitleService._group_overlapping_segments(segments)
 
@@ -359,34 +440,14 @@ class SubtitleService:
         Handles overlapping speech by merging segments with the same overlap_group_id
         into a single subtitle cue with speaker labels on separate lines.
         """
-        # Get media file and transcript segments
-        media_file = db.query(MediaFile).filter(MediaFile.id == media_file_id).first()
-        if not media_file:
-            raise ValueError(f"Media file with ID {media_file_id} not found")
-
-        # Get all transcript segments ordered by start time
-        segments = (
-            db.query(TranscriptSegment)
-            .filter(TranscriptSegment.media_file_id == media_file_id)
-            .order_by(TranscriptSegment.start_time)
-            .all()
+        segments, speaker_map = SubtitleService._load_transcript(
+            db, media_file_id, include_speakers
         )
+        return SubtitleService.render_srt(segments, speaker_map)
 
-        if not segments:
-            raise ValueError("No transcript segments found for this media file")
-
-        # Build speaker map for quick lookup
-        speaker_map: dict[int, str] = {}
-        if include_speakers:
-            speaker_ids = {s.speaker_id for s in segments if s.speaker_id}
-            speaker_rows = (
-                db.query(Speaker.id, Speaker.name, Speaker.display_name)
-                .filter(Speaker.id.in_(speaker_ids))
-                .all()
-            )
-            for row in speaker_rows:
-                speaker_map[row.id] = str(row.display_name) if row.display_name else str(row.name)
-
+    @staticmethod
+    def render_srt(segments: list[TranscriptSegment], speaker_map: dict[int, str]) -> str:
+        """Render SRT content from loaded segments and a speaker map."""
         # Group overlapping segments
         segment_groups = SubtitleService._group_overlapping_segments(segments)
 
@@ -454,34 +515,18 @@ class SubtitleService:
           Alice (00:02:15 - 00:02:18): That's a great idea but--
           Bob (00:02:16 - 00:02:20): I completely disagree!
         """
-        # Get media file and transcript segments
-        media_file = db.query(MediaFile).filter(MediaFile.id == media_file_id).first()
-        if not media_file:
-            raise ValueError(f"Media file with ID {media_file_id} not found")
-
-        # Get all transcript segments ordered by start time
-        segments = (
-            db.query(TranscriptSegment)
-            .filter(TranscriptSegment.media_file_id == media_file_id)
-            .order_by(TranscriptSegment.start_time)
-            .all()
+        segments, speaker_map = SubtitleService._load_transcript(
+            db, media_file_id, include_speakers
         )
+        return SubtitleService.render_txt(segments, speaker_map, include_speakers)
 
-        if not segments:
-            raise ValueError("No transcript segments found for this media file")
-
-        # Build speaker map for quick lookup
-        speaker_map: dict[int, str] = {}
-        if include_speakers:
-            speaker_ids = {s.speaker_id for s in segments if s.speaker_id}
-            speaker_rows = (
-                db.query(Speaker.id, Speaker.name, Speaker.display_name)
-                .filter(Speaker.id.in_(speaker_ids))
-                .all()
-            )
-            for row in speaker_rows:
-                speaker_map[row.id] = str(row.display_name) if row.display_name else str(row.name)
-
+    @staticmethod
+    def render_txt(
+        segments: list[TranscriptSegment],
+        speaker_map: dict[int, str],
+        include_speakers: bool = True,
+    ) -> str:
+        """Render a plain text transcript from loaded segments and a speaker map."""
         # Group overlapping segments
         segment_groups = SubtitleService._group_overlapping_segments(segments)
 
@@ -0,0 +1,78 @@
+"""
+Progress reporting for summary generation.
+
+A long meeting on a local model can take minutes per LLM call. While
+``LLMService.generate_summary`` runs, a ``SummaryProgress`` is handed the
+partial output:
+
+- Streamed text of the single-pass or combining request, forwarded to the
+  user at most every ``STREAM_NOTIFY_INTERVAL_SECONDS``
+- Each finished section of a multi-section summary
+
+When the task fails and runs again for the same transcript, prompt and
+model, finished sections are answered from the LLM response cache
+(``app.services.llm_response_cache``), so only the missing ones reach the
+LLM. With ``LLM_RESPONSE_CACHE_ENABLED`` off a retry starts over; workers
+log a warning at startup in that case.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STREAM_NOTIFY_INTERVAL_SECONDS = 2.0
+
+# Receives (message, progress percent, partial payload)
+ProgressNotifier = Callable[[str, int, dict[str, Any]], None]
+
+
+class SummaryProgress:
+    """Forwards partial summary output to the user.
+
+    Args:
+        file_id: Media file being summarized
+        notify: Callback that pushes an update to the user
+        progress_range: Progress percentages spanned by LLM generation
+    """
+
+    def __init__(
+        self, file_id: int, notify: ProgressNotifier, progress_range: tuple[int, int] = (50, 70)
+    ):
+        self.file_id = file_id
+        self._notify = notify
+        self._start, self._end = progress_range
+        self._lock = threading.Lock()
+        self._last_stream_notify = 0.0
+
+    def _send(self, message: str, progress: int, partial: dict[str, Any]) -> None:
+        try:
+            self._notify(message, progress, partial)
+        except Exception as e:
+            logger.debug(f"Summary progress notification failed: {e}")
+
+    def section_done(self, index: int, done: int, total: int, section: dict[str, Any]) -> None:
+        """Tell the user a section has been summarized."""
+        # Sections take the first three quarters of the range, combining the rest
+        span = (self._end - self._start) * 3 // 4
+        self._send(
+            f"Summarized section {done} of {total}",
+            self._start + span * done // total,
+            {"section": index + 1, "total_sections": total, "section_summary": section},
+        )
+
+    def stream_text(self, text: str) -> None:
+        """Forward the text generated so far, throttled."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_stream_notify < STREAM_NOTIFY_INTERVAL_SECONDS:
+                return
+            self._last_stream_notify = now
+        self._send(
+            "Generating AI summary",
+            self._end - (self._end - self._start) // 4,
+            {"partial_text": text},
+        )
@@ -21,6 +21,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.constants import DEFAULT_LLM_OUTPUT_LANGUAGE
 from app.core.constants import LLM_OUTPUT_LANGUAGES
 from app.models.media import MediaFile
@@ -29,6 +30,7 @@ from app.models.topic import TopicSuggestion
 from app.schemas.topic import LLMSuggestionResponse
 from app.services.llm_service import LLMProvider
 from app.services.llm_service import LLMService
+from app.utils.transcript_builders import build_full_transcript
 
 logger = logging.getLogger(__name__)
 
@@ -259,13 +261,17 @@ IMPORTANT GUIDELINES:
         if progress_callback:
             progress_callback("Calling AI model (this may take a moment)...")
 
-        llm_response = self._call_llm_for_extraction(
-            llm_service=llm_service,
-            transcript=transcript,
-            file_id=media_file_id,
-            duration=float(media_file.duration or 0),
-            output_language=output_language,
+        llm_response = self._get_combined_enrichment_topics(
+            llm_service, media_file, output_language
         )
+        if llm_response is None:
+            llm_response = self._call_llm_for_extraction(
+                llm_service=llm_service,
+                transcript=transcript,
+                file_id=media_file_id,
+                duration=float(media_file.duration or 0),
+                output_language=output_language,
+            )
 
         # Notify: Processing response
         if progress_callback:
@@ -355,6 +361,42 @@ IMPORTANT GUIDELINES:
 
         return "\n".join(transcript_parts)
 
+    def _get_combined_enrichment_topics(
+        self, llm_service: LLMService, media_file: MediaFile, output_language: str
+    ) -> Optional[LLMSuggestionResponse]:
+        """Topic suggestions from a combined enrichment request, if the summary task ran one."""
+        if not settings.LLM_COMBINED_ENRICHMENT:
+            return None
+
+        from app.models.media import TranscriptSegment
+        from app.tasks.speaker_identification_task import _build_metadata_context
+        from app.tasks.speaker_identification_task import _get_known_speakers
+
+        segments = (
+            self.db.query(TranscriptSegment)
+            .filter(TranscriptSegment.media_file_id == media_file.id)
+            .order_by(TranscriptSegment.start_time)
+            .all()
+        )
+        part = llm_service.get_enrichment_part(
+            "topics",
+            build_full_transcript(segments),
+            output_language,
+            known_speakers=_get_known_speakers(self.db, int(media_file.user_id)),
+            metadata_context=_build_metadata_context(media_file),
+        )
+        if part is None:
+            return None
+
+        try:
+            logger.info(
+                f"Using topic suggestions from combined enrichment for file {media_file.id}"
+            )
+            return LLMSuggestionResponse(**part)
+        except Exception as e:
+            logger.warning(f"Ignoring malformed combined enrichment topics: {e}")
+            return None
+
     def _call_llm_for_extraction(
         self,
         llm_service: LLMService,
@@ -445,10 +487,15 @@ IMPORTANT GUIDELINES:
 
         try:
             # Call LLM with provider-specific parameters
-            response = llm_service.chat_completion(messages, **kwargs)
+            response = llm_service.chat_completion(
+                messages, cache_transcript=transcript_text, **kwargs
+            )
 
             # Parse response
-            return self._parse_llm_response(response.content, llm_service.config.provider)
+            parsed = self._parse_llm_response(response.content, llm_service.config.provider)
+            if parsed is not None:
+                llm_service.cache_response(response)
+            return parsed
 
         except Exception as e:
             logger.error(f"Error calling LLM for suggestion extraction: {e}")
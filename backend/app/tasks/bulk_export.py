@@ -0,0 +1,123 @@
+"""Celery task for building large bulk subtitle exports in the background."""
+
+import logging
+import tempfile
+from typing import Optional
+
+from app.core.celery import celery_app
+from app.core.constants import BULK_EXPORT_URL_EXPIRY
+from app.core.constants import NOTIFICATION_TYPE_BULK_EXPORT_COMPLETE
+from app.core.constants import CPUPriority
+from app.db.session_utils import session_scope
+from app.utils.websocket_notify import send_ws_event
+
+logger = logging.getLogger(__name__)
+
+BULK_EXPORT_PREFIX = "exports/"
+# Redis key recording who queued a background export, so the status
+# endpoint can tell unknown or foreign task ids from pending ones
+BULK_EXPORT_OWNER_KEY = "bulk_export_owner:{task_id}"
+
+
+def bulk_export_object_name(user_id: int, task_id: str) -> str:
+    """MinIO object name for a background bulk export archive."""
+    return f"{BULK_EXPORT_PREFIX}{user_id}/{task_id}.zip"
+
+
+def record_bulk_export_owner(task_id: str, user_id: int) -> None:
+    """Remember who queued ``task_id`` for as long as its download link lives."""
+    from app.core.redis import get_redis
+
+    get_redis().setex(
+        BULK_EXPORT_OWNER_KEY.format(task_id=task_id), BULK_EXPORT_URL_EXPIRY, str(user_id)
+    )
+
+
+def get_bulk_export_owner(task_id: str) -> Optional[int]:
+    """User who queued ``task_id``, or None for unknown or expired exports."""
+    from app.core.redis import get_redis
+
+    owner = get_redis().get(BULK_EXPORT_OWNER_KEY.format(task_id=task_id))
+    return int(owner) if owner is not None else None
+
+
+@celery_app.task(
+    bind=True,
+    name="export.bulk_subtitles",
+    priority=CPUPriority.USER_TRIGGERED,
+)
+def bulk_export_subtitles_task(
+    self,
+    user_id: int,
+    is_admin: bool,
+    file_uuids: list[str],
+    subtitle_format: str = "srt",
+    include_speakers: bool = True,
+):
+    """Build a subtitle ZIP for a large selection and upload it to MinIO.
+
+    The archive is written to a temporary file on local disk (not memory),
+    then uploaded with a multipart put. The user is notified over WebSocket
+    with a presigned download URL.
+    """
+    from app.services.bulk_export_service import iter_export_entries
+    from app.services.bulk_export_service import resolve_export_candidates
+    from app.services.bulk_export_service import write_zip
+    from app.services.minio_service import get_file_url
+    from app.services.minio_service import upload_file_tuned
+
+    task_id = self.request.id
+    requested = len(file_uuids)
+
+    try:
+        with session_scope() as db:
+            candidates = resolve_export_candidates(db, file_uuids, user_id, is_admin)
+
+        if not candidates:
+            result = {
+                "status": "error",
+                "task_id": task_id,
+                "user_id": user_id,
+                "file_count": requested,
+                "error": "No files could be exported. Ensure files are completed and accessible.",
+            }
+            send_ws_event(user_id, NOTIFICATION_TYPE_BULK_EXPORT_COMPLETE, result)
+            return result
+
+        entries = iter_export_entries(candidates, subtitle_format, include_speakers)
+        with tempfile.TemporaryFile(suffix=".zip") as archive:
+            exported = write_zip(entries, archive)
+            size = archive.tell()
+            archive.seek(0)
+            object_name = bulk_export_object_name(user_id, task_id)
+            upload_file_tuned(archive, size, object_name, "application/zip")
+
+        result = {
+            "status": "success",
+            "task_id": task_id,
+            "user_id": user_id,
+            "download_url": get_file_url(object_name, expires=BULK_EXPORT_URL_EXPIRY),
+            "filename": f"transcripts_{subtitle_format}.zip",
+            "file_count": requested,
+            "exported_count": exported,
+            "skipped_count": requested - exported,
+            "size_bytes": size,
+        }
+        logger.info(
+            f"Bulk export {task_id} for user {user_id}: {exported}/{requested} files, "
+            f"{size / (1024 * 1024):.1f} MB -> {object_name}"
+        )
+        send_ws_event(user_id, NOTIFICATION_TYPE_BULK_EXPORT_COMPLETE, result)
+        return result
+
+    except Exception as e:
+        logger.error(f"Bulk export {task_id} failed for user {user_id}: {e}")
+        result = {
+            "status": "error",
+            "task_id": task_id,
+            "user_id": user_id,
+            "file_count": requested,
+            "error": str(e),
+        }
+        send_ws_event(user_id, NOTIFICATION_TYPE_BULK_EXPORT_COMPLETE, result)
+        return result
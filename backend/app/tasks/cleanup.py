@@ -286,6 +286,28 @@ def scratch_janitor(self, ttl_seconds: int | None = None) -> dict[str, int]:
     return {"removed": removed, "errors": errors, "ttl_seconds": ttl}
 
 
+@shared_task(bind=True, name="cleanup.expired_bulk_exports", priority=UtilityPriority.ROUTINE)
+def expired_bulk_exports(self) -> dict[str, int]:
+    """Delete background bulk export archives whose download link has expired.
+
+    The presigned URL handed out by ``export.bulk_subtitles`` is valid for
+    ``BULK_EXPORT_URL_EXPIRY`` seconds from upload, after which nothing can
+    fetch the archive. Scheduled hourly via ``celery_app.conf.beat_schedule``.
+    """
+    from app.core.constants import BULK_EXPORT_URL_EXPIRY
+    from app.services.minio_service import delete_expired_objects
+    from app.tasks.bulk_export import BULK_EXPORT_PREFIX
+
+    try:
+        removed = delete_expired_objects(BULK_EXPORT_PREFIX, BULK_EXPORT_URL_EXPIRY)
+    except Exception as e:
+        logger.error(f"expired_bulk_exports error: {e}")
+        return {"removed": 0, "errors": 1}
+    if removed:
+        logger.info(f"expired_bulk_exports: removed {removed} archive(s)")
+    return {"removed": removed, "errors": 0}
+
+
 @celery_app.task(name="cleanup_expired_files", priority=UtilityPriority.ROUTINE)
 def cleanup_expired_files(force: bool = False):
     """
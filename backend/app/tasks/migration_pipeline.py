@@ -7,6 +7,7 @@ migration, and combined migration. Provides:
 - File preparation (DB query + presigned URL generation)
 - Segment collection with merge + top-N selection
 - I/O-pipelined GPU processing (all extractions submitted upfront)
+- Batched inference: segments of a group of files go to the models at once
 
 Architecture:
     ┌──────────────────────────────────────────────┐
@@ -16,7 +17,9 @@ Architecture:
                          │ np.ndarray futures
                          ▼
     ┌──────────────────────────────────────────────┐
-    │  Sequential GPU processing                   │
+    │  Sequential GPU processing, file group at a  │
+    │  time (batch-capable models get all segments │
+    │  of the group in length-bucketed passes)     │
     │  One runner instance per batch task           │
     │  Data already extracted before GPU needs it   │
     └──────────────────────────────────────────────┘
@@ -65,6 +68,10 @@ AUDIO_SAMPLE_RATE = 16000
 MIN_AUDIO_SAMPLES = int(SPEAKER_SHORT_SEGMENT_MIN_DURATION * AUDIO_SAMPLE_RATE)
 DEFAULT_MAX_SEGMENTS = 5
 FILE_SLOW_THRESHOLD_SECONDS = 120
+# Files whose segments are handed to the models together. Large enough to
+# fill several inference batches, small enough that results still land
+# (and progress moves) every few files.
+INFERENCE_GROUP_FILES = 4
 
 
 @dataclass
@@ -252,16 +259,15 @@ def submit_segment_fetches(
     return futures
 
 
-def _process_file_segments(
-    runner: MultiModelRunner,
+def _collect_file_audio(
     seg_futures: list[tuple[Any, dict, Future]],
-) -> dict[str, list[SegmentResult]]:
-    """Process all segment futures for one file, feeding audio to models.
+) -> list[tuple[int, Any]]:
+    """Wait for one file's segment extractions.
 
-    Returns results grouped by model name.
+    Returns (speaker_id, audio) pairs for the usable segments.
     Raises RuntimeError if ALL extractions fail (transient error).
     """
-    results_by_model: dict[str, list[SegmentResult]] = {}
+    segments = []
     extraction_failures = 0
     total_futures = len(seg_futures)
 
@@ -277,16 +283,23 @@ def _process_file_segments(
             extraction_failures += 1
             continue
 
-        # Feed same audio to all models back-to-back
-        segment_results = runner.process_segment(audio_np, 16000, speaker.id)
-        for sr in segment_results:
-            if sr.model_name not in results_by_model:
-                results_by_model[sr.model_name] = []
-            results_by_model[sr.model_name].append(sr)
+        segments.append((speaker.id, audio_np))
 
     if total_futures > 0 and extraction_failures == total_futures:
         raise RuntimeError(f"All {total_futures} segment extractions failed")
 
+    return segments
+
+
+def _group_results_by_model(
+    results: list[SegmentResult],
+    speaker_ids: set[int],
+) -> dict[str, list[SegmentResult]]:
+    """Pick one file's results out of a group run, keyed by model name."""
+    results_by_model: dict[str, list[SegmentResult]] = {}
+    for sr in results:
+        if sr.speaker_id in speaker_ids:
+            results_by_model.setdefault(sr.model_name, []).append(sr)
     return results_by_model
 
 
@@ -310,9 +323,11 @@ def process_batch_pipelined(
     How it works:
     1. Submit ALL segment extractions to the I/O thread pool (16 ffmpeg
        workers). This starts immediately for ALL files in the batch.
-    2. Process files sequentially on GPU — by the time the GPU reaches
-       each file, its audio data is already extracted and waiting.
-    3. Write results (OpenSearch/PostgreSQL) after each file completes.
+    2. Process files in groups of ``INFERENCE_GROUP_FILES`` on GPU — by
+       the time the GPU reaches a group, its audio is already extracted.
+       All segments of the group go to the runner in one call, so batching
+       models run full, length-bucketed forward passes.
+    3. Write results (OpenSearch/PostgreSQL) per file after its group.
 
     Multi-GPU scaling is handled by Celery: each GPU worker container
     picks up its own batch task independently, so N GPUs = N parallel
@@ -349,32 +364,55 @@ def process_batch_pipelined(
             seg_futures = submit_segment_fetches(prepared, io_pool, min_duration)
             file_work.append((fuuid, prepared, seg_futures))
 
-        # Process files sequentially — GPU processes one file while
+        # Process file groups sequentially — GPU processes one group while
         # I/O threads continue extracting segments for upcoming files
-        for fuuid, prepared, seg_futures in file_work:
+        for group_start in range(0, len(file_work), INFERENCE_GROUP_FILES):
             if not is_running_check():
                 logger.warning("Migration stopped, aborting batch")
                 break
 
-            file_start = time.time()
+            group_timer = time.time()
+            ready: list[tuple[str, PreparedFile, list[tuple[int, Any]]]] = []
+            for fuuid, prepared, seg_futures in file_work[
+                group_start : group_start + INFERENCE_GROUP_FILES
+            ]:
+                try:
+                    ready.append((fuuid, prepared, _collect_file_audio(seg_futures)))
+                except Exception as e:
+                    logger.error("%s… failed: %s", fuuid[:12], e)
+                    failed += 1
+                    on_file_failure(fuuid, e)
+
             try:
-                results_by_model = _process_file_segments(runner, seg_futures)
-                count = result_writer(prepared, results_by_model)
-                elapsed = time.time() - file_start
+                results = runner.process_segments(
+                    [segment for _, _, segments in ready for segment in segments],
+                    AUDIO_SAMPLE_RATE,
+                )
+            except Exception as e:
+                logger.error("Inference failed for %d files: %s", len(ready), e)
+                for fuuid, _, _ in ready:
+                    failed += 1
+                    on_file_failure(fuuid, e)
+                continue
 
-                if elapsed > FILE_SLOW_THRESHOLD_SECONDS:
-                    logger.warning("%s… took %.1fs (slow)", fuuid[:12], elapsed)
+            elapsed = time.time() - group_timer
+            if elapsed > FILE_SLOW_THRESHOLD_SECONDS * max(1, len(ready)):
+                logger.warning("%d files took %.1fs (slow)", len(ready), elapsed)
 
-                success += 1
-                on_file_success(fuuid)
+            for fuuid, prepared, _ in ready:
+                try:
+                    speaker_ids = {speaker.id for speaker in prepared.speakers}
+                    count = result_writer(prepared, _group_results_by_model(results, speaker_ids))
+                    success += 1
+                    on_file_success(fuuid)
 
-                if count:
-                    logger.info("%s… %d items processed", fuuid[:12], count)
+                    if count:
+                        logger.info("%s… %d items processed", fuuid[:12], count)
 
-            except Exception as e:
-                logger.error("%s… failed: %s", fuuid[:12], e)
-                failed += 1
-                on_file_failure(fuuid, e)
+                except Exception as e:
+                    logger.error("%s… failed: %s", fuuid[:12], e)
+                    failed += 1
+                    on_file_failure(fuuid, e)
 
     return success, failed
 
@@ -12,6 +12,8 @@ import os
 import tempfile
 import time
 
+from sqlalchemy.orm import undefer
+
 from app.core.celery import celery_app
 from app.core.config import settings
 from app.core.constants import GPUPriority
@@ -23,9 +25,11 @@ from app.services.minio_service import cleanup_temp_audio
 from app.services.minio_service import download_file
 from app.services.minio_service import download_temp_audio
 from app.services.minio_service import temp_audio_exists
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils.task_utils import create_task_record
 from app.utils.task_utils import update_media_file_status
 from app.utils.task_utils import update_task_status
+from app.utils.word_timings import segment_words
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +52,10 @@ def _load_segments_as_transcript(file_id: int) -> dict:
     with session_scope() as db:
         segments = (
             db.query(TranscriptSegment)
+            .options(
+                undefer(TranscriptSegment.word_timings),  # type: ignore[arg-type]
+                undefer(TranscriptSegment.words),  # type: ignore[arg-type]
+            )
             .filter(TranscriptSegment.media_file_id == file_id)
             .order_by(TranscriptSegment.start_time)
             .all()
@@ -57,7 +65,8 @@ def _load_segments_as_transcript(file_id: int) -> dict:
             raise ValueError(f"No transcript segments found for file {file_id}")
 
         # Check that at least some segments have word-level timestamps
-        has_words = any(seg.words for seg in segments)
+        segment_word_lists = [segment_words(seg) for seg in segments]
+        has_words = any(segment_word_lists)
         if not has_words:
             logger.warning(
                 f"File {file_id} has no word-level timestamps; "
@@ -65,7 +74,7 @@ def _load_segments_as_transcript(file_id: int) -> dict:
             )
 
         result_segments = []
-        for seg in segments:
+        for seg, words in zip(segments, segment_word_lists):
             segment_dict: dict = {
                 "text": seg.text,
                 "start": seg.start_time,
@@ -73,7 +82,7 @@ def _load_segments_as_transcript(file_id: int) -> dict:
             }
 
             # Preserve word-level timestamps for fine-grained speaker assignment
-            if seg.words:
+            if words:
                 segment_dict["words"] = [
                     {
                         "word": w.get("word", ""),
@@ -81,7 +90,7 @@ def _load_segments_as_transcript(file_id: int) -> dict:
                         "end": w["end"],
                         "score": w.get("score", 1.0),
                     }
-                    for w in seg.words
+                    for w in words
                     if "start" in w and "end" in w
                 ]
 
@@ -349,6 +358,8 @@ def rediarize_task(  # noqa: C901
             except Exception as e:
                 logger.warning(f"v4 staging error during rediarize (non-fatal): {e}")
 
+        SpeakerSummaryService.refresh_file_summaries_background(file_id)
+
         # Step 8: Finalize — clear diarization_disabled since we just ran diarization
         send_progress_notification(user_id, file_id, 0.95, "Finalizing re-diarization")
         with session_scope() as db:
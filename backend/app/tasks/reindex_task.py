@@ -73,9 +73,12 @@ def _extract_file_metadata(db: Any, media_file: Any) -> dict[str, Any] | None:
         Dict with segments, title, speakers, tags, and other metadata,
         or None if the file has no segments.
     """
+    from sqlalchemy.orm import undefer
+
     from app.models.media import Speaker
     from app.models.media import TranscriptSegment
     from app.services.permission_service import PermissionService
+    from app.utils.word_timings import segment_words
 
     file_id = int(media_file.id)
     file_uuid = str(media_file.uuid)
@@ -83,6 +86,10 @@ def _extract_file_metadata(db: Any, media_file: Any) -> dict[str, Any] | None:
     # Load transcript segments
     segments = (
         db.query(TranscriptSegment)
+        .options(
+            undefer(TranscriptSegment.word_timings),  # type: ignore[arg-type]
+            undefer(TranscriptSegment.words),  # type: ignore[arg-type]
+        )
         .filter(TranscriptSegment.media_file_id == file_id)
         .order_by(TranscriptSegment.start_time)
         .all()
@@ -113,8 +120,9 @@ def _extract_file_metadata(db: Any, media_file: Any) -> dict[str, Any] | None:
             "text": seg.text or "",
             "speaker": speaker_name,
         }
-        if seg.words:
-            seg_dict["words"] = seg.words  # Already a list of dicts from JSONB
+        words = segment_words(seg)
+        if words:
+            seg_dict["words"] = words
         segment_dicts.append(seg_dict)
 
     # Get unique speaker names
@@ -132,8 +140,8 @@ def _extract_file_metadata(db: Any, media_file: Any) -> dict[str, Any] | None:
     if hasattr(media_file, "collection_memberships") and media_file.collection_memberships:
         collection_id_list = [int(cm.collection_id) for cm in media_file.collection_memberships]
 
-    # Compute full access list (owner + shared users/groups) so reindex
-    # preserves share grants instead of resetting to owner-only
+    # Users who can see this file, so their cached searches are invalidated
+    # once the new chunks land (access itself comes from collection_ids)
     accessible_user_ids = PermissionService.get_users_with_file_access(db, file_id)
 
     return {
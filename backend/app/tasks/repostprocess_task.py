@@ -0,0 +1,113 @@
+"""Celery task for re-postprocessing without re-running inference.
+
+Rebuilds a file's transcript from the raw Whisper and PyAnnote outputs kept
+by the transcription pipeline, applying new post-processing settings: dedup
+threshold, sentence splitting, speaker-count constraints resolved on the
+existing speaker embeddings, and segment resegmentation/merging. The result
+is saved and finalized exactly like a fresh transcription.
+
+Runs on the CPU queue (no models are loaded).
+"""
+
+import logging
+
+from app.core.celery import celery_app
+from app.core.constants import CPUPriority
+from app.db.session_utils import session_scope
+from app.models.media import FileStatus
+from app.services.minio_service import download_raw_outputs
+from app.utils.task_utils import create_task_record
+from app.utils.task_utils import update_media_file_status
+from app.utils.task_utils import update_task_status
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="repostprocess", priority=CPUPriority.USER_TRIGGERED)
+def repostprocess_task(
+    self,
+    file_uuid: str,
+    options: dict | None = None,
+    downstream_tasks: list[str] | None = None,
+):
+    """Re-run post-processing on a file's kept raw model outputs.
+
+    Args:
+        file_uuid: UUID of the MediaFile to re-postprocess.
+        options: ``PostprocessOptions`` fields to override; unset fields keep
+            the pipeline defaults.
+        downstream_tasks: Optional list of downstream stage names to run
+            after the transcript is saved. Analytics always re-runs because
+            segments change.
+    """
+    from app.tasks.transcription.core import TranscriptionContext
+    from app.tasks.transcription.core import _process_and_save_critical
+    from app.tasks.transcription.notifications import send_progress_notification
+    from app.tasks.transcription.postprocess import finalize_transcription
+    from app.transcription.raw_outputs import RawOutputs
+    from app.transcription.reprocess import PostprocessOptions
+    from app.transcription.reprocess import repostprocess
+    from app.utils.uuid_helpers import get_file_by_uuid
+
+    task_id = self.request.id
+
+    try:
+        with session_scope() as db:
+            media_file = get_file_by_uuid(db, file_uuid)
+            ctx = TranscriptionContext(
+                task_id=task_id,
+                file_id=int(media_file.id),
+                file_uuid=file_uuid,
+                user_id=int(media_file.user_id),
+                file_path=str(media_file.storage_path),
+                file_name=str(media_file.filename),
+                content_type=str(media_file.content_type),
+            )
+            create_task_record(db, task_id, ctx.user_id, ctx.file_id, "repostprocess")
+            update_task_status(db, task_id, "in_progress", progress=0.05)
+            update_media_file_status(db, ctx.file_id, FileStatus.PROCESSING)
+
+        logger.info(f"Starting re-postprocessing for file {file_uuid} (id={ctx.file_id})")
+        send_progress_notification(ctx.user_id, ctx.file_id, 0.05, "Loading saved model outputs")
+
+        data = download_raw_outputs(ctx.user_id, ctx.file_id)
+        if data is None:
+            raise ValueError(f"No raw model outputs kept for file {ctx.file_id}")
+        raw = RawOutputs.from_bytes(data)
+
+        postprocess_options = PostprocessOptions.from_dict(options)
+        send_progress_notification(ctx.user_id, ctx.file_id, 0.3, "Re-running post-processing")
+        result = repostprocess(raw, postprocess_options)
+        result["asr_provider"] = "local"
+        result.setdefault("diarization_disabled", False)
+
+        downstream = sorted(set(downstream_tasks or []) | {"analytics"})
+        chain_context = _process_and_save_critical(
+            ctx,
+            result,
+            {"downstream_tasks": downstream},
+            postprocess_options=postprocess_options,
+        )
+
+        # Same speaker matching, completion and enrichment as a transcription,
+        # run inline since we are already on the CPU queue
+        return finalize_transcription(chain_context)
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Re-postprocessing failed for file {file_uuid}: {error_msg}")
+
+        try:
+            with session_scope() as db:
+                update_task_status(db, task_id, "failed", error_message=error_msg, completed=True)
+                media_file = get_file_by_uuid(db, file_uuid)
+                update_media_file_status(db, int(media_file.id), FileStatus.ERROR)
+                media_file.last_error_message = error_msg
+                from app.utils.error_classification import categorize_error
+
+                media_file.error_category = categorize_error(error_msg).value
+                db.commit()
+        except Exception as update_err:
+            logger.error(f"Error updating status after re-postprocess failure: {update_err}")
+
+        return {"status": "error", "message": error_msg}
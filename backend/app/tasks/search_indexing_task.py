@@ -228,6 +228,10 @@ def index_transcript_search_task(  # noqa: C901
         return {"status": "failed", "file_id": file_id, "error": str(exc)}
 
 
+# Files per update_by_query when refreshing access tokens
+_ACCESS_UPDATE_BATCH = 500
+
+
 @celery_app.task(
     name="update_file_access_index",
     priority=UtilityPriority.ROUTINE,
@@ -235,15 +239,17 @@ def index_transcript_search_task(  # noqa: C901
     default_retry_delay=10,
 )
 def update_file_access_index(file_ids: list[int]) -> dict[str, Any]:
-    """Reindex accessible_user_ids for specified files.
+    """Refresh ``collection_ids`` and ``access_principals`` on files' chunks.
 
-    Called when:
-    - Collection share is created/updated/revoked
-    - Group membership changes
-    - File is added to/removed from a collection
+    Called when files are added to or removed from a collection, and to
+    backfill chunks indexed before access principals existed. Sharing and
+    group membership changes do NOT call this for backfilled chunks: they
+    only change which collection tokens a user matches (see
+    ``PermissionService``). Revocations rewrite legacy chunks through
+    ``revoke_legacy_file_access``.
 
-    Computes the full set of user IDs with access to each file and
-    performs a bulk partial update on the OpenSearch index.
+    Files are updated in batches with one update-by-query each, the new
+    tokens passed as a per-file script parameter.
 
     Args:
         file_ids: List of media file integer IDs to update.
@@ -253,8 +259,14 @@ def update_file_access_index(file_ids: list[int]) -> dict[str, Any]:
     """
     from app.core.config import settings
     from app.db.session_utils import session_scope
+    from app.models.media import MediaFile
     from app.services.opensearch_service import get_opensearch_client
     from app.services.permission_service import PermissionService
+    from app.services.permission_service import file_access_principals
+    from app.services.redis_cache_service import redis_cache
+    from app.services.search.indexing_service import ensure_chunks_index_exists
+    from app.services.search.indexing_service import get_indexed_accessible_user_ids
+    from app.services.search.suggestion_index import suggestion_index
 
     if not file_ids:
         return {"status": "skipped", "reason": "no_file_ids"}
@@ -263,52 +275,212 @@ def update_file_access_index(file_ids: list[int]) -> dict[str, Any]:
     if not client:
         logger.warning("OpenSearch client not available, skipping access index update")
         return {"status": "skipped", "reason": "no_opensearch"}
+    ensure_chunks_index_exists()
 
     index_name = settings.OPENSEARCH_CHUNKS_INDEX
+    unique_ids = list(dict.fromkeys(int(fid) for fid in file_ids))
     updated = 0
     errors = 0
+    # Users who lose access need their cached searches dropped as well as
+    # those who gain it, so start from the access currently indexed.
+    affected_user_ids = get_indexed_accessible_user_ids({"terms": {"file_id": unique_ids}})
 
-    for file_id in file_ids:
+    for start in range(0, len(unique_ids), _ACCESS_UPDATE_BATCH):
+        batch = unique_ids[start : start + _ACCESS_UPDATE_BATCH]
         try:
-            # Compute all user IDs with access to this file
             with session_scope() as db:
-                accessible_ids = PermissionService.get_users_with_file_access(db, file_id)
+                rows = (
+                    db.query(MediaFile.id, MediaFile.uuid, MediaFile.user_id)
+                    .filter(MediaFile.id.in_(batch))
+                    .all()
+                )
+                owners = {fid: owner_id for fid, _, owner_id in rows}
+                uuids = {str(fid): str(file_uuid) for fid, file_uuid, _ in rows}
+                collections = PermissionService.get_file_collection_ids(db, list(owners))
+                by_file = {
+                    str(fid): {
+                        "collections": sorted(collections[fid]),
+                        "principals": file_access_principals(owner_id, collections[fid]),
+                    }
+                    for fid, owner_id in owners.items()
+                }
+                new_principals = {p for entry in by_file.values() for p in entry["principals"]}
+                affected_user_ids |= PermissionService.get_users_for_principals(db, new_principals)
 
-            if not accessible_ids:
-                logger.debug(f"No accessible users found for file {file_id}, skipping")
+            if not by_file:
                 continue
 
-            # Build bulk update-by-query to set accessible_user_ids on all chunks
             response = client.update_by_query(
                 index=index_name,
                 body={
-                    "query": {"term": {"file_id": file_id}},
+                    "query": {"terms": {"file_id": [int(fid) for fid in by_file]}},
                     "script": {
-                        "source": "ctx._source.accessible_user_ids = params.ids",
+                        "source": (
+                            "def entry = params.by_file[String.valueOf(ctx._source.file_id)];"
+                            "if (entry == null) { ctx.op = 'noop'; return; }"
+                            "ctx._source.collection_ids = entry.collections;"
+                            "ctx._source.access_principals = entry.principals;"
+                            "ctx._source.remove('accessible_user_ids');"
+                        ),
                         "lang": "painless",
-                        "params": {"ids": accessible_ids},
+                        "params": {"by_file": by_file},
                     },
                 },
                 refresh=True,
                 conflicts="proceed",
             )
-
-            file_updated = response.get("updated", 0)
-            updated += file_updated
+            updated += response.get("updated", 0)
+            for fid, entry in by_file.items():
+                suggestion_index.set_principals(uuids[fid], entry["principals"])
             logger.debug(
-                f"Updated accessible_user_ids for file {file_id}: "
-                f"{file_updated} chunks, {len(accessible_ids)} users"
+                f"Updated access principals for {len(by_file)} files: "
+                f"{response.get('updated', 0)} chunks"
             )
 
         except Exception as e:
             errors += 1
-            logger.error(f"Failed to update access index for file {file_id}: {e}")
+            logger.error(f"Failed to update access index for files {batch[:5]}...: {e}")
+
+    redis_cache.bump_search_generation(affected_user_ids)
 
     logger.info(
         f"Access index update complete: {updated} chunks updated across "
-        f"{len(file_ids)} files, {errors} errors"
+        f"{len(unique_ids)} files, {errors} errors"
     )
-    return {"status": "success", "updated": updated, "files": len(file_ids), "errors": errors}
+    return {"status": "success", "updated": updated, "files": len(unique_ids), "errors": errors}
+
+
+# Files loaded per database round trip when rebuilding search suggestions
+_SUGGESTION_REBUILD_BATCH = 200
+
+
+@celery_app.task(name="revoke_legacy_file_access", priority=UtilityPriority.ROUTINE)
+def revoke_legacy_file_access(file_ids: list[int]) -> dict[str, Any]:
+    """Rewrite legacy chunks of files whose sharing was just revoked.
+
+    Chunks indexed before access principals existed are matched on their
+    stored ``accessible_user_ids``, which still list users who lost access
+    through a share or group change. Those files get their access tokens
+    now rather than at the next search maintenance backfill; backfilled
+    chunks need no rewrite.
+
+    Args:
+        file_ids: Files in the collections whose sharing changed.
+    """
+    from app.services.search.indexing_service import get_files_missing_principals
+
+    legacy = get_files_missing_principals([int(fid) for fid in file_ids])
+    if not legacy:
+        return {"status": "skipped", "reason": "no_legacy_chunks"}
+    logger.info(f"Rewriting legacy access on {len(legacy)} files after a revocation")
+    result: dict[str, Any] = update_file_access_index(legacy)
+    return result
+
+
+@celery_app.task(name="rebuild_search_suggestions", priority=UtilityPriority.BACKGROUND)
+def rebuild_search_suggestions() -> dict[str, Any]:
+    """Fill the search suggestion index from PostgreSQL.
+
+    Run once by search maintenance while the index is not ready; after that
+    indexing and metadata edits keep it current. Files are synced by diff,
+    so entries written by concurrent indexing are not counted twice.
+
+    Returns:
+        Dict with rebuild stats.
+    """
+    from collections import defaultdict
+
+    from sqlalchemy import exists
+    from sqlalchemy import select
+
+    from app.core.redis import get_redis
+    from app.db.session_utils import session_scope
+    from app.models.media import FileStatus
+    from app.models.media import FileTag
+    from app.models.media import MediaFile
+    from app.models.media import Speaker
+    from app.models.media import Tag
+    from app.models.media import TranscriptSegment
+    from app.services.permission_service import PermissionService
+    from app.services.permission_service import file_access_principals
+    from app.services.search.suggestion_index import frequent_terms
+    from app.services.search.suggestion_index import suggestion_index
+
+    r = get_redis()
+    if not r.set("suggestion_rebuild_lock", "1", nx=True, ex=3600):
+        return {"status": "already_running"}
+
+    synced = 0
+    try:
+        with session_scope() as db:
+            has_segments = exists(
+                select(TranscriptSegment.id).where(TranscriptSegment.media_file_id == MediaFile.id)
+            )
+            file_ids = [
+                fid
+                for (fid,) in db.query(MediaFile.id)
+                .filter(MediaFile.status == FileStatus.COMPLETED, has_segments)
+                .order_by(MediaFile.id)
+                .all()
+            ]
+
+        for start in range(0, len(file_ids), _SUGGESTION_REBUILD_BATCH):
+            batch = file_ids[start : start + _SUGGESTION_REBUILD_BATCH]
+            with session_scope() as db:
+                files = (
+                    db.query(
+                        MediaFile.id,
+                        MediaFile.uuid,
+                        MediaFile.user_id,
+                        MediaFile.title,
+                        MediaFile.filename,
+                    )
+                    .filter(MediaFile.id.in_(batch))
+                    .all()
+                )
+                collections = PermissionService.get_file_collection_ids(db, batch)
+                tags: dict[int, list[str]] = defaultdict(list)
+                for fid, name in (
+                    db.query(FileTag.media_file_id, Tag.name)
+                    .join(Tag, Tag.id == FileTag.tag_id)
+                    .filter(FileTag.media_file_id.in_(batch))
+                ):
+                    tags[fid].append(name)
+                texts: dict[int, list[str]] = defaultdict(list)
+                speakers: dict[int, set[str]] = defaultdict(set)
+                for fid, text, display_name, name in (
+                    db.query(
+                        TranscriptSegment.media_file_id,
+                        TranscriptSegment.text,
+                        Speaker.display_name,
+                        Speaker.name,
+                    )
+                    .outerjoin(Speaker, Speaker.id == TranscriptSegment.speaker_id)
+                    .filter(TranscriptSegment.media_file_id.in_(batch))
+                ):
+                    texts[fid].append(text or "")
+                    if display_name or name:
+                        speakers[fid].add(display_name or name)
+
+            for fid, file_uuid, owner_id, title, filename in files:
+                suggestion_index.sync_file(
+                    str(file_uuid),
+                    file_access_principals(owner_id, collections[fid]),
+                    title=title or filename or f"File {fid}",
+                    speakers=speakers[fid],
+                    tags=tags[fid],
+                    terms=frequent_terms(texts[fid]),
+                )
+                synced += 1
+
+        suggestion_index.mark_ready()
+        logger.info(f"Search suggestion index rebuilt from {synced} files")
+        return {"status": "success", "files": synced}
+    except Exception as e:
+        logger.error(f"Search suggestion rebuild failed after {synced} files: {e}")
+        return {"status": "failed", "files": synced, "error": str(e)}
+    finally:
+        r.delete("suggestion_rebuild_lock")
 
 
 def _send_indexing_notification(user_id: int, file_id: int, timing: dict[str, Any]) -> None:
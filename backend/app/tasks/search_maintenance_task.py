@@ -153,9 +153,33 @@ def _run_search_maintenance() -> dict[str, Any]:
         "indexed_files": 0,
         "unindexed_files": 0,
         "reindex_triggered": False,
+        "access_backfill_files": 0,
+        "suggestion_rebuild_triggered": False,
     }
 
     try:
+        # Chunks indexed before access principals existed are still matched via
+        # their legacy user list; rewrite them so sharing changes apply to them.
+        from app.services.search.indexing_service import get_files_missing_principals
+
+        missing_principals = get_files_missing_principals()
+        if missing_principals:
+            from app.tasks.search_indexing_task import update_file_access_index
+
+            update_file_access_index.delay(missing_principals)
+            stats["access_backfill_files"] = len(missing_principals)
+            logger.info(f"Dispatched access principal backfill for {len(missing_principals)} files")
+
+        # The suggestion index is kept current by every write once it has
+        # been filled; fill it once from PostgreSQL.
+        from app.services.search.suggestion_index import suggestion_index
+
+        if settings.SEARCH_SUGGESTION_INDEX_ENABLED and not suggestion_index.is_ready():
+            from app.tasks.search_indexing_task import rebuild_search_suggestions
+
+            rebuild_search_suggestions.delay()
+            stats["suggestion_rebuild_triggered"] = True
+
         # Don't dispatch reindex if one is already running
         if _is_reindex_running():
             logger.info("Reindex already in progress, skipping maintenance dispatch")
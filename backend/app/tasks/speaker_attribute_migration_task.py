@@ -121,20 +121,12 @@ def _gender_result_writer(
     from datetime import timezone
 
     from app.models.media import Speaker
+    from app.services.speaker_attribute_service import aggregate_by_speaker
 
-    gender_results = results_by_model.get("gender", [])
-
-    # Gather per-speaker results
-    speaker_probs: dict[int, dict[str, float]] = {}
-    speaker_clip_counts: dict[int, int] = {}
-
-    for sr in gender_results:
-        gender, confidence = sr.value  # tuple[str, float]
-        if sr.speaker_id not in speaker_probs:
-            speaker_probs[sr.speaker_id] = {"male": 0.0, "female": 0.0}
-            speaker_clip_counts[sr.speaker_id] = 0
-        speaker_probs[sr.speaker_id][gender] += confidence
-        speaker_clip_counts[sr.speaker_id] += 1
+    # value is a (gender, confidence) tuple per clip
+    speaker_genders = aggregate_by_speaker(
+        (sr.speaker_id, sr.value) for sr in results_by_model.get("gender", [])
+    )
 
     # Write to DB — mark ALL speakers as attempted
     now = datetime.now(timezone.utc)
@@ -145,11 +137,9 @@ def _gender_result_writer(
         speaker_by_id = {int(s.id): s for s in speakers}
 
         for sid, speaker_obj in speaker_by_id.items():
-            probs = speaker_probs.get(sid)
-            if probs:
-                clips = speaker_clip_counts[sid]
-                final_gender = max(probs, key=lambda k: probs[k])
-                final_conf = probs[final_gender] / clips
+            prediction = speaker_genders.get(sid)
+            if prediction:
+                final_gender, final_conf = prediction
 
                 speaker_obj.predicted_gender = final_gender
                 speaker_obj.predicted_age_range = None
@@ -6,7 +6,7 @@ Non-critical: failure does not affect transcription status.
 
 Uses presigned URL + ffmpeg segment seeking instead of downloading
 entire files from MinIO. Segments are fetched in parallel via a thread
-pool for better throughput.
+pool, then classified together in length-bucketed batches.
 """
 
 import datetime
@@ -75,8 +75,7 @@ def _dispatch_llm_speaker_identification(file_uuid: str) -> None:
 
 def _store_gender_results(
     speakers,
-    speaker_probs: dict[int, dict[str, float]],
-    speaker_clip_counts: dict[int, int],
+    speaker_genders: dict[int, tuple[str, float]],
 ) -> int:
     """Store gender inference results on speaker objects and mark unattempted speakers.
 
@@ -86,13 +85,10 @@ def _store_gender_results(
     updated_count = 0
     speaker_by_id = {int(s.id): s for s in speakers}
 
-    for sid, probs in speaker_probs.items():
+    for sid, (final_gender, final_conf) in speaker_genders.items():
         speaker_obj = speaker_by_id.get(sid)
         if not speaker_obj:
             continue
-        clips = speaker_clip_counts[sid]
-        final_gender = max(probs, key=lambda k: probs[k])
-        final_conf = probs[final_gender] / clips
 
         speaker_obj.predicted_gender = final_gender
         speaker_obj.predicted_age_range = None
@@ -113,14 +109,15 @@ def _run_gender_inference_parallel(
     audio_source: str,
     work_items: list[tuple[int, dict]],
     service,
-) -> tuple[dict[int, dict[str, float]], dict[int, int]]:
+) -> dict[int, tuple[str, float]]:
     """Run gender inference on segments fetched in parallel.
 
-    Returns (speaker_probs, speaker_clip_counts) dicts.
+    All clips are classified in one ``predict_batch`` call after the
+    fetches finish. Returns {speaker_id: (gender, confidence)}.
     """
-    speaker_probs: dict[int, dict[str, float]] = {}
-    speaker_clip_counts: dict[int, int] = {}
+    from app.services.speaker_attribute_service import aggregate_by_speaker
 
+    clips = []
     with ThreadPoolExecutor(max_workers=8, thread_name_prefix="attr-ffmpeg") as pool:
         futures = []
         for speaker_id, seg in work_items:
@@ -137,16 +134,14 @@ def _run_gender_inference_parallel(
 
             if audio_np is None or len(audio_np) < 16000:
                 continue
+            clips.append((speaker_id, audio_np))
 
-            gender, confidence = service._run_inference(audio_np)
-
-            if speaker_id not in speaker_probs:
-                speaker_probs[speaker_id] = {"male": 0.0, "female": 0.0}
-                speaker_clip_counts[speaker_id] = 0
-            speaker_probs[speaker_id][gender] += confidence
-            speaker_clip_counts[speaker_id] += 1
-
-    return speaker_probs, speaker_clip_counts
+    predictions = service.predict_batch([audio_np for _, audio_np in clips])
+    return aggregate_by_speaker(
+        (speaker_id, prediction)
+        for (speaker_id, _), prediction in zip(clips, predictions)
+        if prediction is not None
+    )
 
 
 @celery_app.task(
@@ -233,13 +228,13 @@ def detect_speaker_attributes_task(self, file_uuid: str, user_id: int):
             service = get_cached_attribute_service()
             service.load_models()
 
-            speaker_probs, speaker_clip_counts = _run_gender_inference_parallel(
+            speaker_genders = _run_gender_inference_parallel(
                 audio_source,
                 work_items,
                 service,
             )
 
-            updated_count = _store_gender_results(speakers, speaker_probs, speaker_clip_counts)
+            updated_count = _store_gender_results(speakers, speaker_genders)
             db.commit()
 
             logger.info(
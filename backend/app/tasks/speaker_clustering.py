@@ -132,8 +132,10 @@ def cluster_speakers_for_file(self, file_uuid: str, user_id: int):
     acks_late=True,
     reject_on_worker_lost=True,
 )
-def recluster_all_speakers(self, user_id: int, threshold: float | None = None):
-    """Full re-clustering of all speakers for a user.
+def recluster_all_speakers(
+    self, user_id: int, threshold: float | None = None, incremental: bool = False
+):
+    """Full (or incremental) re-clustering of speakers for a user.
 
     Triggered manually from the UI. Uses a per-user Redis lock to prevent
     concurrent re-clustering runs.
@@ -141,6 +143,7 @@ def recluster_all_speakers(self, user_id: int, threshold: float | None = None):
     Args:
         user_id: Owner user ID.
         threshold: Optional clustering threshold override.
+        incremental: Only cluster speakers added since the last run.
     """
     from app.utils.task_lock import task_lock_manager
 
@@ -179,7 +182,10 @@ def recluster_all_speakers(self, user_id: int, threshold: float | None = None):
                 if threshold is not None:
                     kwargs["threshold"] = threshold
 
-                result = service.batch_recluster(user_id, **kwargs)
+                if incremental:
+                    result = service.incremental_recluster(user_id, **kwargs)
+                else:
+                    result = service.batch_recluster(user_id, **kwargs)
 
                 clustering_tracker.complete(message="Clustering complete")
 
@@ -8,6 +8,8 @@ Architecture:
   GPU batch tasks only when gaps are found.
 - GPU batch worker: reuses migration_pipeline for I/O-pipelined extraction.
 - Periodic beat schedule: runs every 10 minutes for fast gap detection.
+- Each run also reconciles this host's local speaker embedding store
+  (see speaker_embedding_store) against per-user OpenSearch counts.
 
 Redis keys:
 - embedding_consistency_running      — lock (1hr TTL)
@@ -100,6 +102,28 @@ def _get_opensearch_speaker_uuids(index_name: str) -> set[str] | None:
         return None
 
 
+def _reconcile_embedding_store() -> int:
+    """Invalidate local embedding store copies that drifted from OpenSearch.
+
+    Returns:
+        Number of users whose copies were invalidated
+    """
+    from app.services.opensearch_service import count_speaker_embeddings_by_user
+    from app.services.speaker_embedding_store import speaker_embedding_store
+
+    counts = count_speaker_embeddings_by_user()
+    if counts is None:
+        return 0
+    try:
+        drifted = speaker_embedding_store.reconcile(counts)
+    except Exception as e:
+        logger.warning("Speaker embedding store reconcile failed: %s", e)
+        return 0
+    if drifted:
+        logger.info("Invalidated speaker embedding store for %d users", len(drifted))
+    return len(drifted)
+
+
 def _filter_unrepairable_speakers(missing_uuids: set[str]) -> set[str]:
     """Identify speakers whose segments are too short to ever extract embeddings.
 
@@ -395,6 +419,9 @@ def speaker_embedding_consistency_check_task(
                 len(orphan_uuids),
             )
 
+        # Phase 1c: Local embedding mirrors follow OpenSearch after the cleanup
+        _reconcile_embedding_store()
+
         total_missing = len(missing_v3) + len(missing_v4)
 
         if total_missing == 0:
@@ -16,6 +16,7 @@ from app.db.session_utils import session_scope
 from app.models.media import MediaFile
 from app.models.media import Speaker
 from app.models.media import TranscriptSegment
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils import benchmark_timing
 
 logger = logging.getLogger(__name__)
@@ -176,6 +177,8 @@ def extract_speaker_embeddings_task(
                     embedding_service.cleanup()
                     hardware_config.optimize_memory_usage()
 
+            SpeakerSummaryService.refresh_file_summaries(db, file_id)
+
             update_task_status(db, task_id, "completed", progress=1.0, completed=True)
 
             # Also mark the parent transcription task as completed if it was
@@ -24,6 +24,7 @@ from app.services.llm_service import LLMService
 from app.services.metadata_speaker_extractor import MetadataSpeakerExtractor
 from app.services.metadata_speaker_extractor import build_cross_reference_context
 from app.services.metadata_speaker_extractor import cross_reference_attributes
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils.transcript_builders import build_full_transcript
 from app.utils.transcript_builders import build_speaker_segments
 from app.utils.user_settings_helpers import get_user_llm_output_language
@@ -356,6 +357,8 @@ def identify_speakers_llm_task(self, file_uuid: str):
                 metadata_context,
             )
 
+            SpeakerSummaryService.refresh_file_summaries(db, file_id)
+
             update_task_status(db, task_id, "completed", progress=1.0, completed=True)
 
             # Notify enrichment tracker
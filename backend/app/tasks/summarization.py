@@ -6,13 +6,17 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app.core.celery import celery_app
+from app.core.config import settings
 from app.core.constants import NLPPriority
 from app.db.session_utils import session_scope
 from app.models.media import MediaFile
 from app.models.media import TranscriptSegment
 from app.services.llm_service import LLMService
 from app.services.opensearch_summary_service import OpenSearchSummaryService
+from app.services.summary_progress import SummaryProgress
+from app.utils.transcript_builders import build_full_transcript
 from app.utils.transcript_builders import build_transcript_and_stats
+from app.utils.transcript_builders import get_speaker_name
 from app.utils.user_settings_helpers import get_user_llm_output_language
 
 # Setup logging
@@ -241,11 +245,18 @@ def send_summary_notification(
     progress: int = 0,
     summary_data: dict[str, Any] | str | None = None,
     summary_opensearch_id: str | None = None,
+    partial: dict[str, Any] | None = None,
 ) -> bool:
-    """Send summary status notification via WebSocket."""
+    """Send summary status notification via WebSocket.
+
+    ``partial`` carries output that arrived before completion: the streamed
+    summary text so far, or a finished section of a multi-section summary.
+    """
     from app.services.notification_service import send_task_notification
 
     extra: dict[str, Any] = {}
+    if status == "processing" and partial:
+        extra["partial"] = partial
     if status == "completed" and summary_data:
         extra["summary"] = summary_data
     if status == "completed" and summary_opensearch_id:
@@ -350,6 +361,38 @@ def _get_organization_context(db: Session, user_id: int) -> str:
     return context_text
 
 
+def _generate_combined_enrichment(
+    llm_service: LLMService,
+    media_file: MediaFile,
+    transcript_segments: list[TranscriptSegment],
+    speaker_stats: dict[str, Any],
+    output_language: str,
+    organization_context: str,
+    prompt_uuid: str | None,
+    db: Session,
+) -> dict[str, Any] | None:
+    """Run summary, topics and speaker ID as one request; None means summarize alone."""
+    from app.tasks.speaker_identification_task import _build_metadata_context
+    from app.tasks.speaker_identification_task import _get_known_speakers
+
+    speaker_names: dict[str, str] = {}
+    for segment in transcript_segments:
+        if segment.speaker and str(segment.speaker.name) not in speaker_names:
+            speaker_names[str(segment.speaker.name)] = get_speaker_name(segment)
+
+    return llm_service.generate_combined_enrichment(
+        transcript=build_full_transcript(transcript_segments),
+        speaker_data=speaker_stats,
+        speaker_names=speaker_names,
+        known_speakers=_get_known_speakers(db, int(media_file.user_id)),
+        metadata_context=_build_metadata_context(media_file),
+        user_id=int(media_file.user_id),
+        output_language=output_language,
+        organization_context=organization_context,
+        prompt_uuid=prompt_uuid,
+    )
+
+
 def _generate_llm_summary(
     media_file: MediaFile,
     file_id: int,
@@ -358,6 +401,7 @@ def _generate_llm_summary(
     task_id: str,
     db: Session,
     prompt_uuid: str | None = None,
+    transcript_segments: list[TranscriptSegment] | None = None,
 ) -> dict[str, Any] | None:
     """Generate LLM summary and return summary data."""
     start_time = time.time()
@@ -402,14 +446,35 @@ def _generate_llm_summary(
     logger.info(f"User context window: {llm_service.user_context_window} tokens")
 
     try:
-        summary_data = llm_service.generate_summary(
-            transcript=full_transcript,
-            speaker_data=speaker_stats,
-            user_id=int(media_file.user_id),
-            output_language=output_language,
-            organization_context=organization_context,
-            prompt_uuid=prompt_uuid,
-        )
+        summary_data = None
+        if settings.LLM_COMBINED_ENRICHMENT and transcript_segments and media_file.user_id:
+            summary_data = _generate_combined_enrichment(
+                llm_service,
+                media_file,
+                transcript_segments,
+                speaker_stats,
+                output_language,
+                organization_context,
+                prompt_uuid,
+                db,
+            )
+        if summary_data is None:
+            user_id = int(media_file.user_id)
+            progress = SummaryProgress(
+                file_id,
+                lambda message, percent, partial: send_summary_notification(
+                    user_id, file_id, "processing", message, percent, partial=partial
+                ),
+            )
+            summary_data = llm_service.generate_summary(
+                transcript=full_transcript,
+                speaker_data=speaker_stats,
+                user_id=user_id,
+                output_language=output_language,
+                organization_context=organization_context,
+                prompt_uuid=prompt_uuid,
+                progress=progress,
+            )
     except Exception as e:
         _handle_llm_error(e, media_file, file_id, full_transcript, llm_provider, llm_model, db)
         return None  # This line won't be reached due to the raise in _handle_llm_error, but satisfies type checker
@@ -467,6 +532,7 @@ def summarize_transcript_task(
     file_uuid: str,
     force_regenerate: bool = False,
     prompt_uuid: str | None = None,
+    extract_topics_after: bool = False,
 ):
     """
     Generate a comprehensive summary of a transcript using LLM with structured BLUF format
@@ -477,6 +543,9 @@ def summarize_transcript_task(
     Args:
         file_uuid: UUID of the MediaFile to summarize
         force_regenerate: If True, clear existing summaries before regenerating
+        extract_topics_after: Start topic extraction once this task ends, whether
+            or not the summary succeeded. Set for automatic runs in combined
+            enrichment mode, so topic extraction finds the topics part.
     """
     from app.utils.task_utils import create_task_record
     from app.utils.task_utils import update_task_status
@@ -547,7 +616,14 @@ def summarize_transcript_task(
 
             start_time = time.time()
             summary_data = _generate_llm_summary(
-                media_file, file_id, full_transcript, speaker_stats, task_id, db, prompt_uuid
+                media_file,
+                file_id,
+                full_transcript,
+                speaker_stats,
+                task_id,
+                db,
+                prompt_uuid,
+                transcript_segments,
             )
 
             if summary_data is None:
@@ -592,3 +668,17 @@ def summarize_transcript_task(
             return _handle_task_error(
                 e, media_file, file_id if file_id is not None else 0, task_id, db
             )
+        finally:
+            if extract_topics_after:
+                _dispatch_topic_extraction(file_uuid)
+
+
+def _dispatch_topic_extraction(file_uuid: str) -> None:
+    """Start topic extraction after a combined enrichment summary task."""
+    try:
+        from app.tasks.topic_extraction import extract_topics_task
+
+        topic_task = extract_topics_task.delay(file_uuid=file_uuid, force_regenerate=False)
+        logger.info(f"Topic extraction task {topic_task.id} started after summary for {file_uuid}")
+    except Exception as e:
+        logger.warning(f"Failed to start topic extraction for {file_uuid}: {e}")
@@ -12,12 +12,19 @@ from app.core.celery import celery_app
 from app.core.constants import CPUPriority
 from app.db.session_utils import session_scope
 from app.models.media import MediaFile
+from app.services.artifact_cache_service import fetch_bytes
+from app.services.artifact_cache_service import source_for_file
+from app.services.artifact_cache_service import store_bytes
+from app.services.artifact_cache_service import thumbnail_fingerprint
 from app.services.minio_service import MinIOService
 from app.services.minio_service import upload_file
 from app.utils.thumbnail import generate_thumbnail_from_url
 
 logger = logging.getLogger(__name__)
 
+# Seconds into the video the thumbnail frame is taken from
+_THUMBNAIL_TIMESTAMP = 1.0
+
 
 @celery_app.task(name="generate_thumbnail", bind=True, priority=CPUPriority.PIPELINE_CRITICAL)
 def generate_thumbnail_task(self, file_id: int, user_id: int, storage_path: str) -> dict:
@@ -43,38 +50,63 @@ def generate_thumbnail_task(self, file_id: int, user_id: int, storage_path: str)
 
         logger.info(f"Starting thumbnail generation for file {file_id}")
 
-        # Get presigned URL for video access (includes auth credentials)
-        try:
-            # MinIO client is configured with MINIO_HOST (default: "minio" in Docker).
-            # The presigned URL will use that hostname, which is correct for
-            # container-to-container access (FFmpeg runs in the same container).
-            presigned_url = MinIOService().client.presigned_get_object(
-                bucket_name=settings.MEDIA_BUCKET_NAME,
-                object_name=storage_path,
-                expires=timedelta(seconds=300),  # 5 minutes
-            )
-
-            logger.debug(
-                f"Generated presigned URL for thumbnail generation (host: {settings.MINIO_HOST})"
-            )
+        # Same content thumbnailed before: skip FFmpeg
+        artifact_source = source_for_file(file_id)
+        thumbnail_fp = thumbnail_fingerprint(_THUMBNAIL_TIMESTAMP)
+        cached_bytes = (
+            fetch_bytes(artifact_source, "thumbnail", thumbnail_fp, "webp")
+            if artifact_source
+            else None
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to get presigned URL for file {file_id}: {e}")
-            result["error"] = f"Presigned URL generation failed: {str(e)}"
-            return result
+        # Get presigned URL for video access (includes auth credentials)
+        presigned_url = ""
+        if cached_bytes is None:
+            try:
+                # MinIO client is configured with MINIO_HOST (default: "minio" in Docker).
+                # The presigned URL will use that hostname, which is correct for
+                # container-to-container access (FFmpeg runs in the same container).
+                presigned_url = MinIOService().client.presigned_get_object(
+                    bucket_name=settings.MEDIA_BUCKET_NAME,
+                    object_name=storage_path,
+                    expires=timedelta(seconds=300),  # 5 minutes
+                )
+
+                logger.debug(
+                    f"Generated presigned URL for thumbnail generation (host: {settings.MINIO_HOST})"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to get presigned URL for file {file_id}: {e}")
+                result["error"] = f"Presigned URL generation failed: {str(e)}"
+                return result
 
         # Generate thumbnail using ffmpeg with range request support
         try:
-            thumbnail_bytes = generate_thumbnail_from_url(
-                presigned_url=presigned_url,
-                timestamp=1.0,
-            )
+            if cached_bytes is not None:
+                logger.info(f"Thumbnail for file {file_id} served from artifact cache")
+                thumbnail_bytes = cached_bytes
+            else:
+                thumbnail_bytes = generate_thumbnail_from_url(
+                    presigned_url=presigned_url,
+                    timestamp=_THUMBNAIL_TIMESTAMP,
+                )
 
             if not thumbnail_bytes:
                 logger.warning(f"Thumbnail generation returned no data for file {file_id}")
                 result["error"] = "Thumbnail generation returned no data"
                 return result
 
+            if artifact_source is not None and cached_bytes is None:
+                store_bytes(
+                    artifact_source,
+                    "thumbnail",
+                    thumbnail_fp,
+                    "webp",
+                    thumbnail_bytes,
+                    "image/webp",
+                )
+
             # Upload thumbnail to storage
             thumbnail_storage_path = f"user_{user_id}/file_{file_id}/thumbnail.webp"
 
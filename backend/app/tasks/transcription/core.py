@@ -15,10 +15,15 @@ from app.db.session_utils import get_refreshed_object
 from app.db.session_utils import session_scope
 from app.models.media import FileStatus
 from app.models.media import MediaFile
+from app.services.artifact_cache_service import ArtifactSource
+from app.services.artifact_cache_service import TranscriptionArtifacts
 from app.services.minio_service import download_file
 from app.services.opensearch_service import index_transcript
 from app.services.speaker_matching_service import SpeakerMatchingService
 from app.transcription.config import LIGHTWEIGHT_MODELS
+from app.transcription.config import TranscriptionConfig
+from app.transcription.raw_outputs import RawOutputRecorder
+from app.transcription.reprocess import PostprocessOptions
 from app.utils import benchmark_timing
 from app.utils.error_classification import categorize_error
 from app.utils.task_utils import create_task_record
@@ -77,8 +82,6 @@ def _validate_model_override(model_name: str) -> str | None:
         'cpu' if model should run on CPU, 'gpu' if it matches the admin model,
         or None if the model is rejected.
     """
-    from app.transcription.config import TranscriptionConfig
-
     if model_name not in _VALID_LOCAL_MODELS:
         logger.warning("Unknown model '%s', rejecting override", model_name)
         return None
@@ -813,6 +816,21 @@ def _resolve_language_settings(
     return resolved_lang, resolved_translate
 
 
+def _persist_raw_outputs(ctx: TranscriptionContext, recorder: RawOutputRecorder) -> None:
+    """Keep the raw model outputs so the file can be re-postprocessed on CPU."""
+    outputs = recorder.outputs
+    if outputs is None:
+        return
+    try:
+        from app.services.minio_service import upload_raw_outputs
+
+        data = outputs.to_bytes()
+        upload_raw_outputs(ctx.user_id, ctx.file_id, data)
+        logger.info(f"Stored raw model outputs for file {ctx.file_id} ({len(data)} bytes)")
+    except Exception as e:
+        logger.warning(f"Failed to store raw outputs for file {ctx.file_id} (non-fatal): {e}")
+
+
 def _run_transcription_pipeline(
     ctx: TranscriptionContext,
     audio_file_path: str,
@@ -823,9 +841,14 @@ def _run_transcription_pipeline(
     translate_to_english: bool | None = None,
     disable_diarization: bool = False,
     whisper_model: str | None = None,
+    artifact_source: ArtifactSource | None = None,
 ) -> dict:
-    """Run the unified transcription pipeline."""
-    from app.transcription import TranscriptionConfig
+    """Run the unified transcription pipeline.
+
+    With an ``artifact_source``, raw Whisper/PyAnnote outputs cached for the
+    same content and settings are reused instead of running the models.
+    The raw outputs are kept per file for CPU-only re-postprocessing.
+    """
     from app.transcription import TranscriptionPipeline
 
     source_language, translate_to_english = _resolve_language_settings(
@@ -892,9 +915,16 @@ def _run_transcription_pipeline(
         send_progress_notification(ctx.user_id, ctx.file_id, progress, message)
 
     pipeline = TranscriptionPipeline(config)
+    recorder = RawOutputRecorder(
+        TranscriptionArtifacts(artifact_source, config) if artifact_source else None
+    )
     raw_result = pipeline.process(
-        audio_file_path, progress_callback=progress_callback, task_id=ctx.task_id
+        audio_file_path,
+        progress_callback=progress_callback,
+        task_id=ctx.task_id,
+        artifacts=recorder,
     )
+    _persist_raw_outputs(ctx, recorder)
     # Annotate the raw WhisperX result with provider/model metadata so that
     # _process_transcription_result can persist it to media_file.asr_provider /
     # media_file.asr_model.  Without this the local pipeline leaves those columns NULL.
@@ -1275,9 +1305,15 @@ def clean_garbage_words(segments: list, max_word_length: int = 50) -> tuple[list
 
 
 def _dispatch_automatic_summary(
-    file_id: int, file_uuid: str, collection_prompt_uuid: str | None
-) -> None:
-    """Check summary disable settings and dispatch if enabled."""
+    file_id: int,
+    file_uuid: str,
+    collection_prompt_uuid: str | None,
+    extract_topics_after: bool = False,
+) -> bool:
+    """Check summary disable settings and dispatch if enabled.
+
+    Returns True when the summary task was dispatched.
+    """
     from app.tasks.summarization import send_summary_notification
     from app.tasks.summarization import summarize_transcript_task
     from app.utils.summary_settings import get_summary_disable_reason
@@ -1286,7 +1322,7 @@ def _dispatch_automatic_summary(
         media_file = db.query(MediaFile).filter(MediaFile.uuid == file_uuid).first()
         if not media_file:
             logger.warning(f"File {file_uuid} not found for summary dispatch")
-            return
+            return False
 
         if str(media_file.summary_status) == "disabled":
             logger.info(f"Summary disabled for file {file_id} (per-file flag)")
@@ -1297,7 +1333,7 @@ def _dispatch_automatic_summary(
                 "AI summary generation is disabled for this file",
                 0,
             )
-            return
+            return False
 
         disable_reason = get_summary_disable_reason(db, int(media_file.user_id))
         if disable_reason:
@@ -1316,13 +1352,15 @@ def _dispatch_automatic_summary(
                 reason_msg,
                 0,
             )
-            return
+            return False
 
     summary_task = summarize_transcript_task.delay(
         file_uuid=file_uuid,
         prompt_uuid=collection_prompt_uuid,
+        extract_topics_after=extract_topics_after,
     )
     logger.info(f"Automatic summarization task {summary_task.id} started for file {file_id}")
+    return True
 
 
 def _get_collection_prompt_uuid(file_id: int) -> str | None:
@@ -1395,12 +1433,20 @@ def trigger_automatic_summarization(
         # Look up collection default prompt for this file
         collection_prompt_uuid = _get_collection_prompt_uuid(file_id)
 
-        # Summarization
+        # Summarization. With combined enrichment the summary request also
+        # produces the topic suggestions, so topic extraction is started by
+        # the summary task when it finishes (or fails) and reuses them.
+        run_topics = tasks_to_run is None or "topic_extraction" in tasks_to_run
+        chain_topics = run_topics and settings.LLM_COMBINED_ENRICHMENT
+        topics_after_summary = False
         if tasks_to_run is None or "summarization" in tasks_to_run:
-            _dispatch_automatic_summary(file_id, file_uuid, collection_prompt_uuid)
+            dispatched = _dispatch_automatic_summary(
+                file_id, file_uuid, collection_prompt_uuid, extract_topics_after=chain_topics
+            )
+            topics_after_summary = dispatched and chain_topics
 
         # Topic extraction
-        if tasks_to_run is None or "topic_extraction" in tasks_to_run:
+        if run_topics and not topics_after_summary:
             from app.tasks.topic_extraction import extract_topics_task
 
             topic_task = extract_topics_task.delay(file_uuid=file_uuid, force_regenerate=False)
@@ -1532,6 +1578,7 @@ def _run_parallel_cloud_asr_and_diarization(
     from concurrent.futures import ThreadPoolExecutor
     from concurrent.futures import as_completed
 
+    from app.services.asr.chunked import transcribe_chunked
     from app.services.diarization.factory import DiarizationProviderFactory
     from app.services.diarization.types import DiarizeConfig
     from app.utils.diarization_merge import merge_cloud_diarization
@@ -1546,7 +1593,7 @@ def _run_parallel_cloud_asr_and_diarization(
             "falling back to ASR-only",
             ctx.user_id,
         )
-        return asr_provider.transcribe(audio_file_path, asr_config, progress_callback)
+        return transcribe_chunked(asr_provider, audio_file_path, asr_config, progress_callback)
 
     diarize_config = DiarizeConfig(
         min_speakers=min_speakers,
@@ -1567,7 +1614,7 @@ def _run_parallel_cloud_asr_and_diarization(
     diarize_error = None
 
     def run_asr():
-        return asr_provider.transcribe(audio_file_path, asr_config, progress_callback)
+        return transcribe_chunked(asr_provider, audio_file_path, asr_config, progress_callback)
 
     def run_diarize():
         return diarize_provider.diarize(audio_file_path, diarize_config)
@@ -1639,6 +1686,7 @@ def _run_cloud_asr_pipeline(
     Returns:
         Result dict with 'segments' and 'language' keys matching the WhisperX format
     """
+    from app.services.asr.chunked import transcribe_chunked
     from app.services.asr.factory import ASRProviderFactory
     from app.services.asr.types import ASRConfig
 
@@ -1721,7 +1769,7 @@ def _run_cloud_asr_pipeline(
             num_speakers=num_speakers if num_speakers is not None else settings.NUM_SPEAKERS,
         )
     else:
-        asr_result = provider.transcribe(audio_file_path, config, cloud_progress_callback)
+        asr_result = transcribe_chunked(provider, audio_file_path, config, cloud_progress_callback)
 
     # Convert ASRResult to the dict format the rest of the pipeline expects
     raw_segments = _convert_asr_result_to_segments(asr_result, ctx.file_id)
@@ -1990,11 +2038,17 @@ def _process_and_save_critical(
     ctx: TranscriptionContext,
     result: dict,
     preprocess_context: dict,
+    postprocess_options: PostprocessOptions | None = None,
 ) -> dict:
-    """Process speakers, save transcript to DB, release GPU. Returns chain context."""
+    """Process speakers, save transcript to DB, release GPU. Returns chain context.
+
+    ``postprocess_options`` overrides the resegmentation and merge settings;
+    the re-postprocess task passes the user's choices here.
+    """
     from app.utils.hardware_detection import detect_hardware
 
     post_start = time.perf_counter()
+    options = postprocess_options or PostprocessOptions()
 
     # Resegment at speaker boundaries and merge adjacent same-speaker segments
     from app.utils.segment_postprocess import merge_consecutive_segments
@@ -2002,7 +2056,12 @@ def _process_and_save_critical(
 
     send_progress_notification(ctx.user_id, ctx.file_id, 0.68, "Processing speaker segments")
     pre_merge_count = len(result["segments"])
-    result["segments"] = merge_consecutive_segments(resegment_by_speaker(result["segments"]))
+    if options.resegment_by_speaker:
+        result["segments"] = resegment_by_speaker(result["segments"])
+    if options.merge_max_duration > 0:
+        result["segments"] = merge_consecutive_segments(
+            result["segments"], max_duration=options.merge_max_duration
+        )
     post_merge_speakers = {s.get("speaker") for s in result["segments"] if s.get("speaker")}
     logger.info(
         "Segment processing: %d pre-merge → %d post-merge, speakers: %s (file %d)",
@@ -2146,17 +2205,18 @@ def transcribe_gpu_task(self, preprocess_context: dict) -> dict:
     )
 
     try:
-        from app.services.minio_service import download_temp_audio
+        from app.services.minio_service import resolve_temp_audio
 
         with session_scope() as db:
             update_task_status(db, task_id, "in_progress", progress=0.22)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Download preprocessed audio from MinIO temp
+            # Scratch audio is read in place; MinIO temp is downloaded
             step_start = time.perf_counter()
-            local_audio_path = os.path.join(temp_dir, "audio.wav")
             with benchmark_timing.stage(task_id, "gpu_audio_load"):
-                download_temp_audio(file_uuid, local_audio_path)
+                local_audio_path = resolve_temp_audio(
+                    file_uuid, os.path.join(temp_dir, "audio.wav")
+                )
             logger.info(
                 f"TIMING: audio download from temp completed in "
                 f"{time.perf_counter() - step_start:.3f}s"
@@ -2211,6 +2271,9 @@ def transcribe_gpu_task(self, preprocess_context: dict) -> dict:
                     translate_to_english=preprocess_context.get("translate_to_english"),
                     disable_diarization=disable_diarization,
                     whisper_model=whisper_model,
+                    artifact_source=ArtifactSource.from_dict(
+                        preprocess_context.get("artifact_source")
+                    ),
                 )
 
             # Annotate result with diarization flags for downstream
@@ -2255,7 +2318,8 @@ def transcribe_gpu_task(self, preprocess_context: dict) -> dict:
 # ---------------------------------------------------------------------------
 # CPU lightweight transcription task (Stage 2 alternative)
 # Runs base/tiny Whisper models on CPU — zero GPU impact.
-# Diarization is disabled (PyAnnote requires CUDA).
+# Diarization is off unless CPU_DIARIZATION_ENABLED=true (ONNX Runtime backend)
+# and the user's diarization source is not "off".
 # ---------------------------------------------------------------------------
 
 
@@ -2265,9 +2329,13 @@ def _run_cpu_transcription(
     source_language: str | None = None,
     translate_to_english: bool | None = None,
     whisper_model: str | None = None,
+    artifact_source: ArtifactSource | None = None,
+    min_speakers: int | None = None,
+    max_speakers: int | None = None,
+    num_speakers: int | None = None,
+    disable_diarization: bool = False,
 ) -> dict:
     """Run lightweight Whisper transcription on CPU."""
-    from app.transcription import TranscriptionConfig
     from app.transcription import TranscriptionPipeline
 
     source_language, translate_to_english = _resolve_language_settings(
@@ -2278,9 +2346,13 @@ def _run_cpu_transcription(
     with session_scope() as db:
         user_settings = _get_user_transcription_settings(db, ctx.user_id)
 
+    diarize = TranscriptionConfig.cpu_diarization_enabled() and not disable_diarization
     overrides = dict(
         source_language=source_language,
         translate_to_english=translate_to_english,
+        enable_diarization=diarize,
+        enable_native_embeddings=diarize,
+        enable_overlap_detection=diarize,
         min_speakers=1,
         max_speakers=1,
         hf_token=settings.HUGGINGFACE_TOKEN,
@@ -2292,6 +2364,17 @@ def _run_cpu_transcription(
         repetition_penalty=user_settings["repetition_penalty"],
     )
 
+    if diarize:
+        overrides["min_speakers"] = (
+            min_speakers if min_speakers is not None else user_settings["min_speakers"]
+        )
+        overrides["max_speakers"] = (
+            max_speakers if max_speakers is not None else user_settings["max_speakers"]
+        )
+        overrides["num_speakers"] = (
+            num_speakers if num_speakers is not None else settings.NUM_SPEAKERS
+        )
+
     if whisper_model and whisper_model in LIGHTWEIGHT_MODELS:
         overrides["model_name"] = whisper_model
 
@@ -2308,14 +2391,21 @@ def _run_cpu_transcription(
         send_progress_notification(ctx.user_id, ctx.file_id, progress, message)
 
     pipeline = TranscriptionPipeline(config)
+    recorder = RawOutputRecorder(
+        TranscriptionArtifacts(artifact_source, config) if artifact_source else None
+    )
     raw_result = pipeline.process(
-        audio_file_path, progress_callback=progress_callback, task_id=ctx.task_id
+        audio_file_path,
+        progress_callback=progress_callback,
+        task_id=ctx.task_id,
+        artifacts=recorder,
     )
+    _persist_raw_outputs(ctx, recorder)
 
     if isinstance(raw_result, dict):
         raw_result.setdefault("asr_provider", "local")
         raw_result.setdefault("asr_model", config.model_name)
-        raw_result["diarization_disabled"] = True
+        raw_result["diarization_disabled"] = not config.enable_diarization
 
     return raw_result
 
@@ -2335,7 +2425,9 @@ def transcribe_cpu_task(self, preprocess_context: dict) -> dict:
 
     Stage 2 alternative for the 3-stage pipeline chain. Runs on the CPU worker
     instead of GPU, using a small Whisper model with int8 quantization.
-    Diarization is skipped (PyAnnote requires CUDA).
+    Diarization is skipped unless CPU_DIARIZATION_ENABLED=true, in which case
+    PyAnnote runs on ONNX Runtime's CPU provider. A diarization source of
+    "off" skips it either way, as on the GPU path.
     """
     task_id = preprocess_context["task_id"]
     file_uuid = preprocess_context["file_uuid"]
@@ -2357,24 +2449,29 @@ def transcribe_cpu_task(self, preprocess_context: dict) -> dict:
     )
 
     try:
-        from app.services.minio_service import download_temp_audio
+        from app.services.minio_service import resolve_temp_audio
 
         with session_scope() as db:
             update_task_status(db, task_id, "in_progress", progress=0.22)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Download preprocessed audio from MinIO temp
-            local_audio_path = os.path.join(temp_dir, "audio.wav")
+            # Scratch audio is read in place; MinIO temp is downloaded
             with benchmark_timing.stage(task_id, "gpu_audio_load"):
-                download_temp_audio(file_uuid, local_audio_path)
+                local_audio_path = resolve_temp_audio(
+                    file_uuid, os.path.join(temp_dir, "audio.wav")
+                )
 
             send_progress_notification(user_id, file_id, 0.25, "Starting fast CPU transcription")
 
-            # Persist diarization_disabled=True for CPU path
+            # Persist whether the CPU path diarizes
+            diarization_source = preprocess_context.get("diarization_source", "provider")
+            disable_diarization = (
+                diarization_source == "off" or not TranscriptionConfig.cpu_diarization_enabled()
+            )
             with session_scope() as db:
                 media_file = get_refreshed_object(db, MediaFile, file_id)
                 if media_file:
-                    media_file.diarization_disabled = True
+                    media_file.diarization_disabled = disable_diarization
                     db.commit()
 
             whisper_model = preprocess_context.get("whisper_model")
@@ -2385,7 +2482,14 @@ def transcribe_cpu_task(self, preprocess_context: dict) -> dict:
                 source_language=preprocess_context.get("source_language"),
                 translate_to_english=preprocess_context.get("translate_to_english"),
                 whisper_model=whisper_model,
+                artifact_source=ArtifactSource.from_dict(preprocess_context.get("artifact_source")),
+                min_speakers=preprocess_context.get("min_speakers"),
+                max_speakers=preprocess_context.get("max_speakers"),
+                num_speakers=preprocess_context.get("num_speakers"),
+                disable_diarization=disable_diarization,
             )
+            if isinstance(result, dict):
+                result["diarization_source"] = diarization_source
 
             # Validate result
             validation_error = _validate_transcription_result(result, ctx, task_id)
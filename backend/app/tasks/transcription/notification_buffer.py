@@ -0,0 +1,193 @@
+"""
+Per-worker buffer for transcription status notifications.
+
+Pipeline stages report progress many times per file. Publishing each tick
+separately costs a metadata query and a Redis round trip, which adds up
+to thousands of queries and publishes per minute when hundreds of files are
+in flight. This module collapses that traffic in two ways:
+
+- ``FileMetadataCache`` keeps the filename/UUID/size used in every payload,
+  so a file is queried once for the life of its pipeline rather than once
+  per tick. Entries are evicted when the file reaches a final status.
+- ``NotificationBuffer`` coalesces progress updates per ``(user, file)``.
+  The first update for a key is published immediately; later ones within
+  ``NOTIFICATION_PROGRESS_INTERVAL_MS`` only replace the pending value, which
+  a background flusher publishes once the interval has elapsed. Every flush
+  goes out as one Redis pipeline. Status changes (completed, error, ...)
+  bypass coalescing and supersede any pending progress for the same file.
+
+Publishing is serialised under a lock, so a superseded progress update can
+never reach the client after the status change that replaced it.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# (user_id, file_id)
+BufferKey = tuple[int, int]
+# (user_id, payload) pairs handed to the publisher in one batch
+PublishBatch = list[tuple[int, dict]]
+
+_METADATA_CACHE_SIZE = 1024
+
+
+class FileMetadataCache:
+    """Thread-safe LRU cache of notification metadata keyed by file ID."""
+
+    def __init__(self, max_entries: int = _METADATA_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_id: int, loader: Callable[[int], Optional[dict]]) -> Optional[dict]:
+        """Return cached metadata, calling ``loader`` on a miss.
+
+        ``None`` results (file missing or query failed) are not cached, so a
+        transient DB error does not pin placeholder metadata for the run.
+        """
+        with self._lock:
+            cached = self._entries.get(file_id)
+            if cached is not None:
+                self._entries.move_to_end(file_id)
+                return cached
+
+        loaded = loader(file_id)
+        if loaded is None:
+            return None
+
+        with self._lock:
+            self._entries[file_id] = loaded
+            self._entries.move_to_end(file_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return loaded
+
+    def evict(self, file_id: int) -> None:
+        with self._lock:
+            self._entries.pop(file_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class NotificationBuffer:
+    """Coalesce per-file progress notifications and publish them in batches."""
+
+    def __init__(
+        self,
+        publish: Callable[[PublishBatch], bool],
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            publish: Callable that publishes a batch of ``(user_id, payload)``
+                pairs, returning True on success.
+            interval: Minimum seconds between published updates per key.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._publish = publish
+        self._interval = interval
+        self._clock = clock
+        self._pending: dict[BufferKey, dict] = {}
+        self._last_sent: dict[BufferKey, float] = {}
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, user_id: int, file_id: int, payload: dict, coalesce: bool = True) -> bool:
+        """Queue or publish one notification.
+
+        With ``coalesce=False`` (status changes) the payload is published
+        immediately and any pending progress for the same key is dropped.
+
+        Returns True when the update was published or accepted for a later
+        flush, False if publishing failed.
+        """
+        key = (user_id, file_id)
+        with self._publish_lock:
+            with self._lock:
+                now = self._clock()
+                if not coalesce:
+                    self._pending.pop(key, None)
+                    self._last_sent.pop(key, None)
+                elif now - self._last_sent.get(key, float("-inf")) < self._interval:
+                    self._pending[key] = payload
+                    self._ensure_flusher()
+                    return True
+                else:
+                    self._pending.pop(key, None)
+                    self._last_sent[key] = now
+
+                batch = [(user_id, payload)] + self._take(now, force=False)
+            return self._publish(batch)
+
+    def flush(self, force: bool = False) -> bool:
+        """Publish pending updates whose interval has elapsed (all if ``force``)."""
+        with self._publish_lock:
+            with self._lock:
+                now = self._clock()
+                batch = self._take(now, force=force)
+                # Keys idle for a full interval no longer throttle anything
+                for key in [
+                    k
+                    for k, sent in self._last_sent.items()
+                    if k not in self._pending and now - sent >= self._interval
+                ]:
+                    del self._last_sent[key]
+            if not batch:
+                return True
+            return self._publish(batch)
+
+    def _take(self, now: float, force: bool) -> PublishBatch:
+        """Remove and return due pending updates. Caller holds ``_lock``."""
+        due: list[BufferKey] = [
+            key
+            for key in self._pending
+            if force or now - self._last_sent.get(key, float("-inf")) >= self._interval
+        ]
+        batch: PublishBatch = []
+        for key in due:
+            batch.append((key[0], self._pending.pop(key)))
+            self._last_sent[key] = now
+        return batch
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher if it is not running. Caller holds ``_lock``."""
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="notification-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """Flush due updates until nothing is pending, then exit."""
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Background notification flush failed: {e}")
+            with self._lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+
+
+def distinct_users(batch: Iterable[tuple[int, dict]]) -> list[int]:
+    """User IDs in a batch, in first-seen order."""
+    return list(dict.fromkeys(user_id for user_id, _ in batch))
@@ -1,29 +1,55 @@
 import logging
+import threading
+from typing import Optional
 
+from app.core.config import settings
+from app.core.constants import NOTIFICATION_TYPE_TRANSCRIPTION_STATUS
 from app.db.session_utils import session_scope
 from app.models.media import FileStatus
 from app.models.media import MediaFile
 from app.utils.websocket_notify import send_ws_event
+from app.utils.websocket_notify import send_ws_events
+
+from .notification_buffer import FileMetadataCache
+from .notification_buffer import NotificationBuffer
+from .notification_buffer import PublishBatch
+from .notification_buffer import distinct_users
 
 logger = logging.getLogger(__name__)
 
+# Statuses after which a file's pipeline is over and its cached metadata can go
+_FINAL_STATUSES = frozenset({FileStatus.COMPLETED, FileStatus.ERROR, FileStatus.CANCELLED})
 
-def get_file_metadata(file_id: int) -> dict:
-    """Get basic file metadata for notifications."""
+_metadata_cache = FileMetadataCache()
+_buffer: Optional[NotificationBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def _load_file_metadata(file_id: int) -> Optional[dict]:
+    """Query notification metadata for a file, or None if unavailable."""
     try:
         with session_scope() as db:
-            media_file = db.query(MediaFile).filter(MediaFile.id == file_id).first()
-            if media_file:
+            row = (
+                db.query(
+                    MediaFile.uuid, MediaFile.filename, MediaFile.content_type, MediaFile.file_size
+                )
+                .filter(MediaFile.id == file_id)
+                .first()
+            )
+            if row:
                 return {
-                    "file_uuid": str(media_file.uuid),  # Include UUID
-                    "filename": media_file.filename,
-                    "content_type": media_file.content_type,
-                    "file_size": media_file.file_size,
+                    "file_uuid": str(row.uuid),  # Include UUID
+                    "filename": row.filename,
+                    "content_type": row.content_type,
+                    "file_size": row.file_size,
                 }
     except Exception as e:
         logger.warning(f"Failed to get file metadata for file {file_id}: {e}")
+    return None
+
 
-    # Return minimal data if query fails
+def _fallback_metadata(file_id: int) -> dict:
+    """Minimal metadata used when the file cannot be queried."""
     return {
         "file_uuid": None,  # Unknown UUID
         "filename": f"File {file_id}",
@@ -32,12 +58,61 @@ def get_file_metadata(file_id: int) -> dict:
     }
 
 
+def get_file_metadata(file_id: int) -> dict:
+    """Get basic file metadata for notifications."""
+    return _load_file_metadata(file_id) or _fallback_metadata(file_id)
+
+
+def _publish_status_batch(batch: PublishBatch) -> bool:
+    """Publish buffered status notifications and refresh the affected users' caches."""
+    result = send_ws_events(
+        (user_id, NOTIFICATION_TYPE_TRANSCRIPTION_STATUS, data) for user_id, data in batch
+    )
+
+    # Invalidate caches so gallery / status page reflect the new state
+    try:
+        from app.services.redis_cache_service import redis_cache
+
+        for user_id in distinct_users(batch):
+            redis_cache.invalidate_user_files(user_id)
+    except Exception as cache_err:
+        logger.debug(f"Cache invalidation after status change failed: {cache_err}")
+
+    return result
+
+
+def get_notification_buffer() -> NotificationBuffer:
+    """Return this worker process's notification buffer, creating it on first use."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = NotificationBuffer(
+                    _publish_status_batch,
+                    interval=max(settings.NOTIFICATION_PROGRESS_INTERVAL_MS, 0) / 1000.0,
+                )
+    return _buffer
+
+
+def flush_pending_notifications() -> None:
+    """Publish any coalesced progress updates still waiting in this worker."""
+    if _buffer is None:
+        return
+    try:
+        _buffer.flush(force=True)
+    except Exception as e:
+        logger.warning(f"Failed to flush pending notifications: {e}")
+
+
 def send_notification_via_redis(
     user_id: int, file_id: int, status: FileStatus, message: str, progress: int = 0
 ) -> bool:
     """
     Send notification via Redis pub/sub from synchronous context (like Celery worker).
 
+    Progress updates (status ``processing``) are coalesced per file by the
+    worker's notification buffer; any other status is published immediately.
+
     Args:
         user_id: User ID
         file_id: File ID
@@ -46,11 +121,12 @@ def send_notification_via_redis(
         progress: Progress percentage
 
     Returns:
-        True if notification was sent successfully, False otherwise
+        True if notification was sent (or queued) successfully, False otherwise
     """
     try:
-        # Get file metadata
-        file_metadata = get_file_metadata(file_id)
+        file_metadata = _metadata_cache.get(file_id, _load_file_metadata) or _fallback_metadata(
+            file_id
+        )
 
         # Prepare notification data
         data = {
@@ -63,16 +139,11 @@ def send_notification_via_redis(
             "file_size": file_metadata["file_size"],
         }
 
-        result = send_ws_event(user_id, "transcription_status", data)
-
-        # Invalidate caches so gallery / status page reflect the new state
-        try:
-            from app.services.redis_cache_service import redis_cache
-
-            redis_cache.invalidate_user_files(user_id)
-        except Exception as cache_err:
-            logger.debug(f"Cache invalidation after status change failed: {cache_err}")
-
+        result = get_notification_buffer().submit(
+            user_id, file_id, data, coalesce=status == FileStatus.PROCESSING
+        )
+        if status in _FINAL_STATUSES:
+            _metadata_cache.evict(file_id)
         return result
 
     except Exception as e:
@@ -20,6 +20,7 @@ from app.core.celery import celery_app
 from app.core.constants import CeleryQueues
 from app.core.constants import CPUPriority
 from app.db.session_utils import session_scope
+from app.services.speaker_summary_service import SpeakerSummaryService
 from app.utils import benchmark_timing
 from app.utils.task_utils import update_task_status
 from app.utils.websocket_notify import send_ws_event
@@ -162,6 +163,12 @@ def finalize_transcription(self, gpu_result: dict) -> dict:
         else:
             logger.info(f"Skipping speaker embeddings for file {file_id} (diarization disabled)")
 
+        # Speaker directory summaries. Profile suggestions need embeddings, so
+        # the GPU tasks dispatched above refresh them again when they finish.
+        SpeakerSummaryService.refresh_file_summaries_background(
+            file_id, include_suggestions=not is_cloud_asr and not diarization_disabled
+        )
+
         if needs_local_diarization:
             # Cloud ASR + local diarization: mark transcription completed (text is usable),
             # rediarize_task will send its own completion notification after GPU diarization
@@ -2,6 +2,8 @@
 
 Downloads media from MinIO, extracts audio via FFmpeg, and stages
 the normalized audio.wav in MinIO temp storage for the GPU worker.
+When the same content was preprocessed before, the WAV comes from the
+imohash artifact cache and FFmpeg is skipped.
 
 Part of the 3-stage chain: preprocess (CPU) → transcribe (GPU) → postprocess (CPU)
 """
@@ -65,6 +67,10 @@ def preprocess_for_transcription(
 
     Returns context dict consumed by the GPU transcription task via Celery chain.
     """
+    from app.services.artifact_cache_service import audio_fingerprint
+    from app.services.artifact_cache_service import fetch_file
+    from app.services.artifact_cache_service import resolve_source
+    from app.services.artifact_cache_service import store_file
     from app.services.minio_service import upload_temp_audio
     from app.utils.uuid_helpers import get_file_by_uuid
 
@@ -86,6 +92,8 @@ def preprocess_for_transcription(
             storage_path = str(media_file.storage_path)
             file_name = str(media_file.filename)
             content_type = str(media_file.content_type)
+            imohash = str(media_file.imohash) if media_file.imohash else None
+            has_metadata = bool(media_file.metadata_raw)
 
             update_task_status(db, task_id, "in_progress", progress=0.05)
 
@@ -93,11 +101,23 @@ def preprocess_for_transcription(
 
         file_ext = get_audio_file_extension(content_type, file_name)
         is_video = content_type.startswith("video/")
+        artifact_source = resolve_source(imohash, user_id, storage_path)
+        audio_fp = audio_fingerprint()
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_audio_path = os.path.join(temp_dir, "audio.wav")
 
-            if is_video:
+            cache_hit = artifact_source is not None and fetch_file(
+                artifact_source, "audio", audio_fp, "wav", temp_audio_path
+            )
+            if cache_hit:
+                logger.info(f"Preprocessed audio for file {file_id} served from artifact cache")
+                send_progress_notification(user_id, file_id, 0.08, "Reusing preprocessed audio")
+                if not has_metadata:
+                    _extract_metadata_for_cached_audio(
+                        storage_path, file_ext, temp_dir, file_id, content_type, task_id
+                    )
+            elif is_video:
                 _preprocess_video(
                     storage_path,
                     file_ext,
@@ -120,6 +140,9 @@ def preprocess_for_transcription(
                     task_id,
                 )
 
+            if artifact_source is not None and not cache_hit:
+                store_file(artifact_source, "audio", audio_fp, "wav", temp_audio_path, "audio/wav")
+
             # Upload preprocessed audio to MinIO temp for GPU worker
             send_progress_notification(user_id, file_id, 0.18, "Staging audio for transcription")
             audio_size_mb = os.path.getsize(temp_audio_path) / (1024 * 1024)
@@ -181,6 +204,7 @@ def preprocess_for_transcription(
             "disable_diarization": disable_diarization,
             "diarization_source": diarization_source,
             "whisper_model": whisper_model,
+            "artifact_source": artifact_source.to_dict() if artifact_source else None,
         }
 
     except Exception as e:
@@ -320,6 +344,37 @@ def _preprocess_audio(
         shutil.copy2(result_path, temp_audio_path)
 
 
+def _extract_metadata_for_cached_audio(
+    storage_path: str,
+    file_ext: str,
+    temp_dir: str,
+    file_id: int,
+    content_type: str,
+    task_id: str,
+) -> None:
+    """Fill metadata for a file whose audio came from the artifact cache.
+
+    Re-uploads of cached content still need their own metadata row; ffprobe
+    reads only the container header through a presigned URL.
+    """
+    from app.services.minio_service import get_internal_presigned_url
+
+    try:
+        presigned_url = get_internal_presigned_url(storage_path, expires=3600)
+    except Exception as e:
+        logger.warning(f"Could not mint presigned URL for metadata of file {file_id}: {e}")
+        presigned_url = None
+    _extract_metadata_best_effort(
+        storage_path,
+        file_ext,
+        temp_dir,
+        file_id,
+        content_type,
+        presigned_url=presigned_url,
+        task_id=task_id,
+    )
+
+
 def _extract_metadata_best_effort(
     storage_path: str,
     file_ext: str,
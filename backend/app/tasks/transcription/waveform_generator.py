@@ -13,14 +13,47 @@ from typing import Optional
 
 import numpy as np
 
+from app.utils.waveform_pyramid import WaveformPyramid
+
 logger = logging.getLogger(__name__)
 
-# Standard waveform resolutions for responsive design and device optimization
-WAVEFORM_RESOLUTIONS = {
-    "small": 500,  # Mobile phones, thumbnails, low-bandwidth
-    "medium": 1000,  # Desktop standard, tablets
-    "large": 2000,  # High-DPI displays, detailed editing, large screens
-}
+
+def waveform_marker(pyramid: WaveformPyramid) -> dict[str, Any]:
+    """Small JSON summary stored in ``media_file.waveform_data``.
+
+    The pyramid itself lives in the binary ``waveform_pyramid`` column; this
+    marker keeps the existing "has waveform data" checks working.
+    """
+    return {
+        "pyramid": {
+            "levels": len(pyramid.levels),
+            "base_bins": pyramid.levels[0].shape[1] if pyramid.levels else 0,
+            "duration": pyramid.duration,
+        }
+    }
+
+
+def waveform_payload(pyramid: WaveformPyramid, samples: int) -> dict[str, Any]:
+    """Build the ``/waveform`` response body for ``samples`` points.
+
+    Values are per-bin RMS normalised to 0-255, matching the format the
+    frontend player has always consumed.
+    """
+    _, _, rms = pyramid.resample(samples)
+    peak = float(rms.max()) if len(rms) else 0.0
+    waveform = (rms / peak * 255).astype(int).tolist() if peak > 0 else [0] * samples
+
+    duration = pyramid.duration or pyramid.expected_duration
+    return {
+        "waveform": waveform,
+        "duration": duration,
+        "expected_duration": pyramid.expected_duration,
+        "sample_rate": pyramid.sample_rate,
+        "samples": len(waveform),
+        "original_sample_rate": pyramid.original_sample_rate,
+        "extracted_samples": pyramid.total_samples,
+        "seconds_per_point": duration / samples if samples > 0 else 0,
+    }
 
 
 class WaveformGenerator:
@@ -49,37 +82,62 @@ class WaveformGenerator:
                 "FFmpeg is required for waveform generation but not available"
             ) from e
 
-    def generate_waveform_data(self, file_path: str) -> Optional[dict[str, Any]]:
+    def generate_waveform_pyramid(self, file_path: str) -> Optional[WaveformPyramid]:
         """
-        Generate waveform data for multiple resolutions optimized for different devices and screen sizes.
+        Decode a file once and build its multi-resolution waveform pyramid.
 
         Args:
             file_path: Path to the audio/video file
 
         Returns:
-            Dictionary containing waveform data for all resolutions
+            WaveformPyramid covering every display width, or None on failure
         """
         try:
-            # Generate waveforms for all standard resolutions
-            waveform_cache = {}
-
-            for resolution_name, samples in WAVEFORM_RESOLUTIONS.items():
-                waveform_data = self._extract_single_waveform(file_path, samples)
-                if waveform_data:
-                    cache_key = f"waveform_{samples}"
-                    waveform_cache[cache_key] = waveform_data
-                    logger.debug(f"Generated {resolution_name} waveform: {samples} samples")
-
-            # If we got at least one waveform, return the cache
-            if waveform_cache:
-                logger.info(f"Generated waveform data for {len(waveform_cache)} resolutions")
-                return waveform_cache
-            else:
-                logger.warning(f"Failed to generate waveform data for {file_path}")
+            # Probe file for audio information
+            probe_info = self._probe_audio_file(file_path)
+            if not probe_info:
                 return None
 
+            duration = probe_info["duration"]
+
+            # Extract raw audio data (single decode for all resolutions)
+            pcm = self._extract_pcm(file_path, duration)
+            if pcm is None:
+                return None
+
+            total_samples = len(pcm)
+            extracted_duration = total_samples / self.WAVEFORM_SAMPLE_RATE
+            logger.info(
+                f"FFmpeg extraction results: "
+                f"expected_duration={duration:.2f}s, "
+                f"extracted_duration={extracted_duration:.2f}s, "
+                f"audio_samples={total_samples}, "
+                f"sample_rate={self.WAVEFORM_SAMPLE_RATE}"
+            )
+
+            # Validate extraction - warn if significantly different
+            if duration > 0 and abs(extracted_duration - duration) > 1.0:
+                logger.warning(
+                    f"Extracted duration ({extracted_duration:.2f}s) differs from expected ({duration:.2f}s)"
+                )
+
+            pyramid = WaveformPyramid.build(
+                pcm,
+                self.WAVEFORM_SAMPLE_RATE,
+                original_sample_rate=probe_info["sample_rate"],
+                expected_duration=duration,
+            )
+            logger.info(
+                f"Built waveform pyramid: {len(pyramid.levels)} levels, "
+                f"base bin {pyramid.base_bin} samples"
+            )
+            return pyramid
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"FFmpeg error processing file {file_path}: {e}")
+            return None
         except Exception as e:
-            logger.error(f"Error generating waveform data: {e}")
+            logger.error(f"Error generating waveform pyramid for {file_path}: {e}")
             return None
 
     def _probe_audio_file(self, file_path: str) -> Optional[dict[str, Any]]:
@@ -130,16 +188,16 @@ class WaveformGenerator:
 
         return {"duration": duration, "sample_rate": sample_rate}
 
-    def _extract_raw_audio(self, file_path: str, duration: float) -> Optional[np.ndarray]:
+    def _extract_pcm(self, file_path: str, duration: float) -> Optional[np.ndarray]:
         """
-        Extract raw audio data from file using FFmpeg.
+        Extract mono 16-bit PCM from file using FFmpeg.
 
         Args:
             file_path: Path to the audio/video file
             duration: Expected duration (used to ensure complete extraction)
 
         Returns:
-            Numpy array of audio samples as float32, or None if extraction failed
+            Numpy array of int16 audio samples, or None if extraction failed
         """
         ffmpeg_cmd = ["ffmpeg", "-i", file_path]
 
@@ -168,145 +226,11 @@ class WaveformGenerator:
         # Using hardcoded ffmpeg command with validated file path, not user input
         result = subprocess.run(ffmpeg_cmd, capture_output=True, check=True, timeout=300)  # noqa: S603 # nosec B603
 
-        # Convert bytes to numpy array
+        # Keep samples as int16 — the pyramid is built without a float copy
         audio_data = np.frombuffer(result.stdout, dtype=np.int16)
 
         if len(audio_data) == 0:
             logger.warning(f"No audio data extracted from {file_path}")
             return None
 
-        # Convert to float and normalize
-        return audio_data.astype(np.float32) / 32768.0
-
-    def _compute_waveform_samples(self, audio_data: np.ndarray, target_samples: int) -> list[float]:
-        """
-        Compute waveform samples from audio data.
-
-        Args:
-            audio_data: Normalized audio data array
-            target_samples: Number of waveform samples to generate
-
-        Returns:
-            List of waveform values (floats)
-        """
-        total_samples = len(audio_data)
-
-        if total_samples <= target_samples:
-            # Upsample: interpolate to get enough points
-            logger.warning(
-                f"Audio has fewer samples ({total_samples}) than target ({target_samples})"
-            )
-            indices = np.linspace(0, total_samples - 1, target_samples)
-            interpolated: list[float] = np.interp(
-                indices, np.arange(total_samples), np.abs(audio_data)
-            ).tolist()
-            return interpolated
-
-        # Downsample: group audio samples into chunks
-        chunk_size = total_samples / target_samples
-        waveform = []
-
-        for i in range(target_samples):
-            start_idx = int(i * chunk_size)
-            end_idx = min(int((i + 1) * chunk_size), total_samples)
-
-            if start_idx < total_samples and start_idx < end_idx:
-                chunk = audio_data[start_idx:end_idx]
-                # Take RMS (root mean square) for better representation
-                rms_val = np.sqrt(np.mean(chunk**2)) if len(chunk) > 0 else 0.0
-                waveform.append(rms_val)
-            else:
-                waveform.append(0.0)
-
-        return waveform
-
-    def _normalize_waveform(self, waveform: list[float], target_samples: int) -> list[int]:
-        """
-        Normalize waveform to 0-255 range and ensure correct length.
-
-        Args:
-            waveform: List of waveform float values
-            target_samples: Expected number of samples
-
-        Returns:
-            List of integers in 0-255 range
-        """
-        # Ensure we have exactly target_samples
-        if len(waveform) < target_samples:
-            waveform.extend([0.0] * (target_samples - len(waveform)))
-        elif len(waveform) > target_samples:
-            waveform = waveform[:target_samples]
-
-        # Normalize to 0-255 range for visualization
-        if waveform and max(waveform) > 0:
-            max_val = max(waveform)
-            return [int(val / max_val * 255) for val in waveform]
-
-        return [0] * target_samples
-
-    def _extract_single_waveform(
-        self, file_path: str, target_samples: int
-    ) -> Optional[dict[str, Any]]:
-        """
-        Extract waveform data for a single resolution.
-
-        Args:
-            file_path: Path to the audio/video file
-            target_samples: Number of samples to return
-
-        Returns:
-            Dictionary containing waveform data and metadata
-        """
-        try:
-            # Probe file for audio information
-            probe_info = self._probe_audio_file(file_path)
-            if not probe_info:
-                return None
-
-            duration = probe_info["duration"]
-            sample_rate = probe_info["sample_rate"]
-
-            # Extract raw audio data
-            audio_data = self._extract_raw_audio(file_path, duration)
-            if audio_data is None:
-                return None
-
-            # Calculate durations and log extraction results
-            total_samples = len(audio_data)
-            extracted_duration = total_samples / self.WAVEFORM_SAMPLE_RATE
-            logger.info(
-                f"FFmpeg extraction results: "
-                f"expected_duration={duration:.2f}s, "
-                f"extracted_duration={extracted_duration:.2f}s, "
-                f"audio_samples={total_samples}, "
-                f"sample_rate={self.WAVEFORM_SAMPLE_RATE}"
-            )
-
-            # Validate extraction - warn if significantly different
-            if duration > 0 and abs(extracted_duration - duration) > 1.0:
-                logger.warning(
-                    f"Extracted duration ({extracted_duration:.2f}s) differs from expected ({duration:.2f}s)"
-                )
-
-            # Compute waveform samples and normalize
-            actual_duration = extracted_duration if extracted_duration > 0 else duration
-            waveform_float = self._compute_waveform_samples(audio_data, target_samples)
-            waveform = self._normalize_waveform(waveform_float, target_samples)
-
-            return {
-                "waveform": waveform,
-                "duration": actual_duration,
-                "expected_duration": duration,
-                "sample_rate": self.WAVEFORM_SAMPLE_RATE,
-                "samples": len(waveform),
-                "original_sample_rate": sample_rate,
-                "extracted_samples": total_samples,
-                "seconds_per_point": actual_duration / target_samples if target_samples > 0 else 0,
-            }
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error processing file {file_path}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error extracting waveform from {file_path}: {e}")
-            return None
+        return audio_data
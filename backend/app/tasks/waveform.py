@@ -15,12 +15,20 @@ from app.core.constants import CPUPriority
 from app.db.session_utils import get_refreshed_object
 from app.db.session_utils import session_scope
 from app.models.media import MediaFile
+from app.services.artifact_cache_service import ArtifactSource
+from app.services.artifact_cache_service import fetch_bytes
+from app.services.artifact_cache_service import source_for_file
+from app.services.artifact_cache_service import store_bytes
+from app.services.artifact_cache_service import waveform_fingerprint
 from app.services.minio_service import download_file
 from app.services.minio_service import download_temp_audio
 from app.tasks.transcription.waveform_generator import WaveformGenerator
+from app.tasks.transcription.waveform_generator import waveform_marker
 from app.utils import benchmark_timing
 from app.utils.temp_file_utils import cleanup_temp_file
 from app.utils.temp_file_utils import download_to_temp_file
+from app.utils.waveform_pyramid import WaveformPyramid
+from app.utils.waveform_pyramid import load_pyramid
 
 logger = logging.getLogger(__name__)
 
@@ -80,14 +88,32 @@ def _download_to_temp_file(storage_path: str) -> str | None:
         return None
 
 
-def _save_waveform_data(file_id: int, waveform_data: dict) -> None:
-    """Save waveform data to database."""
+def _save_waveform_pyramid(file_id: int, pyramid: WaveformPyramid) -> None:
+    """Save the waveform pyramid and its marker to the database."""
     with session_scope() as db:
         media_file = get_refreshed_object(db, MediaFile, file_id)
         if media_file:
-            media_file.waveform_data = waveform_data
+            media_file.waveform_pyramid = pyramid.to_bytes()
+            media_file.waveform_data = waveform_marker(pyramid)
             db.commit()
-            logger.info(f"Waveform data saved for file {file_id} - generation complete")
+            logger.info(f"Waveform pyramid saved for file {file_id} - generation complete")
+
+
+def _load_cached_pyramid(source: ArtifactSource | None) -> WaveformPyramid | None:
+    """Pyramid built earlier from the same content, if the artifact cache has one."""
+    if source is None:
+        return None
+    fingerprint = waveform_fingerprint(WaveformGenerator.WAVEFORM_SAMPLE_RATE)
+    return load_pyramid(fetch_bytes(source, "waveform", fingerprint, "bin"))
+
+
+def _store_cached_pyramid(source: ArtifactSource | None, pyramid: WaveformPyramid) -> None:
+    if source is None:
+        return
+    fingerprint = waveform_fingerprint(WaveformGenerator.WAVEFORM_SAMPLE_RATE)
+    store_bytes(
+        source, "waveform", fingerprint, "bin", pyramid.to_bytes(), "application/octet-stream"
+    )
 
 
 def _cleanup_temp_file(temp_file_path: str | None) -> None:
@@ -136,6 +162,13 @@ def generate_waveform_task(
     try:
         logger.info(f"Starting waveform generation for file {file_id} ({file_uuid})")
 
+        artifact_source = source_for_file(file_id)
+        cached = _load_cached_pyramid(artifact_source)
+        if cached is not None:
+            logger.info(f"Waveform for file {file_id} served from artifact cache")
+            _save_waveform_pyramid(file_id, cached)
+            return {"success": True, "file_id": file_id, "levels": len(cached.levels)}
+
         if prefer_temp_audio:
             temp_file_path = _download_temp_audio_safe(file_uuid)
 
@@ -149,14 +182,15 @@ def generate_waveform_task(
 
         logger.info(f"Generating waveform visualization for file {file_id}")
         waveform_generator = WaveformGenerator()
-        waveform_data = waveform_generator.generate_waveform_data(temp_file_path)
+        pyramid = waveform_generator.generate_waveform_pyramid(temp_file_path)
 
-        if not waveform_data:
+        if pyramid is None:
             logger.warning(f"Failed to generate waveform data for file {file_id}")
             return {"success": False, "error": "Waveform generation returned no data"}
 
-        _save_waveform_data(file_id, waveform_data)
-        return {"success": True, "file_id": file_id, "resolutions": len(waveform_data)}
+        _save_waveform_pyramid(file_id, pyramid)
+        _store_cached_pyramid(artifact_source, pyramid)
+        return {"success": True, "file_id": file_id, "levels": len(pyramid.levels)}
 
     except Exception as e:
         logger.error(f"Unexpected error in waveform generation: {e}", exc_info=True)
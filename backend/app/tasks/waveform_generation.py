@@ -15,6 +15,7 @@ from app.models.media import FileStatus
 from app.models.media import MediaFile
 from app.services.minio_service import download_file
 from app.tasks.transcription.waveform_generator import WaveformGenerator
+from app.tasks.transcription.waveform_generator import waveform_marker
 from app.utils.temp_file_utils import temp_file_context
 
 logger = logging.getLogger(__name__)
@@ -122,14 +123,15 @@ def _generate_waveform_for_file(file_id: int, storage_path: str, filename: str)
         with temp_file_context(file_data, suffix=file_ext) as temp_file_path:
             # Generate waveform data
             waveform_generator = WaveformGenerator()
-            waveform_data = waveform_generator.generate_waveform_data(temp_file_path)
+            pyramid = waveform_generator.generate_waveform_pyramid(temp_file_path)
 
-            if waveform_data:
+            if pyramid is not None:
                 # Save to database
                 with session_scope() as db:
                     media_file = db.query(MediaFile).filter(MediaFile.id == file_id).first()
                     if media_file:
-                        media_file.waveform_data = waveform_data
+                        media_file.waveform_pyramid = pyramid.to_bytes()
+                        media_file.waveform_data = waveform_marker(pyramid)
                         db.commit()
                         return True
 
@@ -0,0 +1,104 @@
+"""
+Celery task for converting legacy JSONB word timestamps to packed word_timings.
+
+This task runs on backend startup. Each batch packs the JSONB ``words`` of
+segments that have no ``word_timings`` yet and clears the JSONB value, then
+schedules the next batch until none are left. Readers use ``segment_words``
+and accept either column, so files stay usable while the conversion runs.
+"""
+
+import logging
+
+from sqlalchemy import func
+from sqlalchemy import null
+from sqlalchemy import update
+from sqlalchemy.orm import load_only
+
+from app.core.celery import celery_app
+from app.core.constants import CPUPriority
+from app.db.session_utils import session_scope
+from app.models.media import TranscriptSegment
+from app.utils.word_timings import pack_words
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="migrate_word_timings_to_binary", bind=True, priority=CPUPriority.ADMIN_BATCH)
+def migrate_word_timings_to_binary(self, batch_size: int = 2000, after_id: int = 0) -> dict:
+    """
+    Convert a batch of legacy JSONB word timestamps to the packed format.
+
+    Batches walk segment ids upwards, so rows that cannot be packed are
+    skipped once and left on the JSONB path.
+
+    Args:
+        batch_size: Number of segments to convert per batch (default: 2000)
+        after_id: Only consider segments with a greater id (set by the previous batch)
+
+    Returns:
+        Dictionary with migration statistics
+    """
+    summary = {
+        "segments_converted": 0,
+        "segments_failed": 0,
+        "has_more": False,
+    }
+
+    try:
+        with session_scope() as db:
+            segments = (
+                db.query(TranscriptSegment)
+                .options(
+                    load_only(
+                        TranscriptSegment.id,  # type: ignore[arg-type]
+                        TranscriptSegment.words,  # type: ignore[arg-type]
+                    )
+                )
+                .filter(
+                    TranscriptSegment.id > after_id,
+                    # JSONB 'null' is not SQL NULL; only arrays hold word timestamps
+                    func.jsonb_typeof(TranscriptSegment.words) == "array",
+                    TranscriptSegment.word_timings.is_(None),
+                )
+                .order_by(TranscriptSegment.id)
+                .limit(batch_size + 1)  # Get one extra to check if there's more
+                .all()
+            )
+            summary["has_more"] = len(segments) > batch_size
+            batch = segments[:batch_size]
+            last_id = int(batch[-1].id) if batch else after_id
+
+            rows = []
+            for segment in batch:
+                try:
+                    packed = pack_words(segment.words)  # type: ignore[arg-type]
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Cannot pack word timestamps of segment {segment.id}: {e}")
+                    summary["segments_failed"] += 1
+                    continue
+                # null() stores SQL NULL; a plain None would be written as JSONB 'null'
+                rows.append({"id": segment.id, "word_timings": packed, "words": null()})
+
+            if rows:
+                # ORM bulk UPDATE by primary key: one executemany for the batch
+                db.execute(update(TranscriptSegment), rows)
+            summary["segments_converted"] = len(rows)
+            db.commit()
+
+        if summary["has_more"]:
+            logger.info(
+                f"Word timings migration batch completed: {summary['segments_converted']} "
+                f"converted, {summary['segments_failed']} failed. Scheduling next batch..."
+            )
+            migrate_word_timings_to_binary.delay(batch_size=batch_size, after_id=last_id)
+        elif last_id != after_id:
+            logger.info(
+                f"Word timings migration completed: {summary['segments_converted']} "
+                f"converted, {summary['segments_failed']} failed."
+            )
+
+    except Exception as e:
+        logger.error(f"Error in word timings migration task: {e}")
+        summary["error"] = str(e)  # type: ignore[assignment]
+
+    return summary
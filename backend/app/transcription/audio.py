@@ -1,13 +1,16 @@
 """Audio loading for the transcription pipeline.
 
-Uses faster_whisper.decode_audio() which is the same function WhisperX
-calls internally via whisperx.load_audio().
+The preprocessed 16kHz mono PCM artifact is read directly from a memory
+map. Anything else goes through faster_whisper.decode_audio(), which is
+the same function WhisperX calls internally via whisperx.load_audio().
 """
 
 import logging
 
 import numpy as np
 
+from app.utils.pcm_audio import read_pcm_wav
+
 logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 16000
@@ -25,16 +28,18 @@ def load_audio(file_path: str) -> np.ndarray:
     Raises:
         ValueError: If audio is empty, too short, or cannot be loaded.
     """
-    from faster_whisper.audio import decode_audio
-
     logger.info(f"Loading audio: {file_path}")
-    try:
-        audio = decode_audio(file_path, sampling_rate=SAMPLE_RATE)
-    except Exception as e:
-        raise ValueError(
-            f"Unable to load audio content. The file may be corrupted, "
-            f"in an unsupported format, or contain no audio data: {e}"
-        ) from e
+    audio = read_pcm_wav(file_path, SAMPLE_RATE)
+    if audio is None:
+        from faster_whisper.audio import decode_audio
+
+        try:
+            audio = decode_audio(file_path, sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            raise ValueError(
+                f"Unable to load audio content. The file may be corrupted, "
+                f"in an unsupported format, or contain no audio data: {e}"
+            ) from e
 
     if audio is None or len(audio) == 0:
         raise ValueError("Audio file appears to be empty or corrupted")
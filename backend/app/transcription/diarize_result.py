@@ -28,3 +28,12 @@ class DiarizeResult:
             {"start": float(s), "end": float(e), "speaker": str(sp)}
             for s, e, sp in zip(self.start, self.end, self.speaker)
         ]
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> DiarizeResult:
+        """Inverse of ``to_records``."""
+        return cls(
+            start=np.asarray([r["start"] for r in records], dtype=np.float64),
+            end=np.asarray([r["end"] for r in records], dtype=np.float64),
+            speaker=np.asarray([r["speaker"] for r in records], dtype=object),
+        )
@@ -1,13 +1,17 @@
 """PyAnnote v4 speaker diarization.
 
 Direct PyAnnote v4 API usage for speaker diarization with configurable
-speaker count parameters.
+speaker count parameters. On CPU the segmentation and embedding models can
+run on ONNX Runtime (``TranscriptionConfig.diarization_backend="onnx"``).
 """
 
+import contextlib
 import gc
 import logging
 import os
 import time
+from collections.abc import Iterator
+from pathlib import Path
 from typing import ClassVar
 from typing import NoReturn
 
@@ -27,6 +31,52 @@ _BATCH_SIZE_RETRY_SEQUENCE = [16, 8, 4, 2, 1]
 PYANNOTE_V4_MODEL = "pyannote/speaker-diarization-community-1"
 PYANNOTE_V3_FALLBACK = "pyannote/speaker-diarization-3.1"
 
+# ONNX Runtime artifacts. The fork's Phase 6.2 runtime loads both graphs from
+# segmentation.onnx + embedding.onnx (pyannote.audio.onnx.export);
+# scripts/preconvert-onnx-models.py adds the quantized segmentation graph.
+_ONNX_SEGMENTATION_FILE = "segmentation.onnx"
+_ONNX_EMBEDDING_FILE = "embedding.onnx"
+_ONNX_SEGMENTATION_CACHED_FILES = (
+    "pyannote_segmentation_int8.onnx",
+    "pyannote_segmentation_fp32.onnx",
+)
+
+# ORT's per-call overhead is amortised over the sliding windows in a batch;
+# 32 ten-second windows are ~20 MB of input, so CPU memory is not a concern.
+_ONNX_CPU_SEGMENTATION_BATCH_SIZE = 32
+
+# Process-wide variables the fork reads while the pipeline is built. They
+# are restored afterwards so a later PyTorch pipeline in the same worker
+# does not inherit the ONNX gate.
+_ONNX_ENV_VARS = (
+    "PYANNOTE_USE_ONNX",
+    "PYANNOTE_ONNX_MODELS_DIR",
+    "ONNX_NUM_THREADS",
+    "MODEL_CACHE_DIR",
+)
+
+
+@contextlib.contextmanager
+def _restored_environ(names: tuple[str, ...]) -> Iterator[None]:
+    """Undo any change to the ``names`` environment variables on exit."""
+    saved = {name: os.environ.get(name) for name in names}
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def onnx_models_dir() -> Path:
+    """Directory holding the diarization ONNX artifacts."""
+    override = os.getenv("PYANNOTE_ONNX_MODELS_DIR")
+    if override:
+        return Path(override)
+    return Path(os.getenv("MODELS_DIR", "/app/models")) / "onnx"
+
 
 class SpeakerDiarizer:
     """PyAnnote v4 speaker diarization."""
@@ -35,19 +85,55 @@ class SpeakerDiarizer:
         self.config = config
         self._pipeline = None
         self._model_name: str | None = None
+        # Backend actually in use; "onnx" only once ONNX Runtime is wired in
+        self.backend = "pytorch"
 
     @property
     def is_loaded(self) -> bool:
         return self._pipeline is not None
 
+    @property
+    def _wants_onnx(self) -> bool:
+        # ORT's CUDA/CoreML providers lose to eager PyTorch; ONNX is CPU-only
+        return self.config.diarization_backend == "onnx" and self.config.diarization_device == "cpu"
+
     def load_model(self) -> None:
         """Load the PyAnnote diarization pipeline."""
-        from pyannote.audio import Pipeline
-
         step_start = time.perf_counter()
 
         logger.info(f"Loading PyAnnote v4 pipeline: {PYANNOTE_V4_MODEL}")
 
+        # The fork reads its ONNX gate while the pipeline is constructed
+        with _restored_environ(_ONNX_ENV_VARS):
+            if self._wants_onnx:
+                self._enable_onnx_runtime()
+            self._load_pretrained()
+
+            # Move to diarization device (may differ from transcription device in hybrid mode)
+            device = torch.device(self.config.diarization_device)
+            self._pipeline = self._pipeline.to(device)  # type: ignore[attr-defined]
+
+            if self._wants_onnx:
+                self._configure_onnx_segmentation()
+
+        # Configure segmentation batch_size based on GPU VRAM or env override.
+        # PyAnnote defaults to 32 which causes OOM on GPUs with ≤12GB VRAM.
+        self._configure_segmentation_batch_size()
+
+        # Embedding batch_size is pinned at 16 (Phase A finding: throughput
+        # saturates at bs=16 on both CUDA and MPS; larger batches waste VRAM
+        # for no speed gain). See docs/diarization-vram-profile/README.md.
+        self._configure_embedding_batch_size()
+
+        elapsed = time.perf_counter() - step_start
+        logger.info(
+            f"TIMING: diarizer model loaded in {elapsed:.3f}s on {device} (backend={self.backend})"
+        )
+
+    def _load_pretrained(self) -> None:
+        """Load the v4 pipeline, falling back to v3.1."""
+        from pyannote.audio import Pipeline
+
         try:
             self._pipeline = Pipeline.from_pretrained(PYANNOTE_V4_MODEL, token=self.config.hf_token)
             if self._pipeline is None:
@@ -103,21 +189,69 @@ class SpeakerDiarizer:
                     f"Primary: {e}, Fallback: {fallback_e}"
                 ) from e
 
-        # Move to diarization device (may differ from transcription device in hybrid mode)
-        device = torch.device(self.config.diarization_device)
-        self._pipeline = self._pipeline.to(device)  # type: ignore[attr-defined]
+    def _enable_onnx_runtime(self) -> None:
+        """Route segmentation and embedding through ONNX Runtime's CPU provider.
 
-        # Configure segmentation batch_size based on GPU VRAM or env override.
-        # PyAnnote defaults to 32 which causes OOM on GPUs with ≤12GB VRAM.
-        self._configure_segmentation_batch_size()
+        Sets the fork's ``PYANNOTE_USE_ONNX`` gate before the pipeline is
+        built, so ``_setup_phase6_onnx`` swaps the segmentation ``infer``, the
+        WeSpeaker ResNet and the vmap-free batched fbank for ORT sessions.
+        Without the exported artifacts the pipeline stays on PyTorch.
+        """
+        models_dir = onnx_models_dir()
+        if (
+            not (models_dir / _ONNX_SEGMENTATION_FILE).exists()
+            or not (models_dir / _ONNX_EMBEDDING_FILE).exists()
+        ):
+            logger.warning(
+                f"ONNX diarization artifacts not found in {models_dir}; embeddings stay on "
+                "PyTorch. Export them with `python -m pyannote.audio.onnx.export "
+                f"--out-dir {models_dir}`."
+            )
+            return
 
-        # Embedding batch_size is pinned at 16 (Phase A finding: throughput
-        # saturates at bs=16 on both CUDA and MPS; larger batches waste VRAM
-        # for no speed gain). See docs/diarization-vram-profile/README.md.
-        self._configure_embedding_batch_size()
+        os.environ["PYANNOTE_USE_ONNX"] = "1"
+        os.environ["PYANNOTE_ONNX_MODELS_DIR"] = str(models_dir)
+        if self.config.diarization_onnx_threads > 0:
+            os.environ["ONNX_NUM_THREADS"] = str(self.config.diarization_onnx_threads)
+        self.backend = "onnx"
+        logger.info(f"Diarization segmentation + embedding on ONNX Runtime ({models_dir})")
 
-        elapsed = time.perf_counter() - step_start
-        logger.info(f"TIMING: diarizer model loaded in {elapsed:.3f}s on {device}")
+    def _configure_onnx_segmentation(self) -> None:
+        """Swap segmentation to the pre-converted (INT8 by default) ORT graph.
+
+        ``_setup_onnx_cpu`` is the fork's CPU-only hook; it loads
+        ``pyannote_segmentation_{int8,fp32}.onnx`` from ``$MODEL_CACHE_DIR/onnx``
+        and replaces the segmentation ``infer``. Any failure leaves the
+        pipeline on the segmentation path it already has.
+        """
+        setup_onnx_cpu = getattr(self._pipeline, "_setup_onnx_cpu", None)
+        if setup_onnx_cpu is None:
+            logger.warning("Installed pyannote.audio has no ONNX CPU hook; segmentation on PyTorch")
+            return
+
+        models_dir = onnx_models_dir()
+        if not any((models_dir / name).exists() for name in _ONNX_SEGMENTATION_CACHED_FILES):
+            logger.info(
+                f"No pre-converted segmentation model in {models_dir} "
+                "(scripts/preconvert-onnx-models.py --quantize)"
+            )
+            return
+
+        os.environ["MODEL_CACHE_DIR"] = str(models_dir.parent)
+        try:
+            setup_onnx_cpu(
+                quantize=self.config.diarization_onnx_int8,
+                num_threads=self.config.diarization_onnx_threads,
+            )
+        except Exception as e:
+            logger.warning(f"ONNX segmentation setup failed, keeping current path: {e}")
+            return
+
+        self.backend = "onnx"
+        logger.info(
+            "Diarization segmentation on ONNX Runtime "
+            f"({'int8' if self.config.diarization_onnx_int8 else 'fp32'} preferred)"
+        )
 
     def _configure_segmentation_batch_size(self) -> None:
         """Set PyAnnote's segmentation batch_size based on GPU VRAM or env override.
@@ -160,6 +294,8 @@ class SpeakerDiarizer:
                 batch_size = 4
         elif diar_device == "mps":
             batch_size = 8
+        elif self.backend == "onnx":
+            batch_size = _ONNX_CPU_SEGMENTATION_BATCH_SIZE
         else:
             batch_size = 4  # CPU
 
@@ -320,7 +456,7 @@ class SpeakerDiarizer:
         elapsed = time.perf_counter() - step_start
         num_speakers = int(np.unique(diarize_df.speaker).size)
         logger.info(
-            f"TIMING: diarization completed in {elapsed:.3f}s - "
+            f"TIMING: diarization completed in {elapsed:.3f}s ({self.backend}) - "
             f"{num_speakers} speakers, {len(diarize_df)} segments"
         )
 
@@ -68,7 +68,7 @@ class ModelManager:
 
     def get_diarizer(self, config: TranscriptionConfig) -> SpeakerDiarizer:
         """Return cached diarizer if config matches, else load new one."""
-        config_hash = config.config_hash()
+        config_hash = config.diarizer_config_hash()
 
         with self._lock:
             if self._diarizer is not None and self._diarizer_hash == config_hash:
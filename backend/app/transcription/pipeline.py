@@ -27,6 +27,7 @@ class TranscriptionPipeline:
         audio_file_path: str,
         progress_callback: Callable[[float, str], None] | None = None,
         task_id: str | None = None,
+        artifacts: Any | None = None,
     ) -> dict[str, Any]:
         """Full pipeline: audio -> transcribed, diarized, speaker-assigned segments.
 
@@ -36,6 +37,9 @@ class TranscriptionPipeline:
                 for reporting progress. Progress values match the existing
                 WhisperX pipeline range (0.42 -> 0.70).
             task_id: Optional Celery task ID for VRAM profile storage.
+            artifacts: Optional raw-output cache (``TranscriptionArtifacts``).
+                Cached Whisper/PyAnnote outputs are used instead of running
+                the model, and freshly computed outputs are stored.
 
         Returns:
             Dict with keys:
@@ -53,36 +57,21 @@ class TranscriptionPipeline:
 
         profiler.snapshot("pipeline_start")
 
+        transcript, cached_diarization = self._load_cached_outputs(artifacts)
+        needs_audio = transcript is None or (
+            self.config.enable_diarization and cached_diarization is None
+        )
+
         # Steps 1+2: Load audio and ensure model is warm in parallel
         self._report(progress_callback, 0.42, "Loading audio")
         import threading
 
-        from app.transcription.audio import load_audio
-
-        audio_result: list = [None]
-        audio_error: list = [None]
-
-        def _load_audio():
-            try:
-                audio_result[0] = load_audio(audio_file_path)
-            except Exception as e:
-                audio_error[0] = e
-
-        # Start audio loading in background while ensuring model is warm
-        audio_thread = threading.Thread(target=_load_audio, name="audio-load", daemon=True)
-        audio_thread.start()
-
-        # Wait for VRAM before loading transcriber (concurrent mode)
-        if self.config.concurrent_requests > 1:
-            self._wait_for_vram(1500, "transcriber_load")
-
-        with profiler.step("model_load_transcriber"):
-            transcriber = self.manager.get_transcriber(self.config)
-        audio_thread.join()
-
-        if audio_error[0]:
-            raise audio_error[0]
-        audio = audio_result[0]
+        audio, transcriber = self._load_audio_and_transcriber(
+            audio_file_path,
+            load_audio_data=needs_audio,
+            load_transcriber=transcript is None,
+            profiler=profiler,
+        )
 
         profiler.snapshot("after_transcriber_loaded")
 
@@ -93,31 +82,17 @@ class TranscriptionPipeline:
         # is protected by an RLock that safely serializes concurrent
         # loads, so we only pay the cost once even on warm paths.
         diarizer_preload_thread: threading.Thread | None = None
-        if self.config.enable_diarization and self.config.concurrent_requests <= 1:
-            # Single-request mode has headroom to hold both models; skip the
-            # overlap in multi-request mode where VRAM is tight and we need
-            # to release the transcriber before diarizing.
-            def _preload_diarizer() -> None:
-                try:
-                    self.manager.get_diarizer(self.config)
-                except Exception as preload_err:
-                    logger.debug(f"Diarizer preload (non-fatal, will retry inline): {preload_err}")
-
-            diarizer_preload_thread = threading.Thread(
-                target=_preload_diarizer,
-                name="diarizer-preload",
-                daemon=True,
-            )
-            diarizer_preload_thread.start()
+        if transcriber is not None and cached_diarization is None:
+            diarizer_preload_thread = self._start_diarizer_preload()
 
         # Transcribe
-        self._report(progress_callback, 0.43, "Running AI transcription")
-        step_start = time.perf_counter()
-        with profiler.step("transcription"):
-            transcript = transcriber.transcribe(audio)
-        logger.info(
-            f"TIMING: transcription step completed in {time.perf_counter() - step_start:.3f}s"
-        )
+        if transcriber is not None:
+            transcript = self._transcribe(transcriber, audio, profiler, progress_callback)
+            if artifacts:
+                artifacts.save_transcript(transcript)
+        else:
+            self._report(progress_callback, 0.43, "Reusing previous transcription")
+        assert transcript is not None
 
         # Join the preload thread so subsequent get_diarizer() is guaranteed
         # to return a fully-initialised model. If transcription was fast
@@ -137,6 +112,8 @@ class TranscriptionPipeline:
                 profiler,
                 hw,
                 progress_callback,
+                cached=cached_diarization,
+                artifacts=artifacts,
             )
         else:
             result, diarize_df = self._skip_diarization(transcript)
@@ -190,43 +167,23 @@ class TranscriptionPipeline:
         profiler: Any,
         hw: Any,
         progress_callback: Callable[[float, str], None] | None,
+        cached: tuple[Any, dict, dict | None] | None = None,
+        artifacts: Any | None = None,
     ) -> tuple[dict, Any]:
-        """Run PyAnnote diarization and assign speakers to segments."""
-        # Step 3: Load diarizer — skip transcriber release if VRAM allows both
-        self._report(progress_callback, 0.52, "Preparing speaker analysis")
-        hw.log_vram_usage("after transcription, before diarizer load")
-        total_vram_mb = self._get_total_vram_mb()
+        """Run PyAnnote diarization and assign speakers to segments.
 
-        profiler.snapshot("models_warm_no_inference")
-
-        if self.config.concurrent_requests > 1:
-            logger.info(
-                "Concurrent mode (concurrent_requests=%d): keeping transcriber loaded",
-                self.config.concurrent_requests,
-            )
-        elif total_vram_mb >= 16_000:
-            logger.info(
-                "Keeping transcriber loaded (%dMB VRAM total, both models fit)",
-                total_vram_mb,
-            )
+        ``cached`` is a previously stored ``(diarize_df, overlap_info,
+        native_embeddings)`` triple; when given, the diarizer is not run.
+        """
+        if cached is not None:
+            self._report(progress_callback, 0.55, "Reusing previous speaker analysis")
+            diarize_df, overlap_info, native_embeddings = cached
         else:
-            self.manager.release_transcriber()
-            hw.log_vram_usage("after transcriber release")
-            profiler.snapshot("diarizer_only_warm")
-
-        if self.config.concurrent_requests > 1:
-            self._wait_for_vram(2000, "diarization")
-
-        # Step 4: Diarize with PyAnnote v4
-        self._report(progress_callback, 0.55, "Analyzing speaker patterns")
-        step_start = time.perf_counter()
-        with profiler.step("diarization"):
-            diarizer = self.manager.get_diarizer(self.config)
-            diarize_df, overlap_info, native_embeddings = diarizer.diarize(audio)
-        logger.info(
-            f"TIMING: diarization step completed in {time.perf_counter() - step_start:.3f}s"
-        )
-        profiler.snapshot("after_diarization")
+            diarize_df, overlap_info, native_embeddings = self._diarize(
+                audio, profiler, hw, progress_callback
+            )
+            if artifacts:
+                artifacts.save_diarization(diarize_df, overlap_info, native_embeddings)
 
         self._save_intermediate(transcript, diarize_df, overlap_info, native_embeddings)
 
@@ -261,6 +218,148 @@ class TranscriptionPipeline:
 
         return result, diarize_df
 
+    def _load_audio_and_transcriber(
+        self,
+        audio_file_path: str,
+        load_audio_data: bool,
+        load_transcriber: bool,
+        profiler: Any,
+    ) -> tuple[Any, Any]:
+        """Load audio in the background while the transcriber is made warm.
+
+        Either side is skipped when its output is already cached; the
+        skipped value is returned as None.
+        """
+        import threading
+
+        from app.transcription.audio import load_audio
+
+        audio_result: list = [None]
+        audio_error: list = [None]
+
+        def _load_audio():
+            try:
+                audio_result[0] = load_audio(audio_file_path)
+            except Exception as e:
+                audio_error[0] = e
+
+        audio_thread: threading.Thread | None = None
+        if load_audio_data:
+            audio_thread = threading.Thread(target=_load_audio, name="audio-load", daemon=True)
+            audio_thread.start()
+
+        transcriber = None
+        if load_transcriber:
+            # Wait for VRAM before loading transcriber (concurrent mode)
+            if self.config.concurrent_requests > 1:
+                self._wait_for_vram(1500, "transcriber_load")
+
+            with profiler.step("model_load_transcriber"):
+                transcriber = self.manager.get_transcriber(self.config)
+        if audio_thread is not None:
+            audio_thread.join()
+
+        if audio_error[0]:
+            raise audio_error[0]
+        return audio_result[0], transcriber
+
+    def _load_cached_outputs(self, artifacts: Any | None) -> tuple[dict | None, Any | None]:
+        """Raw model outputs from an earlier run on the same content and settings."""
+        if artifacts is None:
+            return None, None
+        transcript = artifacts.load_transcript()
+        diarization = artifacts.load_diarization() if self.config.enable_diarization else None
+        return transcript, diarization
+
+    def _transcribe(
+        self,
+        transcriber: Any,
+        audio: Any,
+        profiler: Any,
+        progress_callback: Callable[[float, str], None] | None,
+    ) -> dict:
+        """Run faster-whisper on the loaded audio."""
+        self._report(progress_callback, 0.43, "Running AI transcription")
+        step_start = time.perf_counter()
+        with profiler.step("transcription"):
+            transcript = transcriber.transcribe(audio)
+        logger.info(
+            f"TIMING: transcription step completed in {time.perf_counter() - step_start:.3f}s"
+        )
+        return transcript
+
+    def _start_diarizer_preload(self) -> Any:
+        """Load the diarizer in the background while Whisper runs.
+
+        Single-request mode has headroom to hold both models; the overlap
+        is skipped in multi-request mode where VRAM is tight and the
+        transcriber must be released before diarizing. Returns the started
+        thread, or None when no preload applies.
+        """
+        import threading
+
+        if not self.config.enable_diarization or self.config.concurrent_requests > 1:
+            return None
+
+        def _preload_diarizer() -> None:
+            try:
+                self.manager.get_diarizer(self.config)
+            except Exception as preload_err:
+                logger.debug(f"Diarizer preload (non-fatal, will retry inline): {preload_err}")
+
+        thread = threading.Thread(
+            target=_preload_diarizer,
+            name="diarizer-preload",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _diarize(
+        self,
+        audio: Any,
+        profiler: Any,
+        hw: Any,
+        progress_callback: Callable[[float, str], None] | None,
+    ) -> tuple[Any, dict, dict | None]:
+        """Run PyAnnote v4 on the audio, releasing the transcriber if VRAM is tight."""
+        # Step 3: Load diarizer — skip transcriber release if VRAM allows both
+        self._report(progress_callback, 0.52, "Preparing speaker analysis")
+        hw.log_vram_usage("after transcription, before diarizer load")
+        total_vram_mb = self._get_total_vram_mb()
+
+        profiler.snapshot("models_warm_no_inference")
+
+        if self.config.concurrent_requests > 1:
+            logger.info(
+                "Concurrent mode (concurrent_requests=%d): keeping transcriber loaded",
+                self.config.concurrent_requests,
+            )
+        elif total_vram_mb >= 16_000:
+            logger.info(
+                "Keeping transcriber loaded (%dMB VRAM total, both models fit)",
+                total_vram_mb,
+            )
+        else:
+            self.manager.release_transcriber()
+            hw.log_vram_usage("after transcriber release")
+            profiler.snapshot("diarizer_only_warm")
+
+        if self.config.concurrent_requests > 1:
+            self._wait_for_vram(2000, "diarization")
+
+        # Step 4: Diarize with PyAnnote v4
+        self._report(progress_callback, 0.55, "Analyzing speaker patterns")
+        step_start = time.perf_counter()
+        with profiler.step("diarization"):
+            diarizer = self.manager.get_diarizer(self.config)
+            diarize_df, overlap_info, native_embeddings = diarizer.diarize(audio)
+        logger.info(
+            f"TIMING: diarization step completed in {time.perf_counter() - step_start:.3f}s"
+        )
+        profiler.snapshot("after_diarization")
+        return diarize_df, overlap_info, native_embeddings
+
     @staticmethod
     def _skip_diarization(transcript: dict) -> tuple[dict, None]:
         """Skip diarization and assign SPEAKER_00 to all segments."""
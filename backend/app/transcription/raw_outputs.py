@@ -0,0 +1,264 @@
+"""Compact binary form of the raw transcriber and diarizer outputs.
+
+Everything downstream of Whisper and PyAnnote (sentence split, dedup,
+speaker assignment, resegmentation) is cheap and deterministic, so keeping
+the model outputs of every file lets those steps be re-run on the CPU
+without inference. Outputs are stored as a compressed ``.npz`` of flat
+columns: times as float64, probabilities and embeddings as float32, and
+strings as one UTF-8 blob with int64 offsets. Loading never unpickles.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+import logging
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+import numpy as np
+
+from app.transcription.diarize_result import DiarizeResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when the array layout changes; older payloads are rejected on load
+RAW_OUTPUTS_FORMAT_VERSION = 1
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Encode strings as a single UTF-8 byte blob plus start offsets."""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> list[str]:
+    raw = blob.tobytes()
+    bounds = offsets.tolist()
+    return [raw[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+
+
+@dataclass
+class RawOutputs:
+    """Model outputs of one file, before any post-processing.
+
+    ``transcript`` is the transcriber dict (``segments`` with ``words``, plus
+    ``language``). The diarization fields are None/empty when diarization
+    was disabled.
+    """
+
+    transcript: dict
+    diarize_df: DiarizeResult | None = None
+    overlap_info: dict = field(default_factory=dict)
+    native_embeddings: dict[str, np.ndarray] | None = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compressed ``.npz`` payload."""
+        segments = self.transcript.get("segments", [])
+        words = [w for s in segments for w in s.get("words") or []]
+
+        word_offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+        if segments:
+            word_offsets[1:] = np.cumsum([len(s.get("words") or []) for s in segments])
+        segment_text, segment_text_offsets = _pack_strings([s.get("text", "") for s in segments])
+        word_text, word_text_offsets = _pack_strings([w.get("word", "") for w in words])
+
+        arrays: dict[str, np.ndarray] = {
+            "version": np.asarray(RAW_OUTPUTS_FORMAT_VERSION, dtype=np.int32),
+            "language": np.frombuffer(
+                (self.transcript.get("language") or "").encode("utf-8"), dtype=np.uint8
+            ),
+            "segment_start": np.asarray([s["start"] for s in segments], dtype=np.float64),
+            "segment_end": np.asarray([s["end"] for s in segments], dtype=np.float64),
+            "segment_text": segment_text,
+            "segment_text_offsets": segment_text_offsets,
+            "word_offsets": word_offsets,
+            "word_start": np.asarray([w["start"] for w in words], dtype=np.float64),
+            "word_end": np.asarray([w["end"] for w in words], dtype=np.float64),
+            "word_probability": np.asarray(
+                [w.get("probability", 1.0) for w in words], dtype=np.float32
+            ),
+            "word_text": word_text,
+            "word_text_offsets": word_text_offsets,
+            "overlap_info": np.frombuffer(
+                json.dumps(self.overlap_info or {}, default=float).encode("utf-8"),
+                dtype=np.uint8,
+            ),
+        }
+
+        if self.diarize_df is not None:
+            labels, speaker_index = np.unique(
+                self.diarize_df.speaker.astype(str), return_inverse=True
+            )
+            label_blob, label_offsets = _pack_strings(labels.tolist())
+            arrays.update(
+                diar_start=self.diarize_df.start.astype(np.float64),
+                diar_end=self.diarize_df.end.astype(np.float64),
+                diar_speaker=speaker_index.astype(np.int32),
+                diar_labels=label_blob,
+                diar_label_offsets=label_offsets,
+            )
+
+        if self.native_embeddings:
+            emb_labels = list(self.native_embeddings)
+            emb_blob, emb_offsets = _pack_strings(emb_labels)
+            arrays.update(
+                embedding_labels=emb_blob,
+                embedding_label_offsets=emb_offsets,
+                embeddings=np.stack(
+                    [np.asarray(self.native_embeddings[k], dtype=np.float32) for k in emb_labels]
+                ),
+            )
+
+        buf = io.BytesIO()
+        np.savez_compressed(buf, **arrays)
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RawOutputs:
+        """Inverse of ``to_bytes``.
+
+        Raises:
+            ValueError: If the payload is not a raw-outputs archive of the
+                current format version.
+        """
+        try:
+            npz = np.load(io.BytesIO(data), allow_pickle=False)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Not a raw outputs archive: {e}") from e
+
+        with npz:
+            version = int(npz["version"]) if "version" in npz.files else None
+            if version != RAW_OUTPUTS_FORMAT_VERSION:
+                raise ValueError(f"Unsupported raw outputs format version: {version}")
+
+            segment_text = _unpack_strings(npz["segment_text"], npz["segment_text_offsets"])
+            word_text = _unpack_strings(npz["word_text"], npz["word_text_offsets"])
+            word_start = npz["word_start"].tolist()
+            word_end = npz["word_end"].tolist()
+            word_probability = npz["word_probability"].tolist()
+            word_offsets = npz["word_offsets"].tolist()
+
+            segments = []
+            for i, (start, end) in enumerate(
+                zip(npz["segment_start"].tolist(), npz["segment_end"].tolist())
+            ):
+                segments.append(
+                    {
+                        "text": segment_text[i],
+                        "start": start,
+                        "end": end,
+                        "words": [
+                            {
+                                "word": word_text[j],
+                                "start": word_start[j],
+                                "end": word_end[j],
+                                "probability": word_probability[j],
+                            }
+                            for j in range(word_offsets[i], word_offsets[i + 1])
+                        ],
+                    }
+                )
+            language = npz["language"].tobytes().decode("utf-8") or None
+            transcript = {"segments": segments, "language": language}
+
+            diarize_df = None
+            if "diar_start" in npz.files:
+                labels = np.asarray(
+                    _unpack_strings(npz["diar_labels"], npz["diar_label_offsets"]),
+                    dtype=object,
+                )
+                diarize_df = DiarizeResult(
+                    start=npz["diar_start"],
+                    end=npz["diar_end"],
+                    speaker=labels[npz["diar_speaker"]],
+                )
+
+            native_embeddings = None
+            if "embeddings" in npz.files:
+                emb_labels = _unpack_strings(
+                    npz["embedding_labels"], npz["embedding_label_offsets"]
+                )
+                matrix = npz["embeddings"]
+                native_embeddings = {label: matrix[i] for i, label in enumerate(emb_labels)}
+
+            overlap_info = json.loads(npz["overlap_info"].tobytes().decode("utf-8"))
+
+        return cls(
+            transcript=transcript,
+            diarize_df=diarize_df,
+            overlap_info=overlap_info,
+            native_embeddings=native_embeddings,
+        )
+
+
+class RawOutputRecorder:
+    """Captures the raw outputs a ``TranscriptionPipeline.process`` run used.
+
+    Implements the pipeline's ``artifacts`` interface and delegates to an
+    optional inner cache (``TranscriptionArtifacts``), recording whatever is
+    loaded from it or freshly computed. The pipeline post-processes the
+    transcript in place, so a copy is taken as soon as it is seen.
+    """
+
+    def __init__(self, inner: Any | None = None) -> None:
+        self.inner = inner
+        self._transcript: dict | None = None
+        self._diarization: tuple[DiarizeResult, dict, dict | None] | None = None
+
+    @property
+    def outputs(self) -> RawOutputs | None:
+        """The recorded outputs, or None if no transcript was produced."""
+        if self._transcript is None:
+            return None
+        diarize_df, overlap_info, native_embeddings = self._diarization or (None, {}, None)
+        return RawOutputs(
+            transcript=self._transcript,
+            diarize_df=diarize_df,
+            overlap_info=overlap_info,
+            native_embeddings=native_embeddings,
+        )
+
+    def load_transcript(self) -> dict | None:
+        transcript = self.inner.load_transcript() if self.inner else None
+        if transcript is not None:
+            self._transcript = copy.deepcopy(transcript)
+        return transcript
+
+    def save_transcript(self, transcript: dict) -> None:
+        self._transcript = copy.deepcopy(transcript)
+        if self.inner:
+            self.inner.save_transcript(transcript)
+
+    def load_diarization(self) -> tuple[DiarizeResult, dict, dict | None] | None:
+        cached = self.inner.load_diarization() if self.inner else None
+        if cached is not None:
+            self._record_diarization(*cached)
+        return cached
+
+    def save_diarization(
+        self,
+        diarize_df: DiarizeResult,
+        overlap_info: dict,
+        native_embeddings: dict | None,
+    ) -> None:
+        self._record_diarization(diarize_df, overlap_info, native_embeddings)
+        if self.inner:
+            self.inner.save_diarization(diarize_df, overlap_info, native_embeddings)
+
+    def _record_diarization(
+        self,
+        diarize_df: DiarizeResult,
+        overlap_info: dict,
+        native_embeddings: dict | None,
+    ) -> None:
+        self._diarization = (
+            diarize_df,
+            copy.deepcopy(overlap_info),
+            dict(native_embeddings) if native_embeddings else None,
+        )
@@ -4,6 +4,10 @@ Loads raw GPU outputs (transcript + diarization) saved by the pipeline
 and reruns the cheap post-processing steps (sentence split, speaker
 assignment, dedup). No GPU needed — runs in <1s.
 
+``repostprocess`` is the production entry point used by the CPU
+re-postprocess task on the ``RawOutputs`` kept for every file; the rest of
+this module is the debug CLI.
+
 Usage:
     # From backend/ directory with venv active:
     PYTHONPATH=. python -m app.transcription.reprocess /path/to/debug_dir
@@ -19,21 +23,51 @@ The debug_dir should contain:
     raw_diarization.json  - from pipeline's _save_intermediate()
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
 import os
 import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from typing import Any
 
 import numpy as np
 
 from app.transcription.diarize_result import DiarizeResult
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+if TYPE_CHECKING:
+    from app.transcription.raw_outputs import RawOutputs
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PostprocessOptions:
+    """Tunables of the steps that run after inference.
+
+    Defaults reproduce the transcription pipeline.
+    """
+
+    enable_sentence_splitting: bool = True
+    enable_dedup: bool = True
+    dedup_overlap_threshold: float = 0.6
+    # Merge diarized speakers down to this count using their embeddings
+    num_speakers: int | None = None
+    max_speakers: int | None = None
+    resegment_by_speaker: bool = True
+    # 0 disables merging of consecutive same-speaker segments
+    merge_max_duration: float = 30.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> PostprocessOptions:
+        """Build from a task payload, ignoring unset and unknown keys."""
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in (data or {}).items() if k in known and v is not None})
+
+
 def load_intermediate(debug_dir: str) -> tuple[dict, DiarizeResult]:
     """Load raw transcript and diarization from saved files."""
     transcript_path = os.path.join(debug_dir, "raw_transcript.json")
@@ -44,11 +78,7 @@ def load_intermediate(debug_dir: str) -> tuple[dict, DiarizeResult]:
 
     with open(diarize_path) as f:
         records = json.load(f)
-    diarize_df = DiarizeResult(
-        start=np.asarray([r["start"] for r in records], dtype=np.float64),
-        end=np.asarray([r["end"] for r in records], dtype=np.float64),
-        speaker=np.asarray([r["speaker"] for r in records], dtype=object),
-    )
+    diarize_df = DiarizeResult.from_records(records)
 
     logger.info(
         f"Loaded: {len(transcript.get('segments', []))} segments, "
@@ -98,6 +128,128 @@ def reprocess(
     return result
 
 
+def constrain_speakers(
+    diarize_df: DiarizeResult,
+    native_embeddings: dict[str, np.ndarray] | None,
+    num_speakers: int | None = None,
+    max_speakers: int | None = None,
+) -> tuple[DiarizeResult, dict[str, np.ndarray] | None]:
+    """Merge diarized speakers until a speaker-count constraint holds.
+
+    Repeatedly merges the pair of speakers whose native PyAnnote centroids
+    are most similar (cosine), keeping the label of the speaker with more
+    speech and a duration-weighted centroid. Speakers without a centroid
+    are never merged. Splitting speakers (raising the count) needs a new
+    diarization run and is not attempted here.
+
+    Returns:
+        The relabelled diarization and the merged centroids.
+    """
+    target = num_speakers if num_speakers is not None else max_speakers
+    if target is None or len(diarize_df) == 0 or not native_embeddings:
+        return diarize_df, native_embeddings
+
+    speakers = diarize_df.speaker.astype(str)
+    durations = diarize_df.end - diarize_df.start
+    labels = [label for label in np.unique(speakers).tolist() if label in native_embeddings]
+    if len(np.unique(speakers)) <= target or len(labels) < 2:
+        return diarize_df, native_embeddings
+
+    weights = np.array([durations[speakers == label].sum() for label in labels])
+    centroids = np.stack(
+        [np.asarray(native_embeddings[label], dtype=np.float64) for label in labels]
+    )
+    active = np.ones(len(labels), dtype=bool)
+    relabel = {label: label for label in labels}
+    excess = len(np.unique(speakers)) - target
+
+    while excess > 0 and active.sum() > 1:
+        normed = centroids / np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-8)
+        similarity = normed @ normed.T
+        similarity[~active, :] = -np.inf
+        similarity[:, ~active] = -np.inf
+        np.fill_diagonal(similarity, -np.inf)
+        i, j = np.unravel_index(int(np.argmax(similarity)), similarity.shape)
+        keep, drop = (i, j) if weights[i] >= weights[j] else (j, i)
+
+        centroids[keep] = (centroids[keep] * weights[keep] + centroids[drop] * weights[drop]) / max(
+            weights[keep] + weights[drop], 1e-8
+        )
+        weights[keep] += weights[drop]
+        active[drop] = False
+        for label, target_label in relabel.items():
+            if target_label == labels[drop]:
+                relabel[label] = labels[keep]
+        logger.info(
+            f"Merged speaker {labels[drop]} into {labels[keep]} (similarity {similarity[i, j]:.3f})"
+        )
+        excess -= 1
+
+    if excess > 0:
+        logger.warning(
+            f"Could not reach {target} speakers from embeddings; "
+            f"{excess} speakers without centroids remain"
+        )
+
+    merged = DiarizeResult(
+        start=diarize_df.start,
+        end=diarize_df.end,
+        speaker=np.asarray([relabel.get(s, s) for s in speakers], dtype=object),
+    )
+    merged_embeddings = {
+        labels[k]: (centroids[k] / max(np.linalg.norm(centroids[k]), 1e-8)).astype(np.float32)
+        for k in np.flatnonzero(active)
+    }
+    return merged, merged_embeddings
+
+
+def repostprocess(raw: RawOutputs, options: PostprocessOptions) -> dict:
+    """Rebuild the pipeline result from kept raw outputs without inference.
+
+    Mirrors ``TranscriptionPipeline.process`` after the model calls: speaker
+    constraint, sentence split + dedup, speaker assignment. The result has
+    the same keys the pipeline returns, ready for resegmentation and saving.
+    """
+    from app.transcription.speaker_assigner import assign_speakers
+    from app.utils.segment_dedup import clean_segments
+
+    step_start = time.perf_counter()
+    result: dict[str, Any] = {
+        "segments": clean_segments(
+            list(raw.transcript.get("segments", [])),
+            enable_sentence_splitting=options.enable_sentence_splitting,
+            enable_dedup=options.enable_dedup,
+            overlap_threshold=options.dedup_overlap_threshold,
+        ),
+        "language": raw.transcript.get("language"),
+    }
+
+    if raw.diarize_df is None:
+        for seg in result["segments"]:
+            seg["speaker"] = "SPEAKER_00"
+            for word in seg.get("words", []):
+                word["speaker"] = "SPEAKER_00"
+        result["diarization_disabled"] = True
+    else:
+        diarize_df, native_embeddings = constrain_speakers(
+            raw.diarize_df,
+            raw.native_embeddings,
+            num_speakers=options.num_speakers,
+            max_speakers=options.max_speakers,
+        )
+        result = assign_speakers(diarize_df, result)
+        if raw.overlap_info.get("count", 0) > 0:
+            result["overlap_info"] = raw.overlap_info
+        if native_embeddings:
+            result["native_speaker_embeddings"] = native_embeddings
+
+    logger.info(
+        f"TIMING: repostprocess completed in {time.perf_counter() - step_start:.3f}s - "
+        f"{len(result['segments'])} segments"
+    )
+    return result
+
+
 def print_summary(result: dict, num_lines: int = 20) -> None:
     """Print first N segments for human review."""
     segments = result.get("segments", [])
@@ -132,6 +284,7 @@ def print_summary(result: dict, num_lines: int = 20) -> None:
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = argparse.ArgumentParser(description="Reprocess saved pipeline data")
     parser.add_argument(
         "debug_dir", help="Directory with raw_transcript.json and raw_diarization.json"
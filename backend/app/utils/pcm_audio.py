@@ -0,0 +1,138 @@
+"""Zero-copy reader for the pipeline's own PCM audio artifact.
+
+Preprocess writes ``audio.wav`` as 16 kHz mono ``pcm_s16le``. Every later
+stage (transcription, diarization, speaker embeddings, speaker attributes)
+used to decode that file again through ffmpeg or PyAV even though the
+samples are already sitting in the file in the format they need.
+
+``open_pcm_wav`` parses the RIFF header and returns a read-only
+``np.memmap`` over the data chunk, so opening is O(1), slicing a segment is
+O(1) and only the pages that are read become resident. It returns None for
+anything that is not plain mono PCM at the requested rate (compressed
+audio, stereo, other sample rates, URLs), and callers then fall back to
+ffmpeg as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format tag, bits per sample) -> little-endian sample dtype
+_SAMPLE_DTYPES = {
+    (_WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+}
+
+# Data chunk sizes written by streaming encoders that never seek back
+_UNKNOWN_DATA_SIZES = (0, 0xFFFFFFFF)
+
+
+def _read_wav_layout(path: str) -> tuple[np.dtype, int, int, int, int] | None:
+    """Return (dtype, channels, sample_rate, data_offset, data_size) of a WAV file."""
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        fmt: bytes | None = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            (size,) = struct.unpack("<I", chunk_header[4:])
+            if chunk_id == b"data":
+                data_offset = f.tell()
+                break
+            if chunk_id == b"fmt ":
+                fmt = f.read(size)
+                f.seek(size & 1, os.SEEK_CUR)
+            else:
+                # Chunks are word-aligned: odd sizes carry a pad byte
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+    if fmt is None or len(fmt) < 16:
+        return None
+    format_tag, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # The real format tag is the first two bytes of the SubFormat GUID
+        (format_tag,) = struct.unpack("<H", fmt[24:26])
+
+    dtype = _SAMPLE_DTYPES.get((format_tag, bits))
+    if dtype is None:
+        return None
+    return dtype, channels, sample_rate, data_offset, size
+
+
+def open_pcm_wav(path: str, sample_rate: int = 16000) -> np.ndarray | None:
+    """Memory-map the samples of a mono PCM WAV at ``sample_rate``.
+
+    Args:
+        path: Local file path. URLs and missing files return None.
+        sample_rate: Required sample rate; other rates return None.
+
+    Returns:
+        Read-only 1-D ``np.memmap`` of int16 or float32 samples, or None when
+        the file is not in a format that can be used without decoding.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        layout = _read_wav_layout(path)
+    except (OSError, struct.error) as e:
+        logger.debug("Could not read WAV header of %s: %s", path, e)
+        return None
+    if layout is None:
+        return None
+
+    dtype, channels, file_rate, data_offset, data_size = layout
+    if channels != 1 or file_rate != sample_rate:
+        return None
+
+    available = os.path.getsize(path) - data_offset
+    if data_size in _UNKNOWN_DATA_SIZES or data_size > available:
+        data_size = available
+    num_samples = data_size // dtype.itemsize
+    if num_samples <= 0:
+        return None
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=(num_samples,))
+
+
+def read_pcm_wav(path: str, sample_rate: int = 16000) -> np.ndarray | None:
+    """Whole artifact as an owned float32 array, or None for foreign formats.
+
+    One conversion pass over the mapped samples and no decoder, for callers
+    that need the full signal in memory.
+    """
+    pcm = open_pcm_wav(path, sample_rate)
+    if pcm is None:
+        return None
+    audio = pcm_to_float32(pcm)
+    return np.array(audio) if audio is pcm else audio
+
+
+def pcm_to_float32(samples: np.ndarray) -> np.ndarray:
+    """Convert PCM samples to float32 in [-1, 1].
+
+    Float32 input is returned as is (a view for memmaps). Int16 input is
+    scaled by 1/32768, the same as ffmpeg's ``pcm_f32le`` output and
+    faster-whisper's decoder, so results match the decoding paths exactly.
+    Only the samples passed in are converted, so converting a slice costs
+    O(slice length).
+    """
+    if samples.dtype == np.float32:
+        return samples
+    audio = samples.astype(np.float32)
+    audio *= np.float32(1 / 32768)  # Power of two: identical to dividing
+    return audio
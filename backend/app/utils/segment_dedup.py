@@ -423,6 +423,7 @@ def clean_segments(
     segments: list[dict],
     enable_sentence_splitting: bool = True,
     enable_dedup: bool = True,
+    overlap_threshold: float = 0.6,
 ) -> list[dict]:
     """
     Full segment cleaning pipeline: sentence split, dedup, clamp overlaps.
@@ -434,6 +435,7 @@ def clean_segments(
         segments: Raw segments from WhisperX transcription
         enable_sentence_splitting: Split multi-sentence segments using NLTK
         enable_dedup: Remove overlapping/duplicate segments
+        overlap_threshold: Containment fraction passed to ``deduplicate_segments``
 
     Returns:
         Cleaned segments ready for speaker assignment and storage
@@ -447,7 +449,7 @@ def clean_segments(
         result = split_sentences_nltk(result)
 
     if enable_dedup:
-        result = deduplicate_segments(result)
+        result = deduplicate_segments(result, overlap_threshold=overlap_threshold)
 
     # Final pass: clamp any remaining timestamp overlaps between adjacent segments
     clamped = _clamp_overlapping_timestamps(result)
@@ -0,0 +1,236 @@
+"""
+Multi-resolution waveform pyramid.
+
+A file's audio is decoded once and reduced to a base level of at most
+``WAVEFORM_PYRAMID_BASE_BINS`` bins, each holding the bin's minimum, maximum
+and RMS amplitude as int16. Coarser levels halve the bin count until it drops
+below ``WAVEFORM_PYRAMID_MIN_BINS``. Any requested width is served by
+reducing the coarsest level that still has at least that many bins, so no
+decoding happens at request time.
+
+Binary layout (little-endian), stored in ``media_file.waveform_pyramid``::
+
+    header  magic "OTWP", version u8, level count u8, reserved u16,
+            sample_rate u32, original_sample_rate u32, base_bin u32,
+            total_samples u64, expected_duration f64
+    level   bin count u32, then min[n], max[n], rms[n] as int16
+"""
+
+import struct
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+import numpy as np
+
+PYRAMID_MAGIC = b"OTWP"
+PYRAMID_VERSION = 1
+
+WAVEFORM_PYRAMID_BASE_BINS = 32768  # ~3x headroom over the 10k-point API maximum
+WAVEFORM_PYRAMID_MIN_BINS = 256
+
+_HEADER = struct.Struct("<4sBBHIIIQd")
+_LEVEL_LEN = struct.Struct("<I")
+
+# Bins processed per block when building the base level, to bound temporaries
+_BUILD_BLOCK_BINS = 4096
+
+
+@dataclass
+class WaveformPyramid:
+    """Min/max/RMS peak pyramid for one media file.
+
+    ``levels[0]`` is the finest level. Each level is an int16 array of shape
+    ``(3, n_bins)`` holding min, max and RMS rows.
+    """
+
+    sample_rate: int
+    base_bin: int
+    total_samples: int
+    original_sample_rate: int = 0
+    expected_duration: float = 0.0
+    levels: list[np.ndarray] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the decoded audio in seconds."""
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+    @classmethod
+    def build(
+        cls,
+        pcm: np.ndarray,
+        sample_rate: int,
+        original_sample_rate: int = 0,
+        expected_duration: float = 0.0,
+        base_bins: int = WAVEFORM_PYRAMID_BASE_BINS,
+        min_bins: int = WAVEFORM_PYRAMID_MIN_BINS,
+    ) -> "WaveformPyramid":
+        """Build a pyramid from mono int16 PCM."""
+        pcm = np.asarray(pcm, dtype=np.int16)
+        total = len(pcm)
+        base_bin = max(1, -(-total // base_bins))
+
+        levels = [_reduce_pcm(pcm, base_bin)]
+        while levels[-1].shape[1] > min_bins:
+            levels.append(_halve_level(levels[-1]))
+
+        return cls(
+            sample_rate=sample_rate,
+            base_bin=base_bin,
+            total_samples=total,
+            original_sample_rate=original_sample_rate,
+            expected_duration=expected_duration,
+            levels=levels,
+        )
+
+    def _level_for(self, points: int) -> np.ndarray:
+        """Coarsest level that still has at least ``points`` bins."""
+        for level in reversed(self.levels):
+            if level.shape[1] >= points:
+                return level
+        return self.levels[0]
+
+    def resample(self, points: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reduce to ``points`` bins.
+
+        Returns ``(mins, maxs, rms)`` as float arrays normalised to [-1, 1]
+        (min/max) and [0, 1] (RMS).
+        """
+        level = self._level_for(points).astype(np.float64) / 32768.0
+        n_bins = level.shape[1]
+        if n_bins == 0:
+            zeros = np.zeros(points)
+            return zeros, zeros.copy(), zeros.copy()
+
+        if n_bins < points:
+            # Fewer bins than requested (very short audio): interpolate
+            positions = np.linspace(0, n_bins - 1, points)
+            index = np.arange(n_bins)
+            return tuple(np.interp(positions, index, row) for row in level)  # type: ignore[return-value]
+
+        edges = (np.arange(points + 1) * n_bins) // points
+        starts = edges[:-1]
+        counts = np.diff(edges)
+        mins = np.minimum.reduceat(level[0], starts)
+        maxs = np.maximum.reduceat(level[1], starts)
+        rms = np.sqrt(np.add.reduceat(level[2] ** 2, starts) / counts)
+        return mins, maxs, rms
+
+    def to_bytes(self) -> bytes:
+        """Serialise to the compact binary layout."""
+        parts = [
+            _HEADER.pack(
+                PYRAMID_MAGIC,
+                PYRAMID_VERSION,
+                len(self.levels),
+                0,
+                self.sample_rate,
+                self.original_sample_rate,
+                self.base_bin,
+                self.total_samples,
+                self.expected_duration,
+            )
+        ]
+        for level in self.levels:
+            parts.append(_LEVEL_LEN.pack(level.shape[1]))
+            parts.append(level.astype("<i2").tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WaveformPyramid":
+        """Deserialise from the binary layout.
+
+        Raises:
+            ValueError: If the blob is truncated or not a supported pyramid.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Waveform pyramid blob is truncated")
+        (
+            magic,
+            version,
+            n_levels,
+            _reserved,
+            sample_rate,
+            original_sample_rate,
+            base_bin,
+            total_samples,
+            expected_duration,
+        ) = _HEADER.unpack_from(data, 0)
+        if magic != PYRAMID_MAGIC or version != PYRAMID_VERSION:
+            raise ValueError("Unsupported waveform pyramid format")
+
+        offset = _HEADER.size
+        levels = []
+        for _ in range(n_levels):
+            (n_bins,) = _LEVEL_LEN.unpack_from(data, offset)
+            offset += _LEVEL_LEN.size
+            size = 3 * n_bins * 2
+            if offset + size > len(data):
+                raise ValueError("Waveform pyramid blob is truncated")
+            level = np.frombuffer(data, dtype="<i2", count=3 * n_bins, offset=offset)
+            levels.append(level.reshape(3, n_bins).astype(np.int16))
+            offset += size
+
+        return cls(
+            sample_rate=sample_rate,
+            base_bin=base_bin,
+            total_samples=total_samples,
+            original_sample_rate=original_sample_rate,
+            expected_duration=expected_duration,
+            levels=levels,
+        )
+
+
+def load_pyramid(data: Optional[bytes]) -> Optional[WaveformPyramid]:
+    """Decode a stored pyramid, returning None for missing or unreadable blobs."""
+    if not data:
+        return None
+    try:
+        return WaveformPyramid.from_bytes(bytes(data))
+    except (ValueError, struct.error):
+        return None
+
+
+def _reduce_pcm(pcm: np.ndarray, bin_size: int) -> np.ndarray:
+    """Min/max/RMS of consecutive ``bin_size`` sample bins (last bin may be short)."""
+    total = len(pcm)
+    n_bins = -(-total // bin_size) if total else 0
+    out = np.zeros((3, n_bins), dtype=np.int16)
+    full_bins = total // bin_size
+
+    block = _BUILD_BLOCK_BINS
+    for start in range(0, full_bins, block):
+        stop = min(start + block, full_bins)
+        chunk = pcm[start * bin_size : stop * bin_size].reshape(stop - start, bin_size)
+        out[0, start:stop] = chunk.min(axis=1)
+        out[1, start:stop] = chunk.max(axis=1)
+        squares = np.square(chunk, dtype=np.float64)
+        out[2, start:stop] = np.minimum(np.sqrt(squares.mean(axis=1)), 32767)
+
+    if full_bins < n_bins:
+        tail = pcm[full_bins * bin_size :]
+        out[0, -1] = tail.min()
+        out[1, -1] = tail.max()
+        out[2, -1] = min(np.sqrt(np.square(tail, dtype=np.float64).mean()), 32767)
+
+    return out
+
+
+def _halve_level(level: np.ndarray) -> np.ndarray:
+    """Merge adjacent bin pairs (an odd trailing bin is carried over)."""
+    n_bins = level.shape[1]
+    pairs = n_bins // 2
+    merged_len = pairs + (n_bins % 2)
+    out = np.empty((3, merged_len), dtype=np.int16)
+
+    even = level[:, 0 : 2 * pairs : 2]
+    odd = level[:, 1 : 2 * pairs : 2]
+    out[0, :pairs] = np.minimum(even[0], odd[0])
+    out[1, :pairs] = np.maximum(even[1], odd[1])
+    rms_sq = (even[2].astype(np.float64) ** 2 + odd[2].astype(np.float64) ** 2) / 2
+    out[2, :pairs] = np.minimum(np.sqrt(rms_sq), 32767)
+
+    if n_bins % 2:
+        out[:, -1] = level[:, -1]
+    return out
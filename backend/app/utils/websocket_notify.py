@@ -8,6 +8,7 @@ and forwards it to the user's active WebSocket connections.
 
 import json
 import logging
+from collections.abc import Iterable
 
 from app.core.redis import get_redis
 
@@ -47,3 +48,33 @@ def send_ws_event(user_id: int, notification_type: str, data: dict) -> bool:
             e,
         )
         return False
+
+
+def send_ws_events(events: Iterable[tuple[int, str, dict]]) -> bool:
+    """Publish several WebSocket notifications in one Redis round trip.
+
+    Args:
+        events: ``(user_id, notification_type, data)`` triples, published in
+            order through a non-transactional pipeline.
+
+    Returns:
+        True on success (including an empty batch), False on failure.
+    """
+    events = list(events)
+    if not events:
+        return True
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for user_id, notification_type, data in events:
+            notification = {
+                "user_id": user_id,
+                "type": notification_type,
+                "data": data,
+            }
+            pipe.publish("websocket_notifications", json.dumps(notification))
+        pipe.execute()
+        logger.debug("Published %d WS notifications in one pipeline", len(events))
+        return True
+    except Exception as e:
+        logger.error("Failed to publish %d WS notifications: %s", len(events), e)
+        return False
@@ -0,0 +1,168 @@
+"""
+Packed word-level timings for transcript segments.
+
+Word timestamps used to be stored as a JSONB list of
+``{"word", "start", "end", "score"}`` dicts, one object per word, which made
+every segment load parse megabytes of JSON for long files. They are now
+stored in ``transcript_segment.word_timings`` as a compact blob that decodes
+into NumPy views over the column bytes without copying; word dicts are only
+built when a caller asks for them.
+
+Binary layout (little-endian)::
+
+    header  magic "OTWT", version u8, reserved u8, reserved u16,
+            word count u32, token bytes u32
+    body    start[n], end[n], score[n] as float32,
+            token offsets[n + 1] as uint32, UTF-8 token blob
+
+The header is 16 bytes and every array is 4-byte aligned, so
+``np.frombuffer`` can view each one in place.
+"""
+
+import struct
+from typing import Any
+from typing import Optional
+from typing import Union
+
+import numpy as np
+
+WORD_TIMINGS_MAGIC = b"OTWT"
+WORD_TIMINGS_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBHII")
+
+# float32 resolves ~2 ms at 5 hours; round back to what the ASR emitted
+_TIME_DECIMALS = 3
+_SCORE_DECIMALS = 4
+
+
+class WordTimings:
+    """Word timings of one segment as parallel arrays.
+
+    ``starts``, ``ends`` and ``scores`` are float32 arrays; when built with
+    ``from_bytes`` they are read-only views over the stored bytes. Tokens are
+    decoded from the UTF-8 blob on access.
+    """
+
+    __slots__ = ("starts", "ends", "scores", "_offsets", "_blob")
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        scores: np.ndarray,
+        offsets: np.ndarray,
+        blob: Union[bytes, memoryview],
+    ) -> None:
+        self.starts = starts
+        self.ends = ends
+        self.scores = scores
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @classmethod
+    def from_words(cls, words: list[dict[str, Any]]) -> "WordTimings":
+        """Pack word dicts, skipping entries without timestamps.
+
+        Accepts either ``score`` or Whisper's ``probability`` for confidence.
+        """
+        timed = [w for w in words if "start" in w and "end" in w]
+        encoded = [str(w.get("word", "")).encode("utf-8") for w in timed]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+        if encoded:
+            offsets[1:] = np.cumsum([len(b) for b in encoded])
+        return cls(
+            starts=np.asarray([w["start"] for w in timed], dtype=np.float32),
+            ends=np.asarray([w["end"] for w in timed], dtype=np.float32),
+            scores=np.asarray(
+                [w.get("score", w.get("probability", 1.0)) for w in timed], dtype=np.float32
+            ),
+            offsets=offsets,
+            blob=b"".join(encoded),
+        )
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "WordTimings":
+        """Decode a packed blob without copying the arrays.
+
+        Raises:
+            ValueError: If the blob is not packed word timings of the current version.
+        """
+        buf = memoryview(data)
+        if len(buf) < _HEADER.size:
+            raise ValueError("Word timings blob is truncated")
+        magic, version, _, _, count, token_bytes = _HEADER.unpack_from(buf)
+        if magic != WORD_TIMINGS_MAGIC or version != WORD_TIMINGS_VERSION:
+            raise ValueError(f"Unsupported word timings format: {magic!r} v{version}")
+
+        expected = _HEADER.size + 4 * (3 * count + count + 1) + token_bytes
+        if len(buf) != expected:
+            raise ValueError(f"Word timings blob has {len(buf)} bytes, expected {expected}")
+
+        columns = []
+        pos = _HEADER.size
+        for dtype, n in (("<f4", count), ("<f4", count), ("<f4", count), ("<u4", count + 1)):
+            columns.append(np.frombuffer(buf, dtype=dtype, count=n, offset=pos))
+            pos += 4 * n
+        starts, ends, scores, offsets = columns
+        return cls(starts, ends, scores, offsets, blob=buf[pos:])
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the packed layout described in the module docstring."""
+        blob = bytes(self._blob)
+        header = _HEADER.pack(WORD_TIMINGS_MAGIC, WORD_TIMINGS_VERSION, 0, 0, len(self), len(blob))
+        return b"".join(
+            (
+                header,
+                self.starts.astype("<f4", copy=False).tobytes(),
+                self.ends.astype("<f4", copy=False).tobytes(),
+                self.scores.astype("<f4", copy=False).tobytes(),
+                self._offsets.astype("<u4", copy=False).tobytes(),
+                blob,
+            )
+        )
+
+    def token(self, index: int) -> str:
+        """Decode the text of a single word."""
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+    @property
+    def tokens(self) -> list[str]:
+        """Decode the text of every word."""
+        blob = bytes(self._blob)
+        bounds = self._offsets.tolist()
+        return [blob[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+
+    def to_words(self) -> list[dict[str, Any]]:
+        """Rebuild the legacy ``{"word", "start", "end", "score"}`` dicts."""
+        starts = np.round(self.starts.astype(np.float64), _TIME_DECIMALS).tolist()
+        ends = np.round(self.ends.astype(np.float64), _TIME_DECIMALS).tolist()
+        scores = np.round(self.scores.astype(np.float64), _SCORE_DECIMALS).tolist()
+        return [
+            {"word": word, "start": start, "end": end, "score": score}
+            for word, start, end, score in zip(self.tokens, starts, ends, scores)
+        ]
+
+
+def pack_words(words: Optional[list[dict[str, Any]]]) -> Optional[bytes]:
+    """Pack word dicts for ``transcript_segment.word_timings``; None if no timed words."""
+    if not words:
+        return None
+    timings = WordTimings.from_words(words)
+    return timings.to_bytes() if len(timings) else None
+
+
+def segment_words(segment: Any) -> Optional[list[dict[str, Any]]]:
+    """Word dicts of a transcript segment, whichever column holds them.
+
+    Reads the packed ``word_timings`` column and falls back to the legacy
+    JSONB ``words`` column for rows not yet converted.
+    """
+    data = segment.word_timings
+    if data is not None:
+        return WordTimings.from_bytes(data).to_words()
+    return segment.words or None
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Speaker assignment engine benchmark.
+
+Compares the dense (words × turns) matrix engine against the sorted sweep
+engine in app.transcription.speaker_assigner on synthetic transcripts of
+increasing size. Reports wall time, peak transient memory (tracemalloc) and
+whether both engines produced identical assignments.
+
+Usage:
+    cd backend
+    python -m scripts.benchmark_speaker_assignment
+    python -m scripts.benchmark_speaker_assignment --sizes 10000:1000 80000:10000
+    python -m scripts.benchmark_speaker_assignment --output assign_bench.json
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.transcription.diarize_result import DiarizeResult
+from app.transcription.speaker_assigner import ENGINE_MATRIX
+from app.transcription.speaker_assigner import ENGINE_SWEEP
+from app.transcription.speaker_assigner import assign_speakers
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+# words:turns pairs, roughly 10 min → 6 h of meeting audio
+DEFAULT_SIZES = ["1500:200", "10000:1200", "40000:5000", "80000:10000"]
+
+
+def build_case(
+    n_words: int, n_turns: int, n_speakers: int, seed: int
+) -> tuple[DiarizeResult, dict]:
+    """Build a synthetic diarization + transcript pair."""
+    rng = np.random.default_rng(seed)
+    total = n_words * 0.27  # ~220 words per minute
+    starts = np.sort(rng.uniform(0, total, n_turns))
+    ends = starts + rng.uniform(0.3, 12.0, n_turns)
+    labels = np.array(
+        [f"SPEAKER_{i:02d}" for i in rng.integers(0, n_speakers, n_turns)], dtype=object
+    )
+    diarize = DiarizeResult(start=starts, end=ends, speaker=labels)
+
+    word_starts = np.sort(rng.uniform(0, total, n_words))
+    word_ends = word_starts + rng.uniform(0.05, 0.6, n_words)
+    segments = []
+    for i in range(0, n_words, 15):
+        words = [
+            {"word": "w", "start": float(word_starts[j]), "end": float(word_ends[j])}
+            for j in range(i, min(i + 15, n_words))
+        ]
+        segments.append({"start": words[0]["start"], "end": words[-1]["end"], "words": words})
+    return diarize, {"segments": segments}
+
+
+def run_engine(engine: str, diarize: DiarizeResult, transcript: dict) -> tuple[dict, float, float]:
+    """Run one engine and return (result, seconds, peak MiB)."""
+    os.environ["SPEAKER_ASSIGN_ENGINE"] = engine
+    payload = copy.deepcopy(transcript)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = assign_speakers(diarize, payload)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="words:turns pairs")
+    parser.add_argument("--speakers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("app.transcription.speaker_assigner").setLevel(logging.WARNING)
+    rows: list[dict[str, Any]] = []
+
+    logger.info(f"{'words':>8} {'turns':>7} {'engine':>7} {'seconds':>9} {'peak MiB':>9} match")
+    for size in args.sizes:
+        n_words, n_turns = (int(v) for v in size.split(":"))
+        diarize, transcript = build_case(n_words, n_turns, args.speakers, args.seed)
+
+        dense, dense_s, dense_mb = run_engine(ENGINE_MATRIX, diarize, transcript)
+        sweep, sweep_s, sweep_mb = run_engine(ENGINE_SWEEP, diarize, transcript)
+        match = dense == sweep
+
+        for engine, seconds, peak in (
+            (ENGINE_MATRIX, dense_s, dense_mb),
+            (ENGINE_SWEEP, sweep_s, sweep_mb),
+        ):
+            logger.info(
+                f"{n_words:>8} {n_turns:>7} {engine:>7} {seconds:>9.3f} {peak:>9.1f} {match}"
+            )
+            rows.append(
+                {
+                    "words": n_words,
+                    "turns": n_turns,
+                    "engine": engine,
+                    "seconds": round(seconds, 4),
+                    "peak_mib": round(peak, 1),
+                    "identical": match,
+                }
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(rows, indent=2))
+        logger.info(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
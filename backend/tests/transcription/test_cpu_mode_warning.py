@@ -2,8 +2,8 @@
 
 The warning is intended to fire once per process when a CPU-only worker
 boots with a configuration intended for GPU (heavy Whisper model and/or
-PyAnnote diarization enabled). It must stay silent for safe CPU configs
-and for any GPU config.
+PyTorch diarization on CPU). It must stay silent for safe CPU configs,
+for ONNX Runtime diarization and for any GPU config.
 """
 
 from __future__ import annotations
@@ -29,6 +29,7 @@ def _config(**overrides: Any) -> TranscriptionConfig:
     base: dict[str, Any] = {
         "model_name": "base",
         "device": "cpu",
+        "diarization_device": "cpu",
         "enable_diarization": False,
     }
     base.update(overrides)
@@ -52,6 +53,20 @@ def test_warns_on_cpu_with_diarization_enabled(caplog):
     assert any("ENABLE_DIARIZATION" in rec.message for rec in caplog.records)
 
 
+def test_silent_for_onnx_diarization_on_cpu(caplog):
+    cfg = _config(enable_diarization=True, diarization_backend="onnx")
+    with caplog.at_level(logging.WARNING, logger="app.transcription.config"):
+        TranscriptionConfig._maybe_warn_cpu_mode_misconfigured(cfg)
+    assert caplog.records == []
+
+
+def test_silent_for_hybrid_gpu_diarization(caplog):
+    cfg = _config(enable_diarization=True, diarization_device="cuda")
+    with caplog.at_level(logging.WARNING, logger="app.transcription.config"):
+        TranscriptionConfig._maybe_warn_cpu_mode_misconfigured(cfg)
+    assert caplog.records == []
+
+
 def test_warns_only_once_per_process(caplog):
     cfg = _config(model_name="large-v3-turbo", enable_diarization=True)
     with caplog.at_level(logging.WARNING, logger="app.transcription.config"):
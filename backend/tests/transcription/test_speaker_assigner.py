@@ -0,0 +1,97 @@
+"""Tests for speaker assignment overlap engines.
+
+The sweep engine must reproduce the dense matrix engine exactly: same
+dominant speaker per word/segment, same lowest-index tie-breaking, and the
+same nearest-midpoint fill for queries with no overlap.
+"""
+
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+import pytest
+
+from app.transcription import speaker_assigner
+from app.transcription.diarize_result import DiarizeResult
+from app.transcription.speaker_assigner import assign_speakers
+
+
+def _diarize(turns: list[tuple[float, float, str]]) -> DiarizeResult:
+    return DiarizeResult(
+        start=np.array([t[0] for t in turns], dtype=np.float64),
+        end=np.array([t[1] for t in turns], dtype=np.float64),
+        speaker=np.array([t[2] for t in turns], dtype=object),
+    )
+
+
+def _random_case(seed: int, n_words: int, n_turns: int, n_speakers: int):
+    rng = np.random.default_rng(seed)
+    total = n_words * 0.4
+    starts = np.sort(rng.uniform(0, total, n_turns)).round(2)
+    ends = (starts + rng.uniform(0.1, 8.0, n_turns)).round(2)
+    labels = [f"SPEAKER_{rng.integers(n_speakers):02d}" for _ in range(n_turns)]
+    diarize = _diarize(list(zip(starts, ends, labels)))
+
+    word_starts = np.sort(rng.uniform(0, total + 20, n_words)).round(2)
+    word_ends = (word_starts + rng.uniform(0.0, 0.6, n_words)).round(2)
+    segments = []
+    for i in range(0, n_words, 12):
+        words = [
+            {"word": f"w{j}", "start": float(word_starts[j]), "end": float(word_ends[j])}
+            for j in range(i, min(i + 12, n_words))
+        ]
+        segments.append({"start": words[0]["start"], "end": words[-1]["end"], "words": words})
+    return diarize, {"segments": segments}
+
+
+def _run(engine: str, diarize: DiarizeResult, transcript: dict, monkeypatch) -> dict:
+    monkeypatch.setenv("SPEAKER_ASSIGN_ENGINE", engine)
+    return assign_speakers(diarize, copy.deepcopy(transcript))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sweep_matches_matrix(seed, monkeypatch):
+    diarize, transcript = _random_case(seed, n_words=3000, n_turns=400, n_speakers=6)
+    dense = _run("matrix", diarize, transcript, monkeypatch)
+    sweep = _run("sweep", diarize, transcript, monkeypatch)
+    assert sweep == dense
+
+
+def test_tie_goes_to_lowest_speaker_index(monkeypatch):
+    diarize = _diarize([(0.0, 1.0, "SPEAKER_01"), (1.0, 2.0, "SPEAKER_00")])
+    transcript = {"segments": [{"start": 0.5, "end": 1.5, "words": []}]}
+    for engine in ("matrix", "sweep"):
+        result = _run(engine, diarize, transcript, monkeypatch)
+        assert result["segments"][0]["speaker"] == "SPEAKER_00"
+
+
+def test_no_overlap_fills_nearest_midpoint(monkeypatch):
+    diarize = _diarize([(0.0, 1.0, "SPEAKER_00"), (10.0, 11.0, "SPEAKER_01")])
+    transcript = {
+        "segments": [
+            {
+                "start": 7.0,
+                "end": 8.0,
+                "words": [{"word": "a", "start": 2.0, "end": 2.5}],
+            }
+        ]
+    }
+    result = _run("sweep", diarize, transcript, monkeypatch)
+    assert result["segments"][0]["speaker"] == "SPEAKER_01"
+    assert result["segments"][0]["words"][0]["speaker"] == "SPEAKER_00"
+
+
+def test_overlap_engines_agree_on_totals():
+    rng = np.random.default_rng(7)
+    d_starts = rng.uniform(0, 100, 50)
+    d_ends = d_starts + rng.uniform(0, 5, 50)
+    d_idx = rng.integers(0, 3, 50)
+    q_starts = rng.uniform(0, 110, 200)
+    q_ends = q_starts + rng.uniform(-0.5, 3, 200)
+    args = (q_starts, q_ends, d_starts, d_ends, d_idx, 3)
+    np.testing.assert_allclose(
+        speaker_assigner._overlap_sweep(*args),
+        speaker_assigner._overlap_matrix(*args),
+        atol=1e-4,
+    )
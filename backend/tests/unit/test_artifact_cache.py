@@ -0,0 +1,58 @@
+"""
+Unit tests for the imohash content-addressed artifact cache.
+
+Artifacts are keyed by content fingerprint plus a hash of the settings that
+produced them, and another user's artifacts are only served when the source
+objects are byte-identical.
+"""
+
+from __future__ import annotations
+
+from app.services.artifact_cache_service import ArtifactSource
+from app.services.artifact_cache_service import artifact_fingerprint
+from app.services.artifact_cache_service import artifact_key
+from app.services.artifact_cache_service import is_trusted
+from app.services.artifact_cache_service import transcription_fingerprint
+from app.transcription.config import TranscriptionConfig
+
+SOURCE = ArtifactSource(imohash="abc123", owner_id=7, source_etag="etag-1")
+
+
+class TestFingerprints:
+    def test_key_layout(self):
+        assert artifact_key("abc123", "audio", "f00d", "wav") == "artifacts/abc123/audio-f00d.wav"
+
+    def test_fingerprint_ignores_key_order(self):
+        assert artifact_fingerprint({"a": 1, "b": 2}) == artifact_fingerprint({"b": 2, "a": 1})
+
+    def test_transcription_settings_change_fingerprint(self):
+        base = TranscriptionConfig()
+        assert transcription_fingerprint(base) == transcription_fingerprint(TranscriptionConfig())
+        assert transcription_fingerprint(base) != transcription_fingerprint(
+            TranscriptionConfig(source_language="de")
+        )
+
+    def test_diarization_only_settings_keep_transcription_fingerprint(self):
+        assert transcription_fingerprint(TranscriptionConfig()) == transcription_fingerprint(
+            TranscriptionConfig(num_speakers=3, max_speakers=5)
+        )
+
+
+class TestTrust:
+    def test_owner_artifacts_need_matching_source_etag(self):
+        assert is_trusted({"owner": "7", "source-etag": "etag-1"}, SOURCE)
+        assert not is_trusted({"owner": "7", "source-etag": "etag-2"}, SOURCE)
+        assert not is_trusted({"owner": "7"}, SOURCE)
+
+    def test_other_user_needs_matching_source_etag(self):
+        assert is_trusted({"owner": "9", "source-etag": "etag-1"}, SOURCE)
+        assert not is_trusted({"owner": "9", "source-etag": "etag-2"}, SOURCE)
+
+    def test_missing_etags_are_never_trusted(self):
+        no_etag = ArtifactSource(imohash="abc123", owner_id=7)
+        assert not is_trusted({"owner": "7"}, no_etag)
+        assert not is_trusted({"owner": "9"}, no_etag)
+
+    def test_source_round_trips_through_task_context(self):
+        assert ArtifactSource.from_dict(SOURCE.to_dict()) == SOURCE
+        assert ArtifactSource.from_dict(None) is None
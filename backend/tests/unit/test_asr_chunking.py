@@ -0,0 +1,121 @@
+"""
+Unit tests for chunked cloud ASR.
+
+Long audio is cut at pauses (or hard-cut with overlap), transcribed per
+chunk, and stitched back onto one timeline without duplicated words.
+"""
+
+from __future__ import annotations
+
+from app.services.asr.chunked import AudioChunk
+from app.services.asr.chunked import plan_chunks
+from app.services.asr.chunked import stitch_results
+from app.services.asr.types import ASRResult
+from app.services.asr.types import ASRSegment
+from app.services.asr.types import ASRWord
+
+
+def _segment(words: list[tuple[str, float, float]]) -> ASRSegment:
+    asr_words = [ASRWord(word=w, start=s, end=e) for w, s, e in words]
+    return ASRSegment(
+        text=" ".join(w for w, _, _ in words),
+        start=asr_words[0].start,
+        end=asr_words[-1].end,
+        words=asr_words,
+    )
+
+
+def _result(*segments: ASRSegment) -> ASRResult:
+    return ASRResult(segments=list(segments), language="en", provider_name="test")
+
+
+class TestPlanChunks:
+    def test_short_audio_is_one_chunk(self):
+        chunks = plan_chunks(500.0, [], 600)
+        assert chunks == [AudioChunk(0, 0.0, 500.0, 0.0, 500.0)]
+
+    def test_cuts_in_longest_pause_before_target(self):
+        silences = [(500.0, 500.4), (560.0, 562.0), (590.0, 590.5), (620.0, 625.0)]
+        chunks = plan_chunks(1500.0, silences, 600)
+        assert chunks[0].end == 561.0
+        assert chunks[1].start == 561.0
+        # Pause cuts need no overlap
+        assert chunks[0].audio_end == chunks[0].end
+        assert chunks[1].audio_start == chunks[1].start
+
+    def test_hard_cut_without_pause_overlaps_neighbours(self):
+        chunks = plan_chunks(1300.0, [], 600, overlap=2.0)
+        assert [(c.start, c.end) for c in chunks] == [(0.0, 600.0), (600.0, 1300.0)]
+        assert chunks[0].audio_end == 602.0
+        assert chunks[1].audio_start == 598.0
+
+    def test_short_tail_is_merged(self):
+        chunks = plan_chunks(700.0, [], 600)
+        assert len(chunks) == 1
+
+    def test_chunks_cover_whole_duration(self):
+        chunks = plan_chunks(7200.0, [(t, t + 1.0) for t in range(0, 7200, 45)], 600)
+        assert chunks[0].start == 0.0
+        assert chunks[-1].end == 7200.0
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert prev.end == nxt.start
+        assert all(c.end - c.start <= 600 for c in chunks[:-1])
+
+
+class TestStitchResults:
+    def test_times_are_offset_by_chunk_start(self):
+        chunks = [AudioChunk(0, 0.0, 10.0, 0.0, 10.0), AudioChunk(1, 10.0, 20.0, 10.0, 20.0)]
+        results = [
+            _result(_segment([("hello", 1.0, 1.5)])),
+            _result(_segment([("world", 2.0, 2.5)])),
+        ]
+        merged = stitch_results(chunks, results)
+        assert [(s.text, s.start, s.end) for s in merged] == [
+            ("hello", 1.0, 1.5),
+            ("world", 12.0, 12.5),
+        ]
+
+    def test_overlap_words_are_kept_once(self):
+        # Hard cut at 10s with 2s overlap on both sides
+        chunks = [AudioChunk(0, 0.0, 10.0, 0.0, 12.0), AudioChunk(1, 10.0, 20.0, 8.0, 20.0)]
+        results = [
+            _result(_segment([("one", 8.5, 9.0), ("two", 9.6, 10.2), ("three", 10.8, 11.4)])),
+            _result(_segment([("one", 0.5, 1.0), ("two", 1.6, 2.2), ("three", 2.8, 3.4)])),
+        ]
+        merged = stitch_results(chunks, results)
+        words = [(w.word, w.start) for s in merged for w in s.words]
+        assert words == [("one", 8.5), ("two", 9.6), ("three", 10.8)]
+        assert [s.text for s in merged] == ["one two", "three"]
+
+    def test_segments_without_words_use_midpoint(self):
+        chunks = [AudioChunk(0, 0.0, 10.0, 0.0, 12.0), AudioChunk(1, 10.0, 20.0, 8.0, 20.0)]
+        results = [
+            _result(ASRSegment(text="tail", start=9.0, end=12.0)),
+            _result(ASRSegment(text="tail", start=1.0, end=4.0)),
+        ]
+        merged = stitch_results(chunks, results)
+        assert [(s.text, s.start) for s in merged] == [("tail", 9.0)]
+
+
+class TestProviderSlots:
+    def test_provider_limit_and_setting_both_cap_chunks(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from app.core.config import settings
+        from app.services.asr import chunked
+        from app.services.asr.assemblyai_provider import AssemblyAIProvider
+        from app.services.asr.google_provider import GoogleASRProvider
+
+        monkeypatch.setattr(chunked, "_provider_slots", {})
+        monkeypatch.setattr(settings, "CLOUD_ASR_CHUNK_CONCURRENCY", 4)
+
+        def limit(provider_cls, name):
+            slots = chunked._slots_for(
+                SimpleNamespace(
+                    provider_name=name, max_concurrent_chunks=provider_cls.max_concurrent_chunks
+                )
+            )
+            return slots._initial_value
+
+        assert limit(GoogleASRProvider, "google") == 2
+        assert limit(AssemblyAIProvider, "assemblyai") == 4
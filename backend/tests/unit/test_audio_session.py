@@ -0,0 +1,102 @@
+"""
+Unit tests for decode-once audio sessions and batched embedding extraction.
+
+The embedding model is mocked so tests run on CPU without downloading any
+PyAnnote weights.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from app.services.audio_segment_utils import AudioSession
+from app.services.speaker_embedding_service import SpeakerEmbeddingService
+
+SR = 16000
+
+
+@pytest.fixture
+def service():
+    """Return a SpeakerEmbeddingService with a fake model (no __init__)."""
+    svc = SpeakerEmbeddingService.__new__(SpeakerEmbeddingService)
+    svc.device = torch.device("cpu")
+
+    def fake_model(waveforms, weights=None):
+        # Embedding = [mean of valid samples, valid length] so tests can check masking
+        valid = weights.sum(dim=1)
+        return torch.stack([waveforms[:, 0, :].sum(dim=1) / (valid * 160), valid], dim=1)
+
+    svc.inference = MagicMock()
+    svc.inference.model = MagicMock(side_effect=fake_model)
+    svc.inference.side_effect = lambda audio: np.array([1.0, 0.0])
+    return svc
+
+
+@pytest.mark.unit
+class TestAudioSession:
+    def test_slice_returns_requested_range(self):
+        audio = np.arange(SR * 3, dtype=np.float32)
+        session = AudioSession.from_array(audio, SR)
+        clip = session.slice(1.0, 1.5)
+        assert len(clip) == SR // 2
+        assert clip[0] == SR
+
+    def test_slice_clamps_to_bounds(self):
+        session = AudioSession.from_array(np.zeros(SR, dtype=np.float32), SR)
+        assert len(session.slice(-1.0, 0.5)) == SR // 2
+        assert len(session.slice(0.5, 10.0)) == SR // 2
+        assert len(session.slice(2.0, 3.0)) == 0
+
+    def test_duration(self):
+        session = AudioSession.from_array(np.zeros(SR * 2, dtype=np.float32), SR)
+        assert session.duration == pytest.approx(2.0)
+
+    def test_slice_before_open_raises(self):
+        with pytest.raises(RuntimeError):
+            AudioSession("missing.wav").slice(0.0, 1.0)
+
+
+@pytest.mark.unit
+class TestBatchedEmbeddings:
+    def test_plan_batches_respects_size_and_pad_ratio(self):
+        lengths = [100, 110, 120, 1000, 1010, 5000]
+        batches = SpeakerEmbeddingService._plan_batches(lengths, batch_size=2)
+        assert batches == [[0, 1], [2], [3, 4], [5]]
+
+    def test_batch_results_align_with_input_order(self, service):
+        clips = [np.full(SR * 2, 2.0, dtype=np.float32), np.full(SR, 1.0, dtype=np.float32)]
+        results = service.extract_embeddings_batch(clips, batch_size=4)
+        assert len(results) == 2
+        for result in results:
+            assert np.linalg.norm(result) == pytest.approx(1.0)
+
+    def test_empty_clip_returns_none(self, service):
+        results = service.extract_embeddings_batch([np.zeros(0, dtype=np.float32)])
+        assert results == [None]
+
+    def test_batch_failure_falls_back_to_single_inference(self, service):
+        service.inference.model.side_effect = RuntimeError("no weights support")
+        clips = [np.ones(SR, dtype=np.float32), np.ones(SR, dtype=np.float32)]
+        results = service.extract_embeddings_batch(clips)
+        assert all(np.allclose(r, [1.0, 0.0]) for r in results)
+        assert service.inference.call_count == 2
+
+    def test_segments_decoded_once(self, service):
+        segments = [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 2.0},
+            {"speaker": "SPEAKER_00", "start": 5.0, "end": 7.0},
+            {"speaker": "SPEAKER_01", "start": 3.0, "end": 4.5},
+        ]
+        session = AudioSession.from_array(np.ones(SR * 10, dtype=np.float32), SR)
+        with patch.object(AudioSession, "open", return_value=session) as open_mock:
+            result = service.extract_embeddings_for_segments(
+                "file.wav", segments, {"SPEAKER_00": 1, "SPEAKER_01": 2}
+            )
+        assert open_mock.call_count == 1
+        assert len(result[1]) == 2
+        assert len(result[2]) == 1
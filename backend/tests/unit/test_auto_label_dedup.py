@@ -0,0 +1,186 @@
+"""
+Unit tests for trigram-prefiltered tag and collection deduplication.
+
+The trigram index must return exactly what the previous SequenceMatcher
+scan returned, so it is checked against a brute-force scan over
+generated near-duplicate names. The database is a fake that records
+which models were queried.
+"""
+
+from __future__ import annotations
+
+import difflib
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.constants import FUZZY_MATCH_THRESHOLD
+from app.models.media import Collection
+from app.models.media import MediaFile
+from app.models.media import Tag
+from app.models.topic import TopicSuggestion
+from app.services import auto_label_service
+from app.services.auto_label_service import AutoLabelService
+from app.services.auto_label_service import TrigramIndex
+
+WORDS = ["machine", "learning", "budget", "review", "team", "meeting", "sales", "forecast"]
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def first(self):
+        return None
+
+    def all(self):
+        return list(self.rows)
+
+
+class FakeDB:
+    def __init__(self, rows_by_model):
+        self.rows_by_model = rows_by_model
+        self.queried: list = []
+        self.expire_on_commit = True
+
+    def query(self, model):
+        self.queried.append(model)
+        return FakeQuery(self.rows_by_model.get(model, []))
+
+
+def _mutate(rng: random.Random, name: str) -> str:
+    chars = list(name)
+    for _ in range(rng.randint(0, 3)):
+        pos = rng.randrange(len(chars))
+        op = rng.choice("dis")
+        if op == "d" and len(chars) > 1:
+            del chars[pos]
+        elif op == "i":
+            chars.insert(pos, rng.choice("aeirstn "))
+        else:
+            chars[pos] = rng.choice("aeirstn")
+    return "".join(chars).strip()
+
+
+def _scan(names: list[str], query: str):
+    for name in names:
+        ratio = difflib.SequenceMatcher(None, query, name).ratio()
+        if ratio >= FUZZY_MATCH_THRESHOLD:
+            return name
+    return None
+
+
+@pytest.mark.unit
+class TestTrigramIndex:
+    def test_matches_full_scan(self):
+        rng = random.Random(7)  # noqa: S311 - reproducible test data
+        names = []
+        for _ in range(400):
+            name = " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+            names.append(_mutate(rng, name) if rng.random() < 0.5 else name)
+        index = TrigramIndex()
+        for name in names:
+            index.add(name, name)
+
+        queries = [_mutate(rng, rng.choice(names)) for _ in range(300)]
+        queries += ["ml", "team", "sales forcast", "x"]
+        for query in queries:
+            assert index.find(query) == _scan(names, query), query
+
+    def test_only_close_names_are_compared(self, monkeypatch):
+        index = TrigramIndex()
+        for i in range(500):
+            index.add(i, f"project {i:04d} kickoff notes")
+        index.add("ml", "machine learning")
+
+        compared = []
+        real_matcher = difflib.SequenceMatcher
+
+        def counting_matcher(isjunk, a, b):
+            compared.append(b)
+            return real_matcher(isjunk, a, b)
+
+        monkeypatch.setattr(auto_label_service.difflib, "SequenceMatcher", counting_matcher)
+        assert index.find("machine learnings") == "ml"
+        assert compared == ["machine learning"]
+
+    def test_empty_names_never_match(self):
+        index = TrigramIndex()
+        index.add("blank", "")
+        assert len(index) == 0
+        assert index.find("") is None
+
+
+@pytest.mark.unit
+class TestServiceDedup:
+    def test_similar_tag_from_cached_index(self):
+        tags = [SimpleNamespace(name="Budget Review"), SimpleNamespace(name="Machine-Learning")]
+        db = FakeDB({Tag: tags})
+        service = AutoLabelService(db)
+
+        assert service.find_existing_similar_tag("machine learnings") is tags[1]
+        assert service.find_existing_similar_tag("sales") is None
+
+        new_tag = SimpleNamespace(name="Sales Forecast")
+        service._remember_tag(new_tag)
+        assert service.find_existing_similar_tag("sales forecasts") is new_tag
+        assert db.queried.count(Tag) == 4  # three exact lookups, one cache load
+
+    def test_retroactive_apply_loads_suggestions_in_chunks(self, monkeypatch):
+        monkeypatch.setattr(auto_label_service, "RETROACTIVE_BATCH_SIZE", 2)
+        suggestions = [SimpleNamespace(id=i, media_file_id=10 + i) for i in range(5)]
+        files = [SimpleNamespace(id=10 + i, filename=f"f{i}", uuid=i) for i in range(4)]
+        db = FakeDB({TopicSuggestion: suggestions, MediaFile: files})
+        service = AutoLabelService(db)
+        monkeypatch.setattr(service, "get_user_auto_label_settings", lambda user_id: {})
+
+        applied = []
+
+        def fake_apply(media_file, suggestion, **kwargs):
+            assert db.expire_on_commit is False
+            applied.append(media_file.id)
+            return {"auto_applied_tags": ["a"], "auto_applied_collections": []}
+
+        monkeypatch.setattr(service, "auto_apply_suggestions", fake_apply)
+        progress = []
+        result = service.retroactive_apply(
+            1, progress_callback=lambda done, total, name, file_uuid: progress.append(done)
+        )
+
+        assert applied == [10, 11, 12, 13]
+        assert result["files_processed"] == 4
+        assert result["files_skipped"] == 1  # suggestion 4 has no media file
+        assert progress == [1, 2, 3, 4]
+        assert db.queried.count(TopicSuggestion) == 4  # id list plus three chunks
+        assert db.queried.count(MediaFile) == 3
+        assert db.expire_on_commit is True
+
+    def test_failed_commit_forgets_remembered_rows(self):
+        class FailingDB(FakeDB):
+            def commit(self):
+                raise RuntimeError("connection lost")
+
+            def rollback(self):
+                self.rolled_back = True
+
+        db = FailingDB({Tag: [], Collection: []})
+        service = AutoLabelService(db)
+        service.find_existing_similar_tag("budget")
+        service._remember_tag(SimpleNamespace(name="Budget Review"))
+        service._get_collection_index(1)
+        service._remember_collection(1, SimpleNamespace(name="Sales"))
+
+        suggestion = SimpleNamespace(suggested_tags=[], suggested_collections=[])
+        with pytest.raises(RuntimeError):
+            service.auto_apply_suggestions(SimpleNamespace(id=1), suggestion, user_id=1)
+
+        assert db.rolled_back
+        assert service.find_existing_similar_tag("budget review") is None
+        assert service.find_existing_similar_collection(1, "sales") is None
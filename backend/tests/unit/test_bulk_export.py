@@ -0,0 +1,202 @@
+"""
+Unit tests for the streaming bulk subtitle export.
+
+Batch rendering is patched out so ordering, bounded prefetch and the
+non-seekable ZIP writer can be checked without a database.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.services import bulk_export_service as bes
+from app.services.bulk_export_service import ExportCandidate
+from app.services.subtitle_service import SubtitleService
+
+
+def _candidates(n: int) -> list[ExportCandidate]:
+    return [ExportCandidate(i, f"file_{i}") for i in range(n)]
+
+
+def _fake_render(batch, subtitle_format, include_speakers):
+    return [(f"{c.base_name}.srt", f"content {c.file_id}".encode()) for c in batch]
+
+
+class TestStreamZip:
+    def test_chunks_form_valid_archive(self):
+        entries = [(f"f{i}.srt", f"line {i}\n".encode() * 50) for i in range(5)]
+
+        chunks = list(bes.stream_zip(iter(entries)))
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        assert len(chunks) > 1  # one chunk per entry plus the central directory
+        assert archive.namelist() == [name for name, _ in entries]
+        assert archive.read("f3.srt") == entries[3][1]
+
+    def test_empty_entries_still_produce_archive(self):
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(bes.stream_zip(iter([])))))
+        assert archive.namelist() == []
+
+    def test_write_zip_counts_entries(self):
+        buf = io.BytesIO()
+        assert bes.write_zip(iter([("a.txt", b"a"), ("b.txt", b"b")]), buf) == 2
+        assert zipfile.ZipFile(buf).namelist() == ["a.txt", "b.txt"]
+
+
+class TestIterExportEntries:
+    def test_preserves_request_order_across_batches(self):
+        with patch.object(bes, "_render_batch", side_effect=_fake_render):
+            entries = bes.iter_export_entries(_candidates(23), "srt", batch_size=4, workers=3)
+            names = [name for name, _ in entries]
+        assert names == [f"file_{i}.srt" for i in range(23)]
+
+    def test_bounds_batches_submitted_ahead(self):
+        rendered: list[int] = []
+        lock = threading.Lock()
+
+        def tracking_render(batch, subtitle_format, include_speakers):
+            with lock:
+                rendered.append(batch[0].file_id)
+            return _fake_render(batch, subtitle_format, include_speakers)
+
+        with patch.object(bes, "_render_batch", side_effect=tracking_render):
+            entries = bes.iter_export_entries(_candidates(40), "srt", batch_size=2, workers=2)
+            next(entries)
+            time.sleep(0.05)
+            assert len(rendered) <= 3  # workers + 1 batches, not all 20
+            assert len(list(entries)) == 39
+
+    def test_no_candidates(self):
+        assert list(bes.iter_export_entries([], "srt")) == []
+
+
+class TestRenderContent:
+    def test_dispatches_on_format(self):
+        segments = [
+            SimpleNamespace(
+                start_time=0.0,
+                end_time=1.5,
+                text="Hello there.",
+                speaker_id=1,
+                overlap_group_id=None,
+            )
+        ]
+        speaker_map = {1: "Alice"}
+
+        srt = SubtitleService.render_content("srt", segments, speaker_map)
+        vtt = SubtitleService.render_content("webvtt", segments, speaker_map)
+        txt = SubtitleService.render_content("txt", segments, speaker_map)
+
+        assert srt.startswith("1\n00:00:00,000 --> ")
+        assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> ")
+        assert txt.startswith("[") and "Alice:\nHello there." in txt
+
+
+class TestExpiredExportCleanup:
+    def test_deletes_only_archives_past_link_expiry(self):
+        from datetime import datetime
+        from datetime import timedelta
+        from datetime import timezone
+
+        from app.services import minio_service
+        from app.tasks.bulk_export import BULK_EXPORT_PREFIX
+        from app.tasks.bulk_export import bulk_export_object_name
+
+        now = datetime.now(timezone.utc)
+        objects = [
+            SimpleNamespace(
+                object_name=bulk_export_object_name(1, "old"), last_modified=now - timedelta(days=2)
+            ),
+            SimpleNamespace(
+                object_name=bulk_export_object_name(1, "new"),
+                last_modified=now - timedelta(hours=1),
+            ),
+        ]
+        client = SimpleNamespace(
+            list_objects=lambda bucket, prefix, recursive: [
+                o for o in objects if o.object_name.startswith(prefix)
+            ],
+            removed=[],
+        )
+        client.remove_object = lambda bucket, name: client.removed.append(name)
+
+        with patch.object(minio_service, "minio_client", client):
+            removed = minio_service.delete_expired_objects(BULK_EXPORT_PREFIX, 86400)
+
+        assert removed == 1
+        assert client.removed == ["exports/1/old.zip"]
+
+
+class TestBulkExportEndpoint:
+    USER = SimpleNamespace(id=7, is_admin=False)
+
+    def _export(self, rendered, background=False):
+        from app.api.endpoints.files import subtitles
+
+        request = subtitles.BulkExportRequest(file_uuids=["a", "b"], background=background)
+        db = SimpleNamespace(close=lambda: None)
+        with (
+            patch.object(subtitles, "resolve_export_candidates", return_value=_candidates(2)),
+            patch.object(subtitles, "iter_export_entries", return_value=iter(rendered)),
+        ):
+            return subtitles.bulk_export_subtitles(request, db, self.USER)
+
+    def test_headers_count_candidates(self):
+        response = self._export([("file_0.srt", b"x")])
+        assert response.headers["X-Candidate-Count"] == "2"
+        assert "X-Exported-Count" not in response.headers
+
+    def test_nothing_rendered_is_not_found(self):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc:
+            self._export([])
+        assert exc.value.status_code == 404
+
+    def test_background_export_records_its_owner(self):
+        from app.tasks import bulk_export
+
+        with (
+            patch.object(bulk_export, "record_bulk_export_owner") as record,
+            patch.object(bulk_export.bulk_export_subtitles_task, "apply_async") as queue,
+        ):
+            response = self._export([], background=True)
+
+        task_id = queue.call_args.kwargs["task_id"]
+        record.assert_called_once_with(task_id, 7)
+        assert response.status_code == 202
+
+    @pytest.mark.parametrize("owner", [None, 8])
+    def test_status_of_unknown_or_foreign_task_is_not_found(self, owner):
+        from fastapi import HTTPException
+
+        from app.api.endpoints.files import subtitles
+        from app.tasks import bulk_export
+
+        with (
+            patch.object(bulk_export, "get_bulk_export_owner", return_value=owner),
+            pytest.raises(HTTPException) as exc,
+        ):
+            subtitles.get_bulk_export_status("made-up", self.USER)
+        assert exc.value.status_code == 404
+
+    def test_status_of_own_queued_task_is_pending(self):
+        from app.api.endpoints.files import subtitles
+        from app.tasks import bulk_export
+
+        with (
+            patch.object(bulk_export, "get_bulk_export_owner", return_value=7),
+            patch("celery.result.AsyncResult") as result,
+        ):
+            result.return_value.ready.return_value = False
+            assert subtitles.get_bulk_export_status("t1", self.USER) == {
+                "status": "pending",
+                "task_id": "t1",
+            }
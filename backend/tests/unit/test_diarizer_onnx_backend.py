@@ -0,0 +1,165 @@
+"""
+Unit tests for the ONNX Runtime diarization backend.
+
+The PyAnnote pipeline is a ``MagicMock`` standing in for the fork, and the
+ONNX artifacts are empty files in a temporary directory, so no model is
+loaded.
+"""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.artifact_cache_service import diarization_fingerprint
+from app.transcription.config import TranscriptionConfig
+from app.transcription.diarizer import SpeakerDiarizer
+
+
+@pytest.fixture
+def models_dir(tmp_path, monkeypatch):
+    onnx_dir = tmp_path / "onnx"
+    onnx_dir.mkdir()
+    # The backend sets process-wide fork gates; keep them inside the test
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    monkeypatch.setenv("PYANNOTE_ONNX_MODELS_DIR", str(onnx_dir))
+    for name in (
+        "PYANNOTE_USE_ONNX",
+        "ONNX_NUM_THREADS",
+        "MODEL_CACHE_DIR",
+        "DIARIZATION_BATCH_SIZE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    return onnx_dir
+
+
+def _diarizer(pipeline=None, **config) -> SpeakerDiarizer:
+    diarizer = SpeakerDiarizer(
+        TranscriptionConfig(diarization_device="cpu", diarization_backend="onnx", **config)
+    )
+    diarizer._pipeline = pipeline if pipeline is not None else MagicMock()
+    return diarizer
+
+
+@pytest.mark.unit
+class TestBackendSelection:
+    @pytest.mark.parametrize(
+        ("env", "device", "expected"),
+        [
+            ("auto", "cpu", "onnx"),
+            ("auto", "cuda", "pytorch"),
+            ("onnx", "mps", "pytorch"),
+            ("pytorch", "cpu", "pytorch"),
+            ("tensorrt", "cpu", "pytorch"),
+        ],
+    )
+    def test_resolves_per_device(self, monkeypatch, env, device, expected):
+        monkeypatch.setenv("DIARIZATION_BACKEND", env)
+        assert TranscriptionConfig._resolve_diarization_backend(device) == expected
+
+    def test_backend_reloads_diarizer_only(self):
+        onnx = TranscriptionConfig(diarization_device="cpu", diarization_backend="onnx")
+        torch_cfg = TranscriptionConfig(diarization_device="cpu", diarization_backend="pytorch")
+
+        assert onnx.config_hash() == torch_cfg.config_hash()
+        assert onnx.diarizer_config_hash() != torch_cfg.diarizer_config_hash()
+
+    def test_pytorch_artifacts_keep_their_fingerprint(self):
+        torch_cfg = TranscriptionConfig(diarization_backend="pytorch")
+        onnx = TranscriptionConfig(diarization_backend="onnx")
+        assert diarization_fingerprint(torch_cfg) != diarization_fingerprint(onnx)
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_cpu_lightweight_diarization_is_opt_in(self, monkeypatch, enabled):
+        monkeypatch.setenv("CPU_DIARIZATION_ENABLED", str(enabled).lower())
+        monkeypatch.delenv("DIARIZATION_BACKEND", raising=False)
+        config = TranscriptionConfig.for_cpu_lightweight()
+
+        assert config.enable_diarization is enabled
+        assert config.diarization_device == "cpu"
+        assert config.diarization_backend == "onnx"
+
+
+@pytest.mark.unit
+class TestOnnxSetup:
+    def test_full_runtime_needs_both_graphs(self, models_dir):
+        diarizer = _diarizer()
+        (models_dir / "segmentation.onnx").touch()
+        diarizer._enable_onnx_runtime()
+        assert "PYANNOTE_USE_ONNX" not in os.environ
+        assert diarizer.backend == "pytorch"
+
+        (models_dir / "embedding.onnx").touch()
+        diarizer._enable_onnx_runtime()
+        assert os.environ["PYANNOTE_USE_ONNX"] == "1"
+        assert diarizer.backend == "onnx"
+
+    def test_quantized_segmentation_is_wired_in(self, models_dir):
+        (models_dir / "pyannote_segmentation_int8.onnx").touch()
+        pipeline = MagicMock()
+        diarizer = _diarizer(pipeline, diarization_onnx_threads=6)
+
+        diarizer._configure_onnx_segmentation()
+
+        pipeline._setup_onnx_cpu.assert_called_once_with(quantize=True, num_threads=6)
+        assert os.environ["MODEL_CACHE_DIR"] == str(models_dir.parent)
+        assert diarizer.backend == "onnx"
+
+    def test_setup_failure_keeps_pytorch(self, models_dir):
+        (models_dir / "pyannote_segmentation_fp32.onnx").touch()
+        pipeline = MagicMock()
+        pipeline._setup_onnx_cpu.side_effect = ImportError("onnxruntime")
+        diarizer = _diarizer(pipeline)
+
+        diarizer._configure_onnx_segmentation()
+        assert diarizer.backend == "pytorch"
+
+    def test_missing_artifact_or_hook_keeps_pytorch(self, models_dir):
+        pipeline = MagicMock()
+        diarizer = _diarizer(pipeline)
+        diarizer._configure_onnx_segmentation()
+        pipeline._setup_onnx_cpu.assert_not_called()
+
+        (models_dir / "pyannote_segmentation_int8.onnx").touch()
+        diarizer = _diarizer(SimpleNamespace(segmentation_batch_size=32))
+        diarizer._configure_onnx_segmentation()
+        assert diarizer.backend == "pytorch"
+
+    def test_onnx_batches_more_windows(self, models_dir):
+        pipeline = SimpleNamespace(segmentation_batch_size=32)
+        diarizer = _diarizer(pipeline)
+        diarizer._configure_segmentation_batch_size()
+        assert pipeline.segmentation_batch_size == 4
+
+        diarizer.backend = "onnx"
+        diarizer._configure_segmentation_batch_size()
+        assert pipeline.segmentation_batch_size == 32
+
+    def test_load_model_restores_process_env(self, models_dir, monkeypatch):
+        (models_dir / "segmentation.onnx").touch()
+        (models_dir / "embedding.onnx").touch()
+        (models_dir / "pyannote_segmentation_int8.onnx").touch()
+        monkeypatch.setenv("MODEL_CACHE_DIR", "/models")
+        pipeline = MagicMock()
+        pipeline.to.return_value = pipeline
+        diarizer = _diarizer(pipeline, diarization_onnx_threads=2)
+        seen = {}
+
+        def fake_load():
+            seen.update(os.environ)
+            diarizer._pipeline = pipeline
+
+        monkeypatch.setattr(diarizer, "_load_pretrained", fake_load)
+        monkeypatch.setattr(diarizer, "_configure_embedding_batch_size", lambda: None)
+        diarizer.load_model()
+
+        assert seen["PYANNOTE_USE_ONNX"] == "1"
+        assert seen["ONNX_NUM_THREADS"] == "2"
+        pipeline._setup_onnx_cpu.assert_called_once()
+        assert "PYANNOTE_USE_ONNX" not in os.environ
+        assert "ONNX_NUM_THREADS" not in os.environ
+        assert os.environ["MODEL_CACHE_DIR"] == "/models"
+        assert os.environ["PYANNOTE_ONNX_MODELS_DIR"] == str(models_dir)
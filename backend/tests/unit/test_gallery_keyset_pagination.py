@@ -0,0 +1,112 @@
+"""
+Unit tests for keyset (cursor) pagination of the media gallery listing.
+
+Covers cursor encoding, sort-mismatch rejection, and the NULL-aware seek
+predicate rendered for the PostgreSQL dialect. No database is required.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from datetime import timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.api.endpoints.files.pagination import Cursor
+from app.api.endpoints.files.pagination import InvalidCursorError
+from app.api.endpoints.files.pagination import apply_keyset_order
+from app.api.endpoints.files.pagination import apply_keyset_seek
+from app.api.endpoints.files.pagination import count_cache_key
+from app.api.endpoints.files.pagination import decode_cursor
+from app.api.endpoints.files.pagination import encode_cursor
+from app.api.endpoints.files.pagination import filter_hash
+from app.api.endpoints.files.pagination import get_cached_total
+from app.models.media import MediaFile
+
+
+def _sql(query: Query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect())).lower()
+
+
+def _where(query: Query) -> str:
+    return re.split(r"\swhere\s", _sql(query), maxsplit=1)[1]
+
+
+class TestCursorCodec:
+    def test_round_trip_datetime(self):
+        ts = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+        row = SimpleNamespace(id=42, upload_time=ts)
+
+        token = encode_cursor("upload_time", "desc", row)
+        decoded = decode_cursor(token, "upload_time", "desc")
+
+        assert "=" not in token
+        assert decoded == Cursor("upload_time", "desc", ts, 42)
+
+    def test_round_trip_null_value(self):
+        row = SimpleNamespace(id=7, duration=None)
+        token = encode_cursor("duration", "asc", row)
+        assert decode_cursor(token, "duration", "asc").value is None
+
+    def test_rejects_other_sort(self):
+        row = SimpleNamespace(id=1, filename="a.mp3")
+        token = encode_cursor("filename", "asc", row)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "filename", "desc")
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "file_size", "asc")
+
+    @pytest.mark.parametrize("token", ["", "not-base64!!", "e30"])
+    def test_rejects_garbage(self, token):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "upload_time", "desc")
+
+
+class TestKeysetQuery:
+    def test_order_has_id_tiebreaker(self):
+        sql = _sql(apply_keyset_order(Query(MediaFile), "file_size", "asc"))
+        assert "order by media_file.file_size asc, media_file.id asc" in sql
+
+    def test_desc_seek_uses_row_comparison(self):
+        query = apply_keyset_seek(Query(MediaFile), Cursor("file_size", "desc", 100, 5))
+        assert "(media_file.file_size, media_file.id) <" in _where(query)
+
+    def test_asc_seek_continues_into_nulls(self):
+        query = apply_keyset_seek(Query(MediaFile), Cursor("duration", "asc", 12.5, 5))
+        where = _where(query)
+        assert "(media_file.duration, media_file.id) >" in where
+        assert "media_file.duration is null" in where
+
+    def test_desc_seek_from_null_group(self):
+        query = apply_keyset_seek(Query(MediaFile), Cursor("completed_at", "desc", None, 9))
+        where = _where(query)
+        assert "media_file.completed_at is null and media_file.id <" in where
+        assert "media_file.completed_at is not null" in where
+
+    def test_asc_seek_within_null_group(self):
+        query = apply_keyset_seek(Query(MediaFile), Cursor("completed_at", "asc", None, 9))
+        where = _where(query)
+        assert "media_file.completed_at is null" in where
+        assert "media_file.id >" in where
+        assert " or " not in where
+
+
+class TestTotalCache:
+    def test_filter_hash_is_order_independent_and_scoped(self):
+        a = filter_hash("mine", {"search": "x", "tag": ["t"]})
+        b = filter_hash("mine", {"tag": ["t"], "search": "x"})
+        assert a == b
+        assert filter_hash("all", {"search": "x", "tag": ["t"]}) != a
+
+    def test_key_is_under_user_files_namespace(self):
+        assert count_cache_key(3, "abc").startswith("cache:files:3:")
+
+    def test_get_cached_total(self):
+        cache = SimpleNamespace(get=lambda key: {"k": 12, "bad": "x"}.get(key))
+        assert get_cached_total(cache, "k") == 12
+        assert get_cached_total(cache, "bad") is None
+        assert get_cached_total(cache, "missing") is None
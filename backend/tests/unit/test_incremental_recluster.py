@@ -0,0 +1,167 @@
+"""
+Unit tests for incremental speaker re-clustering helpers.
+
+DB and OpenSearch access are mocked; only the grouping logic and the
+full-recluster fallback are exercised.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.services import speaker_clustering_service as scs
+from app.services.speaker_clustering_service import SpeakerClusteringService
+from app.services.speaker_clustering_service import _complete_linkage_groups
+
+
+def _unit(v: list[float]) -> list[float]:
+    arr = np.array(v, dtype=np.float32)
+    return (arr / np.linalg.norm(arr)).tolist()
+
+
+@pytest.mark.unit
+class TestCompleteLinkageGroups:
+    def test_single_embedding(self):
+        assert _complete_linkage_groups(np.ones((1, 4), dtype=np.float32), 0.75) == [1]
+
+    def test_separates_dissimilar_speakers(self):
+        embs = np.array(
+            [
+                _unit([1.0, 0.0, 0.0]),
+                _unit([0.98, 0.05, 0.0]),
+                _unit([0.0, 1.0, 0.0]),
+                _unit([0.02, 0.99, 0.0]),
+            ],
+            dtype=np.float32,
+        )
+        labels = _complete_linkage_groups(embs, 0.75)
+        assert labels[0] == labels[1]
+        assert labels[2] == labels[3]
+        assert labels[0] != labels[2]
+
+    def test_complete_linkage_rejects_chains(self):
+        # a~b and b~c are above threshold but a~c is not: no single group of 3
+        embs = np.array(
+            [_unit([1.0, 0.0]), _unit([0.9, 0.45]), _unit([0.6, 0.8])],
+            dtype=np.float32,
+        )
+        labels = _complete_linkage_groups(embs, 0.85)
+        assert len(set(labels)) >= 2
+
+
+@pytest.mark.unit
+class TestIncrementalRecluster:
+    def test_falls_back_to_full_recluster_without_watermark(self):
+        service = SpeakerClusteringService(MagicMock())
+        with (
+            patch.object(scs, "_get_recluster_watermark", return_value=None),
+            patch.object(service, "batch_recluster", return_value={"status": "completed"}) as full,
+        ):
+            result = service.incremental_recluster(7, threshold=0.8)
+        full.assert_called_once_with(7, 0.8, None)
+        assert result == {"status": "completed"}
+
+    def test_no_new_speakers_is_a_noop(self):
+        from datetime import datetime
+        from datetime import timezone
+
+        db = MagicMock()
+        db.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = []
+        service = SpeakerClusteringService(db)
+        with (
+            patch.object(scs, "_get_recluster_watermark", return_value=datetime.now(timezone.utc)),
+            patch.object(scs, "_set_recluster_watermark") as set_watermark,
+        ):
+            result = service.incremental_recluster(7)
+        assert result["new_speakers"] == 0
+        assert result["mode"] == "incremental"
+        set_watermark.assert_called_once()
+        db.commit.assert_not_called()
+
+    def test_step2_joins_stay_out_of_neighbourhoods(self):
+        from datetime import datetime
+        from datetime import timezone
+        from types import SimpleNamespace
+
+        from app.services import opensearch_service
+
+        speakers = [
+            SimpleNamespace(
+                id=i, uuid=f"s{i}", cluster_id=None, predicted_gender=None, profile_id=None
+            )
+            for i in (1, 2, 3)
+        ]
+        embeddings = {"s1": _unit([1.0, 0.0]), "s2": _unit([1.0, 0.02]), "s3": _unit([1.0, 0.04])}
+        existing = SimpleNamespace(id=50, uuid="c50", member_count=3, promoted_to_profile_id=None)
+
+        db = MagicMock()
+        db.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = speakers
+        service = SpeakerClusteringService(db)
+
+        def matching_clusters(emb, user_id, k, threshold):
+            # Only s1 is close to an existing multi-member cluster
+            if emb == embeddings["s1"]:
+                return [{"cluster_uuid": "c50", "similarity": 0.95}]
+            return []
+
+        def similarities(queries, user_id, k):
+            # s2 and s3 both list the already-joined s1 as their best neighbour
+            return [
+                [{"speaker_uuid": u, "similarity": 0.95} for u in ("s1", "s2", "s3")]
+                for _ in queries
+            ]
+
+        groups = []
+
+        def create_cluster(member_ids, user_id, emb_cache, speakers_by_id):
+            groups.append(sorted(member_ids))
+            return SimpleNamespace(id=100 + len(groups)), len(member_ids), True
+
+        with (
+            patch.object(scs, "_get_recluster_watermark", return_value=datetime.now(timezone.utc)),
+            patch.object(scs, "_set_recluster_watermark"),
+            patch.object(
+                opensearch_service,
+                "get_speaker_embeddings_batch",
+                side_effect=lambda uuids, user_id: {u: embeddings[u] for u in uuids},
+            ),
+            patch.object(opensearch_service, "find_matching_clusters", matching_clusters),
+            patch.object(opensearch_service, "msearch_speaker_similarities", similarities),
+            patch.object(opensearch_service, "opensearch_client", None),
+            patch.object(
+                service, "_load_clusters_by_uuid", return_value={"c50": existing}
+            ) as load_clusters,
+            patch.object(service, "_is_speaker_blocked_from_cluster", return_value=False),
+            patch.object(service, "_add_speaker_to_cluster") as add_to_cluster,
+            patch.object(service, "_create_cluster_from_group", create_cluster),
+            patch.object(service, "_update_cluster_centroid"),
+        ):
+            result = service.incremental_recluster(7, threshold=0.8)
+
+        load_clusters.assert_called_once_with(7, ["c50"])  # one query for every match
+        assert add_to_cluster.call_args[0][:2] == (speakers[0], existing)
+        assert groups == [[2, 3]]
+        assert result["joined_existing"] == 1
+        assert result["speakers_assigned"] == 3
+        assert result["singletons"] == 0
+
+
+@pytest.mark.unit
+def test_clusters_for_matches_load_in_one_query():
+    from types import SimpleNamespace
+
+    clusters = [SimpleNamespace(uuid="c1"), SimpleNamespace(uuid="c2")]
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = clusters
+    service = SpeakerClusteringService(db)
+
+    assert service._load_clusters_by_uuid(7, ["c1", "c2", "c1"]) == {
+        "c1": clusters[0],
+        "c2": clusters[1],
+    }
+    assert service._load_clusters_by_uuid(7, []) == {}
+    assert db.query.call_count == 1
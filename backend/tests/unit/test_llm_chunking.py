@@ -0,0 +1,95 @@
+"""
+Unit tests for token-budgeted transcript chunking.
+
+A whitespace "tokenizer" stands in for the real ones so chunk sizes are
+predictable; no tokenizer files or LLM server are needed.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services import llm_service as llm_service_module
+from app.services import llm_tokenizer
+from app.services.llm_service import LLMConfig
+from app.services.llm_service import LLMProvider
+from app.services.llm_service import LLMService
+from app.services.llm_tokenizer import TokenCounter
+from app.services.llm_tokenizer import pack_segments
+
+
+def _word_counter() -> TokenCounter:
+    return TokenCounter("words", lambda texts: [len(text.split()) for text in texts])
+
+
+def _transcript(turns: int, words_per_turn: int) -> str:
+    lines = []
+    for i in range(turns):
+        words = " ".join(f"w{i}_{j}" for j in range(words_per_turn - 1))
+        lines.append(f"SPEAKER_{i % 2:02d}: [{i:02d}:00] {words}.")
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(llm_service_module, "get_token_counter", lambda *a: _word_counter())
+    # 2000 tokens are reserved for prompt + response, leaving 100 for content
+    return LLMService(
+        LLMConfig(provider=LLMProvider.VLLM, model="m", base_url="http://llm", max_tokens=2100)
+    )
+
+
+class TestPackSegments:
+    def test_fills_each_chunk_to_budget(self):
+        groups = pack_segments(["a"] * 6, [40, 40, 20, 50, 50, 10], 100)
+        assert groups == [[0, 1, 2], [3, 4], [5]]
+
+    def test_oversized_segment_stands_alone(self):
+        assert pack_segments(["a", "b", "c"], [10, 150, 10], 100) == [[0], [1], [2]]
+
+    def test_empty(self):
+        assert pack_segments([], [], 100) == []
+
+
+class TestChunkTranscript:
+    def test_short_transcript_is_one_chunk(self, service):
+        transcript = _transcript(3, 10)
+        assert service._chunk_transcript_intelligently(transcript) == [transcript]
+
+    def test_chunks_fill_budget_and_keep_turns_whole(self, service):
+        transcript = _transcript(20, 30)
+        chunks = service._chunk_transcript_intelligently(transcript)
+
+        # 31-word turns (header included), 100 words per chunk: 3 turns per chunk
+        assert len(chunks) == 7
+        assert all(len(chunk.split()) <= 100 for chunk in chunks)
+        assert all(chunk.startswith("SPEAKER_") for chunk in chunks)
+        assert " ".join(chunks).split() == transcript.split()
+
+    def test_oversized_turn_is_split_by_sentences(self, service):
+        sentences = " ".join(f"Sentence {i} has five words." for i in range(60))
+        transcript = f"SPEAKER_00: [00:00] {sentences}"
+        chunks = service._chunk_transcript_intelligently(transcript)
+
+        assert len(chunks) == 4
+        assert all(len(chunk.split()) <= 100 for chunk in chunks)
+        assert " ".join(chunks).split() == transcript.split()
+
+
+class TestTokenCounter:
+    def test_falls_back_to_heuristic_on_error(self):
+        def broken(texts):
+            raise RuntimeError("tokenizer crashed")
+
+        counter = TokenCounter("hf", broken)
+        assert counter.count("some words here") == llm_tokenizer.heuristic_token_count(
+            "some words here"
+        )
+
+    def test_anthropic_uses_heuristic(self, monkeypatch):
+        monkeypatch.setattr(llm_tokenizer, "_counters", {})
+        counter = llm_tokenizer.get_token_counter(
+            "anthropic", "claude", "https://api.anthropic.com/v1/messages"
+        )
+        assert counter.source == "heuristic"
+        assert not counter.exact
@@ -0,0 +1,252 @@
+"""
+Unit tests for the LLM response cache.
+
+Covers what goes into the cache key, LRU eviction and the size cap, and
+that ``LLMService.chat_completion`` answers repeated enrichment prompts from
+the cache once a response has been validated. Redis is replaced by an in-memory fake; no LLM server is needed.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.services import llm_response_cache as cache_module
+from app.services.llm_response_cache import LLMResponseCache
+from app.services.llm_response_cache import build_part_key
+from app.services.llm_response_cache import build_response_key
+from app.services.llm_response_cache import prompt_template_hash
+from app.services.llm_service import LLMConfig
+from app.services.llm_service import LLMProvider
+from app.services.llm_service import LLMService
+
+
+class FakeRedis:
+    """Minimal Redis stand-in for strings and one sorted set."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.zset: dict[str, float] = {}
+        self._queued: list = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def zadd(self, name, mapping):
+        self.zset.update(mapping)
+
+    def zremrangebyscore(self, name, low, high):
+        for member, score in list(self.zset.items()):
+            if score <= high:
+                del self.zset[member]
+
+    def zcard(self, name):
+        return len(self.zset)
+
+    def zpopmin(self, name, count):
+        oldest = sorted(self.zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in oldest:
+            del self.zset[member]
+        return oldest
+
+    def pipeline(self, transaction=True):
+        outer = self
+
+        class _Pipeline:
+            def __getattr__(self, name):
+                return lambda *args: outer._queued.append(getattr(outer, name)(*args))
+
+            def execute(self):
+                results, outer._queued = outer._queued, []
+                return results
+
+        return _Pipeline()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(cache_module.redis_cache, "_redis", redis)
+    monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_SCHEDULER_ENABLED", False)
+    return redis
+
+
+def _messages(transcript: str, instruction: str = "Summarize") -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": "You are an expert meeting analyst."},
+        {"role": "user", "content": f"{instruction}:\n{transcript}"},
+    ]
+
+
+def _key(transcript: str, instruction: str = "Summarize", **params) -> str:
+    return build_response_key(
+        "ollama",
+        "http://llm/api/chat",
+        "llama3",
+        _messages(transcript, instruction),
+        transcript,
+        params,
+    )
+
+
+class TestResponseKey:
+    def test_template_hash_ignores_transcript(self):
+        assert prompt_template_hash(_messages("A: hi"), "A: hi") == prompt_template_hash(
+            _messages("B: bye"), "B: bye"
+        )
+
+    def test_every_input_changes_the_key(self):
+        base = _key("A: hi", max_tokens=4000)
+        assert _key("A: hi", max_tokens=4000) == base
+        assert _key("A: hello", max_tokens=4000) != base
+        assert _key("A: hi", "Extract topics", max_tokens=4000) != base
+        assert _key("A: hi", max_tokens=8000) != base
+
+    def test_part_key_covers_known_speakers_and_metadata(self):
+        def part_key(known_speakers, metadata_context):
+            return build_part_key(
+                "ollama", "llama3", "topics", "hash", "en", known_speakers, metadata_context
+            )
+
+        base = part_key([{"name": "Ada"}], "Title: Standup")
+        assert part_key([{"name": "Ada"}], "Title: Standup") == base
+        assert part_key([{"name": "Ada"}, {"name": "Bob"}], "Title: Standup") != base
+        assert part_key([{"name": "Ada"}], "Title: Retro") != base
+
+
+class TestLLMResponseCache:
+    def test_round_trip(self, fake_redis):
+        cache = LLMResponseCache()
+        cache.set("llm_cache:resp:a", {"content": "{}"})
+        assert cache.get("llm_cache:resp:a") == {"content": "{}"}
+
+    def test_evicts_least_recently_used(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_MAX_ENTRIES", 2)
+        cache = LLMResponseCache()
+        with patch.object(cache_module.time, "time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", {"content": "a"})
+            cache.set("b", {"content": "b"})
+            cache.get("a")
+            cache.set("c", {"content": "c"})
+
+        assert set(fake_redis.store) == {"a", "c"}
+
+    def test_skips_oversized_entries(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES", 16)
+        LLMResponseCache().set("a", {"content": "x" * 32})
+        assert fake_redis.store == {}
+
+    def test_disabled(self, fake_redis, monkeypatch):
+        cache = LLMResponseCache()
+        cache.set("a", {"content": "a"})
+        monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_ENABLED", False)
+        assert cache.get("a") is None
+
+
+class TestChatCompletionCache:
+    @pytest.fixture
+    def service(self):
+        return LLMService(
+            LLMConfig(provider=LLMProvider.OLLAMA, model="llama3", base_url="http://llm")
+        )
+
+    def test_repeated_prompt_is_served_from_cache(self, fake_redis, service):
+        reply = {"message": {"content": '{"bluf": "ok"}'}, "done_reason": "stop"}
+        with patch.object(service, "_send_llm_request", return_value=reply) as send:
+            first = service.chat_completion(_messages("A: hi"), cache_transcript="A: hi")
+            service.cache_response(first)
+            second = service.chat_completion(_messages("A: hi"), cache_transcript="A: hi")
+
+        assert send.call_count == 1
+        assert not first.cached
+        assert second.cached
+        assert second.content == first.content
+
+    def test_unvalidated_response_is_not_cached(self, fake_redis, service):
+        reply = {"message": {"content": "not json"}, "done_reason": "stop"}
+        with patch.object(service, "_send_llm_request", return_value=reply) as send:
+            service.chat_completion(_messages("A: hi"), cache_transcript="A: hi")
+            service.chat_completion(_messages("A: hi"), cache_transcript="A: hi")
+
+        assert send.call_count == 2
+        assert fake_redis.store == {}
+
+    def test_failed_summary_parse_is_not_cached(self, fake_redis, service):
+        reply = {"message": {"content": "not json"}, "done_reason": "stop"}
+        with patch.object(service, "_send_llm_request", return_value=reply):
+            summary = service._process_single_chunk("A: hi", None, "{transcript}{speaker_data}")
+
+        assert "error" in summary
+        assert fake_redis.store == {}
+
+    def test_uncached_without_transcript(self, fake_redis, service):
+        reply = {"message": {"content": "pong"}, "done_reason": "stop"}
+        with patch.object(service, "_send_llm_request", return_value=reply) as send:
+            service.chat_completion(_messages("ping"))
+            service.chat_completion(_messages("ping"))
+
+        assert send.call_count == 2
+        assert fake_redis.store == {}
+
+
+class TestCombinedEnrichmentDispatch:
+    """Automatic topic extraction waits for the summary in combined mode."""
+
+    TASKS = ["summarization", "topic_extraction"]
+
+    def _trigger(self, monkeypatch, combined, summary_dispatched=True):
+        from app.tasks.topic_extraction import extract_topics_task
+        from app.tasks.transcription import core
+
+        monkeypatch.setattr(settings, "LLM_COMBINED_ENRICHMENT", combined)
+        monkeypatch.setattr(core, "_get_collection_prompt_uuid", lambda file_id: None)
+        with (
+            patch.object(
+                core, "_dispatch_automatic_summary", return_value=summary_dispatched
+            ) as dispatch,
+            patch.object(extract_topics_task, "delay") as topics,
+        ):
+            core.trigger_automatic_summarization(1, "f1", tasks_to_run=self.TASKS)
+        return dispatch, topics
+
+    def test_combined_mode_chains_topics_to_the_summary(self, monkeypatch):
+        dispatch, topics = self._trigger(monkeypatch, combined=True)
+        assert dispatch.call_args.kwargs["extract_topics_after"] is True
+        topics.assert_not_called()
+
+    def test_topics_run_directly_without_a_summary_task(self, monkeypatch):
+        _, topics = self._trigger(monkeypatch, combined=True, summary_dispatched=False)
+        topics.assert_called_once_with(file_uuid="f1", force_regenerate=False)
+
+        dispatch, topics = self._trigger(monkeypatch, combined=False)
+        assert dispatch.call_args.kwargs["extract_topics_after"] is False
+        topics.assert_called_once_with(file_uuid="f1", force_regenerate=False)
+
+    def test_failed_summary_still_starts_topics(self):
+        from app.tasks import summarization
+        from app.tasks.topic_extraction import extract_topics_task
+
+        with (
+            patch.object(summarization, "session_scope", lambda: nullcontext(MagicMock())),
+            patch("app.utils.uuid_helpers.get_file_by_uuid", return_value=None),
+            patch.object(summarization, "_handle_task_error", return_value={"status": "error"}),
+            patch.object(extract_topics_task, "delay") as topics,
+        ):
+            result = summarization.summarize_transcript_task.run(
+                file_uuid="f1", extract_topics_after=True
+            )
+
+        assert result == {"status": "error"}
+        topics.assert_called_once_with(file_uuid="f1", force_regenerate=False)
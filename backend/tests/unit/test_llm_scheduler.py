@@ -0,0 +1,126 @@
+"""
+Unit tests for the cluster-wide LLM request scheduler.
+
+Redis is replaced by a ``MagicMock`` whose ``eval`` plays the Lua scripts'
+return values, so these cover the Python side: priority lookup, admission
+polling, passthrough without Redis and how ``LLMService`` retries 429/503
+responses through the shared backoff.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.constants import NLPPriority
+from app.services import llm_scheduler as scheduler_module
+from app.services.llm_scheduler import LLMCapacityTimeoutError
+from app.services.llm_scheduler import LLMScheduler
+from app.services.llm_scheduler import current_priority
+from app.services.llm_scheduler import endpoint_key
+from app.services.llm_service import LLMConfig
+from app.services.llm_service import LLMOverloadedError
+from app.services.llm_service import LLMProvider
+from app.services.llm_service import LLMService
+from app.services.llm_service import _parse_retry_after
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    client.eval.return_value = [1, 0]
+    monkeypatch.setattr(scheduler_module.redis_cache, "_redis", client)
+    monkeypatch.setattr(settings, "LLM_SCHEDULER_ENABLED", True)
+    return client
+
+
+class TestHelpers:
+    def test_endpoint_key_depends_on_api_key(self):
+        url = "https://api.openai.com/v1/chat/completions"
+        assert endpoint_key(url, "a") == endpoint_key(url, "a")
+        assert endpoint_key(url, "a") != endpoint_key(url, "b")
+
+    def test_priority_outside_task_is_user_triggered(self):
+        assert current_priority() == NLPPriority.USER_TRIGGERED
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [("12", 12.0), ("-3", 0.0), (None, None), ("soon", None)],
+    )
+    def test_parse_retry_after(self, header, expected):
+        assert _parse_retry_after(header) == expected
+
+    def test_parse_retry_after_http_date(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestSlot:
+    def test_admitted_slot_is_released(self, redis_client):
+        with LLMScheduler().slot("ep", NLPPriority.USER_TRIGGERED, 100, 300) as lease:
+            pass
+
+        redis_client.zrem.assert_called_once_with("llm_sched:ep:slots", lease.lease_id)
+
+    def test_waits_until_admitted(self, redis_client):
+        redis_client.eval.side_effect = [[0, 10], [1, 0]]
+        with patch.object(scheduler_module.time, "sleep") as sleep:
+            with LLMScheduler().slot("ep", NLPPriority.ADMIN_BATCH, 100, 300):
+                pass
+
+        assert redis_client.eval.call_count == 2
+        sleep.assert_called_once()
+
+    def test_long_waits_keep_the_waiter_alive(self, redis_client):
+        redis_client.eval.side_effect = [[0, 120_000], [1, 0]]
+        with patch.object(scheduler_module.time, "sleep") as sleep:
+            with LLMScheduler().slot("ep", NLPPriority.ADMIN_BATCH, 100, 300):
+                pass
+
+        assert sleep.call_args[0][0] < scheduler_module._WAITER_TTL_SECONDS
+        queue_adds = [
+            c for c in redis_client.zadd.call_args_list if c[0][0] == "llm_sched:ep:queue"
+        ]
+        assert len(queue_adds) == 2
+        assert queue_adds[0] == queue_adds[1]
+        assert all(c.kwargs == {"nx": True} for c in queue_adds)
+
+    def test_gives_up_after_max_wait(self, redis_client, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_SCHEDULER_MAX_WAIT_SECONDS", 0)
+        redis_client.eval.return_value = [0, 1000]
+        with pytest.raises(LLMCapacityTimeoutError):
+            with LLMScheduler().slot("ep", NLPPriority.BACKGROUND, 100, 300):
+                pass
+
+        removed = {call.args[0] for call in redis_client.zrem.call_args_list}
+        assert removed == {"llm_sched:ep:queue", "llm_sched:ep:alive"}
+
+    def test_passthrough_when_disabled(self, redis_client, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_SCHEDULER_ENABLED", False)
+        with LLMScheduler().slot("ep", NLPPriority.USER_TRIGGERED, 100, 300) as lease:
+            assert lease.tokens == 100
+
+        redis_client.eval.assert_not_called()
+
+
+class TestChatCompletionScheduling:
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_ENABLED", False)
+        return LLMService(
+            LLMConfig(provider=LLMProvider.OLLAMA, model="llama3", base_url="http://llm")
+        )
+
+    def test_retries_after_shared_backoff(self, redis_client, service):
+        redis_client.eval.side_effect = [[1, 0], 2000, [1, 0], 1]
+        reply = {"message": {"content": "pong"}, "done_reason": "stop"}
+        overloaded = LLMOverloadedError("LLM API error: 429", retry_after=2)
+        with patch.object(service, "_send_llm_request", side_effect=[overloaded, reply]) as send:
+            response = service.chat_completion([{"role": "user", "content": "ping"}])
+
+        assert response.content == "pong"
+        assert send.call_count == 2
+        # acquire, overload, acquire, success
+        assert redis_client.eval.call_count == 4
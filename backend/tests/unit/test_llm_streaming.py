@@ -0,0 +1,196 @@
+"""
+Unit tests for streamed LLM responses and summary section progress.
+
+HTTP responses are faked at ``session.post`` with the line format of each
+provider's stream; the progress reporter is a ``MagicMock``. No LLM server
+or Redis is needed.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.services import llm_scheduler as llm_scheduler_module
+from app.services import llm_service as llm_service_module
+from app.services.llm_service import LLMConfig
+from app.services.llm_service import LLMProvider
+from app.services.llm_service import LLMService
+
+
+class FakeStreamResponse:
+    def __init__(self, lines: list[str], status_code: int = 200):
+        self.lines = lines
+        self.status_code = status_code
+        self.encoding = None
+        self.headers: dict[str, str] = {}
+        self.text = ""
+
+    def iter_lines(self, decode_unicode=False):
+        return iter(self.lines)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _sse(*events: dict) -> list[str]:
+    return [f"data: {json.dumps(event)}" for event in events] + ["", "data: [DONE]"]
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_SCHEDULER_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_STREAMING_ENABLED", True)
+    monkeypatch.setattr(llm_service_module, "STREAM_CALLBACK_INTERVAL_SECONDS", 0)
+
+
+def _service(provider: LLMProvider, **config) -> LLMService:
+    return LLMService(LLMConfig(provider=provider, model="m", base_url="http://llm", **config))
+
+
+def _stream(service: LLMService, lines: list[str]) -> tuple[object, list[str], dict]:
+    seen: list[str] = []
+    with patch.object(service.session, "post", return_value=FakeStreamResponse(lines)) as post:
+        response = service.chat_completion(
+            [{"role": "user", "content": "hi"}], stream_callback=seen.append
+        )
+    return response, seen, post.call_args.kwargs["json"]
+
+
+class TestStreaming:
+    def test_openai_compatible_sse(self):
+        service = _service(LLMProvider.VLLM)
+        lines = _sse(
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": "Hel"}}]},
+            {"choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {"total_tokens": 12}},
+        )
+        response, seen, payload = _stream(service, lines)
+
+        assert payload["stream"] is True
+        assert payload["stream_options"] == {"include_usage": True}
+        assert response.content == "Hello"
+        assert response.finish_reason == "stop"
+        assert response.usage_tokens == 12
+        assert seen == ["Hel", "Hello"]
+
+    def test_anthropic_sse(self):
+        service = _service(LLMProvider.ANTHROPIC, api_key="k")
+        lines = [
+            "event: message_start",
+            'data: {"type": "message_start", "message": {"usage": {"input_tokens": 5}}}',
+            "event: content_block_delta",
+            'data: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "ok"}}',
+            "event: message_delta",
+            'data: {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, '
+            '"usage": {"output_tokens": 2}}',
+            "event: message_stop",
+            'data: {"type": "message_stop"}',
+        ]
+        response, _, _ = _stream(service, lines)
+
+        assert response.content == "ok"
+        assert response.finish_reason == "end_turn"
+        assert response.usage_tokens == 7
+
+    def test_ollama_ndjson(self):
+        service = _service(LLMProvider.OLLAMA)
+        lines = [
+            json.dumps({"message": {"content": "a"}, "done": False}),
+            json.dumps({"message": {"content": "b"}, "done": False}),
+            json.dumps(
+                {
+                    "message": {"content": ""},
+                    "done": True,
+                    "done_reason": "length",
+                    "prompt_eval_count": 3,
+                    "eval_count": 2,
+                }
+            ),
+        ]
+        response, seen, payload = _stream(service, lines)
+
+        assert payload["stream"] is True
+        assert response.content == "ab"
+        assert response.finish_reason == "length"
+        assert response.usage_tokens == 5
+        assert seen == ["a", "ab"]
+
+    def test_stream_error_event_raises(self):
+        service = _service(LLMProvider.OLLAMA)
+        with pytest.raises(Exception, match="model not found"):
+            _stream(service, [json.dumps({"error": "model not found"})])
+
+    def test_disabled_sends_blocking_request(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_STREAMING_ENABLED", False)
+        service = _service(LLMProvider.OLLAMA)
+        reply = {"message": {"content": "pong"}, "done_reason": "stop"}
+        with patch.object(service, "_send_llm_request", return_value=reply) as send:
+            response = service.chat_completion(
+                [{"role": "user", "content": "hi"}], stream_callback=print
+            )
+
+        assert response.content == "pong"
+        assert send.call_args.args[1]["stream"] is False
+
+
+class TestSectionProgress:
+    def test_reports_each_finished_section(self):
+        service = _service(LLMProvider.OLLAMA)
+        progress = MagicMock()
+
+        def summarize(chunk, section_num, *args, on_success=None):
+            section = {"key_points": [chunk]}
+            on_success(section)
+            return section
+
+        with (
+            patch.object(service, "_summarize_section", side_effect=summarize) as summarize_mock,
+            patch.object(service, "_combine_sections", return_value={"bluf": "x"}) as combine,
+        ):
+            service._process_multiple_chunks(["one", "two"], {}, "{transcript}", progress=progress)
+
+        assert summarize_mock.call_count == 2
+        reported = sorted(call.args[0] for call in progress.section_done.call_args_list)
+        assert reported == [0, 1]
+        assert combine.call_args.args[0] == [{"key_points": ["one"]}, {"key_points": ["two"]}]
+
+    @pytest.mark.parametrize(("cache_enabled", "warned"), [(True, False), (False, True)])
+    def test_worker_warns_when_retries_cannot_resume(self, monkeypatch, cache_enabled, warned):
+        from app.core import celery as celery_module
+
+        monkeypatch.setattr(settings, "LLM_STREAMING_ENABLED", True)
+        monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE_ENABLED", cache_enabled)
+        with patch.object(celery_module.logger, "warning") as warning:
+            celery_module._warn_summary_resume_disabled()
+        assert warning.called is warned
+
+
+class TestStreamLeaseRenewal:
+    def test_stream_renews_scheduler_lease(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_SCHEDULER_ENABLED", True)
+        client = MagicMock()
+        client.eval.return_value = [1, 0]
+        monkeypatch.setattr(llm_scheduler_module.redis_cache, "_redis", client)
+        monkeypatch.setattr(llm_scheduler_module, "_RENEW_INTERVAL_SECONDS", 0)
+        service = _service(LLMProvider.OLLAMA)
+        lines = [
+            json.dumps({"message": {"content": "a"}, "done": False}),
+            json.dumps({"message": {"content": "b"}, "done": True, "done_reason": "stop"}),
+        ]
+
+        response, seen, _ = _stream(service, lines)
+
+        assert response.content == "ab"
+        assert seen == ["a", "ab"]
+        renewals = [c for c in client.zadd.call_args_list if c.args[0].endswith(":slots")]
+        assert len(renewals) == 2
@@ -0,0 +1,173 @@
+"""
+Unit tests for the worker-side notification buffer.
+
+Covers per-file progress coalescing, immediate status changes, batching of
+due updates, and the metadata cache.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.tasks.transcription.notification_buffer import FileMetadataCache
+from app.tasks.transcription.notification_buffer import NotificationBuffer
+from app.tasks.transcription.notification_buffer import distinct_users
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def published() -> list[list[tuple[int, dict]]]:
+    return []
+
+
+@pytest.fixture
+def buffer(clock, published) -> NotificationBuffer:
+    def publish(batch):
+        published.append(list(batch))
+        return True
+
+    buf = NotificationBuffer(publish, interval=0.5, clock=clock)
+    # Keep the background flusher out of the way; tests drive flush() directly
+    buf._ensure_flusher = lambda: None  # type: ignore[method-assign]
+    return buf
+
+
+def _progress(value: int) -> dict:
+    return {"status": "processing", "progress": value}
+
+
+class TestCoalescing:
+    def test_first_update_is_published_immediately(self, buffer, published):
+        assert buffer.submit(1, 10, _progress(5))
+        assert published == [[(1, _progress(5))]]
+
+    def test_updates_within_interval_keep_only_latest(self, buffer, published, clock):
+        buffer.submit(1, 10, _progress(5))
+        for value in (10, 20, 30):
+            clock.now += 0.1
+            assert buffer.submit(1, 10, _progress(value))
+
+        assert len(published) == 1
+        assert buffer.pending_count == 1
+
+        clock.now += 0.5
+        buffer.flush()
+        assert published[-1] == [(1, _progress(30))]
+        assert buffer.pending_count == 0
+
+    def test_flush_before_interval_publishes_nothing(self, buffer, published, clock):
+        buffer.submit(1, 10, _progress(5))
+        clock.now += 0.1
+        buffer.submit(1, 10, _progress(10))
+
+        buffer.flush()
+        assert len(published) == 1
+
+    def test_forced_flush_publishes_everything(self, buffer, published, clock):
+        buffer.submit(1, 10, _progress(5))
+        clock.now += 0.1
+        buffer.submit(1, 10, _progress(10))
+
+        buffer.flush(force=True)
+        assert published[-1] == [(1, _progress(10))]
+
+    def test_keys_are_independent(self, buffer, published):
+        buffer.submit(1, 10, _progress(5))
+        buffer.submit(1, 11, _progress(5))
+        buffer.submit(2, 10, _progress(5))
+        assert len(published) == 3
+
+
+class TestBatching:
+    def test_due_updates_ride_along_with_next_publish(self, buffer, published, clock):
+        buffer.submit(1, 10, _progress(5))
+        buffer.submit(1, 11, _progress(5))
+        clock.now += 0.1
+        buffer.submit(1, 10, _progress(10))
+        buffer.submit(1, 11, _progress(10))
+
+        clock.now += 0.5
+        buffer.submit(2, 20, _progress(1))
+
+        assert published[-1] == [
+            (2, _progress(1)),
+            (1, _progress(10)),
+            (1, _progress(10)),
+        ]
+        assert buffer.pending_count == 0
+
+
+class TestStatusChanges:
+    def test_status_change_bypasses_interval_and_drops_pending(self, buffer, published, clock):
+        buffer.submit(1, 10, _progress(5))
+        clock.now += 0.1
+        buffer.submit(1, 10, _progress(90))
+
+        done = {"status": "completed", "progress": 100}
+        assert buffer.submit(1, 10, done, coalesce=False)
+
+        assert published[-1] == [(1, done)]
+        assert buffer.pending_count == 0
+
+        clock.now += 1
+        buffer.flush(force=True)
+        assert published[-1] == [(1, done)]
+
+    def test_publish_failure_is_reported(self, clock):
+        buf = NotificationBuffer(lambda batch: False, interval=0.5, clock=clock)
+        assert buf.submit(1, 10, _progress(5), coalesce=False) is False
+
+
+class TestFileMetadataCache:
+    def test_loads_once(self):
+        calls = []
+
+        def loader(file_id):
+            calls.append(file_id)
+            return {"filename": f"f{file_id}"}
+
+        cache = FileMetadataCache()
+        assert cache.get(1, loader) == {"filename": "f1"}
+        assert cache.get(1, loader) == {"filename": "f1"}
+        assert calls == [1]
+
+        cache.evict(1)
+        cache.get(1, loader)
+        assert calls == [1, 1]
+
+    def test_misses_are_not_cached(self):
+        calls = []
+
+        def loader(file_id):
+            calls.append(file_id)
+            return None
+
+        cache = FileMetadataCache()
+        assert cache.get(1, loader) is None
+        assert cache.get(1, loader) is None
+        assert calls == [1, 1]
+
+    def test_lru_bound(self):
+        cache = FileMetadataCache(max_entries=2)
+        for file_id in (1, 2, 3):
+            cache.get(file_id, lambda fid: {"id": fid})
+
+        calls = []
+        cache.get(1, lambda fid: calls.append(fid) or {"id": fid})
+        assert calls == [1]
+
+
+def test_distinct_users_preserves_order():
+    assert distinct_users([(2, {}), (1, {}), (2, {})]) == [2, 1]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the zero-copy PCM artifact reader.
+
+WAV files are written with the standard library ``wave`` module; ffmpeg is
+patched to fail so the tests prove the pipeline format is read without it.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import wave
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.services.audio_segment_utils import AudioSession
+from app.services.audio_segment_utils import extract_audio_segment_np
+from app.services.audio_segment_utils import load_full_audio_np
+from app.utils.pcm_audio import open_pcm_wav
+from app.utils.pcm_audio import pcm_to_float32
+from app.utils.pcm_audio import read_pcm_wav
+
+SR = 16000
+
+
+def _write_wav(path, samples: np.ndarray, rate: int = SR, channels: int = 1) -> str:
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.astype("<i2").tobytes())
+    return str(path)
+
+
+@pytest.fixture
+def pipeline_wav(tmp_path):
+    """Two seconds of a ramp in the preprocess format (16 kHz mono s16le)."""
+    samples = (np.arange(SR * 2) % 2000 - 1000).astype(np.int16)
+    return _write_wav(tmp_path / "audio.wav", samples), samples
+
+
+@pytest.fixture
+def no_ffmpeg():
+    with patch.object(subprocess, "run", side_effect=AssertionError("ffmpeg was spawned")):
+        yield
+
+
+@pytest.mark.unit
+class TestOpenPcmWav:
+    def test_maps_pipeline_format(self, pipeline_wav):
+        path, samples = pipeline_wav
+        pcm = open_pcm_wav(path, SR)
+
+        assert isinstance(pcm, np.memmap)
+        assert pcm.dtype == np.dtype("<i2")
+        np.testing.assert_array_equal(pcm, samples)
+
+    def test_float_scaling_matches_decoders(self, pipeline_wav):
+        path, samples = pipeline_wav
+        audio = read_pcm_wav(path, SR)
+
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, samples.astype(np.float32) / 32768.0)
+
+    @pytest.mark.parametrize(("rate", "channels"), [(8000, 1), (SR, 2)])
+    def test_rejects_other_layouts(self, tmp_path, rate, channels):
+        path = _write_wav(
+            tmp_path / "other.wav", np.zeros(rate * channels, np.int16), rate, channels
+        )
+        assert open_pcm_wav(path, SR) is None
+
+    def test_rejects_non_wav_and_urls(self, tmp_path):
+        mp3 = tmp_path / "audio.mp3"
+        mp3.write_bytes(b"ID3\x03\x00" + b"\x00" * 64)
+        assert open_pcm_wav(str(mp3), SR) is None
+        assert open_pcm_wav("https://minio/bucket/audio.wav", SR) is None
+
+    def test_float32_input_is_returned_as_view(self):
+        audio = np.zeros(4, dtype=np.float32)
+        assert pcm_to_float32(audio) is audio
+
+
+@pytest.mark.unit
+class TestConsumersSkipFfmpeg:
+    def test_segment_extraction(self, pipeline_wav, no_ffmpeg):
+        path, samples = pipeline_wav
+        clip = extract_audio_segment_np(path, 0.5, 0.25, SR)
+
+        assert clip.flags.writeable
+        np.testing.assert_array_equal(clip, samples[8000:12000].astype(np.float32) / 32768.0)
+
+    def test_full_load(self, pipeline_wav, no_ffmpeg):
+        path, samples = pipeline_wav
+        assert len(load_full_audio_np(path, SR)) == len(samples)
+
+    def test_audio_session(self, pipeline_wav, no_ffmpeg):
+        path, samples = pipeline_wav
+        with AudioSession(path) as session:
+            assert session.duration == pytest.approx(2.0)
+            clip = session.slice(1.0, 1.5)
+
+        assert clip.dtype == np.float32
+        np.testing.assert_array_equal(clip, samples[SR : SR + SR // 2].astype(np.float32) / 32768.0)
@@ -0,0 +1,127 @@
+"""
+Unit tests for kept raw model outputs and CPU re-postprocessing.
+
+Raw Whisper/PyAnnote outputs round-trip through the compact npz form, and
+speaker-count constraints are resolved by merging existing centroids.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.transcription.diarize_result import DiarizeResult
+from app.transcription.raw_outputs import RawOutputRecorder
+from app.transcription.raw_outputs import RawOutputs
+from app.transcription.reprocess import PostprocessOptions
+from app.transcription.reprocess import constrain_speakers
+
+
+def _transcript() -> dict:
+    return {
+        "language": "de",
+        "segments": [
+            {
+                "text": "Grüße aus Köln",
+                "start": 0.0,
+                "end": 1.5,
+                "words": [
+                    {"word": " Grüße", "start": 0.0, "end": 0.5, "probability": 0.875},
+                    {"word": " aus", "start": 0.6, "end": 0.8, "probability": 0.5},
+                    {"word": " Köln", "start": 0.9, "end": 1.5, "probability": 0.75},
+                ],
+            },
+            {"text": "", "start": 2.0, "end": 2.5, "words": []},
+        ],
+    }
+
+
+def _diarization(*rows: tuple[float, float, str]) -> DiarizeResult:
+    return DiarizeResult(
+        start=np.asarray([r[0] for r in rows], dtype=np.float64),
+        end=np.asarray([r[1] for r in rows], dtype=np.float64),
+        speaker=np.asarray([r[2] for r in rows], dtype=object),
+    )
+
+
+class TestRawOutputsCodec:
+    def test_round_trip(self):
+        raw = RawOutputs(
+            transcript=_transcript(),
+            diarize_df=_diarization((0.0, 1.0, "SPEAKER_01"), (1.0, 2.5, "SPEAKER_00")),
+            overlap_info={"count": 1, "duration": 0.5, "regions": [{"start": 0.9, "end": 1.4}]},
+            native_embeddings={
+                "SPEAKER_00": np.array([1.0, 0.0], dtype=np.float32),
+                "SPEAKER_01": np.array([0.0, 1.0], dtype=np.float32),
+            },
+        )
+
+        loaded = RawOutputs.from_bytes(raw.to_bytes())
+
+        assert loaded.transcript == _transcript()
+        assert loaded.diarize_df is not None
+        assert loaded.diarize_df.to_records() == raw.diarize_df.to_records()
+        assert loaded.overlap_info == raw.overlap_info
+        assert set(loaded.native_embeddings) == {"SPEAKER_00", "SPEAKER_01"}
+        np.testing.assert_array_equal(loaded.native_embeddings["SPEAKER_01"], [0.0, 1.0])
+
+    def test_transcript_only(self):
+        loaded = RawOutputs.from_bytes(RawOutputs(transcript=_transcript()).to_bytes())
+        assert loaded.diarize_df is None
+        assert loaded.native_embeddings is None
+
+    def test_rejects_foreign_payload(self):
+        with pytest.raises(ValueError):
+            RawOutputs.from_bytes(b"not an archive")
+
+
+class TestRawOutputRecorder:
+    def test_snapshot_is_not_affected_by_later_postprocessing(self):
+        recorder = RawOutputRecorder()
+        transcript = _transcript()
+        recorder.save_transcript(transcript)
+        transcript["segments"][0]["speaker"] = "SPEAKER_00"
+        transcript["segments"].pop()
+
+        assert recorder.outputs.transcript == _transcript()
+
+    def test_nothing_recorded(self):
+        assert RawOutputRecorder().outputs is None
+
+
+class TestConstrainSpeakers:
+    def test_merges_most_similar_centroids_into_longest_speaker(self):
+        diarize_df = _diarization(
+            (0.0, 10.0, "SPEAKER_00"),
+            (10.0, 12.0, "SPEAKER_01"),
+            (12.0, 20.0, "SPEAKER_02"),
+        )
+        embeddings = {
+            "SPEAKER_00": np.array([1.0, 0.0]),
+            "SPEAKER_01": np.array([0.9, 0.1]),
+            "SPEAKER_02": np.array([0.0, 1.0]),
+        }
+
+        merged, merged_embeddings = constrain_speakers(diarize_df, embeddings, max_speakers=2)
+
+        assert merged.speaker.tolist() == ["SPEAKER_00", "SPEAKER_00", "SPEAKER_02"]
+        assert set(merged_embeddings) == {"SPEAKER_00", "SPEAKER_02"}
+        assert np.linalg.norm(merged_embeddings["SPEAKER_00"]) == pytest.approx(1.0)
+
+    def test_satisfied_constraint_is_a_no_op(self):
+        diarize_df = _diarization((0.0, 1.0, "SPEAKER_00"), (1.0, 2.0, "SPEAKER_01"))
+        embeddings = {"SPEAKER_00": np.array([1.0, 0.0]), "SPEAKER_01": np.array([0.0, 1.0])}
+
+        merged, _ = constrain_speakers(diarize_df, embeddings, max_speakers=3)
+
+        assert merged is diarize_df
+
+
+class TestPostprocessOptions:
+    def test_ignores_unset_and_unknown_keys(self):
+        options = PostprocessOptions.from_dict(
+            {"enable_dedup": False, "num_speakers": None, "bogus": 1}
+        )
+        assert options.enable_dedup is False
+        assert options.num_speakers is None
+        assert options.merge_max_duration == 30.0
@@ -0,0 +1,111 @@
+"""
+Unit tests for search access principals.
+
+Chunks carry owner and collection tokens; callers are matched through a
+cached principal lookup, so sharing never rewrites backfilled chunks;
+revocations rewrite only chunks still on the legacy user list.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from app.services.permission_service import PermissionService
+from app.services.permission_service import collection_principal
+from app.services.permission_service import file_access_principals
+from app.services.permission_service import user_principal
+from app.services.search import indexing_service
+from app.services.search.indexing_service import build_access_filter
+from app.services.search.indexing_service import get_files_missing_principals
+from app.tasks import search_indexing_task
+
+
+class TestTokens:
+    def test_token_format(self):
+        assert user_principal(7) == "user:7"
+        assert collection_principal(12) == "collection:12"
+
+    def test_file_principals_are_owner_plus_sorted_unique_collections(self):
+        assert file_access_principals(3, [9, 2, 9]) == [
+            "user:3",
+            "collection:2",
+            "collection:9",
+        ]
+
+    def test_file_without_collections_is_owner_only(self):
+        assert file_access_principals(3, None) == ["user:3"]
+
+    def test_expanding_user_tokens_needs_no_collection_lookup(self):
+        class NoQueries:
+            def query(self, *args, **kwargs):
+                raise AssertionError("collection lookup should not run")
+
+        users = PermissionService.get_users_for_principals(
+            NoQueries(), ["user:1", "user:2", "bogus", "collection:x"]
+        )
+        assert users == {1, 2}
+
+
+class TestAccessFilter:
+    def test_matches_principals_or_legacy_user_list(self):
+        with patch.object(
+            PermissionService,
+            "get_cached_search_principals",
+            return_value=["user:5", "collection:1"],
+        ):
+            clause = build_access_filter(5)
+
+        should = clause["bool"]["should"]
+        assert clause["bool"]["minimum_should_match"] == 1
+        assert should[0] == {"terms": {"access_principals": ["user:5", "collection:1"]}}
+        legacy = should[1]["bool"]
+        assert legacy["must_not"] == [{"exists": {"field": "access_principals"}}]
+        assert legacy["filter"] == [{"term": {"accessible_user_ids": 5}}]
+
+    def test_lookup_failure_falls_back_to_own_files(self):
+        with patch.object(
+            PermissionService, "get_cached_search_principals", side_effect=RuntimeError("down")
+        ):
+            clause = build_access_filter(5)
+
+        assert clause["bool"]["should"][0] == {"terms": {"access_principals": ["user:5"]}}
+
+
+class TestLegacyRevocation:
+    def test_missing_principals_lookup_is_scoped_to_files(self):
+        bodies = []
+
+        def search(index, body):
+            bodies.append(body)
+            return {"aggregations": {"files": {"buckets": [{"key": {"file_id": 4}}]}}}
+
+        client = SimpleNamespace(indices=SimpleNamespace(exists=lambda index: True), search=search)
+        with patch.object(indexing_service, "get_opensearch_client", return_value=client):
+            assert get_files_missing_principals([4, 5]) == [4]
+            assert get_files_missing_principals([]) == []
+
+        query = bodies[0]["query"]["bool"]
+        assert query["must_not"] == [{"exists": {"field": "access_principals"}}]
+        assert query["filter"] == [{"terms": {"file_id": [4, 5]}}]
+        assert len(bodies) == 1
+
+    def test_revocation_rewrites_only_legacy_files(self):
+        update = MagicMock(return_value={"status": "success"})
+        with (
+            patch.object(indexing_service, "get_files_missing_principals", return_value=[2]),
+            patch.object(search_indexing_task, "update_file_access_index", update),
+        ):
+            search_indexing_task.revoke_legacy_file_access([1, 2, 3])
+        update.assert_called_once_with([2])
+
+    def test_revocation_without_legacy_chunks_is_a_noop(self):
+        update = MagicMock()
+        with (
+            patch.object(indexing_service, "get_files_missing_principals", return_value=[]),
+            patch.object(search_indexing_task, "update_file_access_index", update),
+        ):
+            result = search_indexing_task.revoke_legacy_file_access([1])
+        assert result["status"] == "skipped"
+        update.assert_not_called()
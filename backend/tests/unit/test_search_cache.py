@@ -0,0 +1,137 @@
+"""
+Unit tests for the two-tier (local LRU + shared Redis) search result cache.
+
+Redis is replaced by an in-memory fake so generation bumps and cross-worker
+sharing can be checked without a server.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services import redis_cache_service
+from app.services.redis_cache_service import RedisCacheService
+from app.services.search import hybrid_search_service as hss
+from app.services.search.hybrid_search_service import SearchHit
+from app.services.search.hybrid_search_service import SearchOccurrence
+from app.services.search.hybrid_search_service import SearchResponse
+
+
+class FakeRedis:
+    """Minimal string-only Redis stand-in."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def mget(self, *keys):
+        return [self.store.get(k) for k in keys]
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def cache():
+    service = RedisCacheService()
+    service._redis = FakeRedis()
+    hss._search_cache.clear()
+    with patch.object(redis_cache_service, "redis_cache", service):
+        yield service
+    hss._search_cache.clear()
+
+
+def _response() -> SearchResponse:
+    occurrence = SearchOccurrence(
+        snippet="hello <mark>world</mark>",
+        speaker="Alice",
+        start_time=1.0,
+        end_time=2.5,
+        chunk_index=0,
+        score=0.9,
+    )
+    hit = SearchHit(
+        file_uuid="uuid-1",
+        file_id=1,
+        title="Meeting",
+        speakers=["Alice"],
+        tags=[],
+        upload_time="2024-01-01T00:00:00",
+        language="en",
+        occurrences=[occurrence],
+        total_occurrences=1,
+    )
+    return SearchResponse(
+        query="world",
+        results=[hit],
+        total_results=1,
+        total_files=1,
+        page=1,
+        page_size=20,
+        total_pages=1,
+        search_time_ms=12.0,
+    )
+
+
+@pytest.mark.unit
+class TestSearchGenerations:
+    def test_defaults_to_zero(self, cache):
+        assert cache.get_search_generations(5) == (0, 0)
+
+    def test_user_bump_is_scoped(self, cache):
+        cache.bump_search_generation([5, 5])
+        assert cache.get_search_generations(5) == (0, 1)
+        assert cache.get_search_generations(6) == (0, 0)
+
+    def test_global_bump_affects_everyone(self, cache):
+        cache.bump_search_generation()
+        assert cache.get_search_generations(6) == (1, 0)
+
+    def test_unavailable_redis_returns_none(self):
+        service = RedisCacheService()
+        with patch.object(RedisCacheService, "redis", None):
+            assert service.get_search_generations(5) is None
+            service.bump_search_generation([5])  # must not raise
+
+
+@pytest.mark.unit
+class TestTwoTierCache:
+    def test_shared_tier_round_trips_dataclasses(self, cache):
+        response = _response()
+        hss._set_cached_response("k", response, user_id=5, shared=True)
+        hss._search_cache.clear()  # simulate a different worker
+
+        restored = hss._get_cached_response("k", user_id=5, shared=True)
+        assert restored == response
+        assert isinstance(restored.results[0].occurrences[0], SearchOccurrence)
+        assert "k" in hss._search_cache  # promoted into the local LRU
+
+    def test_generation_bump_changes_key(self, cache):
+        before = hss._make_cache_key(generations=cache.get_search_generations(5), query="q")
+        cache.bump_search_generation([5])
+        after = hss._make_cache_key(generations=cache.get_search_generations(5), query="q")
+        assert before != after
+
+    def test_clear_search_cache_bumps_global_generation(self, cache):
+        hss._set_cached_response("k", _response())
+        hss.clear_search_cache()
+        assert not hss._search_cache
+        assert cache.get_search_generations(5) == (1, 0)
+
+    def test_local_only_when_not_shared(self, cache):
+        hss._set_cached_response("k", _response(), user_id=5, shared=False)
+        assert not cache.redis.store
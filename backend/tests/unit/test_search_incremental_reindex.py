@@ -0,0 +1,231 @@
+"""
+Unit tests for content-hash incremental reindexing of transcript chunks.
+
+Reindex diffs the new chunk set against the stored one so only added or
+changed chunks are written, and only new text is embedded.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.services.search import indexing_service
+from app.services.search.indexing_service import TranscriptIndexingService
+from app.services.search.indexing_service import chunk_doc_id
+from app.services.search.indexing_service import compute_chunk_hashes
+from app.services.search.indexing_service import embedding_key
+from app.services.search.indexing_service import plan_chunk_sync
+
+EMBEDDING = "neural:model-a"
+
+
+def _chunk(index: int, content: str, **overrides) -> dict:
+    chunk = {
+        "file_uuid": "f1",
+        "chunk_index": index,
+        "content": content,
+        "speaker": "Alice",
+        "title": "Standup",
+        "tags": ["team"],
+        "start_time": float(index * 10),
+        "end_time": float(index * 10 + 9),
+        "collection_ids": [],
+        "access_principals": ["user:1"],
+    }
+    chunk.update(overrides)
+    chunk["content_hash"], chunk["text_hash"] = compute_chunk_hashes(chunk, EMBEDDING)
+    return chunk
+
+
+def _stored(chunks: list[dict]) -> dict[str, dict]:
+    return {
+        chunk_doc_id(c): {
+            "content_hash": c["content_hash"],
+            "text_hash": c["text_hash"],
+            "access_principals": c["access_principals"],
+            "collection_ids": c["collection_ids"],
+        }
+        for c in chunks
+    }
+
+
+class TestChunkHashes:
+    def test_hash_is_deterministic_and_ignores_bookkeeping(self):
+        a = _chunk(0, "hello world")
+        b = _chunk(0, "hello world", indexed_at="2026-01-01T00:00:00", embedding_model="neural")
+        assert a["content_hash"] == b["content_hash"]
+        assert a["text_hash"] == b["text_hash"]
+
+    def test_access_fields_do_not_change_hash(self):
+        a = _chunk(0, "hello world")
+        b = _chunk(0, "hello world", collection_ids=[4], access_principals=["collection:4"])
+        assert a["content_hash"] == b["content_hash"]
+
+    def test_metadata_change_keeps_text_hash(self):
+        a = _chunk(0, "hello world")
+        b = _chunk(0, "hello world", tags=["team", "q3"])
+        assert a["content_hash"] != b["content_hash"]
+        assert a["text_hash"] == b["text_hash"]
+
+    def test_embedding_model_is_part_of_text_hash(self):
+        chunk = _chunk(0, "hello world")
+        _, other_model = compute_chunk_hashes(chunk, "neural:model-b")
+        assert chunk["text_hash"] != other_model
+
+
+class TestPlanChunkSync:
+    def test_identical_chunks_need_no_writes(self):
+        chunks = [_chunk(0, "one"), _chunk(1, "two")]
+        plan = plan_chunk_sync(chunks, _stored(chunks))
+        assert plan.unchanged == 2
+        assert not plan.has_changes
+
+    def test_first_index_embeds_everything(self):
+        chunks = [_chunk(0, "one"), _chunk(1, "two")]
+        plan = plan_chunk_sync(chunks, {})
+        assert plan.embed == chunks
+        assert plan.delete_ids == []
+
+    def test_only_changed_text_is_embedded(self):
+        old = [_chunk(0, "one"), _chunk(1, "two"), _chunk(2, "three")]
+        new = [old[0], _chunk(1, "two, edited"), old[2]]
+        plan = plan_chunk_sync(new, _stored(old))
+        assert plan.unchanged == 2
+        assert [chunk_doc_id(c) for c in plan.embed] == ["f1_1"]
+        assert plan.reuse == []
+
+    def test_shifted_chunks_reuse_stored_embeddings(self):
+        old = [_chunk(0, "one"), _chunk(1, "two")]
+        new = [_chunk(0, "zero"), _chunk(1, "one"), _chunk(2, "two")]
+        plan = plan_chunk_sync(new, _stored(old))
+        assert [chunk_doc_id(c) for c in plan.embed] == ["f1_0"]
+        assert [(chunk_doc_id(c), src) for c, src in plan.reuse] == [
+            ("f1_1", "f1_0"),
+            ("f1_2", "f1_1"),
+        ]
+
+    def test_text_only_mode_never_reuses(self):
+        old = [_chunk(0, "one")]
+        new = [_chunk(0, "one", tags=["other"])]
+        plan = plan_chunk_sync(new, _stored(old), reuse_embeddings=False)
+        assert plan.embed == new
+        assert plan.reuse == []
+
+    def test_removed_chunks_are_deleted(self):
+        old = [_chunk(0, "one"), _chunk(1, "two"), _chunk(2, "three")]
+        plan = plan_chunk_sync(old[:1], _stored(old))
+        assert plan.delete_ids == ["f1_1", "f1_2"]
+
+    def test_stale_access_fields_update_in_place(self):
+        old = [_chunk(0, "one")]
+        new = [_chunk(0, "one", collection_ids=[4], access_principals=["user:1", "collection:4"])]
+        plan = plan_chunk_sync(new, _stored(old))
+        assert plan.access_updates == new
+        assert plan.embed == [] and plan.reuse == []
+
+    def test_legacy_chunks_without_hashes_are_rewritten(self):
+        chunks = [_chunk(0, "one")]
+        plan = plan_chunk_sync(chunks, {"f1_0": {"access_principals": ["user:1"]}})
+        assert plan.embed == chunks
+
+
+class TestEmbeddingKey:
+    def test_model_is_read_from_pipeline(self, monkeypatch):
+        model = {"id": "model-a"}
+
+        def get_pipeline(**kwargs):
+            return {kwargs["id"]: {"processors": [{"text_embedding": {"model_id": model["id"]}}]}}
+
+        client = SimpleNamespace(ingest=SimpleNamespace(get_pipeline=get_pipeline))
+        monkeypatch.setattr(indexing_service, "opensearch_client", client)
+
+        assert embedding_key(True) == "neural:model-a"
+        model["id"] = "model-b"  # switched by another worker
+        assert embedding_key(True) == "neural:model-b"
+        assert embedding_key(False) == "none"
+
+
+class TestEmptyRechunk:
+    def test_zero_chunks_delete_stored_chunks(self, monkeypatch):
+        monkeypatch.setattr(indexing_service, "get_opensearch_client", lambda: object())
+        monkeypatch.setattr(indexing_service, "ensure_chunks_index_exists", lambda: True)
+        monkeypatch.setattr(indexing_service, "ensure_search_pipeline_exists", lambda: True)
+        monkeypatch.setattr(
+            indexing_service, "chunk_transcript_by_speaker_turns", lambda **kwargs: []
+        )
+        service = TranscriptIndexingService()
+        deleted = []
+        monkeypatch.setattr(service, "delete_transcript_chunks", deleted.append)
+
+        result = service.index_transcript_chunks(
+            file_id=1,
+            file_uuid="f1",
+            user_id=1,
+            segments=[{"start": 0.0, "end": 1.0, "text": " ", "speaker": "A"}],
+            title="Standup",
+            speakers=["A"],
+            tags=[],
+        )
+
+        assert result == 0
+        assert deleted == ["f1"]
+
+
+class TestFailedChunkLookup:
+    def _index(self, monkeypatch, client):
+        from app.services.redis_cache_service import redis_cache
+
+        chunks = [_chunk(0, "hello"), _chunk(1, "world")]
+        monkeypatch.setattr(indexing_service, "opensearch_client", client)
+        monkeypatch.setattr(indexing_service, "get_opensearch_client", lambda: client)
+        monkeypatch.setattr(indexing_service, "ensure_chunks_index_exists", lambda: True)
+        monkeypatch.setattr(indexing_service, "ensure_search_pipeline_exists", lambda: True)
+        monkeypatch.setattr(indexing_service, "is_neural_pipeline_available", lambda: False)
+        monkeypatch.setattr(
+            indexing_service, "chunk_transcript_by_speaker_turns", lambda **kwargs: chunks
+        )
+        monkeypatch.setattr(indexing_service.suggestion_index, "sync_file", lambda *a, **k: None)
+        monkeypatch.setattr(redis_cache, "bump_search_generation", lambda user_ids: None)
+        service = TranscriptIndexingService()
+        written = []
+        monkeypatch.setattr(
+            service,
+            "_bulk_index_chunks",
+            lambda batch, use_neural_pipeline: written.extend(batch) or len(batch),
+        )
+        result = service.index_transcript_chunks(
+            file_id=1,
+            file_uuid="f1",
+            user_id=1,
+            segments=[{"start": 0.0, "end": 1.0, "text": "hello world", "speaker": "A"}],
+            title="Standup",
+            speakers=["A"],
+            tags=[],
+        )
+        return result, written
+
+    def test_stale_tail_is_deleted_and_everything_rewritten(self, monkeypatch):
+        deleted = []
+
+        def search(**kwargs):
+            raise ConnectionError("timeout")
+
+        client = SimpleNamespace(
+            search=search, delete_by_query=lambda **kwargs: deleted.append(kwargs["body"]) or {}
+        )
+        result, written = self._index(monkeypatch, client)
+
+        assert [c["chunk_index"] for c in written] == [0, 1]
+        assert result["embedded"] == 2
+        filters = deleted[0]["query"]["bool"]["filter"]
+        assert {"range": {"chunk_index": {"gte": 2}}} in filters
+
+    def test_failed_tail_delete_writes_nothing(self, monkeypatch):
+        def fail(**kwargs):
+            raise ConnectionError("timeout")
+
+        result, written = self._index(
+            monkeypatch, SimpleNamespace(search=fail, delete_by_query=fail)
+        )
+        assert result == 0
+        assert written == []
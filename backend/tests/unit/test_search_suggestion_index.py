@@ -0,0 +1,201 @@
+"""
+Unit tests for the Redis search suggestion index.
+
+Redis is an in-memory fake whose ``eval`` applies the index's count
+script in Python, so the tests cover diffing, access principals and
+ranking without a server.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.search import suggestion_index as index_module
+from app.services.search.suggestion_index import SuggestionIndex
+from app.services.search.suggestion_index import frequent_terms
+from app.services.search.suggestion_index import suggest_for_user
+
+ALICE = ["user:1"]
+BOB = ["user:2", "collection:9"]
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops: list = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self.zsets: dict[str, set[str]] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def exists(self, key):
+        return int(key in self.strings)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+
+    def eval(self, script, numkeys, lex_key, count_key, *args):
+        counts = self.hashes.setdefault(count_key, {})
+        members = self.zsets.setdefault(lex_key, set())
+        for member, delta in zip(args[::2], args[1::2]):
+            counts[member] = counts.get(member, 0) + int(delta)
+            if counts[member] > 0:
+                members.add(member)
+            else:
+                del counts[member]
+                members.discard(member)
+
+    def zrangebylex(self, key, low, high, start, num):
+        low, high = low[1:].decode(), high[1:]
+        found = sorted(m for m in self.zsets.get(key, ()) if m >= low and m.encode() <= high)
+        return found[start : start + num]
+
+    def hmget(self, key, members):
+        counts = self.hashes.get(key, {})
+        return [str(counts[m]) if m in counts else None for m in members]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(index_module, "redis_cache", SimpleNamespace(redis=fake))
+    monkeypatch.setattr(index_module, "_stopwords", lambda: frozenset({"this", "that", "with"}))
+    return fake
+
+
+@pytest.fixture
+def index(redis):
+    index = SuggestionIndex()
+    index.mark_ready()
+    index.sync_file("f1", ALICE, "Weekly Team Meeting", ["John Smith", "Ann"], ["planning"])
+    index.sync_file("f2", ALICE + ["collection:9"], "Budget review", ["John Smith"], [])
+    return index
+
+
+def _texts(suggestions, kind):
+    return [s["text"] for s in suggestions if s["type"] == kind]
+
+
+@pytest.mark.unit
+class TestSuggest:
+    def test_matches_any_word_start(self, index):
+        assert index.suggest(ALICE, "mee", 8) == [
+            {"type": "title", "text": "Weekly Team Meeting", "file_uuid": "f1"}
+        ]
+        assert _texts(index.suggest(ALICE, "smi", 8), "speaker") == ["John Smith"]
+
+    def test_counts_files_and_orders_kinds(self, index):
+        index.sync_file("f3", ALICE, "Jour fixe", ["Joan"], ["journal"])
+        suggestions = index.suggest(ALICE, "jo", 8)
+
+        assert [s["type"] for s in suggestions] == ["title", "speaker", "speaker", "tag"]
+        assert suggestions[1] == {"type": "speaker", "text": "John Smith", "count": 2}
+
+    def test_kinds_have_their_own_scan_budget(self, index, monkeypatch):
+        monkeypatch.setattr(index_module, "SCAN_LIMIT", 3)
+        terms = [f"weekday{i}" for i in range(5)]
+        index.sync_file("f3", ALICE, "Retro", [], [], terms)
+
+        suggestions = index.suggest(ALICE, "wee", 8)
+        assert _texts(suggestions, "title") == ["Weekly Team Meeting"]
+        assert len(_texts(suggestions, "term")) == 3
+
+    def test_not_ready_falls_back(self, index, redis):
+        redis.delete(index_module.READY_KEY)
+        assert index.suggest(ALICE, "jo", 8) is None
+
+    def test_user_lookup_uses_cached_principals(self, index, monkeypatch):
+        from app.services.permission_service import PermissionService
+
+        monkeypatch.setattr(settings, "SEARCH_SUGGESTION_INDEX_ENABLED", True)
+        monkeypatch.setattr(
+            PermissionService, "get_cached_search_principals", staticmethod(lambda uid: BOB)
+        )
+        assert _texts(suggest_for_user(2, "bud", 8), "title") == ["Budget review"]
+        assert suggest_for_user(2, "wee", 8) == []
+
+        monkeypatch.setattr(settings, "SEARCH_SUGGESTION_INDEX_ENABLED", False)
+        assert suggest_for_user(2, "bud", 8) is None
+
+
+@pytest.mark.unit
+class TestWrites:
+    def test_rename_replaces_only_that_kind(self, index):
+        index.update_file("f1", speakers=["Jane Smith", "Ann"])
+
+        assert _texts(index.suggest(ALICE, "j", 8), "speaker") == ["Jane Smith", "John Smith"]
+        assert _texts(index.suggest(ALICE, "plan", 8), "tag") == ["planning"]
+
+        index.update_file("f2", title="Budget 2026")
+        assert _texts(index.suggest(ALICE, "bud", 8), "title") == ["Budget 2026"]
+
+    def test_access_change_moves_entries(self, index):
+        index.set_principals("f2", ALICE)
+        assert index.suggest(BOB, "bud", 8) == []
+
+        index.set_principals("f1", ["user:1", "collection:9"])
+        assert _texts(index.suggest(BOB, "wee", 8), "title") == ["Weekly Team Meeting"]
+
+    def test_removal_drops_unshared_entries(self, index, redis):
+        index.remove_file("f1")
+
+        assert _texts(index.suggest(ALICE, "j", 8), "speaker") == ["John Smith"]
+        assert index.suggest(ALICE, "ann", 8) == []
+        assert not any("Ann" in m for m in redis.zsets["suggest:lex:user:1:speaker"])
+        assert "suggest:file:f1" not in redis.strings
+
+    def test_resync_is_idempotent(self, index, redis):
+        index.sync_file("f2", ALICE + ["collection:9"], "Budget review", ["John Smith"], [])
+        assert (
+            redis.hashes["suggest:n:user:1:speaker"]["john smith\x00speaker\x00\x00John Smith"] == 2
+        )
+
+    def test_older_layout_records_are_rebuilt(self, index, redis):
+        redis.set("suggest:file:f3", '{"principals": ["user:1"], "entries": {"title": ["Old"]}}')
+        index.update_file("f3", title="Ignored")
+        assert index.suggest(ALICE, "ign", 8) == []
+
+        index.sync_file("f3", ALICE, "Quarterly plan", [], [])
+        assert _texts(index.suggest(ALICE, "qua", 8), "title") == ["Quarterly plan"]
+        assert (
+            redis.hashes["suggest:n:user:1:title"][
+                "quarterly plan\x00title\x00f3\x00Quarterly plan"
+            ]
+            == 1
+        )
+
+    def test_edits_before_indexing_are_ignored(self, index, redis):
+        index.update_file("unknown", title="New")
+        index.set_principals("unknown", ALICE)
+        assert "suggest:file:unknown" not in redis.strings
+
+
+@pytest.mark.unit
+def test_frequent_terms_skip_stopwords_and_one_offs(redis):
+    texts = ["This budget, that budget.", "Budget with forecasts", "forecasts and one-offs"]
+    assert frequent_terms(texts) == ["budget", "forecasts"]
@@ -0,0 +1,174 @@
+"""
+Unit tests for batched speaker attribute inference.
+
+The wav2vec2 model is replaced by a fake ONNX session whose logits depend
+only on each clip's valid samples, so batched and single-clip results can
+be compared exactly without transformers or onnxruntime.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.speaker_analysis_models import GenderModelAdapter
+from app.services.speaker_analysis_models import MultiModelRunner
+from app.services.speaker_attribute_service import SpeakerAttributeService
+from app.services.speaker_attribute_service import aggregate_by_speaker
+from app.services.speaker_attribute_service import bucket_by_length
+from app.tasks import migration_pipeline
+from app.tasks.migration_pipeline import PreparedFile
+from app.tasks.migration_pipeline import SpeakerSnapshot
+
+SR = 16000
+
+
+class FakeExtractor:
+    def __call__(self, clips, sampling_rate, return_tensors, padding, return_attention_mask):
+        width = max(len(c) for c in clips)
+        values = np.zeros((len(clips), width), np.float32)
+        mask = np.zeros((len(clips), width), np.int64)
+        for row, clip in enumerate(clips):
+            values[row, : len(clip)] = clip
+            mask[row, : len(clip)] = 1
+        return {"input_values": values, "attention_mask": mask}
+
+
+class FakeSession:
+    """Positive mean amplitude reads as male, negative as female."""
+
+    def __init__(self, fail_batches: bool = False):
+        self.batch_shapes: list[tuple[int, int]] = []
+        self.fail_batches = fail_batches
+
+    def run(self, outputs, feeds):
+        values, mask = feeds["input_values"], feeds["attention_mask"]
+        self.batch_shapes.append(values.shape)
+        if self.fail_batches and len(values) > 1:
+            raise RuntimeError("out of memory")
+        mean = (values * mask).sum(axis=1) / mask.sum(axis=1)
+        return [np.stack([-mean, mean], axis=1) * 10]
+
+
+def _service(session: FakeSession) -> SpeakerAttributeService:
+    service = SpeakerAttributeService(force_cpu=True)
+    service._feature_extractor = FakeExtractor()
+    service._onnx_session = session
+    service._model_loaded = True
+    return service
+
+
+def _clip(seconds: float, level: float) -> np.ndarray:
+    return np.full(int(seconds * SR), level, np.float32)
+
+
+@pytest.mark.unit
+class TestBucketing:
+    def test_similar_lengths_share_a_bucket(self):
+        buckets = bucket_by_length([100, 300, 105, 310, 110], max_batch_size=8)
+        assert buckets == [[0, 2, 4], [1, 3]]
+
+    def test_batch_size_and_sample_budget(self):
+        assert bucket_by_length([10] * 5, max_batch_size=2) == [[0, 1], [2, 3], [4]]
+        assert bucket_by_length([10] * 5, max_batch_size=8, max_batch_samples=30) == [
+            [0, 1, 2],
+            [3, 4],
+        ]
+
+    def test_oversized_clip_still_runs(self):
+        assert bucket_by_length([500], max_batch_size=8, max_batch_samples=100) == [[0]]
+
+
+@pytest.mark.unit
+class TestPredictBatch:
+    def test_one_pass_per_bucket_in_input_order(self, monkeypatch):
+        monkeypatch.setattr(settings, "SPEAKER_ATTRIBUTE_BATCH_SIZE", 16)
+        session = FakeSession()
+        service = _service(session)
+        clips = [_clip(2.0, 0.2), _clip(5.0, -0.3), _clip(2.1, -0.1), _clip(5.2, 0.4)]
+
+        results = service.predict_batch(clips)
+
+        assert len(session.batch_shapes) == 2
+        assert [gender for gender, _ in results] == ["male", "female", "female", "male"]
+        for clip, (gender, confidence) in zip(clips, results):
+            single_gender, single_confidence = service._run_inference(clip)
+            assert gender == single_gender
+            assert confidence == pytest.approx(single_confidence)
+
+    def test_failed_bucket_falls_back_to_single_clips(self):
+        service = _service(FakeSession(fail_batches=True))
+        results = service.predict_batch([_clip(2.0, 0.2), _clip(2.0, -0.2)])
+        assert [gender for gender, _ in results] == ["male", "female"]
+
+    def test_aggregates_per_speaker(self):
+        results = aggregate_by_speaker(
+            [(1, ("male", 0.9)), (1, ("female", 0.6)), (1, ("male", 0.7)), (2, ("female", 0.8))]
+        )
+        assert results[1] == ("male", pytest.approx(1.6 / 3))
+        assert results[2] == ("female", pytest.approx(0.8))
+
+
+class OneAtATimeModel:
+    name = "embedding"
+    min_segment_duration = 1.0
+
+    def process_audio(self, audio_np, sample_rate):
+        return float(audio_np.mean())
+
+    def cleanup(self):
+        pass
+
+
+@pytest.mark.unit
+class TestRunner:
+    def test_batching_and_per_segment_models_share_segments(self):
+        session = FakeSession()
+        runner = MultiModelRunner([OneAtATimeModel(), GenderModelAdapter(_service(session))])
+        segments = [(1, _clip(2.0, 0.5)), (2, _clip(0.5, -0.5)), (2, _clip(2.0, -0.5))]
+
+        results = runner.process_segments(segments, SR)
+
+        gender = [(r.speaker_id, r.value[0]) for r in results if r.model_name == "gender"]
+        assert gender == [(1, "male"), (2, "female")]  # sub-second clip skipped
+        assert len([r for r in results if r.model_name == "embedding"]) == 3
+        assert len(session.batch_shapes) == 1
+
+    def test_pipeline_batches_across_files(self, monkeypatch):
+        session = FakeSession()
+        runner = MultiModelRunner([GenderModelAdapter(_service(session))])
+        monkeypatch.setattr(
+            migration_pipeline,
+            "extract_audio_segment_np",
+            lambda source, start, duration: _clip(duration, 0.3 if source == "a" else -0.3),
+        )
+
+        def prepared(source: str, speaker_id: int) -> PreparedFile:
+            return PreparedFile(
+                file_uuid=source,
+                audio_source=source,
+                speakers=[SpeakerSnapshot(id=speaker_id, uuid=str(speaker_id), name="S")],
+                speaker_segments={speaker_id: [{"start": 0.0, "end": 3.0}]},
+                media_file_id=speaker_id,
+                user_id=1,
+            )
+
+        written = {}
+
+        def writer(prepared_file, results_by_model):
+            written[prepared_file.file_uuid] = [r.value[0] for r in results_by_model["gender"]]
+            return 1
+
+        success, failed = migration_pipeline.process_batch_pipelined(
+            prepared_files=[("a", prepared("a", 1)), ("b", prepared("b", 2))],
+            runner=runner,
+            result_writer=writer,
+            is_running_check=lambda: True,
+            on_file_success=lambda _: None,
+            on_file_failure=lambda *_: None,
+        )
+
+        assert (success, failed) == (2, 0)
+        assert written == {"a": ["male"], "b": ["female"]}
+        assert len(session.batch_shapes) == 1
@@ -0,0 +1,81 @@
+"""
+Unit tests for the paginated speaker directory.
+
+Covers the directory's cursor codec and seek predicate, and the choice of
+the stored top suggestion. No database or OpenSearch is required.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.api.endpoints.speaker_pagination import Cursor
+from app.api.endpoints.speaker_pagination import InvalidCursorError
+from app.api.endpoints.speaker_pagination import apply_keyset_order
+from app.api.endpoints.speaker_pagination import apply_keyset_seek
+from app.api.endpoints.speaker_pagination import decode_cursor
+from app.api.endpoints.speaker_pagination import encode_cursor
+from app.models.media import Speaker
+from app.services.smart_speaker_suggestion_service import ConsolidatedSuggestion
+from app.services.speaker_summary_service import SpeakerSummaryService
+
+
+def _sql(query: Query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect())).lower()
+
+
+def _speaker(**kwargs) -> SimpleNamespace:
+    fields = {"suggested_name": None, "confidence": None, "suggestion_source": None}
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+class TestDirectoryCursor:
+    def test_round_trip_created_at(self):
+        ts = datetime(2026, 5, 4, 8, 0, tzinfo=timezone.utc)
+        token = encode_cursor("created_at", "desc", SimpleNamespace(id=9, created_at=ts))
+        assert decode_cursor(token, "created_at", "desc") == Cursor("created_at", "desc", ts, 9)
+
+    def test_rejects_other_sort(self):
+        token = encode_cursor("segment_count", "desc", SimpleNamespace(id=3, segment_count=12))
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "created_at", "desc")
+
+    def test_seek_on_segment_count(self):
+        sql = _sql(
+            apply_keyset_seek(
+                apply_keyset_order(Query(Speaker), "segment_count", "desc"),
+                Cursor("segment_count", "desc", 12, 3),
+            )
+        )
+        assert "(speaker.segment_count, speaker.id) <" in sql
+        assert "order by speaker.segment_count desc, speaker.id desc" in sql
+
+
+class TestTopSuggestion:
+    def test_ranked_suggestion_wins_over_stored_one(self):
+        speaker = _speaker(suggested_name="Ada", confidence=0.9, suggestion_source="llm_analysis")
+        ranked = [
+            ConsolidatedSuggestion(name="Grace", confidence=0.8, suggestion_type="profile"),
+            ConsolidatedSuggestion(name="Ada", confidence=0.9, suggestion_type="llm_analysis"),
+        ]
+        top = SpeakerSummaryService.select_top_suggestion(speaker, ranked)
+        assert top == ("Grace", 0.8, "profile")
+
+    def test_falls_back_to_stored_suggestion(self):
+        speaker = _speaker(suggested_name="Ada", confidence=0.7, suggestion_source="metadata_hint")
+        assert SpeakerSummaryService.select_top_suggestion(speaker, []) == (
+            "Ada",
+            0.7,
+            "metadata_hint",
+        )
+
+    def test_ignores_diarization_labels(self):
+        speaker = _speaker(suggested_name="SPEAKER_02", confidence=0.9)
+        assert SpeakerSummaryService.select_top_suggestion(speaker, []) is None
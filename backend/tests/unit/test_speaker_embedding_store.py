@@ -0,0 +1,230 @@
+"""
+Unit tests for the local speaker embedding store.
+
+Redis is an in-memory fake and the OpenSearch scroll is patched, so the
+tests only touch a temporary directory.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import opensearch_service
+from app.services import speaker_embedding_store as store_module
+from app.services.speaker_embedding_store import SpeakerEmbeddingStore
+
+USER = 7
+DIM = 4
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops: list = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+def _vec(seed: int) -> list[float]:
+    return [round(0.1 * seed + 0.01 * i, 2) for i in range(DIM)]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(settings, "SPEAKER_EMBEDDING_STORE_ENABLED", True)
+    monkeypatch.setattr(store_module, "redis_cache", SimpleNamespace(redis=fake))
+    return fake
+
+
+@pytest.fixture
+def opensearch(monkeypatch):
+    """Speaker docs of USER in OpenSearch, plus a count of scrolls."""
+    state = SimpleNamespace(docs={f"s{i}": _vec(i) for i in range(3)}, scrolls=0, error=None)
+
+    def iter_speaker_embeddings(user_id, batch_size=200, strict=False, speaker_uuids=None):
+        state.scrolls += 1
+        if state.error:
+            raise state.error
+        items = [
+            {"speaker_uuid": uuid, "embedding": emb, "speaker_id": int(uuid[1:])}
+            for uuid, emb in state.docs.items()
+        ]
+        for i in range(0, len(items), batch_size):
+            yield items[i : i + batch_size]
+
+    monkeypatch.setattr(opensearch_service, "iter_speaker_embeddings", iter_speaker_embeddings)
+    return state
+
+
+@pytest.fixture
+def store(tmp_path, redis, opensearch):
+    return SpeakerEmbeddingStore(tmp_path)
+
+
+def _assert_rows(matrix, expected: dict[str, list[float]]):
+    uuids, vectors = matrix.rows(expected)
+    assert uuids == list(expected)
+    np.testing.assert_allclose(vectors, np.array(list(expected.values())), atol=1e-3)
+
+
+@pytest.mark.unit
+class TestLoad:
+    def test_first_load_builds_then_maps(self, store, opensearch):
+        matrix = store.load(USER)
+
+        assert isinstance(matrix.vectors, np.memmap)
+        assert len(matrix) == 3
+        assert matrix.speaker_id("s2") == 2
+        _assert_rows(matrix, opensearch.docs)
+
+        store.load(USER)
+        assert opensearch.scrolls == 1
+
+    def test_unknown_speakers_are_left_out(self, store):
+        uuids, vectors = store.load(USER).rows(["missing", "s1"])
+        assert uuids == ["s1"]
+        assert vectors.shape == (1, DIM)
+
+    def test_failed_scroll_is_not_cached(self, store, opensearch):
+        opensearch.error = ConnectionError("opensearch down")
+        assert store.load(USER) is None
+
+        opensearch.error = None
+        assert len(store.load(USER)) == 3
+
+    def test_without_redis_callers_use_opensearch(self, store, opensearch, monkeypatch):
+        monkeypatch.setattr(store_module, "redis_cache", SimpleNamespace(redis=None))
+        assert store.load(USER) is None
+        assert opensearch.scrolls == 0
+
+
+@pytest.mark.unit
+class TestWrites:
+    def test_local_writes_apply_without_rebuild(self, store, opensearch):
+        store.load(USER)
+        store.upsert(USER, [("s1", 1, _vec(9)), ("s5", 5, _vec(5))])
+        store.remove(USER, ["s0"])
+
+        matrix = store.load(USER)
+        assert opensearch.scrolls == 1
+        assert "s0" not in matrix
+        _assert_rows(matrix, {"s1": _vec(9), "s2": _vec(2), "s5": _vec(5)})
+
+    def test_write_on_another_host_forces_rebuild(self, tmp_path, store, opensearch):
+        store.load(USER)
+        other_host = SpeakerEmbeddingStore(tmp_path / "other")
+        opensearch.docs["s8"] = _vec(8)
+        other_host.upsert(USER, [("s8", 8, _vec(8))])
+
+        matrix = store.load(USER)
+        assert opensearch.scrolls == 2
+        assert "s8" in matrix
+
+    def test_rebuild_racing_a_write_still_gets_the_write(self, store, opensearch, monkeypatch):
+        store.load(USER)
+        revisions = store._revisions
+
+        def revisions_then_rebuild(client, user_id, bump):
+            result = revisions(client, user_id, bump)
+            if bump:
+                # A reader rebuilds before the write lands; its scroll misses s8
+                store.load(user_id)
+            return result
+
+        with monkeypatch.context() as patched:
+            patched.setattr(store, "_revisions", revisions_then_rebuild)
+            store.upsert(USER, [("s8", 8, _vec(8))])
+
+        matrix = store.load(USER)
+        assert opensearch.scrolls == 2
+        _assert_rows(matrix, {"s0": _vec(0), "s8": _vec(8)})
+
+    def test_other_dimension_leaves_copy_stale(self, store, opensearch):
+        store.load(USER)
+        store.upsert(USER, [("s9", 9, [0.5] * (DIM * 2))])
+
+        store.load(USER)
+        assert opensearch.scrolls == 2
+
+    def test_compaction_keeps_live_rows(self, store, monkeypatch):
+        monkeypatch.setattr(store_module, "COMPACT_MIN_ROWS", 4)
+        store.load(USER)
+        store.upsert(USER, [(f"s{i}", i, _vec(i)) for i in range(3, 6)])
+        store.remove(USER, ["s0", "s1", "s2", "s3"])
+
+        matrix = store.load(USER)
+        assert matrix.vectors.shape == (2, DIM)
+        _assert_rows(matrix, {"s4": _vec(4), "s5": _vec(5)})
+
+
+@pytest.mark.unit
+class TestReconcile:
+    def test_drifted_copy_is_invalidated(self, store, opensearch):
+        store.load(USER)
+        assert store.reconcile({USER: 3}) == []
+
+        opensearch.docs.pop("s0")
+        assert store.reconcile({USER: 2}) == [USER]
+        assert len(store.load(USER)) == 2
+
+    def test_user_without_speakers_is_dropped(self, tmp_path, store):
+        store.load(USER)
+        assert store.reconcile({}) == [USER]
+        assert not (tmp_path / f"user_{USER}").exists()
+
+    def test_index_swap_invalidates_every_copy(self, store, opensearch):
+        store.load(USER)
+        store.invalidate_all()
+        store.load(USER)
+        assert opensearch.scrolls == 2
+
+
+@pytest.mark.unit
+class TestBatchRead:
+    def test_speakers_missing_locally_come_from_mget(self, store, opensearch, monkeypatch):
+        requested = []
+
+        def mget(body):
+            requested.extend(doc["_id"] for doc in body["docs"])
+            return {"docs": [{"_id": "s8", "found": True, "_source": {"embedding": _vec(8)}}]}
+
+        monkeypatch.setattr(opensearch_service, "speaker_embedding_store", store)
+        monkeypatch.setattr(opensearch_service, "opensearch_client", SimpleNamespace(mget=mget))
+        monkeypatch.setattr(opensearch_service, "ensure_indices_exist", lambda: None)
+        monkeypatch.setattr(opensearch_service, "get_active_speaker_index", lambda: "speakers")
+
+        found = opensearch_service.get_speaker_embeddings_batch(["s1", "s8"], user_id=USER)
+
+        assert requested == ["s8"]
+        assert set(found) == {"s1", "s8"}
+        np.testing.assert_allclose(found["s1"], _vec(1), atol=1e-3)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the multi-resolution waveform pyramid.
+
+Checks that widths served from the pyramid match a direct reduction of the
+PCM, and that the binary format round-trips.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.tasks.transcription.waveform_generator import waveform_payload
+from app.utils.waveform_pyramid import WaveformPyramid
+from app.utils.waveform_pyramid import load_pyramid
+
+
+@pytest.fixture
+def pcm() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(22050 * 30) * 8000).clip(-32768, 32767).astype(np.int16)
+
+
+def _direct_minmax(pcm: np.ndarray, points: int) -> tuple[np.ndarray, np.ndarray]:
+    edges = (np.arange(points + 1) * len(pcm)) // points
+    mins = np.array([pcm[a:b].min() for a, b in zip(edges[:-1], edges[1:])])
+    maxs = np.array([pcm[a:b].max() for a, b in zip(edges[:-1], edges[1:])])
+    return mins / 32768.0, maxs / 32768.0
+
+
+class TestBuild:
+    def test_levels_halve_down_to_minimum(self, pcm):
+        pyramid = WaveformPyramid.build(pcm, 22050, base_bins=4096, min_bins=256)
+        sizes = [level.shape[1] for level in pyramid.levels]
+
+        assert sizes[0] <= 4096
+        assert sizes[-1] <= 256
+        assert all(finer == 2 * coarser - (finer % 2) for finer, coarser in zip(sizes, sizes[1:]))
+
+    def test_global_extremes_preserved_at_every_level(self, pcm):
+        pyramid = WaveformPyramid.build(pcm, 22050, base_bins=4096)
+        for level in pyramid.levels:
+            assert level[0].min() == pcm.min()
+            assert level[1].max() == pcm.max()
+
+    def test_duration(self, pcm):
+        pyramid = WaveformPyramid.build(pcm, 22050)
+        assert pyramid.duration == pytest.approx(30.0)
+
+
+class TestResample:
+    @pytest.mark.parametrize("points", [256, 300, 1000, 1024, 4096])
+    def test_minmax_matches_direct_reduction_when_aligned(self, points):
+        # 2^18 samples into 4096 base bins: every power-of-two width lines up exactly
+        rng = np.random.default_rng(1)
+        pcm = rng.integers(-32768, 32767, 1 << 18, dtype=np.int16)
+        pyramid = WaveformPyramid.build(pcm, 22050, base_bins=4096)
+        mins, maxs, rms = pyramid.resample(points)
+
+        assert len(mins) == len(maxs) == len(rms) == points
+        if 4096 % points == 0:
+            direct_mins, direct_maxs = _direct_minmax(pcm, points)
+            np.testing.assert_array_equal(mins, direct_mins)
+            np.testing.assert_array_equal(maxs, direct_maxs)
+        assert mins.min() == pcm.min() / 32768.0
+        assert maxs.max() == pcm.max() / 32768.0
+
+    def test_short_audio_interpolates(self):
+        pyramid = WaveformPyramid.build(np.arange(50, dtype=np.int16), 22050)
+        mins, maxs, rms = pyramid.resample(200)
+        assert len(mins) == len(maxs) == len(rms) == 200
+
+    def test_payload_keeps_legacy_shape(self, pcm):
+        payload = waveform_payload(WaveformPyramid.build(pcm, 22050), 1000)
+
+        assert len(payload["waveform"]) == payload["samples"] == 1000
+        assert max(payload["waveform"]) == 255
+        assert min(payload["waveform"]) >= 0
+        assert payload["extracted_samples"] == len(pcm)
+
+
+class TestSerialisation:
+    def test_round_trip(self, pcm):
+        pyramid = WaveformPyramid.build(
+            pcm, 22050, original_sample_rate=48000, expected_duration=30.01
+        )
+        restored = WaveformPyramid.from_bytes(pyramid.to_bytes())
+
+        assert restored.original_sample_rate == 48000
+        assert restored.expected_duration == pytest.approx(30.01)
+        assert restored.total_samples == len(pcm)
+        assert len(restored.levels) == len(pyramid.levels)
+        for a, b in zip(restored.levels, pyramid.levels):
+            np.testing.assert_array_equal(a, b)
+
+    def test_blob_is_compact(self, pcm):
+        blob = WaveformPyramid.build(pcm, 22050).to_bytes()
+        # int16 x 3 rows, levels sum to < 2x base
+        assert len(blob) < 3 * 2 * 32768 * 2 + 1024
+
+    @pytest.mark.parametrize("blob", [None, b"", b"nope", b"OTWP" + b"\x00" * 40])
+    def test_load_rejects_bad_blobs(self, blob):
+        assert load_pyramid(blob) is None
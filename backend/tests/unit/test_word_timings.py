@@ -0,0 +1,64 @@
+"""
+Unit tests for packed transcript word timings.
+
+Word timestamps round-trip through the binary layout, decode as views over
+the stored bytes, and legacy JSONB rows stay readable through the
+compatibility accessor.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils.word_timings import WordTimings
+from app.utils.word_timings import pack_words
+from app.utils.word_timings import segment_words
+
+WORDS = [
+    {"word": " Grüße", "start": 0.0, "end": 0.5, "probability": 0.875},
+    {"word": " aus", "start": 0.6, "end": 0.8, "score": 0.5},
+    {"word": " Köln", "start": 17999.125, "end": 18000.5},
+]
+
+
+class TestWordTimingsCodec:
+    def test_round_trip(self):
+        timings = WordTimings.from_bytes(pack_words(WORDS))
+
+        assert timings.to_words() == [
+            {"word": " Grüße", "start": 0.0, "end": 0.5, "score": 0.875},
+            {"word": " aus", "start": 0.6, "end": 0.8, "score": 0.5},
+            {"word": " Köln", "start": 17999.125, "end": 18000.5, "score": 1.0},
+        ]
+
+    def test_decode_is_zero_copy(self):
+        timings = WordTimings.from_bytes(pack_words(WORDS))
+
+        assert not timings.starts.flags.owndata
+        assert not timings.starts.flags.writeable
+        assert timings.token(2) == " Köln"
+
+    def test_words_without_timestamps_are_dropped(self):
+        assert pack_words([{"word": "uh"}]) is None
+        assert pack_words([]) is None
+        assert len(WordTimings.from_bytes(pack_words(WORDS + [{"word": "uh"}]))) == 3
+
+    @pytest.mark.parametrize("data", [b"", b"OTWT", pack_words(WORDS)[:-1]])
+    def test_rejects_malformed_blob(self, data):
+        with pytest.raises(ValueError):
+            WordTimings.from_bytes(data)
+
+
+class TestSegmentWords:
+    def test_prefers_packed_column(self):
+        segment = SimpleNamespace(word_timings=pack_words(WORDS[:1]), words=WORDS)
+        assert segment_words(segment) == [
+            {"word": " Grüße", "start": 0.0, "end": 0.5, "score": 0.875}
+        ]
+
+    def test_falls_back_to_legacy_jsonb(self):
+        legacy = [{"word": "hi", "start": 1.0, "end": 1.2, "score": 0.9}]
+        assert segment_words(SimpleNamespace(word_timings=None, words=legacy)) == legacy
+        assert segment_words(SimpleNamespace(word_timings=None, words=[])) is None
@@ -166,6 +166,7 @@ CREATE TABLE IF NOT EXISTS media_file (
     metadata_important JSONB NULL,
     -- Waveform visualization data
     waveform_data JSONB NULL,
+    waveform_pyramid BYTEA NULL,
     -- Media technical specs
     media_format VARCHAR(50) NULL,
     codec VARCHAR(50) NULL,
@@ -262,6 +263,13 @@ CREATE TABLE IF NOT EXISTS speaker (
     status_text VARCHAR(500) NULL, -- Human-readable status text
     status_color VARCHAR(50) NULL, -- CSS color for status display
     resolved_display_name VARCHAR(255) NULL, -- Best available display name
+    -- Denormalized summary for the speaker directory (maintained by SpeakerSummaryService)
+    segment_count INTEGER NOT NULL DEFAULT 0,
+    first_segment_times JSONB NULL, -- First 4 segments: [{"uuid", "start_time", "segment_index"}]
+    top_suggestion_name VARCHAR(255) NULL,
+    top_suggestion_confidence FLOAT NULL,
+    top_suggestion_type VARCHAR(50) NULL, -- "profile", "llm_analysis", "voice_match", ...
+    summary_updated_at TIMESTAMP WITH TIME ZONE NULL,
     predicted_gender VARCHAR(20) NULL, -- AI-predicted gender ("male", "female", "unknown")
     predicted_age_range VARCHAR(30) NULL, -- AI-predicted age range ("child", "teen", "young_adult", "adult", "senior")
     attribute_confidence JSONB NULL, -- Confidence scores: {"gender": 0.92, "age_range": 0.75}
@@ -304,7 +312,8 @@ CREATE TABLE IF NOT EXISTS transcript_segment (
     is_overlap BOOLEAN NOT NULL DEFAULT FALSE,
     overlap_group_id UUID NULL,
     overlap_confidence FLOAT NULL,
-    words JSONB NULL,
+    words JSONB NULL, -- Legacy word timestamps; converted to word_timings on startup
+    word_timings BYTEA NULL, -- Packed float32 start/end/score + UTF-8 tokens (app.utils.word_timings)
     CONSTRAINT uq_transcript_segment_content UNIQUE (media_file_id, start_time, end_time, text)
 );
 
@@ -383,6 +392,12 @@ CREATE INDEX IF NOT EXISTS idx_media_file_error_category ON media_file(error_cat
 CREATE INDEX IF NOT EXISTS idx_media_file_user_status_upload ON media_file(user_id, status, upload_time DESC);
 CREATE INDEX IF NOT EXISTS idx_media_file_summary_status_partial ON media_file(summary_status) WHERE summary_status IS NOT NULL AND summary_status != 'completed';
 CREATE INDEX IF NOT EXISTS idx_media_file_user_completed ON media_file(user_id, completed_at DESC) WHERE status = 'completed' AND completed_at IS NOT NULL;
+-- keyset (cursor) gallery pagination: (user_id, sort_field, id)
+CREATE INDEX IF NOT EXISTS idx_media_file_user_upload_time_id ON media_file(user_id, upload_time DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_media_file_user_completed_at_id ON media_file(user_id, completed_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_media_file_user_filename_id ON media_file(user_id, filename DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_media_file_user_duration_id ON media_file(user_id, duration DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_media_file_user_file_size_id ON media_file(user_id, file_size DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_speaker_display_name ON speaker(display_name) WHERE display_name IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_speaker_name ON speaker(name);
 CREATE INDEX IF NOT EXISTS idx_task_media_file_status ON task(media_file_id, status);
@@ -406,6 +421,9 @@ CREATE INDEX IF NOT EXISTS idx_speaker_user_id ON speaker(user_id);
 CREATE INDEX IF NOT EXISTS idx_speaker_media_file_id ON speaker(media_file_id);
 CREATE INDEX IF NOT EXISTS idx_speaker_profile_id ON speaker(profile_id);
 CREATE INDEX IF NOT EXISTS idx_speaker_verified ON speaker(verified);
+-- Keyset pagination indexes for the speaker directory
+CREATE INDEX IF NOT EXISTS idx_speaker_user_created_at_id ON speaker(user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_speaker_user_segment_count_id ON speaker(user_id, segment_count DESC, id DESC);
 
 CREATE INDEX IF NOT EXISTS idx_speaker_profile_user_id ON speaker_profile(user_id);
 
@@ -33,6 +33,7 @@ export type NotificationType =
   | 'clustering_progress'
   | 'clustering_complete'
   | 'clustering_file_complete'
+  | 'bulk_export_complete'
   | 'attribute_migration_progress'
   | 'attribute_migration_complete'
   | 'data_integrity_progress'
@@ -414,6 +415,12 @@ function createWebSocketStore() {
                 );
               }
               return;
+            } else if (data.type === 'bulk_export_complete') {
+              // Background bulk export finished — gallery page starts the download
+              if (typeof window !== 'undefined') {
+                window.dispatchEvent(new CustomEvent('bulk-export-complete', { detail: data.data }));
+              }
+              return;
             } else if (data.type === 'collection_shared') {
               // Collection shared with user — invalidate collections cache and notify
               if (typeof window !== 'undefined') {
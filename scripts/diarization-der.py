@@ -4,9 +4,16 @@
 In-container: same rule as vram-probe-diarization.py (fails outside Docker).
 Reads RTTMs from docs/diarization-vram-profile/raw/rttm/ and emits
 docs/diarization-vram-profile/accuracy.md with per-config DER + tier.
+
+``--onnx-parity AUDIO [AUDIO ...]`` instead diarizes each file on CPU with
+the production ``SpeakerDiarizer`` twice — PyTorch backend, then ONNX
+Runtime backend — and scores ONNX against PyTorch with the same metric and
+tiers. Writes RTTMs for both backends plus onnx-parity.md, and exits 1 if
+any file lands in T3. Run from /app so ``app`` is importable.
 """
 from __future__ import annotations
 
+import argparse
 import json
 import logging
 import os
@@ -57,8 +64,124 @@ def classify(der: float, spk_match: bool) -> str:
     return 'T3'
 
 
+def annotation_from_diarization(diarize_df, uri: str) -> Annotation:
+    """Convert a ``DiarizeResult`` into a pyannote Annotation."""
+    ann = Annotation(uri=uri)
+    for start, end, speaker in zip(diarize_df.start, diarize_df.end, diarize_df.speaker):
+        ann[Segment(float(start), float(end))] = str(speaker)
+    return ann
+
+
+def write_rttm(ann: Annotation, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        ann.write_rttm(f)
+
+
+def diarize_all(backend: str, audio_files: list[Path], rttm_dir: Path) -> dict[str, Annotation]:
+    """Diarize every file with one backend; the model is loaded once."""
+    from app.transcription.audio import load_audio
+    from app.transcription.config import TranscriptionConfig
+    from app.transcription.diarizer import SpeakerDiarizer
+
+    config = TranscriptionConfig.for_cpu_lightweight(
+        hf_token=os.environ.get('HUGGINGFACE_TOKEN'),
+        enable_diarization=True,
+        enable_native_embeddings=False,
+        diarization_backend=backend,
+    )
+    diarizer = SpeakerDiarizer(config)
+    diarizer.load_model()
+    if diarizer.backend != backend:
+        raise RuntimeError(f'Requested {backend} backend but diarizer loaded {diarizer.backend}')
+
+    results = {}
+    try:
+        for audio_path in audio_files:
+            diarize_df, _, _ = diarizer.diarize(load_audio(str(audio_path)))
+            ann = annotation_from_diarization(diarize_df, audio_path.stem)
+            write_rttm(ann, rttm_dir / f'{audio_path.stem}__backend-{backend}.rttm')
+            results[audio_path.stem] = ann
+    finally:
+        diarizer.unload_model()
+    return results
+
+
+def onnx_parity(audio_files: list[Path], out_md: Path) -> int:
+    """Score the ONNX Runtime backend against the PyTorch backend on CPU."""
+    missing = [p for p in audio_files if not p.exists()]
+    if missing:
+        log.error(f'Missing audio: {", ".join(map(str, missing))}')
+        return 1
+
+    rttm_dir = out_md.parent / 'raw' / 'rttm-onnx-parity'
+    # PyTorch first: the ONNX backend flips process-wide fork env gates
+    references = diarize_all('pytorch', audio_files, rttm_dir)
+    hypotheses = diarize_all('onnx', audio_files, rttm_dir)
+
+    der_metric = DiarizationErrorRate(collar=0.25, skip_overlap=False)
+    results = []
+    for file, ref in references.items():
+        hyp = hypotheses[file]
+        der = float(der_metric(ref, hyp))
+        ref_spk, hyp_spk = len(ref.labels()), len(hyp.labels())
+        results.append({
+            'file': file,
+            'ref_spk': ref_spk,
+            'hyp_spk': hyp_spk,
+            'der': round(der, 4),
+            'tier': classify(der, hyp_spk == ref_spk),
+        })
+
+    lines = [
+        '# Diarization ONNX Runtime Parity\n',
+        'DER of the ONNX Runtime CPU backend against the PyTorch CPU backend, computed with '
+        '`pyannote.metrics.DiarizationErrorRate(collar=0.25, skip_overlap=False)`.\n',
+        'Tiers: **T1** DER ≤ 1 %, **T2** DER ≤ 3 %, **T3** DER > 3 % or speaker-count mismatch.\n',
+        '',
+        '| file | pytorch_spk | onnx_spk | DER | tier |',
+        '|---|---:|---:|---:|:---:|',
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['file']} | {r['ref_spk']} | {r['hyp_spk']} | {r['der']:.4f} | **{r['tier']}** |"
+        )
+    out_md.parent.mkdir(parents=True, exist_ok=True)
+    out_md.write_text('\n'.join(lines) + '\n')
+    out_md.with_suffix('.json').write_text(json.dumps(results, indent=2))
+    log.info(f'Wrote {out_md} with {len(results)} rows')
+
+    failed = [r['file'] for r in results if r['tier'] == 'T3']
+    if failed:
+        log.error(f'ONNX backend outside parity (T3): {", ".join(failed)}')
+        return 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description='Diarization DER against a reference.')
+    p.add_argument(
+        '--onnx-parity',
+        nargs='+',
+        type=Path,
+        metavar='AUDIO',
+        help='Score the ONNX Runtime CPU backend against PyTorch on these files.',
+    )
+    p.add_argument(
+        '--out',
+        type=Path,
+        default=Path('/app/docs/diarization-vram-profile/onnx-parity.md'),
+        help='Markdown report for --onnx-parity.',
+    )
+    return p.parse_args()
+
+
 def main() -> int:
+    args = parse_args()
     require_container()
+    if args.onnx_parity:
+        return onnx_parity(args.onnx_parity, args.out)
+
     rttm_dir = Path('/app/docs/diarization-vram-profile/raw/rttm')
     out_md = Path('/app/docs/diarization-vram-profile/accuracy.md')
     if not rttm_dir.exists():
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Export the speaker gender model to INT8 ONNX (one-time setup).
+
+The CPU speaker-attribute path loads this file when
+SPEAKER_ATTRIBUTE_ONNX_ENABLED=true (see SpeakerAttributeService).
+
+Usage:
+    python scripts/export-gender-onnx.py [--out ./models/onnx/gender_wav2vec2_int8.onnx]
+
+This script:
+1. Loads prithivMLmods/Common-Voice-Gender-Detection (wav2vec2, PyTorch)
+2. Exports to ONNX FP32 with dynamic batch and time axes
+3. Quantizes weights to INT8 (dynamic quantization)
+4. Checks the INT8 graph against PyTorch on a padded batch
+"""
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+import torch
+
+MODEL_NAME = "prithivMLmods/Common-Voice-Gender-Detection"
+SAMPLE_RATE = 16000
+
+
+def _padded_batch(extractor, seconds: list[float]) -> dict:
+    rng = np.random.default_rng(0)
+    clips = [rng.standard_normal(int(s * SAMPLE_RATE)).astype(np.float32) * 0.1 for s in seconds]
+    return extractor(
+        clips,
+        sampling_rate=SAMPLE_RATE,
+        return_tensors="np",
+        padding=True,
+        return_attention_mask=True,
+    )
+
+
+def export(out_path: Path) -> int:
+    from transformers import Wav2Vec2FeatureExtractor
+    from transformers import Wav2Vec2ForSequenceClassification
+
+    fp32_path = out_path.with_name(out_path.stem.replace("_int8", "") + "_fp32.onnx")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    print(f"[1/4] Loading {MODEL_NAME}")
+    extractor = Wav2Vec2FeatureExtractor.from_pretrained(MODEL_NAME)
+    model = Wav2Vec2ForSequenceClassification.from_pretrained(MODEL_NAME).eval()
+
+    dummy = _padded_batch(extractor, [3.0, 2.5])
+    input_values = torch.from_numpy(dummy["input_values"].astype(np.float32))
+    attention_mask = torch.from_numpy(dummy["attention_mask"].astype(np.int64))
+
+    print(f"[2/4] Exporting FP32: {fp32_path}")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        torch.onnx.export(
+            model,
+            (input_values, attention_mask),
+            str(fp32_path),
+            input_names=["input_values", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_values": {0: "batch", 1: "samples"},
+                "attention_mask": {0: "batch", 1: "samples"},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+            do_constant_folding=True,
+        )
+    print(f"   ✓ Saved {fp32_path.stat().st_size / (1024 * 1024):.1f} MB")
+
+    print(f"[3/4] Quantizing to INT8: {out_path}")
+    from onnxruntime.quantization import QuantType
+    from onnxruntime.quantization import quantize_dynamic
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        quantize_dynamic(str(fp32_path), str(out_path), weight_type=QuantType.QInt8)
+    print(f"   ✓ Saved {out_path.stat().st_size / (1024 * 1024):.1f} MB")
+
+    print("[4/4] Checking INT8 against PyTorch")
+    import onnxruntime as ort
+
+    batch = _padded_batch(extractor, [4.0, 3.6, 3.5, 1.2])
+    with torch.inference_mode():
+        ref = (
+            model(
+                input_values=torch.from_numpy(batch["input_values"].astype(np.float32)),
+                attention_mask=torch.from_numpy(batch["attention_mask"].astype(np.int64)),
+            )
+            .logits.softmax(-1)
+            .numpy()
+        )
+    session = ort.InferenceSession(str(out_path), providers=["CPUExecutionProvider"])
+    logits = session.run(
+        ["logits"],
+        {
+            "input_values": batch["input_values"].astype(np.float32),
+            "attention_mask": batch["attention_mask"].astype(np.int64),
+        },
+    )[0]
+    probs = np.exp(logits - logits.max(-1, keepdims=True))
+    probs /= probs.sum(-1, keepdims=True)
+    agree = int((probs.argmax(-1) == ref.argmax(-1)).sum())
+    print(f"   max |Δp| = {np.abs(probs - ref).max():.4f}, argmax agreement {agree}/{len(ref)}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export the gender model to INT8 ONNX")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path("./models/onnx/gender_wav2vec2_int8.onnx"),
+        help="INT8 output path (the FP32 graph is written next to it)",
+    )
+    args = parser.parse_args()
+
+    if args.out.exists():
+        print(f"✓ {args.out} already exists, nothing to do")
+        return 0
+    try:
+        return export(args.out)
+    except Exception as e:
+        print(f"✗ Export failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())